@@ -0,0 +1,277 @@
+"""
+Push-based SOL balance updates over a Solana RPC WebSocket.
+
+AccountSubscriber keeps one WebSocket to the node at SOLANA_WS_URL and holds an
+accountSubscribe subscription for every watched wallet. Each accountNotification
+carries the account's new lamport balance, which is handed to the registered update
+listeners (BalancePoller turns them into BalanceChangeEvents) within moments of the
+change, with no RPC traffic while nothing happens.
+
+The socket reconnects with exponential backoff and re-subscribes every wallet. While
+it is down, connection listeners are told so that polling takes over. The feed is
+disabled when SOLANA_WS_URL is unset or the optional websockets package is missing.
+Point ws_url at a local stand-in server to exercise it offline.
+"""
+
+import asyncio
+import itertools
+import json
+import random
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from loguru import logger
+
+try:
+    import websockets
+except ImportError:  # Optional; balances are polled without it
+    websockets = None
+
+from bot.config import SOLANA_WS_URL
+
+DEFAULT_COMMITMENT = "confirmed"
+RECONNECT_MIN_DELAY = 1.0     # First reconnect delay (seconds)
+RECONNECT_MAX_DELAY = 30.0    # Reconnect delay cap (seconds)
+PING_INTERVAL = 20.0          # Keep-alive ping interval; many RPC providers drop idle sockets
+PING_TIMEOUT = 20.0
+
+UpdateListener = Callable[[str, int], Awaitable[None]]
+ConnectionListener = Callable[[bool], None]
+
+
+class AccountSubscriber:
+    """Solana accountSubscribe client delivering lamport balances for watched wallets."""
+
+    def __init__(self, ws_url: Optional[str], commitment: str = DEFAULT_COMMITMENT):
+        """
+        Initialize the subscriber.
+
+        Args:
+            ws_url: Solana RPC WebSocket URL (wss://...), or None to disable the feed
+            commitment: Commitment level for account notifications
+        """
+        self.ws_url = ws_url
+        self.commitment = commitment
+        self.connected = False
+        self.reconnects = 0
+        self.notifications = 0
+        self._wallets: Set[str] = set()
+        self._subscription_by_wallet: Dict[str, int] = {}
+        self._wallet_by_subscription: Dict[int, str] = {}
+        self._requests: Dict[int, Tuple[str, str]] = {}
+        self._request_ids = itertools.count(1)
+        self._update_listeners: List[UpdateListener] = []
+        self._connection_listeners: List[ConnectionListener] = []
+        self._ws = None
+        self._task: Optional[asyncio.Task] = None
+        self._send_tasks: Set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the feed can run: a WebSocket URL is configured and websockets is installed."""
+        return bool(self.ws_url) and websockets is not None
+
+    def is_live(self, wallet_address: str) -> bool:
+        """
+        Check whether a wallet's balance is currently being pushed.
+
+        Args:
+            wallet_address: Wallet address
+
+        Returns:
+            True if the socket is up and the node has confirmed the wallet's subscription
+        """
+        return self.connected and wallet_address in self._subscription_by_wallet
+
+    def add_update_listener(self, listener: UpdateListener):
+        """
+        Register a coroutine called with (wallet_address, lamports) for every notification.
+
+        Args:
+            listener: Async callable
+        """
+        self._update_listeners.append(listener)
+
+    def add_connection_listener(self, listener: ConnectionListener):
+        """
+        Register a callback called with True/False when the socket connects or drops.
+
+        Args:
+            listener: Callable taking the new connection state
+        """
+        self._connection_listeners.append(listener)
+
+    async def start(self):
+        """Start the connection loop if the feed is enabled."""
+        if not self.enabled:
+            if self.ws_url and websockets is None:
+                logger.warning("SOLANA_WS_URL is set but the websockets package is not installed; balances will be polled")
+            return
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info("Account subscription feed started")
+
+    async def stop(self):
+        """Stop the connection loop and close the socket."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for task in list(self._send_tasks):
+            task.cancel()
+        logger.info("Account subscription feed stopped")
+
+    def subscribe(self, wallet_address: str):
+        """
+        Start pushing a wallet's balance. Safe to call before the socket is up.
+
+        Args:
+            wallet_address: Wallet address
+        """
+        if wallet_address in self._wallets:
+            return
+        self._wallets.add(wallet_address)
+        if self._ws is not None:
+            self._send_in_background("accountSubscribe", wallet_address,
+                                     [wallet_address, {"encoding": "base64", "commitment": self.commitment}])
+
+    def unsubscribe(self, wallet_address: str):
+        """
+        Stop pushing a wallet's balance.
+
+        Args:
+            wallet_address: Wallet address
+        """
+        self._wallets.discard(wallet_address)
+        subscription = self._subscription_by_wallet.pop(wallet_address, None)
+        if subscription is None:
+            return
+        self._wallet_by_subscription.pop(subscription, None)
+        if self._ws is not None:
+            self._send_in_background("accountUnsubscribe", wallet_address, [subscription])
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get feed statistics.
+
+        Returns:
+            Dictionary with connection state, wallet and subscription counts, notifications and reconnects
+        """
+        return {
+            "enabled": self.enabled,
+            "connected": self.connected,
+            "wallets": len(self._wallets),
+            "live_subscriptions": len(self._subscription_by_wallet),
+            "notifications": self.notifications,
+            "reconnects": self.reconnects
+        }
+
+    def _set_connected(self, connected: bool):
+        """Record the connection state and notify connection listeners on a change."""
+        if connected == self.connected:
+            return
+        self.connected = connected
+        for listener in self._connection_listeners:
+            try:
+                listener(connected)
+            except Exception as e:
+                logger.error(f"Error in account feed connection listener: {str(e)}")
+
+    def _send_in_background(self, method: str, wallet_address: str, params: List[Any]):
+        """Send a request without waiting, keeping a reference to the task."""
+        task = asyncio.create_task(self._send(method, wallet_address, params))
+        self._send_tasks.add(task)
+        task.add_done_callback(self._send_tasks.discard)
+
+    async def _send(self, method: str, wallet_address: str, params: List[Any]):
+        """Send one JSON-RPC request over the socket."""
+        ws = self._ws
+        if ws is None:
+            return
+        request_id = next(self._request_ids)
+        self._requests[request_id] = (method, wallet_address)
+        try:
+            await ws.send(json.dumps({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}))
+        except Exception as e:
+            self._requests.pop(request_id, None)
+            logger.debug(f"Could not send {method} for {wallet_address}: {str(e)}")
+
+    async def _run(self):
+        """Connection loop: connect, re-subscribe every wallet, dispatch messages, reconnect on failure."""
+        delay = RECONNECT_MIN_DELAY
+        while True:
+            try:
+                async with websockets.connect(self.ws_url, ping_interval=PING_INTERVAL,
+                                              ping_timeout=PING_TIMEOUT) as ws:
+                    self._ws = ws
+                    self._set_connected(True)
+                    delay = RECONNECT_MIN_DELAY
+                    logger.info(f"Account subscription feed connected; subscribing {len(self._wallets)} wallets")
+                    for wallet_address in list(self._wallets):
+                        await self._send("accountSubscribe", wallet_address,
+                                         [wallet_address, {"encoding": "base64", "commitment": self.commitment}])
+                    async for message in ws:
+                        await self._handle_message(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Account subscription feed disconnected: {str(e)}")
+            finally:
+                self._ws = None
+                self._subscription_by_wallet.clear()
+                self._wallet_by_subscription.clear()
+                self._requests.clear()
+                self._set_connected(False)
+
+            self.reconnects += 1
+            await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+            delay = min(RECONNECT_MAX_DELAY, delay * 2)
+
+    async def _handle_message(self, message: Any):
+        """Dispatch one message: a subscription acknowledgement or an account notification."""
+        try:
+            payload = json.loads(message)
+        except ValueError:
+            logger.debug("Ignoring non-JSON message from account feed")
+            return
+        if not isinstance(payload, dict):
+            return
+
+        if "id" in payload:
+            method, wallet_address = self._requests.pop(payload["id"], (None, None))
+            if method != "accountSubscribe":
+                return
+            if "error" in payload:
+                logger.warning(f"accountSubscribe failed for {wallet_address}: {payload['error']}")
+                return
+            subscription = payload.get("result")
+            if wallet_address not in self._wallets:
+                # Unsubscribed while the request was in flight
+                self._send_in_background("accountUnsubscribe", wallet_address, [subscription])
+                return
+            self._subscription_by_wallet[wallet_address] = subscription
+            self._wallet_by_subscription[subscription] = wallet_address
+            return
+
+        if payload.get("method") != "accountNotification":
+            return
+        params = payload.get("params") or {}
+        wallet_address = self._wallet_by_subscription.get(params.get("subscription"))
+        if wallet_address is None:
+            return
+        value = (params.get("result") or {}).get("value")
+        # A null value means the account no longer exists (balance drained to zero)
+        lamports = int(value.get("lamports", 0)) if isinstance(value, dict) else 0
+        self.notifications += 1
+        for listener in self._update_listeners:
+            try:
+                await listener(wallet_address, lamports)
+            except Exception as e:
+                logger.error(f"Error in account feed update listener for {wallet_address}: {str(e)}")
+
+
+# Shared feed; disabled unless SOLANA_WS_URL is configured
+account_subscriber = AccountSubscriber(SOLANA_WS_URL)
@@ -0,0 +1,216 @@
+"""
+Adaptive concurrency limiting for rate-limited backend operations.
+
+The limiter uses additive-increase/multiplicative-decrease (AIMD), the same rule
+TCP uses for its congestion window. Each successful call grows the concurrency limit
+by roughly one slot per full window of calls. Each throttling signal (HTTP 429 or a
+Jito bundle rejection) halves the limit. Over time the limit settles just under the
+highest concurrency the backend sustains, shared by every user in the process.
+"""
+
+import asyncio
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Dict, List
+
+from loguru import logger
+
+DEFAULT_INITIAL_LIMIT = 4.0
+DEFAULT_MIN_LIMIT = 1.0
+DEFAULT_MAX_LIMIT = 16.0
+DEFAULT_DECREASE_INTERVAL = 2.0    # Seconds during which repeat throttles count as one event
+
+# Substrings of error messages that mean the backend or Jito is throttling us
+RATE_LIMIT_INDICATORS = [
+    "Failed to send Jito bundle",
+    "rate limit",
+    "too many requests",
+    "429",
+    "throttle",
+    "jito.wtf/api/v1/bundles",
+    "bundle submission failed"
+]
+
+
+def is_throttling_signal(error_message: str) -> bool:
+    """
+    Check if an error message indicates rate limiting.
+
+    Args:
+        error_message: The error message to check
+
+    Returns:
+        True if this appears to be a rate limiting error
+    """
+    error_lower = error_message.lower()
+    return any(indicator.lower() in error_lower for indicator in RATE_LIMIT_INDICATORS)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Process-wide AIMD concurrency limiter usable from threads and coroutines.
+
+    Slots are counted under one lock. Blocked threads wait on a condition variable.
+    Blocked coroutines wait on futures that are woken from whichever thread frees
+    a slot.
+    """
+
+    def __init__(self, name: str, initial_limit: float = DEFAULT_INITIAL_LIMIT,
+                 min_limit: float = DEFAULT_MIN_LIMIT, max_limit: float = DEFAULT_MAX_LIMIT,
+                 decrease_interval: float = DEFAULT_DECREASE_INTERVAL):
+        """
+        Initialize the limiter.
+
+        Args:
+            name: Limiter name used in logs
+            initial_limit: Starting concurrency limit
+            min_limit: Lowest the limit may be cut to
+            max_limit: Highest the limit may grow to
+            decrease_interval: Seconds after a decrease during which further throttles are ignored
+        """
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_interval = decrease_interval
+        self._limit = max(min_limit, min(initial_limit, max_limit))
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._async_waiters: List[asyncio.Future] = []
+        self._last_decrease = 0.0
+        self._successes = 0
+        self._throttles = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed to run concurrently."""
+        with self._lock:
+            return self._effective_limit()
+
+    def _effective_limit(self) -> int:
+        """Whole-slot limit. Caller must hold the lock."""
+        return max(1, int(self._limit))
+
+    def _try_acquire(self) -> bool:
+        """Take a slot if one is free. Caller must hold the lock."""
+        if self._in_flight < self._effective_limit():
+            self._in_flight += 1
+            return True
+        return False
+
+    def acquire(self):
+        """Block the calling thread until a slot is free, then take it."""
+        with self._condition:
+            while not self._try_acquire():
+                self._condition.wait()
+
+    async def acquire_async(self):
+        """Wait without blocking the event loop until a slot is free, then take it."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                if self._try_acquire():
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    # Pass on a wake-up this waiter may have consumed
+                    self._remove_waiter(waiter)
+                    self._wake_waiters()
+                raise
+            with self._lock:
+                self._remove_waiter(waiter)
+
+    def _remove_waiter(self, waiter: asyncio.Future):
+        """Forget a coroutine's wait future. Caller must hold the lock."""
+        if waiter in self._async_waiters:
+            self._async_waiters.remove(waiter)
+
+    def release(self):
+        """Return a slot and wake waiters that may now proceed."""
+        with self._condition:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._wake_waiters()
+
+    def _wake_waiters(self):
+        """Wake blocked threads and coroutines so they re-check for a slot. Caller must hold the lock."""
+        free_slots = self._effective_limit() - self._in_flight
+        if free_slots <= 0:
+            return
+        self._condition.notify(free_slots)
+        for waiter in self._async_waiters[:free_slots]:
+            loop = waiter.get_loop()
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self._resolve_waiter, waiter)
+
+    @staticmethod
+    def _resolve_waiter(waiter: asyncio.Future):
+        """Complete a coroutine's wait future on its own event loop."""
+        if not waiter.done():
+            waiter.set_result(None)
+
+    def record_success(self):
+        """Additive increase: grow the limit by about one slot per window of successful calls."""
+        with self._condition:
+            self._successes += 1
+            previous = self._effective_limit()
+            self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+            if self._effective_limit() > previous:
+                logger.info(f"{self.name} limiter: concurrency raised to {self._effective_limit()}")
+                self._wake_waiters()
+
+    def record_throttle(self):
+        """
+        Multiplicative decrease: halve the limit on a throttling signal.
+
+        Calls that were already in flight when the limit was cut often report the
+        same overload. Throttles within decrease_interval of the last cut are
+        therefore counted but do not cut the limit again.
+        """
+        with self._lock:
+            self._throttles += 1
+            now = time.monotonic()
+            if now - self._last_decrease < self.decrease_interval:
+                return
+            self._last_decrease = now
+            self._limit = max(self.min_limit, self._limit / 2)
+            logger.warning(f"{self.name} limiter: throttled, concurrency cut to {self._effective_limit()}")
+
+    @contextmanager
+    def slot(self):
+        """Hold a slot for the duration of a blocking call."""
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def async_slot(self):
+        """Hold a slot for the duration of an awaited call."""
+        await self.acquire_async()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get limiter statistics.
+
+        Returns:
+            Dictionary with the current limit, in-flight calls, waiters and signal counts
+        """
+        with self._lock:
+            return {
+                "limit": self._effective_limit(),
+                "limit_exact": round(self._limit, 2),
+                "in_flight": self._in_flight,
+                "waiting_coroutines": len(self._async_waiters),
+                "successes": self._successes,
+                "throttles": self._throttles
+            }
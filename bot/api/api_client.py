@@ -1,15 +1,57 @@
 import json
 import time
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Tuple
 import requests
+import httpx
 from loguru import logger
 from bot.config import API_BASE_URL
+from bot.api.single_flight import SingleFlight
+from bot.api.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, OUTAGE_STATUS_CODES
+from bot.api.adaptive_limiter import AdaptiveConcurrencyLimiter, is_throttling_signal
+from bot.api.latency_tracker import LatencyTracker
+from bot.api.backend_warmer import backend_warmer
+from bot.api.balance_cache import balance_cache
+from bot.api.token_registry import token_registry
+from bot.api.quote_prefetcher import QuotePrefetcher
+from bot.api.trade_scheduler import trade_scheduler, RescheduleOperation, ScheduledRun
+from bot.api.signature_status import (
+    signature_status_client, SignatureStatus, SignatureStatusError, DEFAULT_CONFIRM_TIMEOUT, is_signature
+)
+from bot.api.response_decoding import (
+    decode_json, is_truncated, JSONRecoveryError, BalanceResponse, ChildWalletsResponse, QuoteResponse
+)
+from bot.api.timeouts import (
+    TimeoutProfile, Deadline, RequestTimeout, HEALTH_TIMEOUTS, BALANCE_TIMEOUTS, QUOTE_TIMEOUTS,
+    SWAP_TIMEOUTS, FUNDING_TIMEOUTS, TRANSFER_TIMEOUTS
+)
 import uuid
 import hashlib
 import random
 import asyncio
 import os
-import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from bot.utils.adaptive_interval import AdaptiveInterval
+
+# Multi-wallet balance reads
+BALANCE_BATCH_ENDPOINT = '/api/wallets/balances'
+BALANCE_BATCH_SIZE = 100            # Accounts per batch request (getMultipleAccounts limit)
+BALANCE_FETCH_CONCURRENCY = 10      # Concurrent single-wallet reads when batching is unavailable
+TOKEN_BALANCE_BATCH_ENDPOINT = '/api/wallets/token-balances'
+
+# Wallets swapping at once during an SPL volume run's buy phase
+SPL_SWAP_CONCURRENCY = 8
+# Random pause (seconds) between one wallet's consecutive buys
+SPL_WALLET_TRADE_GAP = (1.0, 5.0)
+
+# Funding confirmation
+FUNDING_CONFIRM_TIMEOUT = 30.0      # Seconds each confirmation stage waits for transfers to show
+FUNDING_PROBE_MIN_INTERVAL = 0.5    # First re-probe delay (seconds)
+FUNDING_PROBE_MAX_INTERVAL = 4.0    # Re-probe delay cap (seconds)
+
+# Per-transfer entries of multi-transfer responses
+TRANSFER_SIGNATURE_KEYS = ("transactionId", "signature", "txId", "txid")
+TRANSFER_RECIPIENT_KEYS = ("childPublicKey", "publicKey", "recipient", "toPublicKey", "to", "wallet", "address")
 
 class ApiClientError(Exception):
     """Base exception for API client errors."""
@@ -21,7 +63,18 @@ class ApiTimeoutError(ApiClientError):
 
 class ApiBadResponseError(ApiClientError):
     """Exception raised when the API returns a non-200 status code."""
-    pass
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+class ApiCircuitOpenError(ApiClientError):
+    """Exception raised without a request when the endpoint's circuit breaker is open."""
+
+    def __init__(self, message: str, family: str, retry_after: float = 0.0):
+        super().__init__(message)
+        self.family = family
+        self.retry_after = retry_after
 
 
 class ApiClient:
@@ -38,7 +91,29 @@ class ApiClient:
         self.base_url = base_url
         self.timeout = timeout
         self.session = requests.Session()
-        
+
+        # Native asyncio transport with its own connection pool, created lazily
+        # on first use so it binds to the running event loop
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop = None
+        self._async_pool_limits = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+        # Concurrent identical balance and quote reads share one in-flight request
+        self._single_flight = SingleFlight("ApiClient")
+
+        # Fail fast per endpoint family while the backend is down
+        self._circuit_breakers = CircuitBreakerRegistry("ApiClient")
+
+        # Swap concurrency across all users, adapted to rate-limit signals
+        self._swap_limiter = AdaptiveConcurrencyLimiter("ApiClient swap")
+
+        # Online per-endpoint latency, used to hedge slow quote requests at their p95
+        self._latency = LatencyTracker()
+
+        # Whether the backend has a batch balance endpoint (None until first probed)
+        self._batch_balances_supported: Optional[bool] = None
+        self._batch_token_balances_supported: Optional[bool] = None
+
         # Set to False to use the real API
         self.use_mock = False
         
@@ -60,7 +135,207 @@ class ApiClient:
     def set_run_id(self, run_id: str):
         """Set the run ID for tracing purposes."""
         self.run_id = run_id
-    
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled async HTTP client, creating it for the running event loop if needed.
+
+        Returns:
+            httpx.AsyncClient bound to the current event loop
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client.is_closed or self._async_client_loop is not loop:
+            self._async_client = httpx.AsyncClient(
+                limits=self._async_pool_limits,
+                timeout=self.timeout,
+                headers={'User-Agent': 'NinjaBot-Api-Client/1.0'}
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
+    async def aclose(self):
+        """Close the async HTTP client and release its pooled connections."""
+        if self._async_client is not None and not self._async_client.is_closed:
+            await self._async_client.aclose()
+        self._async_client = None
+        self._async_client_loop = None
+
+    def get_coalescing_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics for coalesced balance and quote reads.
+
+        Returns:
+            Dictionary with request, backend call and coalesced counts and the hit ratio
+        """
+        return self._single_flight.stats()
+
+    @staticmethod
+    def _valid_status_codes(method: str) -> List[int]:
+        """
+        Get the status codes accepted as success for an HTTP method.
+
+        - 200 OK for GET and most operations
+        - 201 Created for POST operations that create new resources
+        - 204 No Content for DELETE operations
+        """
+        valid_status_codes = [200]
+        if method.lower() == 'post':
+            valid_status_codes.append(201)
+        if method.lower() == 'delete':
+            valid_status_codes.append(204)
+        return valid_status_codes
+
+    @staticmethod
+    def _describe_timeout(timeout: Any) -> str:
+        """Format a numeric timeout or TimeoutProfile for log messages."""
+        return str(timeout) if isinstance(timeout, TimeoutProfile) else f"{timeout}s"
+
+    @staticmethod
+    def _attempt_timeout(base_timeout: RequestTimeout, deadline: Deadline, endpoint: str) -> RequestTimeout:
+        """
+        Get the timeout for the next attempt so it cannot run past the deadline.
+
+        Args:
+            base_timeout: The request's timeout (seconds or TimeoutProfile)
+            deadline: Deadline for the whole retry loop
+            endpoint: API endpoint, for the error message
+
+        Returns:
+            Timeout of the same kind as base_timeout, capped to the remaining budget
+
+        Raises:
+            ApiTimeoutError: If the deadline has already passed
+        """
+        if deadline.expired:
+            raise ApiTimeoutError(f"Deadline of {deadline.budget:.0f}s exceeded for {endpoint}")
+        if isinstance(base_timeout, TimeoutProfile):
+            return base_timeout.capped(deadline.remaining())
+        return min(float(base_timeout), deadline.remaining())
+
+    def _prepare_request_kwargs(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply default timeout and tracing headers to request kwargs."""
+        if 'timeout' not in kwargs:
+            kwargs['timeout'] = self.timeout
+        if 'headers' not in kwargs:
+            kwargs['headers'] = {}
+        if self.run_id:
+            kwargs['headers']['X-Run-Id'] = self.run_id
+        return kwargs
+
+    @staticmethod
+    def _endpoint_family(endpoint: str) -> str:
+        """
+        Map an endpoint to the circuit breaker family it belongs to.
+
+        Args:
+            endpoint: API endpoint path
+
+        Returns:
+            Family name (balance, jupiter_quote, swap, fund_children or default)
+        """
+        if (endpoint.startswith('/api/wallets/mother/') or endpoint.startswith('/api/wallets/token-balance/')
+                or endpoint == BALANCE_BATCH_ENDPOINT):
+            return 'balance'
+        if endpoint.startswith('/api/jupiter/quote') or endpoint.startswith('/api/spl/quote'):
+            return 'jupiter_quote'
+        if endpoint.startswith('/api/jupiter/swap') or endpoint.startswith('/api/spl/execute_'):
+            return 'swap'
+        if endpoint.startswith('/api/wallets/fund-children'):
+            return 'fund_children'
+        return 'default'
+
+    def _acquire_circuit(self, endpoint: str) -> CircuitBreaker:
+        """
+        Get the circuit breaker for an endpoint and check that a request may be sent.
+
+        Args:
+            endpoint: API endpoint path
+
+        Returns:
+            The endpoint family's circuit breaker
+
+        Raises:
+            ApiCircuitOpenError: If the breaker is open and the request must fail fast
+        """
+        family = self._endpoint_family(endpoint)
+        breaker = self._circuit_breakers.get(family)
+        if not breaker.allow_request():
+            retry_after = breaker.retry_after()
+            logger.warning(f"Circuit '{family}' open, failing fast for {endpoint} (retry in {retry_after:.1f}s)")
+            raise ApiCircuitOpenError(
+                f"Circuit breaker open for {family} endpoints; retry in {retry_after:.1f}s",
+                family=family,
+                retry_after=retry_after
+            )
+        return breaker
+
+    def _record_status(self, breaker: CircuitBreaker, status_code: int):
+        """Record a received response with the breaker; only gateway errors count as outages."""
+        if status_code in OUTAGE_STATUS_CODES:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+            # The backend is awake, so its keep-warm ping can wait
+            backend_warmer.record_contact(self.base_url)
+
+    def get_circuit_breaker_status(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the state of every endpoint family's circuit breaker.
+
+        Returns:
+            Dictionary mapping endpoint family to breaker state
+        """
+        return self._circuit_breakers.snapshot()
+
+    def _decode_response(self, response: Any) -> Any:
+        """
+        Decode a response body in a single pass, recovering what it can from malformed JSON.
+
+        Args:
+            response: requests or httpx response
+
+        Returns:
+            Decoded (or partially recovered) JSON data
+
+        Raises:
+            ApiClientError: If no data could be recovered
+        """
+        try:
+            data = decode_json(response.content)
+        except JSONRecoveryError as e:
+            logger.error(f"Failed to parse JSON response: {str(e)}")
+            logger.error(f"Response text: {response.text}")
+            raise ApiClientError(f"Failed to parse JSON response: {str(e)}")
+        if is_truncated(data):
+            logger.warning(f"Response body was cut off; recovered partial data: {response.text[:200]}")
+        return data
+
+    def _check_response_message(self, response: Any) -> None:
+        """
+        Inspect the 'message' field of a response for parameter errors.
+
+        Raises:
+            ApiClientError: If the message reports a client-side parameter error
+        """
+        if isinstance(response, dict) and 'message' in response:
+            message = response['message']
+            # Check if the message indicates an error
+            if ('error' in message.lower() or
+                'missing' in message.lower() or
+                'invalid' in message.lower() or
+                'must' in message.lower()):
+
+                logger.warning(f"API returned warning message: {message}")
+
+                # For client-side parameter errors, don't retry
+                if ('missing required parameter' in message.lower() or
+                    'invalid parameter' in message.lower() or
+                    'each child wallet must' in message.lower()):
+                    raise ApiClientError(f"Parameter error: {message}")
+            else:
+                # Just a normal message, log it
+                logger.info(f"API message: {message}")
+
     def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """
         Make an HTTP request to the API.
@@ -78,18 +353,11 @@ class ApiClient:
             ApiBadResponseError: If the API returns a non-200 status code
         """
         url = f"{self.base_url}{endpoint}"
-        
-        # Set default timeout if not provided
-        if 'timeout' not in kwargs:
-            kwargs['timeout'] = self.timeout
-        
-        # Add headers if not present
-        if 'headers' not in kwargs:
-            kwargs['headers'] = {}
-        
-        # Add run_id for tracing if available
-        if self.run_id:
-            kwargs['headers']['X-Run-Id'] = self.run_id
+        kwargs = self._prepare_request_kwargs(kwargs)
+        timeout = kwargs['timeout']
+        if isinstance(timeout, TimeoutProfile):
+            kwargs['timeout'] = timeout.as_requests_timeout()
+        breaker = self._acquire_circuit(endpoint)
             
         start_time = time.time()
         
@@ -108,6 +376,7 @@ class ApiClient:
             
             response = getattr(self.session, method.lower())(url, **kwargs)
             elapsed = time.time() - start_time
+            self._record_status(breaker, response.status_code)
             
             logger.debug(
                 f"Received response from {endpoint} in {elapsed:.2f}s",
@@ -125,143 +394,283 @@ class ApiClient:
             except Exception as e:
                 logger.warning(f"Could not log response content: {str(e)}")
             
-            # Check for valid status codes:
-            # - 200 OK for GET and most operations
-            # - 201 Created for POST operations that create new resources
-            # - 204 No Content for DELETE operations
-            valid_status_codes = [200]
-            
-            # Add 201 for resource creation (POST)
-            if method.lower() == 'post':
-                valid_status_codes.append(201)
-                
-            # Add 204 for resource deletion (DELETE)
-            if method.lower() == 'delete':
-                valid_status_codes.append(204)
-                
-            if response.status_code not in valid_status_codes:
+            if response.status_code not in self._valid_status_codes(method):
                 logger.error(
                     f"API error: {response.status_code} {response.text}",
                     extra={"status_code": response.status_code, "response_text": response.text}
                 )
-                raise ApiBadResponseError(f"API returned {response.status_code}: {response.text}")
-                
-            # Parse JSON response safely
-            try:
-                # First try standard JSON parsing
-                json_data = response.json()
-                return json_data
-            except json.JSONDecodeError as e:
-                logger.warning(f"Standard JSON parsing failed: {str(e)}")
-                
-                # As a fallback, try to extract structured data manually
-                try:
-                    # If response contains key-value patterns, extract them
-                    # First check if it looks like JSON (starts with { and ends with })
-                    if response.text.strip().startswith('{') and response.text.strip().endswith('}'):
-                        # Try to manually extract key-value pairs
-                        result = {}
-                        # Extract all "key":"value" pairs
-                        pattern = r'"([^"]+)"\s*:\s*"([^"]+)"'
-                        matches = re.findall(pattern, response.text)
-                        for key, value in matches:
-                            result[key] = value
-                            
-                        # Extract numeric values
-                        pattern = r'"([^"]+)"\s*:\s*([0-9.]+)'
-                        matches = re.findall(pattern, response.text)
-                        for key, value in matches:
-                            try:
-                                result[key] = float(value)
-                            except:
-                                result[key] = value
-                        
-                        # Extract boolean values
-                        pattern = r'"([^"]+)"\s*:\s*(true|false)'
-                        matches = re.findall(pattern, response.text)
-                        for key, value in matches:
-                            result[key] = (value.lower() == 'true')
-                        
-                        # Extract array values
-                        pattern = r'"([^"]+)"\s*:\s*\[(.*?)\]'
-                        matches = re.findall(pattern, response.text, re.DOTALL)
-                        for key, value in matches:
-                            # Simple handling for arrays - just store as string for now
-                            result[key] = value.strip()
-                            
-                        # If we extracted data, return it
-                        if result:
-                            logger.info("Successfully extracted data manually from JSON response")
-                            return result
-                except Exception as manual_error:
-                    logger.error(f"Manual JSON extraction failed: {str(manual_error)}")
+                raise ApiBadResponseError(f"API returned {response.status_code}: {response.text}", status_code=response.status_code)
                 
-                # If all parsing attempts fail, raise the original error
-                logger.error(f"Failed to parse JSON response: {str(e)}")
-                logger.error(f"Response text: {response.text}")
-                raise ApiClientError(f"Failed to parse JSON response: {str(e)}")
+            return self._decode_response(response)
             
         except requests.exceptions.Timeout:
+            breaker.record_failure()
             logger.error(
-                f"Request to {url} timed out after {self.timeout}s",
-                extra={"endpoint": endpoint, "timeout": self.timeout}
+                f"Request to {url} timed out after {self._describe_timeout(timeout)}",
+                extra={"endpoint": endpoint, "timeout": kwargs['timeout']}
             )
             raise ApiTimeoutError(f"Request to {endpoint} timed out")
             
         except requests.exceptions.RequestException as e:
+            breaker.record_failure()
             logger.error(
                 f"Request to {url} failed: {str(e)}",
                 extra={"endpoint": endpoint, "error": str(e)}
             )
             raise ApiClientError(f"Request failed: {str(e)}")
+
+    async def _make_request_async(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """
+        Make an HTTP request to the API on the pooled async transport.
+        
+        Args:
+            method: HTTP method (get, post, etc.)
+            endpoint: API endpoint
+            **kwargs: Additional arguments to pass to httpx (params, json, headers, timeout)
+            
+        Returns:
+            The JSON response data
+            
+        Raises:
+            ApiTimeoutError: If the request times out
+            ApiBadResponseError: If the API returns a non-200 status code
+        """
+        url = f"{self.base_url}{endpoint}"
+        kwargs = self._prepare_request_kwargs(kwargs)
+        timeout = kwargs['timeout']
+        if isinstance(timeout, TimeoutProfile):
+            kwargs['timeout'] = timeout.as_httpx_timeout()
+        breaker = self._acquire_circuit(endpoint)
+        client = self._get_async_client()
+        
+        start_time = time.time()
+        
+        try:
+            logger.debug(
+                f"Making async {method.upper()} request to {endpoint}",
+                extra={
+                    "method": method,
+                    "url": url,
+                    "params": kwargs.get('params'),
+                    "run_id": self.run_id
+                }
+            )
+            
+            response = await client.request(method.upper(), url, **kwargs)
+            elapsed = time.time() - start_time
+            self._record_status(breaker, response.status_code)
+            
+            logger.debug(
+                f"Received async response from {endpoint} in {elapsed:.2f}s",
+                extra={
+                    "status_code": response.status_code,
+                    "elapsed_time": elapsed,
+                    "payload_size": len(response.content),
+                    "endpoint": endpoint
+                }
+            )
+            
+            if response.status_code not in self._valid_status_codes(method):
+                logger.error(
+                    f"API error: {response.status_code} {response.text}",
+                    extra={"status_code": response.status_code, "response_text": response.text}
+                )
+                raise ApiBadResponseError(f"API returned {response.status_code}: {response.text}", status_code=response.status_code)
+            
+            return self._decode_response(response)
+            
+        except httpx.TimeoutException:
+            breaker.record_failure()
+            logger.error(
+                f"Async request to {url} timed out after {self._describe_timeout(timeout)}",
+                extra={"endpoint": endpoint, "timeout": str(timeout)}
+            )
+            raise ApiTimeoutError(f"Request to {endpoint} timed out")
+            
+        except httpx.HTTPError as e:
+            breaker.record_failure()
+            logger.error(
+                f"Async request to {url} failed: {str(e)}",
+                extra={"endpoint": endpoint, "error": str(e)}
+            )
+            raise ApiClientError(f"Request failed: {str(e)}")
+    
+    @staticmethod
+    def _is_throttled(error: ApiClientError) -> bool:
+        """Check whether a failed request was rejected by rate limiting."""
+        if isinstance(error, ApiBadResponseError) and error.status_code == 429:
+            return True
+        return is_throttling_signal(str(error))
+
+    def _make_limited_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """
+        Make a request, holding a swap limiter slot for swap endpoints.
+        
+        Successful swaps let the shared limiter raise concurrency, and rate limit
+        responses make it halve concurrency for every user.
+        
+        Args:
+            method: HTTP method (get, post, etc.)
+            endpoint: API endpoint
+            **kwargs: Additional arguments to pass to requests
+            
+        Returns:
+            The JSON response data
+        """
+        if self._endpoint_family(endpoint) != 'swap':
+            return self._make_request(method, endpoint, **kwargs)
+        
+        with self._swap_limiter.slot():
+            try:
+                response = self._make_request(method, endpoint, **kwargs)
+            except ApiClientError as e:
+                if self._is_throttled(e):
+                    self._swap_limiter.record_throttle()
+                raise
+            self._swap_limiter.record_success()
+            return response
+
+    async def _make_limited_request_async(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """
+        Async version of _make_limited_request; waiting for a slot does not block the event loop.
+        """
+        if self._endpoint_family(endpoint) != 'swap':
+            return await self._make_request_async(method, endpoint, **kwargs)
+        
+        async with self._swap_limiter.async_slot():
+            try:
+                response = await self._make_request_async(method, endpoint, **kwargs)
+            except ApiClientError as e:
+                if self._is_throttled(e):
+                    self._swap_limiter.record_throttle()
+                raise
+            self._swap_limiter.record_success()
+            return response
+
+    def get_swap_limiter_stats(self) -> Dict[str, Any]:
+        """
+        Get the adaptive swap concurrency limiter's statistics.
+        
+        Returns:
+            Dictionary with the current limit, in-flight swaps and signal counts
+        """
+        return self._swap_limiter.stats()
+
+    async def _make_hedged_request_async(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """
+        Make an idempotent request, sending a duplicate if the first is slower than usual.
+        
+        If the first request has not answered by the endpoint's p95 latency, a second
+        identical request is sent and whichever answers first wins; the other is cancelled.
+        Until enough latencies have been recorded, requests are sent without hedging.
+        Latency is recorded end to end, from the first send to the winning answer, so slow
+        requests rescued by a hedge still count towards the percentiles.
+        
+        Args:
+            method: HTTP method (get, post, etc.)
+            endpoint: API endpoint (must be safe to call twice, e.g. a quote)
+            **kwargs: Additional arguments for the request
+            
+        Returns:
+            The JSON response data of the first successful request
+            
+        Raises:
+            ApiClientError: If the request fails (both requests, when hedged)
+        """
+        def send():
+            return asyncio.create_task(self._make_limited_request_async(method, endpoint, **kwargs))
+        
+        hedge_delay = self._latency.hedge_delay(endpoint)
+        started = time.monotonic()
+        first = send()
+        if hedge_delay is None:
+            self._latency.record_request(endpoint)
+            response = await first
+            self._latency.record(endpoint, time.monotonic() - started)
+            return response
+        
+        second = None
+        try:
+            done, _ = await asyncio.wait({first}, timeout=hedge_delay)
+            if done:
+                self._latency.record_request(endpoint)
+                response = first.result()
+                self._latency.record(endpoint, time.monotonic() - started)
+                return response
+            
+            logger.debug(f"Hedging {endpoint}: no answer after p95 of {hedge_delay:.2f}s")
+            second = send()
+            pending = {first, second}
+            first_error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        self._latency.record_request(endpoint, hedged=True, hedge_won=task is second)
+                        self._latency.record(endpoint, time.monotonic() - started)
+                        return task.result()
+                    first_error = first_error or task.exception()
+            self._latency.record_request(endpoint, hedged=True)
+            raise first_error
+        finally:
+            for task in (first, second):
+                if task is not None and not task.done():
+                    task.cancel()
     
-    def _make_request_with_retry(self, method: str, endpoint: str, max_retries: int = 3, initial_backoff: float = 1.0, **kwargs) -> Dict[str, Any]:
+    def get_quote_latency_stats(self) -> Dict[str, Any]:
+        """
+        Get Jupiter quote latency percentiles and hedging statistics.
+        
+        Returns:
+            Dictionary with p50/p95/p99 latency in seconds, hedge rate and hedge wins
+        """
+        return self._latency.stats('/api/jupiter/quote')
+
+    def _make_request_with_retry(self, method: str, endpoint: str, max_retries: int = 3, initial_backoff: float = 1.0,
+                                 deadline: Optional[Deadline] = None, **kwargs) -> Dict[str, Any]:
         """
         Make an HTTP request to the API with retry logic for transient failures.
         
+        When the request's timeout is a TimeoutProfile, its total budget bounds the whole
+        loop: each attempt's timeout is capped to the time left, and no retry is started
+        once the backoff would run past the deadline.
+        
         Args:
             method: HTTP method (get, post, etc.)
             endpoint: API endpoint
             max_retries: Maximum number of retry attempts
             initial_backoff: Initial backoff time in seconds
-            **kwargs: Additional arguments to pass to requests
+            deadline: Optional deadline for all attempts; defaults to the timeout profile's total
+            **kwargs: Additional arguments to pass to requests (timeout may be a TimeoutProfile)
             
         Returns:
             The JSON response data
             
         Raises:
-            ApiTimeoutError: If all retry attempts time out
+            ApiTimeoutError: If all retry attempts time out or the deadline passes
             ApiBadResponseError: If the API returns a non-200 status code after all retries
         """
         retries = 0
         backoff = initial_backoff
+        base_timeout = kwargs.get('timeout', self.timeout)
+        if deadline is None and isinstance(base_timeout, TimeoutProfile):
+            deadline = Deadline(base_timeout.total)
         
         while True:
+            if deadline is not None:
+                kwargs['timeout'] = self._attempt_timeout(base_timeout, deadline, endpoint)
             try:
-                response = self._make_request(method, endpoint, **kwargs)
+                response = self._make_limited_request(method, endpoint, **kwargs)
                 
                 # Check if the response contains an error message
-                if isinstance(response, dict) and 'message' in response:
-                    message = response['message']
-                    # Check if the message indicates an error
-                    if ('error' in message.lower() or 
-                        'missing' in message.lower() or 
-                        'invalid' in message.lower() or 
-                        'must' in message.lower()):
-                        
-                        logger.warning(f"API returned warning message: {message}")
-                        
-                        # For client-side parameter errors, don't retry
-                        if ('missing required parameter' in message.lower() or 
-                            'invalid parameter' in message.lower() or
-                            'each child wallet must' in message.lower()):
-                            raise ApiClientError(f"Parameter error: {message}")
-                    else:
-                        # Just a normal message, log it
-                        logger.info(f"API message: {message}")
+                self._check_response_message(response)
                 
                 return response
                 
+            except ApiCircuitOpenError:
+                # Backend is known to be down; retrying would only wait for nothing
+                raise
+                
             except (ApiTimeoutError, ApiClientError) as e:
                 retries += 1
                 
@@ -270,6 +679,11 @@ class ApiClient:
                     logger.error(f"Failed after {retries} retries: {str(e)}")
                     raise
                 
+                # Stop if waiting for the next attempt would run past the deadline
+                if deadline is not None and deadline.remaining() <= backoff:
+                    logger.error(f"Deadline for {endpoint} reached after {retries} attempt(s): {str(e)}")
+                    raise
+                
                 # Log retry attempt
                 logger.warning(
                     f"Request failed, retrying ({retries}/{max_retries}) after {backoff:.2f}s: {str(e)}",
@@ -280,39 +694,80 @@ class ApiClient:
                 time.sleep(backoff)
                 backoff *= 2  # Exponential backoff
     
-    async def _make_request_with_retry_async(self, method: str, endpoint: str, max_retries: int = 3, initial_backoff: float = 1.0, **kwargs) -> Dict[str, Any]:
+    async def _make_request_with_retry_async(self, method: str, endpoint: str, max_retries: int = 3, initial_backoff: float = 1.0,
+                                             deadline: Optional[Deadline] = None, hedge: bool = False,
+                                             **kwargs) -> Dict[str, Any]:
         """
         Async version of _make_request_with_retry.
         
+        Requests go through the pooled async transport and backoff is awaited,
+        so a retrying call never blocks the event loop for other users.
+        
         Args:
             method: HTTP method (get, post, etc)
             endpoint: API endpoint
             max_retries: Maximum number of retries
             initial_backoff: Initial backoff time in seconds (will be multiplied by 2^retry_count)
-            **kwargs: Additional arguments for the request
+            deadline: Optional deadline for all attempts; defaults to the timeout profile's total
+            hedge: Hedge each attempt with a duplicate request at the endpoint's p95 latency
+                (only for idempotent endpoints)
+            **kwargs: Additional arguments for the request (timeout may be a TimeoutProfile)
             
         Returns:
             Response data
             
         Raises:
-            ApiClientError: If the request fails after all retries
+            ApiClientError: If the request fails after all retries or the deadline passes
         """
-        # This is an async wrapper for the synchronous method
-        # In a full async implementation, the actual request mechanism would be async too
-        # But for compatibility, we're just calling the sync method here
-        return self._make_request_with_retry(method, endpoint, max_retries, initial_backoff, **kwargs)
-    
-    # ---------------------------------------------------------------------
-    # SPL SWAP READINESS (ADDED)
-    # ---------------------------------------------------------------------
-    def check_spl_swap_readiness(self, child_wallets: List[str], min_swap_amount_sol: float = 0.0001) -> Dict[str, Any]:
-        """Compute readiness / minimum funding requirements for SPL swap volume.
-
-        This mimics what a backend endpoint might return while keeping logic
-        aligned with documented funding constraints in cause_debugging.yaml.
-
-        Strategy (Root‑Cause Fix Alignment):
-        - Ensure each child wallet has enough usable SOL after reserving a
+        retries = 0
+        backoff = initial_backoff
+        base_timeout = kwargs.get('timeout', self.timeout)
+        if deadline is None and isinstance(base_timeout, TimeoutProfile):
+            deadline = Deadline(base_timeout.total)
+        
+        send = self._make_hedged_request_async if hedge else self._make_limited_request_async
+        
+        while True:
+            if deadline is not None:
+                kwargs['timeout'] = self._attempt_timeout(base_timeout, deadline, endpoint)
+            try:
+                response = await send(method, endpoint, **kwargs)
+                self._check_response_message(response)
+                return response
+                
+            except ApiCircuitOpenError:
+                raise
+                
+            except (ApiTimeoutError, ApiClientError) as e:
+                retries += 1
+                
+                if retries >= max_retries:
+                    logger.error(f"Failed after {retries} retries: {str(e)}")
+                    raise
+                
+                if deadline is not None and deadline.remaining() <= backoff:
+                    logger.error(f"Deadline for {endpoint} reached after {retries} attempt(s): {str(e)}")
+                    raise
+                
+                logger.warning(
+                    f"Request failed, retrying ({retries}/{max_retries}) after {backoff:.2f}s: {str(e)}",
+                    extra={"retry_count": retries, "backoff": backoff, "error": str(e)}
+                )
+                
+                await asyncio.sleep(backoff)
+                backoff *= 2  # Exponential backoff
+    
+    # ---------------------------------------------------------------------
+    # SPL SWAP READINESS (ADDED)
+    # ---------------------------------------------------------------------
+    def check_spl_swap_readiness(self, child_wallets: List[str], min_swap_amount_sol: float = 0.0001) -> Dict[str, Any]:
+        """Compute readiness / minimum funding requirements for SPL swap volume.
+
+        This mimics what a backend endpoint might return while keeping logic
+        aligned with documented funding constraints in cause_debugging.yaml.
+
+        Strategy (Root‑Cause Fix Alignment):
+        - Ensure each child wallet has enough usable SOL after reserving a
           conservative gas buffer.
         - Previously reserve was too high (0.003050). We reduce to ~0.0015 SOL.
         - Allow user's intended volume amounts without excessive floors.
@@ -366,6 +821,27 @@ class ApiClient:
         """
         Check if the API is responsive and functioning.
         
+        The result includes the current state of every endpoint family's circuit breaker
+        under 'circuit_breakers', and Jupiter quote latency percentiles and hedge rate
+        under 'quote_latency'.
+        
+        Args:
+            mother_wallet_address: Optional mother wallet address to check instead of creating a new one
+            
+        Returns:
+            Dictionary with API health information
+        """
+        health = dict(self._probe_api_health(mother_wallet_address))
+        health['circuit_breakers'] = self.get_circuit_breaker_status()
+        health['quote_latency'] = self.get_quote_latency_stats()
+        if self._circuit_breakers.any_open():
+            logger.warning(f"API health check: open circuit breakers {health['circuit_breakers']}")
+        return health
+
+    def _probe_api_health(self, mother_wallet_address: str = None) -> Dict[str, Any]:
+        """
+        Probe the API health endpoints, using the cached result while it is fresh.
+        
         Args:
             mother_wallet_address: Optional mother wallet address to check instead of creating a new one
             
@@ -411,7 +887,7 @@ class ApiClient:
         for endpoint in endpoints:
             try:
                 logger.debug(f"Trying health check with endpoint: {endpoint}")
-                response = self._make_request('get', endpoint)
+                response = self._make_request('get', endpoint, timeout=HEALTH_TIMEOUTS)
                 
                 # If we get here, the endpoint worked - check if it has useful data
                 if isinstance(response, dict):
@@ -535,6 +1011,12 @@ class ApiClient:
         # Add run_id for tracing if available
         if self.run_id:
             kwargs['headers']['X-Run-Id'] = self.run_id
+        
+        try:
+            breaker = self._acquire_circuit(endpoint)
+        except ApiCircuitOpenError as e:
+            logger.error(f"Direct request skipped: {str(e)}")
+            return None
             
         start_time = time.time()
         
@@ -543,6 +1025,7 @@ class ApiClient:
             
             response = getattr(self.session, method.lower())(url, **kwargs)
             elapsed = time.time() - start_time
+            self._record_status(breaker, response.status_code)
             
             logger.debug(f"Received direct response from {endpoint} in {elapsed:.2f}s")
             
@@ -567,6 +1050,7 @@ class ApiClient:
             return response
             
         except Exception as e:
+            breaker.record_failure()
             logger.error(f"Direct request failed: {str(e)}")
             return None
     
@@ -625,14 +1109,12 @@ class ApiClient:
                 }
                 return fallback_wallet
             
-            # Extract wallet address directly from response text using regex
+            # Decode the body once, tolerating malformed JSON
             try:
-                import re
-                match = re.search(r'"motherWalletPublicKey"\s*:\s*"([^"]+)"', response.text)
-                if match:
-                    public_key = match.group(1)
-                    private_key_match = re.search(r'"motherWalletPrivateKeyBase58"\s*:\s*"([^"]+)"', response.text)
-                    private_key = private_key_match.group(1) if private_key_match else ''
+                response_data = self._decode_response(response)
+                public_key = response_data.get('motherWalletPublicKey') if isinstance(response_data, dict) else None
+                if public_key:
+                    private_key = response_data.get('motherWalletPrivateKeyBase58', '')
                     
                     logger.info(f"Successfully extracted mother wallet address: {public_key}")
                     
@@ -708,12 +1190,11 @@ class ApiClient:
                 }
                 return fallback_wallet
             
-            # Extract wallet address directly from response text
+            # Decode the body once, tolerating malformed JSON
             try:
-                import re
-                match = re.search(r'"motherWalletPublicKey"\s*:\s*"([^"]+)"', response.text)
-                if match:
-                    public_key = match.group(1)
+                response_data = self._decode_response(response)
+                public_key = response_data.get('motherWalletPublicKey') if isinstance(response_data, dict) else None
+                if public_key:
                     logger.info(f"Successfully extracted imported wallet address: {public_key}")
                     # Store the mother wallet address for future health checks
                     self._latest_mother_wallet = public_key
@@ -753,6 +1234,36 @@ class ApiClient:
             logger.error(f"Error importing wallet: {str(e)}")
             raise ApiClientError(f"Failed to import wallet: {str(e)}")
     
+    @staticmethod
+    def _child_wallets_from_payload(payload: Any) -> List[Dict[str, Any]]:
+        """
+        Convert a decoded /api/wallets/children payload into child wallet dicts.
+        
+        Args:
+            payload: Decoded response body
+            
+        Returns:
+            List of child wallet information (empty if the payload has no childWallets)
+        """
+        children = ChildWalletsResponse.from_payload(payload)
+        if children is None:
+            return []
+        
+        child_wallets = []
+        for child in children.wallets:
+            # Enhanced logging for private key retrieval
+            if child.private_key:
+                logger.debug(f"Child wallet {child.address} (index {child.index}): private key retrieved.")
+            else:
+                logger.warning(f"Child wallet {child.address} (index {child.index}): private key 'privateKeyBase58' NOT found in API response object for this child.")
+            
+            child_wallets.append({
+                'address': child.address,
+                'private_key': child.private_key,  # Store private key if available
+                'index': child.index
+            })
+        return child_wallets
+    
     def derive_child_wallets(self, n: int, mother_wallet: str) -> List[Dict[str, Any]]:
         """
         Derive child wallets from a mother wallet.
@@ -791,36 +1302,18 @@ class ApiClient:
                 response_data = self._make_request_with_retry('post', '/api/wallets/children', json=payload)
                 
                 # Check if response contains childWallets array
-                if isinstance(response_data, dict) and 'childWallets' in response_data:
-                    child_wallets = []
-                    for i, child in enumerate(response_data['childWallets']):
-                        if isinstance(child, dict) and 'publicKey' in child:
-                            # Fix: Use privateKeyBase58 instead of privateKey
-                            priv_key = child.get('privateKeyBase58', '')
-                            
-                            # Enhanced logging for private key retrieval
-                            if priv_key:
-                                logger.debug(f"Child wallet {child['publicKey']} (index {i}): private key retrieved.")
-                            else:
-                                logger.warning(f"Child wallet {child['publicKey']} (index {i}): private key 'privateKeyBase58' NOT found in API response object for this child.")
-                            
-                            child_wallets.append({
-                                'address': child['publicKey'],
-                                'private_key': priv_key,  # Store private key if available
-                                'index': i
-                            })
+                child_wallets = self._child_wallets_from_payload(response_data)
+                if child_wallets:
+                    logger.info(f"Successfully derived {len(child_wallets)} child wallets")
                     
-                    if child_wallets:
-                        logger.info(f"Successfully derived {len(child_wallets)} child wallets")
-                        
-                        # Save child wallets data
-                        self.save_wallet_data('children', {
-                            'mother_address': mother_wallet,
-                            'wallets': child_wallets,
-                            'created_at': time.time()
-                        })
-                        
-                        return child_wallets
+                    # Save child wallets data
+                    self.save_wallet_data('children', {
+                        'mother_address': mother_wallet,
+                        'wallets': child_wallets,
+                        'created_at': time.time()
+                    })
+                    
+                    return child_wallets
             except Exception as api_error:
                 logger.warning(f"Standard API call failed for child wallets, trying direct call: {str(api_error)}")
             
@@ -842,31 +1335,11 @@ class ApiClient:
                     for i in range(n)
                 ]
             
-            # Extract wallet addresses and private keys using regex to avoid JSON parsing issues
+            # Decode the body once, tolerating malformed or truncated JSON
             try:
-                # Find all public keys and private keys in the response
-                public_key_matches = re.findall(r'"publicKey"\s*:\s*"([^"]+)"', response.text)
-                # Fix: Search for privateKeyBase58 instead of privateKey
-                private_key_matches = re.findall(r'"privateKeyBase58"\s*:\s*"([^"]+)"', response.text)
+                child_wallets = self._child_wallets_from_payload(self._decode_response(response))
                 
-                if public_key_matches and len(public_key_matches) == n:
-                    child_wallets = []
-                    for i, addr in enumerate(public_key_matches):
-                        # Try to get corresponding private key if available
-                        private_key = private_key_matches[i] if i < len(private_key_matches) else ''
-                        
-                        # Enhanced logging for private key retrieval in regex fallback
-                        if private_key:
-                            logger.debug(f"Child wallet {addr} (index {i}): private key extracted via regex from direct call.")
-                        else:
-                            logger.warning(f"Child wallet {addr} (index {i}): private key 'privateKeyBase58' NOT found via regex in direct call response.")
-                        
-                        child_wallets.append({
-                            'address': addr,
-                            'private_key': private_key,
-                            'index': i
-                        })
-                    
+                if child_wallets and len(child_wallets) == n:
                     logger.info(f"Successfully extracted {len(child_wallets)} child wallet addresses")
                     
                     # Save child wallets data
@@ -1317,15 +1790,10 @@ class ApiClient:
         while time.time() - start_time < max_wait_time:
             # Check balance
             try:
-                balance_info = self.check_balance(wallet_address)
+                balance_info = await self.check_balance_async(wallet_address, fresh=True)
                 
                 # Extract SOL balance
-                current_balance = 0
-                if "balances" in balance_info:
-                    for token_balance in balance_info["balances"]:
-                        if token_balance.get("symbol") == "SOL":
-                            current_balance = token_balance.get("amount", 0)
-                            break
+                current_balance = self._extract_sol_balance(balance_info)
                 
                 result["final_balance"] = current_balance
                 result["difference"] = current_balance - initial_balance
@@ -1408,119 +1876,81 @@ class ApiClient:
         
         return result
     
-    def _verify_balance_change_sync(self, wallet_address: str, initial_balance: float, 
-                                   target_balance: float, max_wait_time: int = 60, 
-                                   check_interval: int = 5) -> Dict[str, Any]:
+    def _assess_funding_balance(self, result: Dict[str, Any], current_balance: float, initial_balance: float,
+                                target_balance: float, balance_checks: int, elapsed: float) -> Tuple[bool, bool]:
         """
-        Synchronous version of balance change verification to avoid event loop conflicts.
+        Record one balance observation and decide whether the funding is confirmed.
         
         Args:
-            wallet_address: Wallet address to monitor
+            result: Verification result being built (updated in place)
+            current_balance: Balance observed on this check
             initial_balance: Initial balance before transfer
             target_balance: Expected balance after transfer
-            max_wait_time: Maximum time to wait in seconds
-            check_interval: Interval between checks in seconds
+            balance_checks: Number of checks made so far, including this one
+            elapsed: Seconds since verification started
             
         Returns:
-            Dictionary with verification result
+            Tuple of (verified, significant_change_detected) for this observation
         """
-        logger.info(f"Verifying wallet {wallet_address} balance change from {initial_balance} to {target_balance}")
-        
-        start_time = time.time()
-        result = {
-            "verified": False,
-            "initial_balance": initial_balance,
-            "target_balance": target_balance,
-            "final_balance": initial_balance,
-            "difference": 0,
-            "duration": 0,
-            "balance_history": []
-        }
-        
-        # Track balance changes over time to detect any positive movement
-        balance_checks = 0
-        significant_change_detected = False
         expected_change = target_balance - initial_balance
+        significant_change_detected = False
         
-        while time.time() - start_time < max_wait_time:
-            # Check balance
-            try:
-                balance_info = self.check_balance(wallet_address)
-                
-                # Extract SOL balance
-                current_balance = 0
-                if "balances" in balance_info:
-                    for token_balance in balance_info["balances"]:
-                        if token_balance.get("symbol") == "SOL":
-                            current_balance = token_balance.get("amount", 0)
-                            break
-                
-                result["final_balance"] = current_balance
-                result["difference"] = current_balance - initial_balance
-                balance_checks += 1
-                
-                # Record balance history for debugging
-                result["balance_history"].append({
-                    "time": time.time() - start_time,
-                    "balance": current_balance,
-                    "change": current_balance - initial_balance
-                })
-                
-                # Calculate actual balance change
-                balance_change = current_balance - initial_balance
-                
-                # OPTIMIZED DETECTION: Check for successful funding early
-                # 1. If balance increased significantly (any positive change > 0.001 SOL), likely successful
-                if balance_change > 0.001:
-                    logger.info(f"✅ Significant balance increase detected: +{balance_change:.6f} SOL (from {initial_balance} to {current_balance})")
-                    significant_change_detected = True
-                    
-                    # If balance increased by at least 50% of expected amount, consider successful
-                    if balance_change >= (expected_change * 0.5):
-                        logger.info(f"✅ Balance change is sufficient (≥50% of expected): {balance_change:.6f} vs expected {expected_change:.6f} SOL")
-                        result["verified"] = True
-                        break
-                
-                # 2. Check if balance matches target (with tolerance for fees/rounding)
-                balance_tolerance = max(0.0001, abs(expected_change) * 0.05)  # 5% tolerance or 0.0001 SOL minimum
-                if abs(current_balance - target_balance) <= balance_tolerance:
-                    logger.info(f"✅ Balance reached target within tolerance: {current_balance} SOL (target: {target_balance} SOL)")
-                    result["verified"] = True
-                    break
-                
-                # 3. Early verification for any positive change after minimal checks
-                if balance_checks >= 2 and balance_change > 0.0001:  # Any meaningful increase
-                    logger.info(f"✅ Balance increase detected: +{balance_change:.6f} SOL")
-                    significant_change_detected = True
-                    
-                    # Accept any reasonable positive change early (for quick funding confirmation)
-                    if balance_change >= (expected_change * 0.3):  # At least 30% of expected
-                        logger.info(f"✅ Accepting balance increase as successful funding (early detection)")
-                        result["verified"] = True
-                        break
-                
-                # 4. For very small expected changes, be more lenient
-                if abs(expected_change) < 0.01 and balance_change > 0:  # For small transfers
-                    logger.info(f"✅ Small transfer detected, accepting any positive change: +{balance_change:.6f} SOL")
-                    result["verified"] = True
-                    break
-                
-                # Log progress
-                if balance_change != 0:
-                    logger.info(f"Balance change: {balance_change:+.6f} SOL (from {initial_balance} to {current_balance})")
-                else:
-                    logger.info(f"No balance change yet: {current_balance} SOL (check {balance_checks})")
-            
-            except Exception as e:
-                logger.warning(f"Error checking balance during verification: {str(e)}")
-            
-            # Use shorter wait times for faster verification
-            actual_wait = min(check_interval, 3)  # Cap at 3 seconds for faster checks
-            logger.info(f"Waiting {actual_wait}s for balance to update... ({int(time.time() - start_time)}s elapsed)")
-            time.sleep(actual_wait)
-        
-        result["duration"] = time.time() - start_time
+        result["final_balance"] = current_balance
+        result["difference"] = current_balance - initial_balance
+        
+        # Record balance history for debugging
+        result["balance_history"].append({
+            "time": elapsed,
+            "balance": current_balance,
+            "change": current_balance - initial_balance
+        })
+        
+        # Calculate actual balance change
+        balance_change = current_balance - initial_balance
+        
+        # OPTIMIZED DETECTION: Check for successful funding early
+        # 1. If balance increased significantly (any positive change > 0.001 SOL), likely successful
+        if balance_change > 0.001:
+            logger.info(f"✅ Significant balance increase detected: +{balance_change:.6f} SOL (from {initial_balance} to {current_balance})")
+            significant_change_detected = True
+            
+            # If balance increased by at least 50% of expected amount, consider successful
+            if balance_change >= (expected_change * 0.5):
+                logger.info(f"✅ Balance change is sufficient (≥50% of expected): {balance_change:.6f} vs expected {expected_change:.6f} SOL")
+                return True, significant_change_detected
+        
+        # 2. Check if balance matches target (with tolerance for fees/rounding)
+        balance_tolerance = max(0.0001, abs(expected_change) * 0.05)  # 5% tolerance or 0.0001 SOL minimum
+        if abs(current_balance - target_balance) <= balance_tolerance:
+            logger.info(f"✅ Balance reached target within tolerance: {current_balance} SOL (target: {target_balance} SOL)")
+            return True, significant_change_detected
+        
+        # 3. Early verification for any positive change after minimal checks
+        if balance_checks >= 2 and balance_change > 0.0001:  # Any meaningful increase
+            logger.info(f"✅ Balance increase detected: +{balance_change:.6f} SOL")
+            significant_change_detected = True
+            
+            # Accept any reasonable positive change early (for quick funding confirmation)
+            if balance_change >= (expected_change * 0.3):  # At least 30% of expected
+                logger.info(f"✅ Accepting balance increase as successful funding (early detection)")
+                return True, significant_change_detected
+        
+        # 4. For very small expected changes, be more lenient
+        if abs(expected_change) < 0.01 and balance_change > 0:  # For small transfers
+            logger.info(f"✅ Small transfer detected, accepting any positive change: +{balance_change:.6f} SOL")
+            return True, significant_change_detected
+        
+        # Log progress
+        if balance_change != 0:
+            logger.info(f"Balance change: {balance_change:+.6f} SOL (from {initial_balance} to {current_balance})")
+        else:
+            logger.info(f"No balance change yet: {current_balance} SOL (check {balance_checks})")
         
+        return False, significant_change_detected
+
+    def _finalize_balance_verification(self, result: Dict[str, Any], wallet_address: str,
+                                       significant_change_detected: bool, max_wait_time: int) -> Dict[str, Any]:
+        """Apply the lenient final criteria to a funding verification result and log a summary."""
         # Final evaluation with more lenient criteria
         if not result["verified"]:
             # Accept ANY positive balance change as success for funding verification
@@ -1544,7 +1974,7 @@ class ApiClient:
         logger.info(f"  Duration: {result['duration']:.1f}s")
         
         return result
-    
+
     async def verify_transaction(self, from_wallet: str, to_wallet: str, 
                                amount: float, max_wait_time: int = 60,
                                check_interval: int = 5) -> Dict[str, Any]:
@@ -1565,21 +1995,13 @@ class ApiClient:
         
         # Get initial balances
         try:
-            # Get initial from_wallet balance
-            from_balance_info = self.check_balance(from_wallet)
-            initial_from_balance = 0
-            for token_balance in from_balance_info.get("balances", []):
-                if token_balance.get("symbol") == "SOL":
-                    initial_from_balance = token_balance.get("amount", 0)
-                    break
-            
-            # Get initial to_wallet balance
-            to_balance_info = self.check_balance(to_wallet)
-            initial_to_balance = 0
-            for token_balance in to_balance_info.get("balances", []):
-                if token_balance.get("symbol") == "SOL":
-                    initial_to_balance = token_balance.get("amount", 0)
-                    break
+            # Get initial from_wallet and to_wallet balances
+            from_balance_info, to_balance_info = await asyncio.gather(
+                self.check_balance_async(from_wallet, fresh=True),
+                self.check_balance_async(to_wallet, fresh=True)
+            )
+            initial_from_balance = self._extract_sol_balance(from_balance_info)
+            initial_to_balance = self._extract_sol_balance(to_balance_info)
             
             logger.info(f"Initial balances - From: {initial_from_balance} SOL, To: {initial_to_balance} SOL")
             
@@ -1647,10 +2069,14 @@ class ApiClient:
                                         amount: float, max_wait_time: int = 30,
                                         check_interval: int = 5,
                                         initial_sender_balance: float = None,
-                                        initial_receiver_balance: float = None) -> Dict[str, Any]:
+                                        initial_receiver_balance: float = None,
+                                        signature: Optional[str] = None) -> Dict[str, Any]:
         """
         Enhanced transaction verification with multiple strategies and longer timeouts.
         
+        When the transaction signature is known it is confirmed through the signature-status
+        endpoint first; balance diffing is only used if the signature does not settle.
+        
         Args:
             from_wallet: Sender wallet address
             to_wallet: Receiver wallet address
@@ -1659,6 +2085,7 @@ class ApiClient:
             check_interval: Balance check interval in seconds (default: 10)
             initial_sender_balance: Pre-transaction sender balance (if known)
             initial_receiver_balance: Pre-transaction receiver balance (if known)
+            signature: Transaction signature, if the backend returned one
             
         Returns:
             Dictionary with enhanced verification results
@@ -1669,22 +2096,30 @@ class ApiClient:
         verification_attempts = []
         
         try:
+            if signature:
+                status = (await self.confirm_signatures_async([signature], timeout=max_wait_time)).get(signature)
+                if status is not None and (status.failed or status.reached(signature_status_client.commitment)):
+                    return {
+                        "verified": not status.failed,
+                        "verification_method": "signature_status",
+                        "signature": signature,
+                        "slot": status.slot,
+                        "error": status.err,
+                        "amount": amount,
+                        "duration": time.time() - start_time,
+                        "attempts": verification_attempts
+                    }
+                logger.info(f"Signature {signature} did not settle; falling back to balance verification")
+            
             # Get initial balances if not provided
             if initial_sender_balance is None or initial_receiver_balance is None:
                 try:
-                    from_balance_info = self.check_balance(from_wallet)
-                    initial_sender_balance = 0
-                    for token_balance in from_balance_info.get("balances", []):
-                        if token_balance.get("symbol") == "SOL":
-                            initial_sender_balance = token_balance.get("amount", 0)
-                            break
-                    
-                    to_balance_info = self.check_balance(to_wallet)
-                    initial_receiver_balance = 0
-                    for token_balance in to_balance_info.get("balances", []):
-                        if token_balance.get("symbol") == "SOL":
-                            initial_receiver_balance = token_balance.get("amount", 0)
-                            break
+                    from_balance_info, to_balance_info = await asyncio.gather(
+                        self.check_balance_async(from_wallet, fresh=True),
+                        self.check_balance_async(to_wallet, fresh=True)
+                    )
+                    initial_sender_balance = self._extract_sol_balance(from_balance_info)
+                    initial_receiver_balance = self._extract_sol_balance(to_balance_info)
                             
                 except Exception as e:
                     logger.warning(f"Error getting initial balances for enhanced verification: {str(e)}")
@@ -1715,21 +2150,13 @@ class ApiClient:
                         
                         # Get sender balance
                         try:
-                            from_balance_info = self.check_balance(from_wallet)
-                            for token_balance in from_balance_info.get("balances", []):
-                                if token_balance.get("symbol") == "SOL":
-                                    current_sender_balance = token_balance.get("amount", 0)
-                                    break
+                            current_sender_balance = self._extract_sol_balance(await self.check_balance_async(from_wallet, fresh=True))
                         except Exception as e:
                             logger.warning(f"Error checking sender balance: {str(e)}")
                         
                         # Get receiver balance
                         try:
-                            to_balance_info = self.check_balance(to_wallet)
-                            for token_balance in to_balance_info.get("balances", []):
-                                if token_balance.get("symbol") == "SOL":
-                                    current_receiver_balance = token_balance.get("amount", 0)
-                                    break
+                            current_receiver_balance = self._extract_sol_balance(await self.check_balance_async(to_wallet, fresh=True))
                         except Exception as e:
                             logger.warning(f"Error checking receiver balance: {str(e)}")
                         
@@ -1831,58 +2258,60 @@ class ApiClient:
                 "attempts": verification_attempts
             }
     
-    def fund_child_wallets(self, mother_wallet: str, child_wallets: List[str], token_address: str, amount_per_wallet: float, 
-                      mother_private_key: str = None, priority_fee: int = 25000, batch_id: str = None,
-                      idempotency_key: str = None, verify_transfers: bool = True) -> Dict[str, Any]:
-        """Fund child wallets with calculated amounts based on volume requirements"""
-        
+    @staticmethod
+    def _normalize_funding_amount(amount_per_wallet: float) -> float:
+        """Enforce the absolute minimum funding amount per child wallet."""
         # Calculate minimum required amount: basic swap minimum (0.0001) + gas buffer (0.0015) 
         absolute_minimum = 0.0016  # Absolute minimum for basic functionality
         
         # Only enforce absolute minimum, don't override user's volume-based calculations
         if amount_per_wallet < absolute_minimum:
             logger.warning(f"Requested funding amount {amount_per_wallet} is below absolute minimum {absolute_minimum}, adjusting...")
-            amount_per_wallet = absolute_minimum
-        else:
-            logger.info(f"Using calculated funding amount: {amount_per_wallet} SOL per wallet")
-            
-        if self.use_mock:
-            # Mock successful funding operation
-            return {
-                "status": "success",
-                "funded_wallets": len(child_wallets),
-                "transactions": [
-                    {"tx_id": f"mock_tx_{i}", "status": "confirmed"}
-                    for i in range(len(child_wallets))
-                ]
-            }
+            return absolute_minimum
         
-        # Generate a batch ID if not provided
-        if not batch_id:
-            batch_id = self.generate_batch_id()
+        logger.info(f"Using calculated funding amount: {amount_per_wallet} SOL per wallet")
+        return amount_per_wallet
+
+    @staticmethod
+    def _mock_funding_result(child_wallets: List[str]) -> Dict[str, Any]:
+        """Build a mock successful funding operation result."""
+        return {
+            "status": "success",
+            "funded_wallets": len(child_wallets),
+            "transactions": [
+                {"tx_id": f"mock_tx_{i}", "status": "confirmed"}
+                for i in range(len(child_wallets))
+            ]
+        }
+
+    def _select_wallets_to_fund(self, mother_wallet: str, child_wallets: List[str], amount_per_wallet: float,
+                                current_balances: Dict[str, float],
+                                idempotency_key: str = None) -> Tuple[List[Dict[str, Any]], set]:
+        """
+        Deduplicate child wallets and drop those that already hold enough SOL.
         
+        Args:
+            mother_wallet: Mother wallet address
+            child_wallets: Child wallet addresses requested for funding
+            amount_per_wallet: Amount of SOL per child wallet
+            current_balances: Known SOL balances of the child wallets
+            idempotency_key: Optional idempotency key for the batch
+            
+        Returns:
+            Tuple of (formatted child wallet entries for the API, set of already funded wallets)
+        """
         # Check for duplicate requests - store already processed wallets
         processed_wallets = set()
         
         # Check which wallets already have sufficient balance to avoid unnecessary funding
         already_funded_wallets = set()
-        for child_wallet in child_wallets:
-            try:
-                balance_info = self.check_balance(child_wallet)
-                current_balance = 0
-                for token_balance in balance_info.get("balances", []):
-                    if token_balance.get("symbol") == "SOL":
-                        current_balance = token_balance.get("amount", 0)
-                        break
-                
-                # If wallet already has sufficient balance (more than 80% of target), skip funding
-                if current_balance >= (amount_per_wallet * 0.8):
-                    logger.info(f"Wallet {child_wallet} already has sufficient balance ({current_balance} SOL), skipping funding")
-                    already_funded_wallets.add(child_wallet)
-            except Exception as e:
-                logger.warning(f"Could not check existing balance for {child_wallet}: {str(e)}")
+        for child_wallet, current_balance in current_balances.items():
+            # If wallet already has sufficient balance (more than 80% of target), skip funding
+            if current_balance >= (amount_per_wallet * 0.8):
+                logger.info(f"Wallet {child_wallet} already has sufficient balance ({current_balance} SOL), skipping funding")
+                already_funded_wallets.add(child_wallet)
         
-                                                            # Format child wallets exactly as in test_specific_transfers.py
+        # Format child wallets exactly as in test_specific_transfers.py
         formatted_child_wallets = []
         for i, child_wallet in enumerate(child_wallets):
             # Skip if wallet already in the processed set (duplicate)
@@ -1912,23 +2341,526 @@ class ApiClient:
                 "operationId": operation_id
             })
         
-        # If no valid wallets after deduplication and funding checks, return early
-        if not formatted_child_wallets:
-            if already_funded_wallets:
-                logger.info(f"All {len(already_funded_wallets)} child wallets already have sufficient funding")
-                return {
-                    "status": "success",
-                    "message": f"All {len(already_funded_wallets)} child wallets already funded",
-                    "already_funded_wallets": len(already_funded_wallets),
-                    "successful_transfers": len(already_funded_wallets),
-                    "failed_transfers": 0
-                }
+        return formatted_child_wallets, already_funded_wallets
+
+    @staticmethod
+    def _nothing_to_fund_result(already_funded_wallets: set) -> Dict[str, Any]:
+        """Build the early-return result used when no child wallet needs funding."""
+        if already_funded_wallets:
+            logger.info(f"All {len(already_funded_wallets)} child wallets already have sufficient funding")
+            return {
+                "status": "success",
+                "message": f"All {len(already_funded_wallets)} child wallets already funded",
+                "already_funded_wallets": len(already_funded_wallets),
+                "successful_transfers": len(already_funded_wallets),
+                "failed_transfers": 0
+            }
+        
+        logger.warning(f"No valid child wallets to fund after deduplication")
+        return {
+            "status": "skipped",
+            "message": "No valid child wallets to fund after deduplication"
+        }
+
+    @staticmethod
+    def _build_funding_payload(mother_private_key: str, formatted_child_wallets: List[Dict[str, Any]],
+                               priority_fee: int) -> Dict[str, Any]:
+        """Build the /api/wallets/fund-children payload exactly matching the API specification."""
+        funding_payload = {
+            "motherWalletPrivateKeyBase58": mother_private_key,
+            "childWallets": formatted_child_wallets
+        }
+        
+        # Only add optional fields if they have values
+        if priority_fee and priority_fee != 25000:  # Only add if different from default
+            funding_payload["priorityFee"] = priority_fee
+        
+        return funding_payload
+
+    @staticmethod
+    def _new_funding_result(batch_id: str, already_funded_wallets: set) -> Dict[str, Any]:
+        """Build the initial result structure for a funding operation."""
+        return {
+            "batch_id": batch_id,
+            "status": "unknown",
+            "api_response": None,
+            "verification_results": [],
+            "successful_transfers": len(already_funded_wallets),  # Count already funded wallets as successful
+            "failed_transfers": 0,
+            "already_funded_wallets": len(already_funded_wallets),
+            "newly_funded_wallets": 0,
+            "api_timeout": False
+        }
+
+    @staticmethod
+    def _extract_transfer_signatures(api_result: Any, recipients: List[str]) -> Dict[str, str]:
+        """
+        Map each recipient to the transaction signature the backend returned for its transfer.
+        
+        Args:
+            api_result: Decoded response of a multi-transfer endpoint
+            recipients: Recipient addresses in request order
+            
+        Returns:
+            Dictionary mapping recipient address to signature, for transfers that reported one
+        """
+        if not isinstance(api_result, dict):
+            return {}
+        data = api_result.get("data") if isinstance(api_result.get("data"), dict) else api_result
+        entries = next((data[key] for key in ("results", "transfers") if isinstance(data.get(key), list)), [])
+        
+        wanted = set(recipients)
+        signatures = {}
+        for index, entry in enumerate(entries):
+            if not isinstance(entry, dict):
+                continue
+            signature = next((entry[key] for key in TRANSFER_SIGNATURE_KEYS if is_signature(entry.get(key))), None)
+            if signature is None:
+                continue
+            recipient = next((entry[key] for key in TRANSFER_RECIPIENT_KEYS if entry.get(key) in wanted), None)
+            if recipient is None and len(entries) == len(recipients):
+                # Entries without an address are reported in request order
+                recipient = recipients[index]
+            if recipient is not None:
+                signatures[recipient] = signature
+        return signatures
+    
+    def _record_signature_confirmations(self, result: Dict[str, Any], signatures: Dict[str, str],
+                                        statuses: Dict[str, SignatureStatus]) -> set:
+        """
+        Record funding transfers settled by their signature status.
+        
+        Args:
+            result: Funding result being built
+            signatures: Recipient address to transfer signature
+            statuses: Signature to last known status
+            
+        Returns:
+            Recipients whose transfer confirmed or failed, which need no balance check
+        """
+        settled = set()
+        for recipient, signature in signatures.items():
+            status = statuses.get(signature)
+            if status is None:
+                continue
+            if status.failed:
+                verification_result = {"verified": False, "error": f"Transaction {signature} failed: {status.err}"}
+            elif status.reached(signature_status_client.commitment):
+                verification_result = {"verified": True, "slot": status.slot}
             else:
-                logger.warning(f"No valid child wallets to fund after deduplication")
-                return {
-                    "status": "skipped",
-                    "message": "No valid child wallets to fund after deduplication"
+                continue
+            verification_result.update({"signature": signature, "verification_method": "signature_status"})
+            self._record_funding_verification(result, recipient, verification_result)
+            settled.add(recipient)
+        return settled
+
+    @staticmethod
+    def _record_funding_verification(result: Dict[str, Any], child_address: str,
+                                     verification_result: Dict[str, Any]) -> None:
+        """Add one child wallet verification outcome to the funding result."""
+        # Add wallet address to result
+        verification_result["wallet_address"] = child_address
+        
+        # Track successful and failed transfers
+        if verification_result.get("verified"):
+            result["successful_transfers"] += 1
+            result["newly_funded_wallets"] += 1
+            if verification_result.get("verification_method") == "signature_status":
+                logger.info(f"✅ Verified funding for {child_address}: transaction {verification_result['signature']} confirmed")
+            else:
+                logger.info(f"✅ Verified funding for {child_address}: {verification_result.get('final_balance')} SOL")
+        elif "error" in verification_result:
+            logger.error(f"Error verifying transfer to {child_address}: {verification_result['error']}")
+            result["failed_transfers"] += 1
+        else:
+            result["failed_transfers"] += 1
+            logger.warning(f"❌ Failed to verify funding for {child_address}: expected change not detected")
+            
+        # Add to verification results
+        result["verification_results"].append(verification_result)
+
+    @staticmethod
+    def _apply_mother_balance_evidence(result: Dict[str, Any], initial_mother_balance: float,
+                                       final_mother_balance: float, formatted_child_wallets: List[Dict[str, Any]],
+                                       already_funded_wallets: set, amount_per_wallet: float) -> None:
+        """Use the mother wallet balance decrease as evidence of funding when child checks were inconclusive."""
+        mother_balance_change = initial_mother_balance - final_mother_balance
+        expected_total_spent = len(formatted_child_wallets) * amount_per_wallet
+        
+        logger.info(f"Mother wallet balance change: {mother_balance_change:.6f} SOL (expected: ~{expected_total_spent:.6f} SOL)")
+        
+        # If mother wallet balance decreased significantly, consider it evidence of successful funding
+        if mother_balance_change > (expected_total_spent * 0.5):  # At least 50% of expected amount
+            logger.info(f"✅ Mother wallet balance decreased by {mother_balance_change:.6f} SOL, indicating successful funding")
+            
+            # If we had verification failures but mother wallet shows spending, mark as partial success
+            if result["failed_transfers"] > 0 and result["newly_funded_wallets"] == 0:
+                logger.info("Adjusting status based on mother wallet balance evidence")
+                # Assume all wallets were funded based on mother wallet evidence
+                result["newly_funded_wallets"] = len(formatted_child_wallets)
+                result["successful_transfers"] = len(already_funded_wallets) + len(formatted_child_wallets)
+                result["failed_transfers"] = 0
+
+    @staticmethod
+    def _finalize_funding_status(result: Dict[str, Any], formatted_child_wallets: List[Dict[str, Any]],
+                                 already_funded_wallets: set) -> None:
+        """Update the overall funding status based on verification results."""
+        total_expected = len(formatted_child_wallets) + len(already_funded_wallets)
+        if result["successful_transfers"] == total_expected:
+            result["status"] = "success"
+        elif result["successful_transfers"] > 0:
+            result["status"] = "partial_success"
+        elif result["api_timeout"] and result["newly_funded_wallets"] == 0:
+            # Special case: API timeout but no verified funding - still might be processing
+            result["status"] = "timeout_pending_verification"
+            logger.warning("API timed out and verification inconclusive - transactions may still be processing")
+        else:
+            result["status"] = "failed"
+        
+        logger.info(f"Transfer verification completed: {result['successful_transfers']} total successful ({result['already_funded_wallets']} already funded, {result['newly_funded_wallets']} newly funded), {result['failed_transfers']} failed")
+
+    @staticmethod
+    def _start_funding_probes(children: List[Dict[str, Any]],
+                              initial_balances: Dict[str, float]) -> Dict[str, Dict[str, Any]]:
+        """Build the per-wallet probe state for balance-confirming a set of funded children."""
+        probes = {}
+        for child in children:
+            initial_balance = initial_balances.get(child["publicKey"], 0)
+            probes[child["publicKey"]] = {
+                "checks": 0,
+                "significant": False,
+                "result": {
+                    "verified": False,
+                    "initial_balance": initial_balance,
+                    "target_balance": initial_balance + child["amountSol"],
+                    "final_balance": initial_balance,
+                    "difference": 0,
+                    "duration": 0,
+                    "balance_history": []
                 }
+            }
+        return probes
+
+    def _assess_funding_probes(self, probes: Dict[str, Dict[str, Any]], balances: Dict[str, int],
+                               elapsed: float) -> List[str]:
+        """
+        Assess one batched balance read of the children still awaiting their funding.
+        
+        Args:
+            probes: Probe state from _start_funding_probes() (updated in place)
+            balances: Lamports read this round; unreadable wallets are absent
+            elapsed: Seconds since probing started
+            
+        Returns:
+            Addresses not verified yet
+        """
+        for address, lamports in balances.items():
+            probe = probes.get(address)
+            if probe is None or probe["result"]["verified"]:
+                continue
+            probe["checks"] += 1
+            result = probe["result"]
+            verified, significant = self._assess_funding_balance(
+                result, lamports / 1_000_000_000, result["initial_balance"],
+                result["target_balance"], probe["checks"], elapsed
+            )
+            probe["significant"] = probe["significant"] or significant
+            result["verified"] = verified
+        return [address for address, probe in probes.items() if not probe["result"]["verified"]]
+
+    def _finish_funding_probes(self, probes: Dict[str, Dict[str, Any]], elapsed: float,
+                               timeout: float) -> Dict[str, Dict[str, Any]]:
+        """Apply the final criteria to every probed wallet and return address -> verification result."""
+        results = {}
+        for address, probe in probes.items():
+            probe["result"]["duration"] = elapsed
+            results[address] = self._finalize_balance_verification(
+                probe["result"], address, probe["significant"], int(timeout)
+            )
+        return results
+
+    def _probe_funded_balances(self, children: List[Dict[str, Any]], initial_balances: Dict[str, float],
+                               timeout: float = FUNDING_CONFIRM_TIMEOUT) -> Dict[str, Dict[str, Any]]:
+        """
+        Watch funded children until each shows its transfer or the timeout passes.
+        
+        The first read is made immediately. Each round reads every wallet not yet verified
+        in one batched check_balances() call, and the delay between rounds backs off from
+        FUNDING_PROBE_MIN_INTERVAL to FUNDING_PROBE_MAX_INTERVAL.
+        
+        Args:
+            children: Funded children as {"publicKey", "amountSol"} dictionaries
+            initial_balances: SOL balances read before the transfer
+            timeout: Seconds to keep probing
+            
+        Returns:
+            Dictionary mapping each child address to its verification result
+        """
+        probes = self._start_funding_probes(children, initial_balances)
+        pending = list(probes)
+        interval = AdaptiveInterval(FUNDING_PROBE_MIN_INTERVAL, FUNDING_PROBE_MAX_INTERVAL)
+        start_time = time.time()
+        
+        while pending:
+            try:
+                balances = self.check_balances(pending, fresh=True)
+            except Exception as e:
+                logger.warning(f"Error checking balances during funding verification: {str(e)}")
+                balances = {}
+            pending = self._assess_funding_probes(probes, balances, time.time() - start_time)
+            remaining = timeout - (time.time() - start_time)
+            if not pending or remaining <= 0:
+                break
+            interval.on_unchanged()
+            time.sleep(min(interval.next_delay(), remaining))
+        
+        return self._finish_funding_probes(probes, time.time() - start_time, timeout)
+
+    async def _probe_funded_balances_async(self, children: List[Dict[str, Any]], initial_balances: Dict[str, float],
+                                           timeout: float = FUNDING_CONFIRM_TIMEOUT) -> Dict[str, Dict[str, Any]]:
+        """
+        Awaitable version of _probe_funded_balances().
+        
+        Args:
+            children: Funded children as {"publicKey", "amountSol"} dictionaries
+            initial_balances: SOL balances read before the transfer
+            timeout: Seconds to keep probing
+            
+        Returns:
+            Dictionary mapping each child address to its verification result
+        """
+        probes = self._start_funding_probes(children, initial_balances)
+        pending = list(probes)
+        interval = AdaptiveInterval(FUNDING_PROBE_MIN_INTERVAL, FUNDING_PROBE_MAX_INTERVAL)
+        start_time = time.time()
+        
+        while pending:
+            try:
+                balances = await self.check_balances_async(pending, fresh=True)
+            except Exception as e:
+                logger.warning(f"Error checking balances during funding verification: {str(e)}")
+                balances = {}
+            pending = self._assess_funding_probes(probes, balances, time.time() - start_time)
+            remaining = timeout - (time.time() - start_time)
+            if not pending or remaining <= 0:
+                break
+            interval.on_unchanged()
+            await trade_scheduler.sleep(min(interval.next_delay(), remaining))
+        
+        return self._finish_funding_probes(probes, time.time() - start_time, timeout)
+
+    def _read_sol_balance(self, wallet_address: str) -> Optional[float]:
+        """Read one wallet's SOL balance uncached, or None if it cannot be read."""
+        lamports = self.check_balances([wallet_address], fresh=True).get(wallet_address)
+        return lamports / 1_000_000_000 if lamports is not None else None
+
+    async def _read_sol_balance_async(self, wallet_address: str) -> Optional[float]:
+        """Awaitable version of _read_sol_balance()."""
+        lamports = (await self.check_balances_async([wallet_address], fresh=True)).get(wallet_address)
+        return lamports / 1_000_000_000 if lamports is not None else None
+
+    @staticmethod
+    def _mother_debit_seen(initial_balance: float, balance: Optional[float], expected_debit: float) -> bool:
+        """Whether the mother wallet has been debited by at least half of the funded total."""
+        return balance is not None and initial_balance - balance >= expected_debit * 0.5
+
+    def _watch_mother_debit(self, mother_wallet: str, initial_balance: float, expected_debit: float,
+                            children_done: threading.Event) -> Optional[float]:
+        """
+        Probe the mother wallet until its debit shows or the children's confirmation ends.
+        
+        Args:
+            mother_wallet: Mother wallet address
+            initial_balance: Mother SOL balance before the funding
+            expected_debit: Total SOL sent to the children
+            children_done: Set when the children's confirmation has finished
+            
+        Returns:
+            Last mother SOL balance read, or None if it could not be read
+        """
+        interval = AdaptiveInterval(FUNDING_PROBE_MIN_INTERVAL, FUNDING_PROBE_MAX_INTERVAL)
+        balance = None
+        while True:
+            try:
+                balance = self._read_sol_balance(mother_wallet)
+            except Exception as e:
+                logger.warning(f"Could not read mother wallet balance: {str(e)}")
+            if self._mother_debit_seen(initial_balance, balance, expected_debit) or children_done.is_set():
+                return balance
+            interval.on_unchanged()
+            # Wakes early when the children finish so the last read reflects their final state
+            children_done.wait(interval.next_delay())
+
+    async def _watch_mother_debit_async(self, mother_wallet: str, initial_balance: float, expected_debit: float,
+                                        children_done: asyncio.Event) -> Optional[float]:
+        """
+        Awaitable version of _watch_mother_debit().
+        
+        Args:
+            mother_wallet: Mother wallet address
+            initial_balance: Mother SOL balance before the funding
+            expected_debit: Total SOL sent to the children
+            children_done: Set when the children's confirmation has finished
+            
+        Returns:
+            Last mother SOL balance read, or None if it could not be read
+        """
+        interval = AdaptiveInterval(FUNDING_PROBE_MIN_INTERVAL, FUNDING_PROBE_MAX_INTERVAL)
+        balance = None
+        while True:
+            try:
+                balance = await self._read_sol_balance_async(mother_wallet)
+            except Exception as e:
+                logger.warning(f"Could not read mother wallet balance: {str(e)}")
+            if self._mother_debit_seen(initial_balance, balance, expected_debit) or children_done.is_set():
+                return balance
+            interval.on_unchanged()
+            try:
+                await asyncio.wait_for(children_done.wait(), timeout=interval.next_delay())
+            except asyncio.TimeoutError:
+                pass
+
+    def _confirm_funding(self, result: Dict[str, Any], mother_wallet: str,
+                         formatted_child_wallets: List[Dict[str, Any]], initial_balances: Dict[str, float],
+                         initial_mother_balance: float, already_funded_wallets: set,
+                         amount_per_wallet: float) -> None:
+        """
+        Confirm a submitted funding batch and record the outcome in result.
+        
+        Confirmation starts as soon as the request returns, with no fixed propagation wait.
+        Transfers with a signature are confirmed by signature status while children without
+        one are probed by balance at the same time. Children whose signature never settled
+        fall back to balance probes. The mother wallet's debit is watched in parallel and
+        serves as evidence when the child checks are inconclusive.
+        
+        Args:
+            result: Funding result being built (updated in place)
+            mother_wallet: Mother wallet address
+            formatted_child_wallets: Funded children as {"publicKey", "amountSol"} dictionaries
+            initial_balances: Child SOL balances read before the funding
+            initial_mother_balance: Mother SOL balance read before the funding
+            already_funded_wallets: Children skipped because they were already funded
+            amount_per_wallet: SOL sent to each child
+        """
+        signatures = self._extract_transfer_signatures(
+            result["api_response"], [child["publicKey"] for child in formatted_child_wallets]
+        )
+        unsigned = [child for child in formatted_child_wallets if child["publicKey"] not in signatures]
+        expected_debit = len(formatted_child_wallets) * amount_per_wallet
+        children_done = threading.Event()
+        
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            mother_future = pool.submit(
+                self._watch_mother_debit, mother_wallet, initial_mother_balance, expected_debit, children_done
+            )
+            try:
+                unsigned_future = pool.submit(self._probe_funded_balances, unsigned, initial_balances)
+                statuses = self.confirm_signatures(list(signatures.values()), timeout=FUNDING_CONFIRM_TIMEOUT)
+                settled = self._record_signature_confirmations(result, signatures, statuses)
+                unconfirmed = [child for child in formatted_child_wallets
+                               if child["publicKey"] in signatures and child["publicKey"] not in settled]
+                probed = self._probe_funded_balances(unconfirmed, initial_balances)
+                probed.update(unsigned_future.result())
+            finally:
+                children_done.set()
+            final_mother_balance = mother_future.result()
+        
+        self._record_funding_confirmation(
+            result, probed, final_mother_balance, initial_mother_balance,
+            formatted_child_wallets, already_funded_wallets, amount_per_wallet
+        )
+
+    async def _confirm_funding_async(self, result: Dict[str, Any], mother_wallet: str,
+                                     formatted_child_wallets: List[Dict[str, Any]], initial_balances: Dict[str, float],
+                                     initial_mother_balance: float, already_funded_wallets: set,
+                                     amount_per_wallet: float) -> None:
+        """
+        Awaitable version of _confirm_funding(); every stage shares the event loop.
+        
+        Args:
+            result: Funding result being built (updated in place)
+            mother_wallet: Mother wallet address
+            formatted_child_wallets: Funded children as {"publicKey", "amountSol"} dictionaries
+            initial_balances: Child SOL balances read before the funding
+            initial_mother_balance: Mother SOL balance read before the funding
+            already_funded_wallets: Children skipped because they were already funded
+            amount_per_wallet: SOL sent to each child
+        """
+        signatures = self._extract_transfer_signatures(
+            result["api_response"], [child["publicKey"] for child in formatted_child_wallets]
+        )
+        unsigned = [child for child in formatted_child_wallets if child["publicKey"] not in signatures]
+        expected_debit = len(formatted_child_wallets) * amount_per_wallet
+        children_done = asyncio.Event()
+        
+        mother_task = asyncio.create_task(self._watch_mother_debit_async(
+            mother_wallet, initial_mother_balance, expected_debit, children_done
+        ))
+        try:
+            statuses, probed = await asyncio.gather(
+                self.confirm_signatures_async(list(signatures.values()), timeout=FUNDING_CONFIRM_TIMEOUT),
+                self._probe_funded_balances_async(unsigned, initial_balances)
+            )
+            settled = self._record_signature_confirmations(result, signatures, statuses)
+            unconfirmed = [child for child in formatted_child_wallets
+                           if child["publicKey"] in signatures and child["publicKey"] not in settled]
+            probed.update(await self._probe_funded_balances_async(unconfirmed, initial_balances))
+        except BaseException:
+            mother_task.cancel()
+            raise
+        finally:
+            children_done.set()
+        final_mother_balance = await mother_task
+        
+        self._record_funding_confirmation(
+            result, probed, final_mother_balance, initial_mother_balance,
+            formatted_child_wallets, already_funded_wallets, amount_per_wallet
+        )
+
+    def _record_funding_confirmation(self, result: Dict[str, Any], probed: Dict[str, Dict[str, Any]],
+                                     final_mother_balance: Optional[float], initial_mother_balance: float,
+                                     formatted_child_wallets: List[Dict[str, Any]], already_funded_wallets: set,
+                                     amount_per_wallet: float) -> None:
+        """Record balance-probed children and the mother debit evidence, then set the overall status."""
+        for child_address, verification_result in probed.items():
+            self._record_funding_verification(result, child_address, verification_result)
+        
+        if final_mother_balance is not None:
+            self._apply_mother_balance_evidence(
+                result, initial_mother_balance, final_mother_balance,
+                formatted_child_wallets, already_funded_wallets, amount_per_wallet
+            )
+        else:
+            logger.warning("Could not verify mother wallet balance change")
+        
+        self._finalize_funding_status(result, formatted_child_wallets, already_funded_wallets)
+
+    def fund_child_wallets(self, mother_wallet: str, child_wallets: List[str], token_address: str, amount_per_wallet: float, 
+                      mother_private_key: str = None, priority_fee: int = 25000, batch_id: str = None,
+                      idempotency_key: str = None, verify_transfers: bool = True) -> Dict[str, Any]:
+        """Fund child wallets with calculated amounts based on volume requirements"""
+        amount_per_wallet = self._normalize_funding_amount(amount_per_wallet)
+            
+        if self.use_mock:
+            return self._mock_funding_result(child_wallets)
+        
+        # Generate a batch ID if not provided
+        if not batch_id:
+            batch_id = self.generate_batch_id()
+        
+        # Check which wallets already have sufficient balance to avoid unnecessary funding
+        current_balances = {
+            child_wallet: lamports / 1_000_000_000
+            for child_wallet, lamports in self.check_balances(child_wallets).items()
+        }
+        
+        formatted_child_wallets, already_funded_wallets = self._select_wallets_to_fund(
+            mother_wallet, child_wallets, amount_per_wallet, current_balances, idempotency_key
+        )
+        
+        # If no valid wallets after deduplication and funding checks, return early
+        if not formatted_child_wallets:
+            return self._nothing_to_fund_result(already_funded_wallets)
         
         # Get initial balances for verification BEFORE making API call
         initial_balances = {}
@@ -1937,73 +2869,146 @@ class ApiClient:
         if verify_transfers:
             # Get mother wallet initial balance
             try:
-                mother_balance_info = self.check_balance(mother_wallet)
-                for token_balance in mother_balance_info.get("balances", []):
-                    if token_balance.get("symbol") == "SOL":
-                        initial_mother_balance = token_balance.get("amount", 0)
-                        break
+                initial_mother_balance = self._extract_sol_balance(self.check_balance(mother_wallet))
                 logger.info(f"Initial mother wallet balance: {initial_mother_balance} SOL")
             except Exception as e:
                 logger.warning(f"Could not get initial mother balance: {str(e)}")
             
-            # Get child wallet initial balances
+            # Child balances were read moments ago for the already-funded check
             for child in formatted_child_wallets:
-                try:
-                    balance_info = self.check_balance(child["publicKey"])
-                    for token_balance in balance_info.get("balances", []):
-                        if token_balance.get("symbol") == "SOL":
-                            initial_balances[child["publicKey"]] = token_balance.get("amount", 0)
-                            break
-                except Exception as e:
-                    logger.warning(f"Could not get initial balance for {child['publicKey']}: {str(e)}")
-                    initial_balances[child["publicKey"]] = 0
+                initial_balances[child["publicKey"]] = current_balances.get(child["publicKey"], 0)
             
             logger.info(f"Captured initial balances for {len(initial_balances)} child wallets")
             
-        # Prepare the funding payload exactly matching the API specification
-        funding_payload = {
-            "motherWalletPrivateKeyBase58": mother_private_key,
-            "childWallets": formatted_child_wallets
-        }
-        
-        # Only add optional fields if they have values
-        if priority_fee and priority_fee != 25000:  # Only add if different from default
-            funding_payload["priorityFee"] = priority_fee
+        funding_payload = self._build_funding_payload(mother_private_key, formatted_child_wallets, priority_fee)
             
         logger.info(f"Funding {len(formatted_child_wallets)} child wallets with batch ID: {batch_id} and priority fee: {priority_fee}")
         
-        # Use a higher timeout for blockchain operations
-        original_timeout = self.timeout
-        self.timeout = max(self.timeout, 45)  # Use at least 45 seconds for blockchain operations
+        result = self._new_funding_result(batch_id, already_funded_wallets)
         
-        # Initialize result structure
-        result = {
-            "batch_id": batch_id,
-            "status": "unknown",
-            "api_response": None,
-            "verification_results": [],
-            "successful_transfers": len(already_funded_wallets),  # Count already funded wallets as successful
-            "failed_transfers": 0,
-            "already_funded_wallets": len(already_funded_wallets),
-            "newly_funded_wallets": 0,
-            "api_timeout": False
+        # Make API call and handle both success and timeout scenarios
+        try:
+            try:
+                api_result = self._make_request_with_retry(
+                    'post', 
+                    '/api/wallets/fund-children', 
+                    json=funding_payload,
+                    timeout=FUNDING_TIMEOUTS
+                )
+            finally:
+                # The funding may land even if the request fails, so drop cached balances either way
+                self.invalidate_balances(mother_wallet, *child_wallets)
+            
+            # Log API response
+            logger.info(f"API Response for funding: {json.dumps(api_result, default=str)}")
+            
+            result["api_response"] = api_result
+            result["status"] = api_result.get("status", "unknown")
+            
+        except ApiTimeoutError as e:
+            # API timed out but transactions might have gone through
+            logger.warning(f"API timeout during funding operation (batch: {batch_id}): {str(e)}")
+            result["api_timeout"] = True
+            result["status"] = "timeout"
+            result["api_response"] = {"error": "API timeout", "message": str(e)}
+            
+        except Exception as e:
+            logger.error(f"Error in fund_child_wallets API call: {str(e)}")
+            result["status"] = "error"
+            result["api_response"] = {"error": str(e)}
+        
+        # ALWAYS attempt verification if requested, regardless of API success/timeout
+        if verify_transfers:
+            logger.info("Starting funding verification (regardless of API response status)...")
+            
+            self._confirm_funding(
+                result, mother_wallet, formatted_child_wallets, initial_balances,
+                initial_mother_balance, already_funded_wallets, amount_per_wallet
+            )
+        
+        return result
+
+    async def fund_child_wallets_async(self, mother_wallet: str, child_wallets: List[str], token_address: str,
+                                       amount_per_wallet: float, mother_private_key: str = None,
+                                       priority_fee: int = 25000, batch_id: str = None,
+                                       idempotency_key: str = None, verify_transfers: bool = True) -> Dict[str, Any]:
+        """
+        Awaitable version of fund_child_wallets() on the pooled async transport.
+        
+        Balance reads for the pre-check run concurrently and confirmation starts as soon as
+        the request returns, with all waits yielding to the event loop.
+        
+        Args:
+            mother_wallet: Mother wallet address
+            child_wallets: Child wallet addresses to fund
+            token_address: Token address (unused, kept for signature compatibility)
+            amount_per_wallet: Amount of SOL per child wallet
+            mother_private_key: Base58 private key of the mother wallet
+            priority_fee: Priority fee in microlamports
+            batch_id: Optional batch ID
+            idempotency_key: Optional idempotency key for the batch
+            verify_transfers: Whether to verify the transfers by checking balances
+            
+        Returns:
+            Funding result in the same format as fund_child_wallets()
+        """
+        amount_per_wallet = self._normalize_funding_amount(amount_per_wallet)
+        
+        if self.use_mock:
+            return self._mock_funding_result(child_wallets)
+        
+        if not batch_id:
+            batch_id = self.generate_batch_id()
+        
+        current_balances = {
+            child_wallet: lamports / 1_000_000_000
+            for child_wallet, lamports in (await self.check_balances_async(child_wallets)).items()
         }
         
-        # Make API call and handle both success and timeout scenarios
-        api_success = False
+        formatted_child_wallets, already_funded_wallets = self._select_wallets_to_fund(
+            mother_wallet, child_wallets, amount_per_wallet, current_balances, idempotency_key
+        )
+        
+        if not formatted_child_wallets:
+            return self._nothing_to_fund_result(already_funded_wallets)
+        
+        initial_balances = {}
+        initial_mother_balance = 0
+        
+        if verify_transfers:
+            try:
+                initial_mother_balance = self._extract_sol_balance(await self.check_balance_async(mother_wallet))
+                logger.info(f"Initial mother wallet balance: {initial_mother_balance} SOL")
+            except Exception as e:
+                logger.warning(f"Could not get initial mother balance: {str(e)}")
+            
+            for child in formatted_child_wallets:
+                initial_balances[child["publicKey"]] = current_balances.get(child["publicKey"], 0)
+            
+            logger.info(f"Captured initial balances for {len(initial_balances)} child wallets")
+        
+        funding_payload = self._build_funding_payload(mother_private_key, formatted_child_wallets, priority_fee)
+        
+        logger.info(f"Funding {len(formatted_child_wallets)} child wallets with batch ID: {batch_id} and priority fee: {priority_fee}")
+        
+        result = self._new_funding_result(batch_id, already_funded_wallets)
+        
         try:
-            api_result = self._make_request_with_retry(
-                'post', 
-                '/api/wallets/fund-children', 
-                json=funding_payload
-            )
+            try:
+                api_result = await self._make_request_with_retry_async(
+                    'post',
+                    '/api/wallets/fund-children',
+                    json=funding_payload,
+                    timeout=FUNDING_TIMEOUTS
+                )
+            finally:
+                # The funding may land even if the request fails, so drop cached balances either way
+                self.invalidate_balances(mother_wallet, *child_wallets)
             
-            # Log API response
             logger.info(f"API Response for funding: {json.dumps(api_result, default=str)}")
             
             result["api_response"] = api_result
             result["status"] = api_result.get("status", "unknown")
-            api_success = True
             
         except ApiTimeoutError as e:
             # API timed out but transactions might have gone through
@@ -2017,113 +3022,159 @@ class ApiClient:
             result["status"] = "error"
             result["api_response"] = {"error": str(e)}
         
-        finally:
-            # Restore original timeout
-            self.timeout = original_timeout
-        
-        # ALWAYS attempt verification if requested, regardless of API success/timeout
         if verify_transfers:
             logger.info("Starting funding verification (regardless of API response status)...")
             
-            # Optimized wait times since API already confirms transactions with WebSocket
-            # Only need minimal time for balance propagation
-            wait_time = 8 if result["api_timeout"] else 5
-            logger.info(f"Waiting {wait_time} seconds for balance propagation before verification...")
-            time.sleep(wait_time)
-            
-            # Use synchronous verification to avoid event loop conflicts
-            for child in formatted_child_wallets:
-                child_address = child["publicKey"]
-                initial_balance = initial_balances.get(child_address, 0)
-                expected_balance = initial_balance + child["amountSol"]
-                
-                try:
-                    # Use optimized verification with shorter timeouts since API confirms quickly
-                    verification_result = self._verify_balance_change_sync(
-                        child_address,
-                        initial_balance,
-                        expected_balance,
-                        max_wait_time=30,   # Reduced from 120s since API already confirms
-                        check_interval=3    # Faster checks since transactions are confirmed
-                    )
-                    
-                    # Add wallet address to result
-                    verification_result["wallet_address"] = child_address
-                    
-                    # Track successful and failed transfers
-                    if verification_result["verified"]:
-                        result["successful_transfers"] += 1
-                        result["newly_funded_wallets"] += 1
-                        logger.info(f"✅ Verified funding for {child_address}: {verification_result['final_balance']} SOL")
-                    else:
-                        result["failed_transfers"] += 1
-                        logger.warning(f"❌ Failed to verify funding for {child_address}: expected change not detected")
-                        
-                    # Add to verification results
-                    result["verification_results"].append(verification_result)
-                    
-                except Exception as e:
-                    logger.error(f"Error verifying transfer to {child_address}: {str(e)}")
-                    result["failed_transfers"] += 1
-                    result["verification_results"].append({
-                        "wallet_address": child_address,
-                        "verified": False,
-                        "error": str(e)
-                    })
-                
-            # Additional verification: Check mother wallet balance decrease
-            try:
-                final_mother_balance_info = self.check_balance(mother_wallet)
-                final_mother_balance = 0
-                for token_balance in final_mother_balance_info.get("balances", []):
-                    if token_balance.get("symbol") == "SOL":
-                        final_mother_balance = token_balance.get("amount", 0)
-                        break
-                
-                mother_balance_change = initial_mother_balance - final_mother_balance
-                expected_total_spent = len(formatted_child_wallets) * amount_per_wallet
-                
-                logger.info(f"Mother wallet balance change: {mother_balance_change:.6f} SOL (expected: ~{expected_total_spent:.6f} SOL)")
-                
-                # If mother wallet balance decreased significantly, consider it evidence of successful funding
-                if mother_balance_change > (expected_total_spent * 0.5):  # At least 50% of expected amount
-                    logger.info(f"✅ Mother wallet balance decreased by {mother_balance_change:.6f} SOL, indicating successful funding")
-                    
-                    # If we had verification failures but mother wallet shows spending, mark as partial success
-                    if result["failed_transfers"] > 0 and result["newly_funded_wallets"] == 0:
-                        logger.info("Adjusting status based on mother wallet balance evidence")
-                        # Assume all wallets were funded based on mother wallet evidence
-                        result["newly_funded_wallets"] = len(formatted_child_wallets)
-                        result["successful_transfers"] = len(already_funded_wallets) + len(formatted_child_wallets)
-                        result["failed_transfers"] = 0
-                
-            except Exception as e:
-                logger.warning(f"Could not verify mother wallet balance change: {str(e)}")
-            
-            # Update overall status based on verification results
-            total_expected = len(formatted_child_wallets) + len(already_funded_wallets)
-            if result["successful_transfers"] == total_expected:
-                result["status"] = "success"
-            elif result["successful_transfers"] > 0:
-                result["status"] = "partial_success"
-            elif result["api_timeout"] and result["newly_funded_wallets"] == 0:
-                # Special case: API timeout but no verified funding - still might be processing
-                result["status"] = "timeout_pending_verification"
-                logger.warning("API timed out and verification inconclusive - transactions may still be processing")
-            else:
-                result["status"] = "failed"
-            
-            logger.info(f"Transfer verification completed: {result['successful_transfers']} total successful ({result['already_funded_wallets']} already funded, {result['newly_funded_wallets']} newly funded), {result['failed_transfers']} failed")
+            await self._confirm_funding_async(
+                result, mother_wallet, formatted_child_wallets, initial_balances,
+                initial_mother_balance, already_funded_wallets, amount_per_wallet
+            )
         
         return result
     
-    def check_balance(self, wallet_address: str, token_address: str = None) -> Dict[str, Any]:
+    @staticmethod
+    def _placeholder_balance_response(wallet_address: str) -> Dict[str, Any]:
+        """Build the zero-balance placeholder returned when a balance cannot be read."""
+        return {
+            "success": False,
+            "wallet": wallet_address,
+            "balance": 0,
+            "balances": [
+                {
+                    "token": "So11111111111111111111111111111111111111112",  # SOL
+                    "amount": 0,
+                    "symbol": "SOL"
+                }
+            ]
+        }
+
+    @staticmethod
+    def _extract_sol_balance(balance_info: Dict[str, Any]) -> float:
+        """Extract the SOL amount from a check_balance() response."""
+        for token_balance in balance_info.get("balances", []) if isinstance(balance_info, dict) else []:
+            if token_balance.get("symbol") == "SOL":
+                return token_balance.get("amount", 0)
+        return 0
+
+    def _format_balance_response(self, response: Dict[str, Any], wallet_address: str,
+                                 token_address: str = None) -> Optional[Dict[str, Any]]:
+        """
+        Transform a raw /api/wallets/mother/{address} response into the balance format
+        expected by the rest of the code.
+
+        Args:
+            response: Raw API response
+            wallet_address: Wallet address that was queried
+            token_address: Optional token contract address
+
+        Returns:
+            Formatted balance information, or None if the response has no publicKey
+        """
+        # The API response appears to have a format like:
+        # {"publicKey": "...", "balanceSol": 0.001, "balanceLamports": 1000000}
+        balance = BalanceResponse.from_payload(response)
+        if balance is None:
+            return None
+
+        sol_balance = balance.balance_sol
+        logger.info(f"Extracted SOL balance from API response: {sol_balance} (field: {balance.source_field})")
+
+        # Format expected by the rest of the code
+        formatted_response = {
+            "success": True,
+            "wallet": balance.public_key,
+            "balance": sol_balance,  # For backward compatibility
+            "balances": [
+                {
+                    "token": "So11111111111111111111111111111111111111112",  # SOL mint address
+                    "amount": sol_balance,
+                    "symbol": "SOL"
+                }
+            ]
+        }
+
+        # If a specific token was requested and it's not SOL, add a placeholder
+        if token_address and token_address != "So11111111111111111111111111111111111111112":
+            # Try to find the token in tokens list
+            token_info = self._get_token_info(token_address, wallet_address)
+            if token_info:
+                formatted_response["balances"].append({
+                    "token": token_address,
+                    "amount": 0,  # Default to 0 for testing
+                    "symbol": token_info.get("symbol", "Unknown")
+                })
+
+        return formatted_response
+
+    def invalidate_balances(self, *wallet_addresses: str):
+        """
+        Drop cached and in-flight balance reads for wallets touched by a swap or transfer.
+        
+        Args:
+            *wallet_addresses: Wallet addresses whose balances are about to change
+        """
+        wallets = {address for address in wallet_addresses if address}
+        if not wallets:
+            return
+        balance_cache.invalidate(wallets)
+        self._single_flight.invalidate(
+            lambda key: key[0] in ('balance', 'token_balance') and key[1] in wallets
+        )
+    
+    def get_balance_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics for the shared balance cache.
+        
+        Returns:
+            Dictionary with hit, miss, eviction and invalidation counts and the hit ratio
+        """
+        return balance_cache.stats()
+    
+    def _get_balance_payload(self, wallet_address: str, fresh: bool = False) -> Dict[str, Any]:
+        """
+        Read a wallet's raw SOL balance response, served from the shared cache when fresh.
+        
+        Args:
+            wallet_address: Wallet address to read
+            fresh: Skip the cache (the result is still cached for other callers)
+            
+        Returns:
+            Raw /api/wallets/mother/{address} response
+        """
+        if not fresh:
+            cached = balance_cache.get(wallet_address)
+            if cached is not None:
+                return cached
+        generation = balance_cache.generation(wallet_address)
+        response = self._make_request_with_retry('get', f'/api/wallets/mother/{wallet_address}', timeout=BALANCE_TIMEOUTS)
+        if BalanceResponse.from_payload(response) is not None:
+            balance_cache.put(wallet_address, response, generation=generation)
+        return response
+    
+    async def _get_balance_payload_async(self, wallet_address: str, fresh: bool = False) -> Dict[str, Any]:
+        """Async version of _get_balance_payload; concurrent reads of one wallet share a request."""
+        if not fresh:
+            cached = balance_cache.get(wallet_address)
+            if cached is not None:
+                return cached
+        generation = balance_cache.generation(wallet_address)
+        endpoint = f'/api/wallets/mother/{wallet_address}'
+        response = await self._single_flight.do(
+            ('balance', wallet_address),
+            lambda: self._make_request_with_retry_async('get', endpoint, timeout=BALANCE_TIMEOUTS)
+        )
+        if BalanceResponse.from_payload(response) is not None:
+            balance_cache.put(wallet_address, response, generation=generation)
+        return response
+    
+    def check_balance(self, wallet_address: str, token_address: str = None, fresh: bool = False) -> Dict[str, Any]:
         """
         Check the balance of a wallet.
         
         Args:
             wallet_address: Wallet address to check
             token_address: Optional token contract address
+            fresh: Bypass the shared balance cache, e.g. when waiting for a balance change
             
         Returns:
             Balance information
@@ -2147,187 +3198,297 @@ class ApiClient:
         try:
             # Try standard API call first with extended timeout for Solana RPC
             try:
-                # Temporarily increase timeout for balance checks to account for Solana RPC delays
-                original_timeout = self.timeout
-                self.timeout = max(self.timeout, 15)  # Minimum 15 seconds for Solana balance queries
+                # Balance profile allows for Solana RPC delays
+                response = self._get_balance_payload(wallet_address, fresh=fresh)
                 
-                response = self._make_request_with_retry('get', endpoint)
-                
-                # Restore original timeout
-                self.timeout = original_timeout
                 # Log the entire response for debugging
                 logger.info(f"Raw balance response from API: {json.dumps(response)}")
                 
-                # Transform API response into expected format
-                # The API response appears to have a format like:
-                # {"publicKey": "...", "balanceSol": 0.001, "balanceLamports": 1000000}
-                if 'publicKey' in response:
-                    # Check for various possible balance fields with priority order
-                    sol_balance = 0
-                    if 'balanceSol' in response and response['balanceSol'] is not None:
-                        sol_balance = float(response['balanceSol'])
-                        logger.info(f"Using balanceSol field: {sol_balance}")
-                    elif 'balanceLamports' in response and response['balanceLamports'] is not None:
-                        # Convert lamports to SOL (1 SOL = 1,000,000,000 lamports)
-                        sol_balance = float(response['balanceLamports']) / 1000000000
-                        logger.info(f"Using balanceLamports field: {response['balanceLamports']} lamports = {sol_balance} SOL")
-                    elif 'balance' in response and response['balance'] is not None:
-                        sol_balance = float(response['balance'])
-                        logger.info(f"Using balance field: {sol_balance}")
-                    
-                    logger.info(f"Extracted SOL balance from API response: {sol_balance}")
-                    
-                    # Format expected by the rest of the code
-                    formatted_response = {
-                        "success": True,
-                        "wallet": response['publicKey'],
-                        "balance": sol_balance,  # For backward compatibility
-                        "balances": [
-                            {
-                                "token": "So11111111111111111111111111111111111111112",  # SOL mint address
-                                "amount": sol_balance,
-                                "symbol": "SOL"
-                            }
-                        ]
-                    }
-                    
-                    # If a specific token was requested and it's not SOL, add a placeholder
-                    if token_address and token_address != "So11111111111111111111111111111111111111112":
-                        # Try to find the token in tokens list
-                        token_info = self._get_token_info(token_address, wallet_address)
-                        if token_info:
-                            formatted_response["balances"].append({
-                                "token": token_address,
-                                "amount": 0,  # Default to 0 for testing
-                                "symbol": token_info.get("symbol", "Unknown")
-                            })
-                    
+                formatted_response = self._format_balance_response(response, wallet_address, token_address)
+                if formatted_response is not None:
                     return formatted_response
             except Exception as api_error:
                 logger.warning(f"Standard balance check failed, trying direct call: {str(api_error)}")
-                # Restore timeout in case of error
-                self.timeout = original_timeout
                 
             # If standard API call failed, try direct call
             response = self.direct_call('get', endpoint)
             if not response:
                 logger.error(f"Failed to check balance for {wallet_address} - null response")
                 # Return a placeholder response for testing
-                return {
-                    "success": False,
-                    "wallet": wallet_address,
-                    "balance": 0,
-                    "balances": [
-                        {
-                            "token": "So11111111111111111111111111111111111111112",  # SOL
-                            "amount": 0,
-                            "symbol": "SOL"
-                        }
-                    ]
-                }
+                return self._placeholder_balance_response(wallet_address)
             
             # Log the full response for debugging
             logger.info(f"Direct call response status: {response.status_code}")
             logger.info(f"Direct call response content: {response.text}")
             
-            # Try to extract balance directly from response text
-            try:
-                import re
-                # Extract publicKey using regex
-                pubkey_match = re.search(r'"publicKey"\s*:\s*"([^"]+)"', response.text)
-                
-                # Try multiple patterns for balance extraction - the API might return different formats
-                balance_patterns = [
-                    r'"balanceSol"\s*:\s*([0-9.]+)',  # Standard format: "balanceSol": 0.002
-                    r'"balanceSol"\s*:\s*([0-9.e\-+]+)',  # Scientific notation: "balanceSol": 2.0e-3
-                    r'"balance"\s*:\s*([0-9.]+)',  # Alternative key: "balance": 0.002
-                    r'"lamports"\s*:\s*([0-9]+)',  # Lamports format: "lamports": 2000000
-                    r'"balanceLamports"\s*:\s*([0-9]+)'  # Explicit lamports: "balanceLamports": 2000000
-                ]
-                
-                sol_balance = 0
-                for pattern in balance_patterns:
-                    balance_match = re.search(pattern, response.text)
-                    if balance_match:
-                        raw_value = balance_match.group(1)
-                        logger.info(f"Found balance match with pattern '{pattern}': {raw_value}")
-                        
-                        # Handle different format types
-                        if 'lamports' in pattern:
-                            # Convert lamports to SOL (1 SOL = 1,000,000,000 lamports)
-                            sol_balance = float(raw_value) / 1000000000
-                        else:
-                            # Direct SOL value
-                            sol_balance = float(raw_value)
-                        
-                        # Found a match, break the loop
-                        break
-                
-                if pubkey_match:
-                    public_key = pubkey_match.group(1)
-                    logger.info(f"Successfully extracted balance for {public_key}: {sol_balance} SOL")
-                    return {
-                        "success": True,
-                        "wallet": public_key,
-                        "balance": sol_balance,
-                        "balances": [
-                            {
-                                "token": "So11111111111111111111111111111111111111112",  # SOL mint address
-                                "amount": sol_balance,
-                                "symbol": "SOL"
-                            }
-                        ]
-                    }
-            except Exception as e:
-                logger.error(f"Failed to extract balance from response: {str(e)}")
+            # Decode the body once, tolerating malformed JSON
+            formatted_response = self._format_balance_response(
+                self._decode_response(response), wallet_address, token_address
+            )
+            if formatted_response is not None:
+                return formatted_response
             
             # If all extraction methods fail, return a placeholder
-            if 'wallet' not in response:
-                response = {
-                    "success": False,
-                    "wallet": wallet_address,
-                    "balance": 0,
-                    "balances": [
-                        {
-                            "token": "So11111111111111111111111111111111111111112",  # SOL
-                            "amount": 0,
-                            "symbol": "SOL"
-                        }
-                    ]
-                }
-                
-            return response
+            return self._placeholder_balance_response(wallet_address)
             
         except ApiClientError as e:
             logger.error(f"Failed to check balance: {str(e)}")
             
             # Return a placeholder response for testing
+            return self._placeholder_balance_response(wallet_address)
+
+    async def check_balance_async(self, wallet_address: str, token_address: str = None,
+                                  fresh: bool = False) -> Dict[str, Any]:
+        """
+        Awaitable version of check_balance() on the pooled async transport.
+        
+        Args:
+            wallet_address: Wallet address to check
+            token_address: Optional token contract address
+            fresh: Bypass the shared balance cache, e.g. when waiting for a balance change
+            
+        Returns:
+            Balance information in the same format as check_balance()
+        """
+        if self.use_mock:
+            return self.check_balance(wallet_address, token_address)
+        
+        try:
+            # Balance profile allows for Solana RPC delays
+            response = await self._get_balance_payload_async(wallet_address, fresh=fresh)
+            logger.info(f"Raw balance response from API: {json.dumps(response)}")
+            
+            formatted_response = self._format_balance_response(response, wallet_address, token_address)
+            if formatted_response is not None:
+                return formatted_response
+            
+            logger.warning(f"Balance response for {wallet_address} has no publicKey")
+            return self._placeholder_balance_response(wallet_address)
+            
+        except ApiClientError as e:
+            logger.error(f"Failed to check balance: {str(e)}")
+            return self._placeholder_balance_response(wallet_address)
+    
+    @staticmethod
+    def _parse_balance_batch(payload: Any) -> Dict[str, int]:
+        """
+        Convert a batch balance response into an address -> lamports mapping.
+        
+        Accepts {"balances": [{"publicKey": ..., "balanceLamports": ...}, ...]},
+        {"balances": {address: lamports}} or a bare list of balance objects.
+        
+        Args:
+            payload: Decoded response body
+            
+        Returns:
+            Dictionary mapping wallet address to lamports
+        """
+        entries = payload.get('balances', payload.get('data')) if isinstance(payload, dict) else payload
+        if isinstance(entries, dict):
+            return {address: int(lamports) for address, lamports in entries.items() if lamports is not None}
+        
+        balances = {}
+        for entry in entries if isinstance(entries, list) else []:
+            balance = BalanceResponse.from_payload(entry)
+            if balance is not None:
+                balances[balance.public_key] = balance.lamports
+        return balances
+    
+    @staticmethod
+    def _cache_balance_batch(balances: Dict[str, int], generations: Dict[str, int]) -> Dict[str, int]:
+        """Store batch-read balances in the shared cache in the single-wallet response format."""
+        for address, lamports in balances.items():
+            if address in generations:
+                balance_cache.put(
+                    address, {"publicKey": address, "balanceLamports": lamports}, generation=generations[address]
+                )
+        return balances
+    
+    @staticmethod
+    def _cached_lamports(addresses: List[str]) -> Dict[str, int]:
+        """Get the balances of the given wallets that the shared cache can still serve."""
+        balances = {}
+        for address in addresses:
+            balance = BalanceResponse.from_payload(balance_cache.get(address))
+            if balance is not None:
+                balances[address] = balance.lamports
+        return balances
+    
+    def _fetch_balance_batch(self, addresses: List[str]) -> Optional[Dict[str, int]]:
+        """
+        Read up to BALANCE_BATCH_SIZE balances with one batch request.
+        
+        The first call probes whether the backend has a batch endpoint. A 404 or 405
+        marks it unsupported, so later calls go straight to single-wallet reads.
+        
+        Args:
+            addresses: Wallet addresses (at most BALANCE_BATCH_SIZE)
+            
+        Returns:
+            Address -> lamports mapping, or None if the batch request could not be used
+        """
+        probing = self._batch_balances_supported is None
+        generations = {address: balance_cache.generation(address) for address in addresses}
+        try:
+            response = self._make_request_with_retry(
+                'post', BALANCE_BATCH_ENDPOINT, json={"publicKeys": addresses},
+                max_retries=1 if probing else 3, timeout=BALANCE_TIMEOUTS
+            )
+        except ApiBadResponseError as e:
+            if e.status_code in (404, 405):
+                logger.info("Backend has no batch balance endpoint, using concurrent single-wallet reads")
+                self._batch_balances_supported = False
+            else:
+                logger.warning(f"Batch balance request failed: {str(e)}")
+            return None
+        except ApiClientError as e:
+            logger.warning(f"Batch balance request failed: {str(e)}")
+            return None
+        
+        self._batch_balances_supported = True
+        return self._cache_balance_batch(self._parse_balance_batch(response), generations)
+    
+    async def _fetch_balance_batch_async(self, addresses: List[str]) -> Optional[Dict[str, int]]:
+        """Async version of _fetch_balance_batch."""
+        probing = self._batch_balances_supported is None
+        generations = {address: balance_cache.generation(address) for address in addresses}
+        try:
+            response = await self._make_request_with_retry_async(
+                'post', BALANCE_BATCH_ENDPOINT, json={"publicKeys": addresses},
+                max_retries=1 if probing else 3, timeout=BALANCE_TIMEOUTS
+            )
+        except ApiBadResponseError as e:
+            if e.status_code in (404, 405):
+                logger.info("Backend has no batch balance endpoint, using concurrent single-wallet reads")
+                self._batch_balances_supported = False
+            else:
+                logger.warning(f"Batch balance request failed: {str(e)}")
+            return None
+        except ApiClientError as e:
+            logger.warning(f"Batch balance request failed: {str(e)}")
+            return None
+        
+        self._batch_balances_supported = True
+        return self._cache_balance_batch(self._parse_balance_batch(response), generations)
+    
+    def _fetch_balance_lamports(self, wallet_address: str) -> Optional[int]:
+        """Read one wallet's SOL balance in lamports, or None if it could not be read."""
+        try:
+            response = self._get_balance_payload(wallet_address, fresh=True)
+        except ApiClientError as e:
+            logger.warning(f"Could not read balance for {wallet_address}: {str(e)}")
+            return None
+        balance = BalanceResponse.from_payload(response)
+        return balance.lamports if balance is not None else None
+    
+    async def _fetch_balance_lamports_async(self, wallet_address: str) -> Optional[int]:
+        """Async version of _fetch_balance_lamports; shares in-flight reads with check_balance_async."""
+        try:
+            response = await self._get_balance_payload_async(wallet_address, fresh=True)
+        except ApiClientError as e:
+            logger.warning(f"Could not read balance for {wallet_address}: {str(e)}")
+            return None
+        balance = BalanceResponse.from_payload(response)
+        return balance.lamports if balance is not None else None
+    
+    def check_balances(self, wallet_addresses: List[str], fresh: bool = False) -> Dict[str, int]:
+        """
+        Read the SOL balances of many wallets at once.
+        
+        Balances still fresh in the shared balance cache are served without a request.
+        The rest are read from the backend's batch endpoint in chunks of BALANCE_BATCH_SIZE
+        when it has one. Otherwise wallets are read concurrently, at most
+        BALANCE_FETCH_CONCURRENCY at a time.
+        
+        Args:
+            wallet_addresses: Wallet addresses (duplicates are read once)
+            fresh: Skip the balance cache, for callers waiting on an external change
+            
+        Returns:
+            Dictionary mapping each readable address to its balance in lamports;
+            addresses whose balance could not be read are omitted
+        """
+        addresses = list(dict.fromkeys(address for address in wallet_addresses if address))
+        if not addresses:
+            return {}
+        
+        if self.use_mock:
             return {
-                "success": False,
-                "wallet": wallet_address,
-                "balance": 0,
-                "balances": [
-                    {
-                        "token": "So11111111111111111111111111111111111111112",  # SOL
-                        "amount": 0,
-                        "symbol": "SOL"
-                    }
-                ]
+                address: int(self._extract_sol_balance(self.check_balance(address)) * 1_000_000_000)
+                for address in addresses
             }
+        
+        balances = {} if fresh else self._cached_lamports(addresses)
+        pending = [address for address in addresses if address not in balances]
+        if pending and self._batch_balances_supported is not False:
+            for start in range(0, len(pending), BALANCE_BATCH_SIZE):
+                chunk = pending[start:start + BALANCE_BATCH_SIZE]
+                fetched = self._fetch_balance_batch(chunk)
+                if fetched is None:
+                    break
+                balances.update({address: lamports for address, lamports in fetched.items() if address in chunk})
+        
+        remaining = [address for address in addresses if address not in balances]
+        if remaining:
+            with ThreadPoolExecutor(max_workers=min(BALANCE_FETCH_CONCURRENCY, len(remaining))) as pool:
+                for address, lamports in zip(remaining, pool.map(self._fetch_balance_lamports, remaining)):
+                    if lamports is not None:
+                        balances[address] = lamports
+        
+        logger.info(f"Read balances for {len(balances)}/{len(addresses)} wallets")
+        return balances
     
-    def _get_token_info(self, token_address: str, mother_wallet_address: str = None) -> Dict[str, Any]:
-        """Get token information."""
-        try:
-            tokens_response = self.check_api_health(mother_wallet_address)
-            if 'tokens' in tokens_response:
-                tokens_dict = tokens_response['tokens']
-                # Find the token by address
-                for symbol, address in tokens_dict.items():
-                    if address == token_address:
-                        return {"symbol": symbol, "address": address}
+    async def check_balances_async(self, wallet_addresses: List[str], fresh: bool = False) -> Dict[str, int]:
+        """
+        Awaitable version of check_balances() on the pooled async transport.
+        
+        Args:
+            wallet_addresses: Wallet addresses (duplicates are read once)
+            fresh: Skip the balance cache, for callers waiting on an external change
+            
+        Returns:
+            Dictionary mapping each readable address to its balance in lamports
+        """
+        addresses = list(dict.fromkeys(address for address in wallet_addresses if address))
+        if not addresses:
             return {}
-        except Exception:
+        
+        if self.use_mock:
+            return self.check_balances(addresses, fresh=fresh)
+        
+        balances = {} if fresh else self._cached_lamports(addresses)
+        pending = [address for address in addresses if address not in balances]
+        if pending and self._batch_balances_supported is not False:
+            chunks = [pending[start:start + BALANCE_BATCH_SIZE] for start in range(0, len(pending), BALANCE_BATCH_SIZE)]
+            # Probe with the first chunk so an unsupported endpoint is only tried once
+            results = [await self._fetch_balance_batch_async(chunks[0])]
+            if results[0] is not None and len(chunks) > 1:
+                results += await asyncio.gather(*(self._fetch_balance_batch_async(chunk) for chunk in chunks[1:]))
+            for chunk, fetched in zip(chunks, results):
+                if fetched is not None:
+                    balances.update({address: lamports for address, lamports in fetched.items() if address in chunk})
+        
+        remaining = [address for address in addresses if address not in balances]
+        if remaining:
+            semaphore = asyncio.Semaphore(BALANCE_FETCH_CONCURRENCY)
+            
+            async def fetch(address: str) -> Optional[int]:
+                async with semaphore:
+                    return await self._fetch_balance_lamports_async(address)
+            
+            for address, lamports in zip(remaining, await asyncio.gather(*(fetch(address) for address in remaining))):
+                if lamports is not None:
+                    balances[address] = lamports
+        
+        logger.info(f"Read balances for {len(balances)}/{len(addresses)} wallets")
+        return balances
+    
+    def _get_token_info(self, token_address: str, mother_wallet_address: str = None) -> Dict[str, Any]:
+        """Get token information from the local token registry, without any request."""
+        symbol = token_registry.symbol(token_address)
+        if symbol is None:
             return {}
+        return {"symbol": symbol, "address": token_address}
     
     def start_execution(self, run_id: str) -> Dict[str, Any]:
         """
@@ -2420,35 +3581,79 @@ class ApiClient:
     
     def get_transaction_status(self, tx_hash: str) -> Dict[str, Any]:
         """
-        Get the status of a transaction using mock data since API endpoint does not exist.
+        Get the status of a transaction from the Solana RPC signature-status endpoint.
         
         Args:
-            tx_hash: Transaction hash to check
+            tx_hash: Transaction signature to check
             
         Returns:
-            Transaction status (mock data)
+            Transaction status: 'confirmed', 'failed', 'processing' or 'not_found'
+            ('unknown' if the lookup itself failed)
         """
-        # Log structured information about transaction status check
-        logger.info(
-            "Checking transaction status using mock data",
-            extra={
-                "tx_hash": tx_hash,
-                "method": "mock_data",
-                "reason": "api_endpoint_not_available"
-            }
-        )
+        if self.use_mock:
+            return {"tx_hash": tx_hash, "status": "confirmed", "confirmations": 32, "slot": None}
         
-        # Always use mock data since /api/transactions endpoint does not exist
-        import random
-        statuses = ["confirmed", "confirmed", "confirmed", "processing", "failed"]
-        weighted_statuses = statuses[:3] * 3 + statuses[3:] # Make confirmed more likely
+        try:
+            status = signature_status_client.get_statuses([tx_hash], search_history=True)[tx_hash]
+        except SignatureStatusError as e:
+            logger.warning(f"Could not get status of transaction {tx_hash}: {str(e)}")
+            return {"tx_hash": tx_hash, "status": "unknown", "error": str(e)}
+        
+        if status.failed:
+            state = "failed"
+        elif status.reached(signature_status_client.commitment):
+            state = "confirmed"
+        elif status.found:
+            state = "processing"
+        else:
+            state = "not_found"
         
         return {
             "tx_hash": tx_hash,
-            "status": random.choice(weighted_statuses),
-            "confirmations": random.randint(0, 32) if random.choice(weighted_statuses) != "failed" else 0,
-            "block_time": int(time.time()) - random.randint(0, 600)
+            "status": state,
+            "confirmation_status": status.confirmation_status,
+            "confirmations": status.confirmations,
+            "slot": status.slot,
+            "error": status.err
         }
+    
+    def confirm_signatures(self, signatures: List[str],
+                           timeout: float = DEFAULT_CONFIRM_TIMEOUT) -> Dict[str, SignatureStatus]:
+        """
+        Wait for transaction signatures to confirm, probing up to 256 per RPC call.
+        
+        Args:
+            signatures: Transaction signatures returned by the backend
+            timeout: Seconds to wait for every signature to confirm or fail
+            
+        Returns:
+            Dictionary mapping each signature to its last known status
+        """
+        signatures = [signature for signature in signatures if is_signature(signature)]
+        if not signatures:
+            return {}
+        if self.use_mock:
+            return {signature: SignatureStatus(signature, confirmation_status="confirmed") for signature in signatures}
+        return signature_status_client.wait_for_confirmation(signatures, timeout=timeout)
+    
+    async def confirm_signatures_async(self, signatures: List[str],
+                                       timeout: float = DEFAULT_CONFIRM_TIMEOUT) -> Dict[str, SignatureStatus]:
+        """
+        Awaitable version of confirm_signatures().
+        
+        Args:
+            signatures: Transaction signatures returned by the backend
+            timeout: Seconds to wait for every signature to confirm or fail
+            
+        Returns:
+            Dictionary mapping each signature to its last known status
+        """
+        signatures = [signature for signature in signatures if is_signature(signature)]
+        if not signatures:
+            return {}
+        if self.use_mock:
+            return {signature: SignatureStatus(signature, confirmation_status="confirmed") for signature in signatures}
+        return await signature_status_client.wait_for_confirmation_async(signatures, timeout=timeout)
 
     def check_sufficient_balance(self, mother_wallet: str, token_address: str, required_volume: float) -> Dict[str, Any]:
         """
@@ -2598,10 +3803,6 @@ class ApiClient:
         operation_id = self.generate_transfer_operation_id(child_wallet, mother_wallet, amount)
         batch_id = self.generate_batch_id()
         
-        # Use a higher timeout for blockchain operations
-        original_timeout = self.timeout
-        self.timeout = max(self.timeout, 60)  # Increased to 60 seconds for better blockchain confirmation
-        
         try:
             # Get initial balances before transfer
             try:
@@ -2640,11 +3841,16 @@ class ApiClient:
                 
                 logger.info(f"Using returnAllFunds=true to ensure complete fund return from {child_wallet}")
                 
-                api_result = self._make_request_with_retry(
-                    'post',
-                    '/api/wallets/return-funds',  # Using the documented endpoint
-                    json=return_funds_payload
-                )
+                try:
+                    api_result = self._make_request_with_retry(
+                        'post',
+                        '/api/wallets/return-funds',  # Using the documented endpoint
+                        json=return_funds_payload,
+                        timeout=TRANSFER_TIMEOUTS
+                    )
+                finally:
+                    # The transfer may land even if the request fails, so drop cached balances either way
+                    self.invalidate_balances(child_wallet, mother_wallet)
                 logger.info(f"API Response for return-funds endpoint: {json.dumps(api_result, default=str)}")
                 
                 # Extract transaction signature if available
@@ -2659,26 +3865,30 @@ class ApiClient:
             # Enhanced verification logic - check multiple sources
             verification_result = None
             verified = False
+            verification_method = None
+            signature_failed = False
             
-            # If we have a transaction signature, verify it directly
+            # If we have a transaction signature, confirm it directly
             if transaction_signature and verify_transfer:
-                logger.info(f"Verifying transaction signature: {transaction_signature}")
-                try:
-                    # Check transaction status via API if available
-                    tx_status = self.get_transaction_status(transaction_signature)
-                    if tx_status.get("status") == "confirmed" or tx_status.get("confirmed"):
-                        verified = True
-                        logger.success(f"Transaction confirmed via signature verification: {transaction_signature}")
-                except Exception as e:
-                    logger.warning(f"Transaction signature verification failed: {str(e)}")
+                logger.info(f"Confirming transaction signature: {transaction_signature}")
+                status = (await self.confirm_signatures_async([transaction_signature])).get(transaction_signature)
+                if status is not None and status.failed:
+                    signature_failed = True
+                    api_error = api_error or f"Transaction failed on-chain: {status.err}"
+                    logger.error(f"Transaction {transaction_signature} failed on-chain: {status.err}")
+                elif status is not None and status.reached(signature_status_client.commitment):
+                    verified = True
+                    verification_method = "signature_status"
+                    logger.success(f"Transaction confirmed via signature status: {transaction_signature}")
             
             # If API succeeded, consider it verified
-            if api_result and api_result.get("status") == "success":
+            if not verified and not signature_failed and api_result and api_result.get("status") == "success":
                 verified = True
+                verification_method = "api"
                 logger.success(f"Transaction verified via API success response")
             
-            # If not yet verified and we want verification, do comprehensive balance checking
-            if not verified and verify_transfer and initial_sender_balance > 0:
+            # Balance diffing is only a fallback for transfers without a settled signature
+            if not verified and not signature_failed and verify_transfer and initial_sender_balance > 0:
                 logger.info("Performing comprehensive balance verification...")
                 
                 # Allow more time for blockchain propagation
@@ -2687,7 +3897,7 @@ class ApiClient:
                 # For returnAllFunds, we expect the child wallet to be nearly empty (just gas remaining)
                 # Check if child wallet balance decreased significantly
                 try:
-                    final_balance_info = self.check_balance(child_wallet)
+                    final_balance_info = self.check_balance(child_wallet, fresh=True)
                     final_balance = 0
                     for token_balance in final_balance_info.get("balances", []):
                         if token_balance.get("symbol") == "SOL":
@@ -2743,7 +3953,7 @@ class ApiClient:
                     "initial_receiver_balance": initial_receiver_balance,
                     "child_final_balance": api_result.get("childWalletFinalBalanceSol", 0) if api_result else None,
                     "verified": True,
-                    "verification_method": "api" if api_result and api_result.get("status") == "success" else "enhanced_balance_check"
+                    "verification_method": verification_method or "enhanced_balance_check"
                 }
                 
                 if verification_result:
@@ -2782,9 +3992,6 @@ class ApiClient:
                 "amount": amount,
                 "error": str(e)
             }
-        finally:
-            # Restore original timeout
-            self.timeout = original_timeout
     
     async def transfer_between_wallets(self, from_wallet: str, from_private_key: str, 
                                      to_wallet: str, amount: float, token_address: str = None,
@@ -2820,10 +4027,6 @@ class ApiClient:
         operation_id = self.generate_transfer_operation_id(from_wallet, to_wallet, amount)
         batch_id = self.generate_batch_id()
         
-        # Use a higher timeout for blockchain operations
-        original_timeout = self.timeout
-        self.timeout = max(self.timeout, 45)  # Use at least 45 seconds for blockchain operations
-        
         try:
             # For generic transfers, we can use the fund-children endpoint
             # by treating the sender as a "mother" wallet
@@ -2843,11 +4046,16 @@ class ApiClient:
                 "idempotencyKey": operation_id
             }
             
-            api_result = self._make_request_with_retry(
-                'post',
-                '/api/wallets/fund-children',
-                json=transfer_payload
-            )
+            try:
+                api_result = self._make_request_with_retry(
+                    'post',
+                    '/api/wallets/fund-children',
+                    json=transfer_payload,
+                    timeout=FUNDING_TIMEOUTS
+                )
+            finally:
+                # The transfer may land even if the request fails, so drop cached balances either way
+                self.invalidate_balances(from_wallet, to_wallet)
             
             logger.info(f"API Response for wallet-to-wallet transfer: {json.dumps(api_result, default=str)}")
             
@@ -2897,9 +4105,6 @@ class ApiClient:
                 "amount": amount,
                 "error": str(e)
             }
-        finally:
-            # Restore original timeout
-            self.timeout = original_timeout
             
     async def execute_volume_run(
         self,
@@ -3447,6 +4652,81 @@ class ApiClient:
                 'max_attempts': 2
             }
 
+    def _mock_jupiter_quote(self, input_mint: str, output_mint: str, amount: int,
+                            slippage_bps: int, platform_fee_bps: int) -> Dict[str, Any]:
+        """Build realistic mock Jupiter quote data for testing."""
+        import random
+        
+        # Simulate different output amounts based on input
+        base_rate = 0.98  # Simulate 2% price impact base
+        variation = random.uniform(-0.02, 0.02)  # ±2% variation
+        output_amount = int(amount * (base_rate + variation))
+        
+        mock_quote = {
+            "message": "Jupiter quote retrieved successfully",
+            "quoteResponse": {
+                "inputMint": input_mint,
+                "outputMint": output_mint,
+                "inAmount": str(amount),
+                "outAmount": str(output_amount),
+                "amount": str(amount),
+                "otherAmountThreshold": str(int(output_amount * 0.98)),
+                "swapMode": "ExactIn",
+                "slippageBps": slippage_bps,
+                "platformFee": None if platform_fee_bps == 0 else {"amount": str(int(amount * platform_fee_bps / 10000)), "feeBps": platform_fee_bps},
+                "priceImpactPct": str(round(random.uniform(0.1, 2.0), 2)),
+                "routePlan": [
+                    {
+                        "swapInfo": {
+                            "ammKey": "mock_amm_key",
+                            "label": "Mock DEX",
+                            "inputMint": input_mint,
+                            "outputMint": output_mint,
+                            "inAmount": str(amount),
+                            "outAmount": str(output_amount),
+                            "feeAmount": str(int(amount * 0.003)),  # 0.3% fee
+                            "feeMint": input_mint
+                        },
+                        "percent": 100
+                    }
+                ],
+                "_formattedInfo": {
+                    "inputToken": input_mint,
+                    "outputToken": output_mint,
+                    "inputAmount": f"{amount / 1000000000} SOL" if input_mint == "SOL" else str(amount),
+                    "outputAmount": f"{output_amount / 1000000000} SOL" if output_mint == "SOL" else str(output_amount),
+                    "priceImpactPct": round(random.uniform(0.1, 2.0), 2),
+                    "routeSteps": 1
+                }
+            }
+        }
+        
+        logger.info(f"Mock Jupiter quote: {amount} {input_mint} → {output_amount} {output_mint}")
+        return mock_quote
+
+    def _validate_quote_response(self, response: Any, input_mint: str, output_mint: str) -> Dict[str, Any]:
+        """
+        Validate a Jupiter quote response and log the quoted amounts.
+        
+        Raises:
+            ApiClientError: If the response has no quoteResponse
+        """
+        if not isinstance(response, dict):
+            raise ApiClientError("Invalid response format from Jupiter quote API")
+        
+        quote = QuoteResponse.from_payload(response)
+        if quote is None:
+            error_msg = response.get("message", "Unknown error in Jupiter quote response")
+            raise ApiClientError(f"Jupiter quote failed: {error_msg}")
+        
+        # Log successful quote retrieval
+        logger.info(
+            f"Jupiter quote successful: {quote.in_amount} {input_mint} → {quote.out_amount} {output_mint} "
+            f"(impact: {quote.price_impact_pct}%)"
+        )
+        
+        return response
+
     def get_jupiter_quote(self, input_mint: str, output_mint: str, amount: int, 
                          slippage_bps: int = 50, only_direct_routes: bool = False,
                          as_legacy_transaction: bool = False, platform_fee_bps: int = 0) -> Dict[str, Any]:
@@ -3469,55 +4749,7 @@ class ApiClient:
             ApiClientError: If the quote request fails
         """
         if self.use_mock:
-            # Mock realistic Jupiter quote data for testing
-            import random
-            
-            # Simulate different output amounts based on input
-            base_rate = 0.98  # Simulate 2% price impact base
-            variation = random.uniform(-0.02, 0.02)  # ±2% variation
-            output_amount = int(amount * (base_rate + variation))
-            
-            mock_quote = {
-                "message": "Jupiter quote retrieved successfully",
-                "quoteResponse": {
-                    "inputMint": input_mint,
-                    "outputMint": output_mint,
-                    "inAmount": str(amount),
-                    "outAmount": str(output_amount),
-                    "amount": str(amount),
-                    "otherAmountThreshold": str(int(output_amount * 0.98)),
-                    "swapMode": "ExactIn",
-                    "slippageBps": slippage_bps,
-                    "platformFee": None if platform_fee_bps == 0 else {"amount": str(int(amount * platform_fee_bps / 10000)), "feeBps": platform_fee_bps},
-                    "priceImpactPct": str(round(random.uniform(0.1, 2.0), 2)),
-                    "routePlan": [
-                        {
-                            "swapInfo": {
-                                "ammKey": "mock_amm_key",
-                                "label": "Mock DEX",
-                                "inputMint": input_mint,
-                                "outputMint": output_mint,
-                                "inAmount": str(amount),
-                                "outAmount": str(output_amount),
-                                "feeAmount": str(int(amount * 0.003)),  # 0.3% fee
-                                "feeMint": input_mint
-                            },
-                            "percent": 100
-                        }
-                    ],
-                    "_formattedInfo": {
-                        "inputToken": input_mint,
-                        "outputToken": output_mint,
-                        "inputAmount": f"{amount / 1000000000} SOL" if input_mint == "SOL" else str(amount),
-                        "outputAmount": f"{output_amount / 1000000000} SOL" if output_mint == "SOL" else str(output_amount),
-                        "priceImpactPct": round(random.uniform(0.1, 2.0), 2),
-                        "routeSteps": 1
-                    }
-                }
-            }
-            
-            logger.info(f"Mock Jupiter quote: {amount} {input_mint} → {output_amount} {output_mint}")
-            return mock_quote
+            return self._mock_jupiter_quote(input_mint, output_mint, amount, slippage_bps, platform_fee_bps)
         
         # Prepare the request payload
         payload = {
@@ -3533,38 +4765,17 @@ class ApiClient:
         logger.info(f"Requesting Jupiter quote: {amount} {input_mint} → {output_mint} (slippage: {slippage_bps}bps)")
         
         try:
-            # Use existing retry mechanism with extended timeout for DEX operations
-            original_timeout = self.timeout
-            self.timeout = max(self.timeout, 20)  # DEX quotes can take longer
-            
+            # Use existing retry mechanism with the DEX quote timeout profile
             response = self._make_request_with_retry(
                 'post',
                 '/api/jupiter/quote',
                 json=payload,
                 max_retries=3,
-                initial_backoff=1.0
+                initial_backoff=1.0,
+                timeout=QUOTE_TIMEOUTS
             )
             
-            # Restore original timeout
-            self.timeout = original_timeout
-            
-            # Validate response structure
-            if not isinstance(response, dict):
-                raise ApiClientError("Invalid response format from Jupiter quote API")
-            
-            if "quoteResponse" not in response:
-                error_msg = response.get("message", "Unknown error in Jupiter quote response")
-                raise ApiClientError(f"Jupiter quote failed: {error_msg}")
-            
-            # Log successful quote retrieval
-            quote_data = response["quoteResponse"]
-            input_amount = quote_data.get("inAmount", "unknown")
-            output_amount = quote_data.get("outAmount", "unknown")
-            price_impact = quote_data.get("priceImpactPct", "unknown")
-            
-            logger.info(f"Jupiter quote successful: {input_amount} {input_mint} → {output_amount} {output_mint} (impact: {price_impact}%)")
-            
-            return response
+            return self._validate_quote_response(response, input_mint, output_mint)
             
         except (ApiTimeoutError, ApiBadResponseError) as e:
             logger.error(f"Jupiter quote API error: {str(e)}")
@@ -3572,75 +4783,119 @@ class ApiClient:
         except Exception as e:
             logger.error(f"Unexpected error in Jupiter quote: {str(e)}")
             raise ApiClientError(f"Jupiter quote request failed: {str(e)}")
-        finally:
-            # Ensure timeout is restored even if an exception occurs
-            self.timeout = original_timeout
 
-    def execute_jupiter_swap(self, user_wallet_private_key: str, quote_response: Dict[str, Any],
-                           wrap_and_unwrap_sol: bool = True, as_legacy_transaction: bool = False,
-                           collect_fees: bool = True, verify_swap: bool = True) -> Dict[str, Any]:
+    async def get_jupiter_quote_async(self, input_mint: str, output_mint: str, amount: int,
+                                      slippage_bps: int = 50, only_direct_routes: bool = False,
+                                      as_legacy_transaction: bool = False, platform_fee_bps: int = 0) -> Dict[str, Any]:
         """
-        Execute a swap on Jupiter DEX using a quote response.
+        Awaitable version of get_jupiter_quote() on the pooled async transport.
         
         Args:
-            user_wallet_private_key: Base58 encoded private key of the user's wallet
-            quote_response: Jupiter quote response from get_jupiter_quote
-            wrap_and_unwrap_sol: Whether to automatically wrap and unwrap SOL (default: True)
+            input_mint: Token mint address of the input token or symbol (SOL, USDC, etc.)
+            output_mint: Token mint address of the output token or symbol (SOL, USDC, etc.)
+            amount: Amount of input token in base units (e.g., lamports for SOL)
+            slippage_bps: Slippage tolerance in basis points (default: 50)
+            only_direct_routes: Whether to only use direct swap routes (default: False)
             as_legacy_transaction: Whether to use legacy transactions (default: False)
-            collect_fees: Whether to collect fees from the swap (default: True)
-            verify_swap: Whether to verify the swap by checking balance changes (default: True)
+            platform_fee_bps: Platform fee in basis points (default: 0)
             
         Returns:
-            Dictionary containing swap execution results
+            Dictionary containing Jupiter quote response
             
         Raises:
-            ApiClientError: If the swap execution fails
+            ApiClientError: If the quote request fails
         """
         if self.use_mock:
-            # Mock successful swap execution for testing
-            import random
-            
-            # Extract info from quote response for realistic mock
-            quote_data = quote_response.get("quoteResponse", {})
-            input_mint = quote_data.get("inputMint", "SOL")
-            output_mint = quote_data.get("outputMint", "USDC")
-            in_amount = quote_data.get("inAmount", "1000000000")
-            out_amount = quote_data.get("outAmount", "980000000")
-            
-            # Generate mock transaction ID
-            mock_tx_id = f"mock_swap_tx_{int(time.time())}_{random.randint(1000, 9999)}"
-            
-            # Mock fee collection result
-            fee_collection_result = None
-            if collect_fees:
-                fee_amount = float(in_amount) * 0.001 if in_amount.isdigit() else 0.001  # 0.1% fee
-                fee_collection_result = {
-                    "status": "success",
-                    "transactionId": f"mock_fee_tx_{int(time.time())}",
-                    "feeAmount": fee_amount,
-                    "feeTokenMint": input_mint
-                }
+            return self._mock_jupiter_quote(input_mint, output_mint, amount, slippage_bps, platform_fee_bps)
+        
+        payload = {
+            "inputMint": input_mint,
+            "outputMint": output_mint,
+            "amount": amount,
+            "slippageBps": slippage_bps,
+            "onlyDirectRoutes": only_direct_routes,
+            "asLegacyTransaction": as_legacy_transaction,
+            "platformFeeBps": platform_fee_bps
+        }
+        
+        logger.info(f"Requesting Jupiter quote: {amount} {input_mint} → {output_mint} (slippage: {slippage_bps}bps)")
+        
+        try:
+            response = await self._single_flight.do(
+                ('jupiter_quote',) + tuple(payload.values()),
+                lambda: self._make_request_with_retry_async(
+                    'post',
+                    '/api/jupiter/quote',
+                    json=payload,
+                    max_retries=3,
+                    initial_backoff=1.0,
+                    timeout=QUOTE_TIMEOUTS,
+                    hedge=True
+                )
+            )
+            return self._validate_quote_response(response, input_mint, output_mint)
             
-            mock_swap_result = {
-                "message": "Swap executed successfully",
-                "status": "success", 
-                "transactionId": mock_tx_id,
-                "feeCollection": fee_collection_result,
-                "newBalanceSol": round(random.uniform(0.1, 5.0), 6),
-                "swapDetails": {
-                    "inputMint": input_mint,
-                    "outputMint": output_mint,
-                    "inputAmount": in_amount,
-                    "outputAmount": out_amount,
-                    "priceImpact": quote_data.get("priceImpactPct", "1.5")
-                },
-                "verified": verify_swap,
-                "executionTime": round(random.uniform(2.0, 8.0), 2)
+        except (ApiTimeoutError, ApiBadResponseError) as e:
+            logger.error(f"Jupiter quote API error: {str(e)}")
+            raise ApiClientError(f"Failed to get Jupiter quote: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error in Jupiter quote: {str(e)}")
+            raise ApiClientError(f"Jupiter quote request failed: {str(e)}")
+
+    def _mock_jupiter_swap(self, quote_response: Dict[str, Any], collect_fees: bool, verify_swap: bool) -> Dict[str, Any]:
+        """Build a mock successful swap execution result for testing."""
+        import random
+        
+        # Extract info from quote response for realistic mock
+        quote_data = quote_response.get("quoteResponse", {})
+        input_mint = quote_data.get("inputMint", "SOL")
+        output_mint = quote_data.get("outputMint", "USDC")
+        in_amount = quote_data.get("inAmount", "1000000000")
+        out_amount = quote_data.get("outAmount", "980000000")
+        
+        # Generate mock transaction ID
+        mock_tx_id = f"mock_swap_tx_{int(time.time())}_{random.randint(1000, 9999)}"
+        
+        # Mock fee collection result
+        fee_collection_result = None
+        if collect_fees:
+            fee_amount = float(in_amount) * 0.001 if in_amount.isdigit() else 0.001  # 0.1% fee
+            fee_collection_result = {
+                "status": "success",
+                "transactionId": f"mock_fee_tx_{int(time.time())}",
+                "feeAmount": fee_amount,
+                "feeTokenMint": input_mint
             }
-            
-            logger.info(f"Mock Jupiter swap: {in_amount} {input_mint} → {out_amount} {output_mint} (TX: {mock_tx_id})")
-            return mock_swap_result
         
+        mock_swap_result = {
+            "message": "Swap executed successfully",
+            "status": "success", 
+            "transactionId": mock_tx_id,
+            "feeCollection": fee_collection_result,
+            "newBalanceSol": round(random.uniform(0.1, 5.0), 6),
+            "swapDetails": {
+                "inputMint": input_mint,
+                "outputMint": output_mint,
+                "inputAmount": in_amount,
+                "outputAmount": out_amount,
+                "priceImpact": quote_data.get("priceImpactPct", "1.5")
+            },
+            "verified": verify_swap,
+            "executionTime": round(random.uniform(2.0, 8.0), 2)
+        }
+        
+        logger.info(f"Mock Jupiter swap: {in_amount} {input_mint} → {out_amount} {output_mint} (TX: {mock_tx_id})")
+        return mock_swap_result
+
+    def _build_swap_payload(self, user_wallet_private_key: str, quote_response: Dict[str, Any],
+                            wrap_and_unwrap_sol: bool, as_legacy_transaction: bool,
+                            collect_fees: bool) -> Dict[str, Any]:
+        """
+        Validate swap parameters and build the /api/jupiter/swap request payload.
+        
+        Raises:
+            ApiClientError: If required parameters are missing or invalid
+        """
         # Validate required parameters
         if not user_wallet_private_key:
             raise ApiClientError("Missing required parameter: user_wallet_private_key")
@@ -3652,24 +4907,124 @@ class ApiClient:
             raise ApiClientError("Invalid quote_response: missing 'quoteResponse' field")
         
         # Prepare the swap request payload
-        payload = {
+        return {
             "userWalletPrivateKeyBase58": user_wallet_private_key,
             "quoteResponse": quote_response["quoteResponse"],
             "wrapAndUnwrapSol": wrap_and_unwrap_sol,
             "asLegacyTransaction": as_legacy_transaction,
             "collectFees": collect_fees
         }
+
+    def _process_swap_response(self, response: Any, quote_data: Dict[str, Any],
+                               verify_swap: bool, execution_time: float) -> Dict[str, Any]:
+        """
+        Validate a Jupiter swap response and build the swap result.
         
-        # Get initial balance for verification if enabled
-        initial_balances = {}
-        if verify_swap:
-            try:
-                # Extract wallet public key from private key for balance checking
-                # Note: In production, you'd use proper Solana SDK for this
-                # For now, we'll skip initial balance check and rely on API response
-                logger.info("Swap verification enabled - will verify using API response")
-            except Exception as e:
-                logger.warning(f"Could not get initial balance for verification: {str(e)}")
+        Raises:
+            ApiClientError: If the swap did not succeed
+        """
+        input_mint = quote_data.get("inputMint", "unknown")
+        output_mint = quote_data.get("outputMint", "unknown")
+        input_amount = quote_data.get("inAmount", "unknown")
+        expected_output = quote_data.get("outAmount", "unknown")
+        
+        # Enhanced response validation with structured logging
+        try:
+            # Validate response structure with detailed error handling
+            if not isinstance(response, dict):
+                logger.error(f"❌ Jupiter swap: Invalid response type {type(response)}, expected dict")
+                raise ApiClientError("Invalid response format from Jupiter swap API - response is not a dictionary")
+            
+            # Log response structure for debugging
+            response_keys = list(response.keys()) if response else []
+            logger.info(f"🔍 Jupiter swap response keys: {response_keys}")
+            
+            # Check for successful swap execution with robust error message extraction
+            if response.get("status") != "success":
+                # Robust error message extraction with fallbacks
+                error_msg = None
+                try:
+                    error_msg = response.get("message", "")
+                    if not error_msg or error_msg == '':
+                        error_msg = response.get("error", "")
+                    if not error_msg or error_msg == '':
+                        error_msg = str(response.get("data", {}).get("message", ""))
+                    if not error_msg or error_msg == '':
+                        error_msg = "Unknown Jupiter swap execution error"
+                except Exception as msg_extract_error:
+                    logger.warning(f"⚠️ Jupiter swap: Error extracting message: {str(msg_extract_error)}")
+                    error_msg = f"Jupiter swap failed with malformed error response: {str(response)[:200]}"
+                
+                logger.error(f"❌ Jupiter swap failed: status={response.get('status')}, message={error_msg}")
+                raise ApiClientError(f"Jupiter swap failed: {error_msg}")
+                
+        except ApiClientError:
+            # Re-raise known API errors
+            raise
+        except Exception as validation_error:
+            # Handle unexpected validation errors with detailed logging
+            logger.error(f"❌ Jupiter swap validation error: {str(validation_error)}, response_type: {type(response)}")
+            logger.error(f"❌ Jupiter swap raw response (first 300 chars): {str(response)[:300]}")
+            raise ApiClientError(f"Jupiter swap response validation failed: {str(validation_error)}")
+        
+        # Extract swap results
+        transaction_id = response.get("transactionId")
+        fee_collection = response.get("feeCollection", {})
+        new_balance_sol = response.get("newBalanceSol", 0)
+        
+        # Enhanced response with verification status
+        swap_result = {
+            "message": response.get("message", "Swap executed successfully"),
+            "status": "success",
+            "transactionId": transaction_id,
+            "feeCollection": fee_collection,
+            "newBalanceSol": new_balance_sol,
+            "swapDetails": {
+                "inputMint": input_mint,
+                "outputMint": output_mint,
+                "inputAmount": input_amount,
+                "expectedOutput": expected_output,
+                "priceImpact": quote_data.get("priceImpactPct")
+            },
+            "verified": verify_swap,  # In real implementation, would check actual balances
+            "executionTime": round(execution_time, 2),
+            "api_response": response
+        }
+        
+        # Log successful swap
+        fee_status = fee_collection.get("status", "unknown") if fee_collection else "disabled"
+        logger.info(f"Jupiter swap successful: TX {transaction_id}, fees: {fee_status}, time: {execution_time:.2f}s")
+        
+        return swap_result
+
+    def execute_jupiter_swap(self, user_wallet_private_key: str, quote_response: Dict[str, Any],
+                           wrap_and_unwrap_sol: bool = True, as_legacy_transaction: bool = False,
+                           collect_fees: bool = True, verify_swap: bool = True,
+                           wallet_address: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Execute a swap on Jupiter DEX using a quote response.
+        
+        Args:
+            user_wallet_private_key: Base58 encoded private key of the user's wallet
+            quote_response: Jupiter quote response from get_jupiter_quote
+            wrap_and_unwrap_sol: Whether to automatically wrap and unwrap SOL (default: True)
+            as_legacy_transaction: Whether to use legacy transactions (default: False)
+            collect_fees: Whether to collect fees from the swap (default: True)
+            verify_swap: Whether to verify the swap by checking balance changes (default: True)
+            wallet_address: Public key of the swapping wallet, whose cached balances are invalidated
+            
+        Returns:
+            Dictionary containing swap execution results
+            
+        Raises:
+            ApiClientError: If the swap execution fails
+        """
+        if self.use_mock:
+            return self._mock_jupiter_swap(quote_response, collect_fees, verify_swap)
+        
+        payload = self._build_swap_payload(
+            user_wallet_private_key, quote_response, wrap_and_unwrap_sol, as_legacy_transaction, collect_fees
+        )
         
         # Extract swap details for logging
         quote_data = quote_response["quoteResponse"]
@@ -3681,93 +5036,83 @@ class ApiClient:
         logger.info(f"Executing Jupiter swap: {input_amount} {input_mint} → {expected_output} {output_mint}")
         
         try:
-            # Use existing retry mechanism with extended timeout for DEX operations
-            original_timeout = self.timeout
-            self.timeout = max(self.timeout, 30)  # DEX swaps need more time
-            
+            # Use existing retry mechanism with the DEX swap timeout profile
             start_time = time.time()
             
-            response = self._make_request_with_retry(
-                'post',
-                '/api/jupiter/swap',
-                json=payload,
-                max_retries=3,
-                initial_backoff=2.0  # Longer initial backoff for swaps
-            )
+            try:
+                response = self._make_request_with_retry(
+                    'post',
+                    '/api/jupiter/swap',
+                    json=payload,
+                    max_retries=3,
+                    initial_backoff=2.0,  # Longer initial backoff for swaps
+                    timeout=SWAP_TIMEOUTS
+                )
+            finally:
+                # The swap may land even if the request fails, so drop cached balances either way
+                self.invalidate_balances(wallet_address)
             
             execution_time = time.time() - start_time
             
-            # Restore original timeout
-            self.timeout = original_timeout
+            return self._process_swap_response(response, quote_data, verify_swap, execution_time)
             
-            # Enhanced response validation with structured logging
-            try:
-                # Validate response structure with detailed error handling
-                if not isinstance(response, dict):
-                    logger.error(f"❌ Jupiter swap: Invalid response type {type(response)}, expected dict")
-                    raise ApiClientError("Invalid response format from Jupiter swap API - response is not a dictionary")
-                
-                # Log response structure for debugging
-                response_keys = list(response.keys()) if response else []
-                logger.info(f"🔍 Jupiter swap response keys: {response_keys}")
-                
-                # Check for successful swap execution with robust error message extraction
-                if response.get("status") != "success":
-                    # Robust error message extraction with fallbacks
-                    error_msg = None
-                    try:
-                        error_msg = response.get("message", "")
-                        if not error_msg or error_msg == '':
-                            error_msg = response.get("error", "")
-                        if not error_msg or error_msg == '':
-                            error_msg = str(response.get("data", {}).get("message", ""))
-                        if not error_msg or error_msg == '':
-                            error_msg = "Unknown Jupiter swap execution error"
-                    except Exception as msg_extract_error:
-                        logger.warning(f"⚠️ Jupiter swap: Error extracting message: {str(msg_extract_error)}")
-                        error_msg = f"Jupiter swap failed with malformed error response: {str(response)[:200]}"
-                    
-                    logger.error(f"❌ Jupiter swap failed: status={response.get('status')}, message={error_msg}")
-                    raise ApiClientError(f"Jupiter swap failed: {error_msg}")
-                    
-            except ApiClientError:
-                # Re-raise known API errors
-                raise
-            except Exception as validation_error:
-                # Handle unexpected validation errors with detailed logging
-                logger.error(f"❌ Jupiter swap validation error: {str(validation_error)}, response_type: {type(response)}")
-                logger.error(f"❌ Jupiter swap raw response (first 300 chars): {str(response)[:300]}")
-                raise ApiClientError(f"Jupiter swap response validation failed: {str(validation_error)}")
-            
-            # Extract swap results
-            transaction_id = response.get("transactionId")
-            fee_collection = response.get("feeCollection", {})
-            new_balance_sol = response.get("newBalanceSol", 0)
-            
-            # Enhanced response with verification status
-            swap_result = {
-                "message": response.get("message", "Swap executed successfully"),
-                "status": "success",
-                "transactionId": transaction_id,
-                "feeCollection": fee_collection,
-                "newBalanceSol": new_balance_sol,
-                "swapDetails": {
-                    "inputMint": input_mint,
-                    "outputMint": output_mint,
-                    "inputAmount": input_amount,
-                    "expectedOutput": expected_output,
-                    "priceImpact": quote_data.get("priceImpactPct")
-                },
-                "verified": verify_swap,  # In real implementation, would check actual balances
-                "executionTime": round(execution_time, 2),
-                "api_response": response
-            }
+        except (ApiTimeoutError, ApiBadResponseError) as e:
+            logger.error(f"Jupiter swap API error: {str(e)}")
+            raise ApiClientError(f"Failed to execute Jupiter swap: {str(e)}")
+        except Exception as e:
+            logger.error(f"Unexpected error in Jupiter swap: {str(e)}")
+            raise ApiClientError(f"Jupiter swap execution failed: {str(e)}")
+
+    async def execute_jupiter_swap_async(self, user_wallet_private_key: str, quote_response: Dict[str, Any],
+                                         wrap_and_unwrap_sol: bool = True, as_legacy_transaction: bool = False,
+                                         collect_fees: bool = True, verify_swap: bool = True,
+                                         wallet_address: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Awaitable version of execute_jupiter_swap() on the pooled async transport.
+        
+        Args:
+            user_wallet_private_key: Base58 encoded private key of the user's wallet
+            quote_response: Jupiter quote response from get_jupiter_quote
+            wrap_and_unwrap_sol: Whether to automatically wrap and unwrap SOL (default: True)
+            as_legacy_transaction: Whether to use legacy transactions (default: False)
+            collect_fees: Whether to collect fees from the swap (default: True)
+            verify_swap: Whether to verify the swap by checking balance changes (default: True)
+            wallet_address: Public key of the swapping wallet, whose cached balances are invalidated
+            
+        Returns:
+            Dictionary containing swap execution results
+            
+        Raises:
+            ApiClientError: If the swap execution fails
+        """
+        if self.use_mock:
+            return self._mock_jupiter_swap(quote_response, collect_fees, verify_swap)
+        
+        payload = self._build_swap_payload(
+            user_wallet_private_key, quote_response, wrap_and_unwrap_sol, as_legacy_transaction, collect_fees
+        )
+        
+        quote_data = quote_response["quoteResponse"]
+        logger.info(f"Executing Jupiter swap: {quote_data.get('inAmount', 'unknown')} {quote_data.get('inputMint', 'unknown')} "
+                    f"→ {quote_data.get('outAmount', 'unknown')} {quote_data.get('outputMint', 'unknown')}")
+        
+        try:
+            start_time = time.time()
             
-            # Log successful swap
-            fee_status = fee_collection.get("status", "unknown") if fee_collection else "disabled"
-            logger.info(f"Jupiter swap successful: TX {transaction_id}, fees: {fee_status}, time: {execution_time:.2f}s")
+            try:
+                response = await self._make_request_with_retry_async(
+                    'post',
+                    '/api/jupiter/swap',
+                    json=payload,
+                    max_retries=3,
+                    initial_backoff=2.0,  # Longer initial backoff for swaps
+                    timeout=SWAP_TIMEOUTS
+                )
+            finally:
+                # The swap may land even if the request fails, so drop cached balances either way
+                self.invalidate_balances(wallet_address)
             
-            return swap_result
+            return self._process_swap_response(response, quote_data, verify_swap, time.time() - start_time)
             
         except (ApiTimeoutError, ApiBadResponseError) as e:
             logger.error(f"Jupiter swap API error: {str(e)}")
@@ -3775,9 +5120,6 @@ class ApiClient:
         except Exception as e:
             logger.error(f"Unexpected error in Jupiter swap: {str(e)}")
             raise ApiClientError(f"Jupiter swap execution failed: {str(e)}")
-        finally:
-            # Ensure timeout is restored even if an exception occurs
-            self.timeout = original_timeout
 
     def generate_batch_id(self) -> str:
         """Generate a unique batch ID for a group of transfers."""
@@ -3833,26 +5175,18 @@ class ApiClient:
         operation_id = self.generate_transfer_operation_id(child_wallet, mother_wallet, amount)
         batch_id = self.generate_batch_id()
         
-        # Use a higher timeout for blockchain operations
-        original_timeout = self.timeout
-        self.timeout = max(self.timeout, 60)  # Increased to 60 seconds for better blockchain confirmation
+        # Return-funds needs time for blockchain confirmation
+        request_timeout = TRANSFER_TIMEOUTS
         
         try:
             # Get initial balances before transfer
             try:
-                sender_balance_info = self.check_balance(child_wallet)
-                initial_sender_balance = 0
-                for token_balance in sender_balance_info.get("balances", []):
-                    if token_balance.get("symbol") == "SOL":
-                        initial_sender_balance = token_balance.get("amount", 0)
-                        break
-                
-                receiver_balance_info = self.check_balance(mother_wallet)
-                initial_receiver_balance = 0
-                for token_balance in receiver_balance_info.get("balances", []):
-                    if token_balance.get("symbol") == "SOL":
-                        initial_receiver_balance = token_balance.get("amount", 0)
-                        break
+                sender_balance_info, receiver_balance_info = await asyncio.gather(
+                    self.check_balance_async(child_wallet),
+                    self.check_balance_async(mother_wallet)
+                )
+                initial_sender_balance = self._extract_sol_balance(sender_balance_info)
+                initial_receiver_balance = self._extract_sol_balance(receiver_balance_info)
                 
                 logger.info(f"Initial balances - Child: {initial_sender_balance} SOL, Mother: {initial_receiver_balance} SOL")
             except Exception as e:
@@ -3875,11 +5209,16 @@ class ApiClient:
                 
                 logger.info(f"Using returnAllFunds=true to ensure complete fund return from {child_wallet}")
                 
-                api_result = self._make_request_with_retry(
-                    'post',
-                    '/api/wallets/return-funds',  # Using the documented endpoint
-                    json=return_funds_payload
-                )
+                try:
+                    api_result = await self._make_request_with_retry_async(
+                        'post',
+                        '/api/wallets/return-funds',  # Using the documented endpoint
+                        json=return_funds_payload,
+                        timeout=request_timeout
+                    )
+                finally:
+                    # The transfer may land even if the request fails, so drop cached balances either way
+                    self.invalidate_balances(child_wallet, mother_wallet)
                 logger.info(f"API Response for return-funds endpoint: {json.dumps(api_result, default=str)}")
                 
                 # Extract transaction signature if available
@@ -3894,26 +5233,30 @@ class ApiClient:
             # Enhanced verification logic - check multiple sources
             verification_result = None
             verified = False
+            verification_method = None
+            signature_failed = False
             
-            # If we have a transaction signature, verify it directly
+            # If we have a transaction signature, confirm it directly
             if transaction_signature and verify_transfer:
-                logger.info(f"Verifying transaction signature: {transaction_signature}")
-                try:
-                    # Check transaction status via API if available
-                    tx_status = self.get_transaction_status(transaction_signature)
-                    if tx_status.get("status") == "confirmed" or tx_status.get("confirmed"):
-                        verified = True
-                        logger.success(f"Transaction confirmed via signature verification: {transaction_signature}")
-                except Exception as e:
-                    logger.warning(f"Transaction signature verification failed: {str(e)}")
+                logger.info(f"Confirming transaction signature: {transaction_signature}")
+                status = (await self.confirm_signatures_async([transaction_signature])).get(transaction_signature)
+                if status is not None and status.failed:
+                    signature_failed = True
+                    api_error = api_error or f"Transaction failed on-chain: {status.err}"
+                    logger.error(f"Transaction {transaction_signature} failed on-chain: {status.err}")
+                elif status is not None and status.reached(signature_status_client.commitment):
+                    verified = True
+                    verification_method = "signature_status"
+                    logger.success(f"Transaction confirmed via signature status: {transaction_signature}")
             
             # If API succeeded, consider it verified
-            if api_result and api_result.get("status") == "success":
+            if not verified and not signature_failed and api_result and api_result.get("status") == "success":
                 verified = True
+                verification_method = "api"
                 logger.success(f"Transaction verified via API success response")
             
-            # If not yet verified and we want verification, do comprehensive balance checking
-            if not verified and verify_transfer and initial_sender_balance > 0:
+            # Balance diffing is only a fallback for transfers without a settled signature
+            if not verified and not signature_failed and verify_transfer and initial_sender_balance > 0:
                 logger.info("Performing comprehensive balance verification...")
                 
                 # Allow more time for blockchain propagation
@@ -3922,12 +5265,7 @@ class ApiClient:
                 # For returnAllFunds, we expect the child wallet to be nearly empty (just gas remaining)
                 # Check if child wallet balance decreased significantly
                 try:
-                    final_balance_info = self.check_balance(child_wallet)
-                    final_balance = 0
-                    for token_balance in final_balance_info.get("balances", []):
-                        if token_balance.get("symbol") == "SOL":
-                            final_balance = token_balance.get("amount", 0)
-                            break
+                    final_balance = self._extract_sol_balance(await self.check_balance_async(child_wallet, fresh=True))
                     
                     # Consider successful if child wallet balance decreased significantly
                     balance_decrease = initial_sender_balance - final_balance
@@ -3978,7 +5316,7 @@ class ApiClient:
                     "initial_receiver_balance": initial_receiver_balance,
                     "child_final_balance": api_result.get("childWalletFinalBalanceSol", 0) if api_result else None,
                     "verified": True,
-                    "verification_method": "api" if api_result and api_result.get("status") == "success" else "enhanced_balance_check"
+                    "verification_method": verification_method or "enhanced_balance_check"
                 }
                 
                 if verification_result:
@@ -4017,9 +5355,6 @@ class ApiClient:
                 "amount": amount,
                 "error": str(e)
             }
-        finally:
-            # Restore original timeout
-            self.timeout = original_timeout
     
     async def transfer_between_wallets(self, from_wallet: str, from_private_key: str, 
                                      to_wallet: str, amount: float, token_address: str = None,
@@ -4055,9 +5390,8 @@ class ApiClient:
         operation_id = self.generate_transfer_operation_id(from_wallet, to_wallet, amount)
         batch_id = self.generate_batch_id()
         
-        # Use a higher timeout for blockchain operations
-        original_timeout = self.timeout
-        self.timeout = max(self.timeout, 45)  # Use at least 45 seconds for blockchain operations
+        # Use the blockchain funding timeout profile
+        request_timeout = FUNDING_TIMEOUTS
         
         try:
             # For generic transfers, we can use the fund-children endpoint
@@ -4078,11 +5412,16 @@ class ApiClient:
                 "idempotencyKey": operation_id
             }
             
-            api_result = self._make_request_with_retry(
-                'post',
-                '/api/wallets/fund-children',
-                json=transfer_payload
-            )
+            try:
+                api_result = await self._make_request_with_retry_async(
+                    'post',
+                    '/api/wallets/fund-children',
+                    json=transfer_payload,
+                    timeout=request_timeout
+                )
+            finally:
+                # The transfer may land even if the request fails, so drop cached balances either way
+                self.invalidate_balances(from_wallet, to_wallet)
             
             logger.info(f"API Response for wallet-to-wallet transfer: {json.dumps(api_result, default=str)}")
             
@@ -4132,9 +5471,6 @@ class ApiClient:
                 "amount": amount,
                 "error": str(e)
             }
-        finally:
-            # Restore original timeout
-            self.timeout = original_timeout
             
     async def execute_volume_run(
         self,
@@ -4792,12 +6128,16 @@ class ApiClient:
                 "timestamp": time.time()
             }
             
-            response = self._make_request_with_retry(
-                "POST", 
-                "/api/spl/execute_buy", 
-                json=operation_data,
-                timeout=300  # 5 minute timeout for execution
-            )
+            try:
+                response = self._make_request_with_retry(
+                    "POST", 
+                    "/api/spl/execute_buy", 
+                    json=operation_data,
+                    timeout=300  # 5 minute timeout for execution
+                )
+            finally:
+                # The swaps may land even if the request fails, so drop cached balances either way
+                self.invalidate_balances(mother_wallet, *child_wallets)
             
             if response.get("success"):
                 logger.info("SPL buy operation initiated successfully")
@@ -4838,12 +6178,16 @@ class ApiClient:
                 "timestamp": time.time()
             }
             
-            response = self._make_request_with_retry(
-                "POST",
-                "/api/spl/execute_sell",
-                json=operation_data,
-                timeout=300  # 5 minute timeout for execution
-            )
+            try:
+                response = self._make_request_with_retry(
+                    "POST",
+                    "/api/spl/execute_sell",
+                    json=operation_data,
+                    timeout=300  # 5 minute timeout for execution
+                )
+            finally:
+                # The swaps may land even if the request fails, so drop cached balances either way
+                self.invalidate_balances(mother_wallet, *child_wallets)
             
             if response.get("success"):
                 logger.info("SPL sell operation initiated successfully")
@@ -4996,8 +6340,29 @@ class ApiClient:
         trades: List[Dict[str, Any]],
         token_address: str,
         verify_transfers: bool = True,
+        max_concurrent_swaps: int = SPL_SWAP_CONCURRENCY,
+        user_id: Optional[int] = None,
     ) -> Dict[str, Any]:
-        """Execute SPL volume generation with separated buy/sell phases for natural trading patterns"""
+        """
+        Execute SPL volume generation with separated buy/sell phases for natural trading patterns.
+        
+        Each buy is dispatched by the shared trade scheduler when its schedule timestamp
+        comes due. Buys on different wallets run concurrently, at most max_concurrent_swaps
+        at a time, while each wallet's own buys stay sequential. Sell operations in the
+        schedule set the pacing of the sell phase. Failed swaps are retried once.
+        
+        Args:
+            child_wallets: Child wallet addresses
+            child_private_keys: Private keys matching child_wallets
+            trades: Planned trades with wallet_index, amount and timestamp
+            token_address: Token mint to trade
+            verify_transfers: Whether to verify each swap
+            max_concurrent_swaps: Wallets allowed to swap at the same time (1 = one at a time)
+            user_id: Telegram user the run belongs to, so the scheduler shares swaps fairly between users
+            
+        Returns:
+            Run results with per-phase counts, volume and swap results
+        """
         
         try:
             logger.info(f"Starting advanced SPL volume generation with {len(trades)} swaps for token {token_address}")
@@ -5044,15 +6409,18 @@ class ApiClient:
                 "pattern_type": "separated_phases"  # Indicate the new pattern
             }
             
-            def calculate_safe_swap_amount(wallet_address: str, requested_sol: float) -> float:
+            async def calculate_safe_swap_amount(wallet_address: str, requested_sol: float,
+                                                 known_lamports: Optional[int] = None) -> float:
                 """Calculate safe swap amount based on actual wallet balance and requirements"""
                 try:
-                    balance_response = self.check_balance(wallet_address)
-                    if not balance_response.get("success"):
-                        logger.warning(f"Failed to get balance for wallet {wallet_address}")
-                        return 0.0
-                    
-                    current_balance_sol = balance_response.get("balance", 0.0)
+                    if known_lamports is None:
+                        balance_response = await self.check_balance_async(wallet_address)
+                        if not balance_response.get("success"):
+                            logger.warning(f"Failed to get balance for wallet {wallet_address}")
+                            return 0.0
+                        current_balance_sol = balance_response.get("balance", 0.0)
+                    else:
+                        current_balance_sol = known_lamports / 1_000_000_000
                     current_lamports = int(current_balance_sol * 1_000_000_000)
                     
                     # Dynamic buffer calculation based on actual wallet balance
@@ -5109,17 +6477,21 @@ class ApiClient:
             insufficient_wallets = []
             jupiter_ready_wallets = 0
             
+            # Read every wallet's balance in one batched call
+            lamport_balances = await self.check_balances_async(child_wallets)
+            
             for wallet_address in child_wallets:
                 # Check current balance and Jupiter readiness
-                balance_response = self.check_balance(wallet_address)
-                if balance_response.get("success"):
-                    current_balance_sol = balance_response.get("balance", 0.0)
+                if wallet_address in lamport_balances:
+                    current_balance_sol = lamport_balances[wallet_address] / 1_000_000_000
                     # Jupiter minimum: REDUCED to work with 0.0075 SOL funded wallets
                     # 0.005 SOL swap + 0.0005 SOL buffer = 0.0055 SOL total (further reduced)
                     jupiter_minimum = 0.0055
                     
                     if current_balance_sol >= jupiter_minimum:
-                        safe_amount = calculate_safe_swap_amount(wallet_address, 0.005)  # Test with reduced realistic amount
+                        safe_amount = await calculate_safe_swap_amount(
+                            wallet_address, 0.005, known_lamports=lamport_balances[wallet_address]
+                        )  # Test with reduced realistic amount
                         if safe_amount > 0:
                             total_usable_balance += safe_amount
                             jupiter_ready_wallets += 1
@@ -5157,6 +6529,10 @@ class ApiClient:
             successful_sells = 0
             total_volume = 0.0
             
+            # Scheduled sells only pace the sell phase; every other trade is a buy
+            sell_trades = [trade for trade in trades if trade.get("type") == "sell"]
+            trades = [trade for trade in trades if trade.get("type") != "sell"]
+            
             # VOLUME ENFORCEMENT: Calculate total intended volume from trades
             intended_total_volume = sum(trade.get("amount", trade.get("amount_sol", 0.001)) for trade in trades)
             logger.info(f"✅ Volume enforcement: Intended total volume: {intended_total_volume:.6f} SOL across {len(trades)} trades")
@@ -5182,10 +6558,13 @@ class ApiClient:
             logger.info(f"📊 Volume checkpoint: Processing {intended_total_volume:.6f} SOL across {len(trades)} planned trades")
             
             planned_volume = 0.0
+            trade_timestamp = 0.0
             for i, trade in enumerate(trades):
                 wallet_idx = trade.get("wallet_index", i % len(child_wallets))
                 wallet_address = child_wallets[wallet_idx]
                 trade_sol_amount = trade.get("amount", trade.get("amount_sol", 0.001))
+                # Trades without a schedule timestamp keep a random 1-5 second spacing
+                trade_timestamp = trade.get("timestamp", trade_timestamp + random.uniform(1, 5))
                 
                 # Volume conservation: Track planned vs intended volume
                 remaining = max(0.0, intended_total_volume - planned_volume)
@@ -5198,7 +6577,7 @@ class ApiClient:
                     logger.debug(f"Volume planning progress: {planned_volume:.6f}/{intended_total_volume:.6f} SOL ({i+1}/{len(trades)} trades)")
                 
                 # Determine a safe per-wallet amount and cap it to the remaining target
-                safe_amount = calculate_safe_swap_amount(wallet_address, trade_sol_amount)
+                safe_amount = await calculate_safe_swap_amount(wallet_address, trade_sol_amount)
                 if safe_amount <= 0:
                     logger.warning(f"Skipping buy {i+1}: insufficient balance for wallet {wallet_address[:8]}...")
                     continue
@@ -5212,13 +6591,12 @@ class ApiClient:
                     "wallet_private_key": private_key_map[wallet_address],
                     "amount_sol": planned_amount,
                     "operation_id": f"buy_{i}",
-                    "original_trade_index": i
+                    "original_trade_index": i,
+                    "timestamp": trade_timestamp
                 })
                 planned_volume += planned_amount
-            # Shuffle buy operations to randomize execution order
-            random.shuffle(buy_operations)
             
-            # Phase 2: Execute BUY operations with delays
+            # Phase 2: Execute BUY operations at their scheduled times
             # Validate Phase 1 volume conservation
             actual_buy_volume = sum(op.get('amount_sol', 0) for op in buy_operations)
             buy_volume_compliance = (actual_buy_volume / intended_total_volume) * 100 if intended_total_volume > 0 else 0
@@ -5231,139 +6609,219 @@ class ApiClient:
             
             planned_volume = actual_buy_volume  # Update planned_volume to actual
             
-            for buy_op in buy_operations:
-                try:
-                    wallet_address = buy_op["wallet_address"] 
-                    wallet_private_key = buy_op["wallet_private_key"]
-                    trade_sol_amount = buy_op["amount_sol"]
-                    
-                    # Real-time balance verification before trade execution
-                    pre_trade_check = calculate_safe_swap_amount(wallet_address, trade_sol_amount)
-                    
-                    # Dynamic adjustment if wallet balance changed since planning
-                    if pre_trade_check < trade_sol_amount:
-                        logger.info(f"🔄 Real-time adjustment: {wallet_address[:8]} {trade_sol_amount:.6f} → {pre_trade_check:.6f} SOL (balance declined)")
-                        amount = pre_trade_check
-                    else:
-                        amount = trade_sol_amount
-                    
-                    # Enhanced minimum threshold check with structured logging
-                    if amount <= 0.001:  # Increased from 0 to 0.001 SOL minimum
-                        current_bal = self.check_balance(wallet_address).get("balance", 0.0)
-                        logger.warning(f"⚠️ Skipping {wallet_address[:8]}: insufficient balance {current_bal:.6f} SOL → safe amount {amount:.6f} SOL")
+            # The shared trade scheduler dispatches each buy when its timestamp comes due, up to
+            # max_concurrent_swaps at a time. Each wallet's own swaps run one after another, so its
+            # balance is re-read only after its previous swap, with a random 1-5 second pause after
+            # each; a buy whose wallet is still busy waits without holding one of the concurrency
+            # slots other wallets could use.
+            buy_run_id = f"{batch_id}_buy"
+            logger.info(f"🛍️ Executing BUY operations on schedule, up to {max_concurrent_swaps} wallets at a time")
+            
+            # Wallets whose swap errored after being sent; they may hold tokens despite the failure
+            unconfirmed_buy_wallets = set()
+            
+            def count_settled(run: ScheduledRun):
+                """Count each operation of a finished run once, from the outcome it settled with."""
+                for outcome in run.results.values():
+                    if outcome is None:
+                        continue  # Nothing to trade
+                    if outcome != "skipped":
+                        results["swaps_executed"] += 1
+                    if outcome != "success":
                         results["swaps_failed"] += 1
-                        continue
-                    
-                    # Volume conservation logging with emoji indicators
-                    if amount < trade_sol_amount:
-                        reduction_pct = ((trade_sol_amount - amount) / trade_sol_amount) * 100
-                        logger.info(f"📉 Volume reduction: {wallet_address[:8]} {trade_sol_amount:.6f} → {amount:.6f} SOL (-{reduction_pct:.1f}%)")
-                    
-                    logger.info(f"BUY Operation: {amount:.6f} SOL → {token_address[:8]}... (Wallet: {wallet_address[:8]}...)")
+                for reason in run.failures.values():
+                    if reason != "cancelled":
+                        results["swaps_executed"] += 1
+                    results["swaps_failed"] += 1
+            
+            # Quotes for buys about to come due are requested while earlier swaps are in flight
+            buy_quotes = QuotePrefetcher(self.get_jupiter_quote_async)
+            
+            def buy_quote_params(amount_sol: float) -> Dict[str, Any]:
+                return {
+                    "input_mint": SOL_MINT,
+                    "output_mint": token_address,
+                    "amount": int(amount_sol * 1_000_000_000),  # Convert to lamports
+                    "slippage_bps": 100
+                }
+            
+            def prefetch_next_buys():
+                # Only buys due well within a quote's lifetime on an idle wallet; later quotes would expire
+                buy_quotes.prefetch_ahead(
+                    (buy_op["operation_id"], buy_quote_params(buy_op["amount_sol"]))
+                    for buy_op in trade_scheduler.upcoming(buy_run_id, within=buy_quotes.max_age / 2)
+                    if buy_op["wallet_address"] not in buy_run.busy_keys
+                )
+            
+            def record_buy(buy_op: Dict[str, Any], wallet_address: str, amount: float):
+                """Count a landed buy towards the volume and the wallet's sell."""
+                nonlocal successful_buys, total_volume
+                successful_buys += 1
+                # Track token balance for this wallet (estimate)
+                wallet_token_balances[wallet_address] += amount  # Use SOL amount as proxy
+                # Count executed buy amount towards total executed volume
+                total_volume += amount
+                results["swap_results"].append({
+                    "operation_id": buy_op["operation_id"],
+                    "type": "buy",
+                    "wallet": wallet_address[:8] + "...",
+                    "amount_sol": amount,
+                    "status": "success",
+                    "timestamp": time.time()
+                })
+            
+            async def recover_buy(buy_op: Dict[str, Any], amount: float, error_msg: str) -> str:
+                """
+                Settle a buy whose swap raised. The swap may still have landed, so it is never
+                retried; a balance-related failure gets one recovery buy at half the amount.
+                """
+                wallet_address = buy_op["wallet_address"]
+                # Its sell reads the real token balance, selling whatever did land
+                unconfirmed_buy_wallets.add(wallet_address)
+                
+                # Intelligent recovery for balance-related failures
+                if '"message"' in error_msg or 'insufficient' in error_msg.lower():
+                    logger.info(f"🔄 Attempting balance recovery for {wallet_address[:8]}")
                     
-                    # BUY operation (SOL -> Token)
-                    buy_quote = self.get_jupiter_quote(
-                        input_mint=SOL_MINT,
-                        output_mint=token_address,
-                        amount=int(amount * 1_000_000_000),  # Convert to lamports
-                        slippage_bps=100
-                    )
+                    # Try with 50% of current amount
+                    recovery_amount = amount * 0.5
+                    recovery_safe_amount = await calculate_safe_swap_amount(wallet_address, recovery_amount)
                     
-                    # Check for valid quote
-                    if buy_quote.get("quoteResponse") is not None:
-                        buy_result = self.execute_jupiter_swap(
-                            user_wallet_private_key=wallet_private_key,
-                            quote_response=buy_quote,
-                            verify_swap=verify_transfers
-                        )
-                        
-                        # Check if buy was successful
-                        buy_result_successful = (buy_result.get("status") == "success" or buy_result.get("success") == True)
-                        
-                        if buy_result_successful:
-                            logger.info(f"✅ BUY successful: {amount:.6f} SOL → {token_address[:8]}... (Wallet: {wallet_address[:8]}...)")
-                            successful_buys += 1
-                            
-                            # Track token balance for this wallet (estimate)
-                            wallet_token_balances[wallet_address] += amount  # Use SOL amount as proxy
-                            # Count executed buy amount towards total executed volume
-                            total_volume += amount
+                    if recovery_safe_amount >= 0.0005:  # Worth retrying
+                        logger.info(f"🔄 Recovery attempt: {recovery_safe_amount:.6f} SOL (50% reduction)")
+                        try:
+                            # Retry with recovery amount
+                            recovery_quote = await self.get_jupiter_quote_async(
+                                input_mint=SOL_MINT,
+                                output_mint=token_address,
+                                amount=int(recovery_safe_amount * 1_000_000_000),
+                                slippage_bps=100
+                            )
                             
-                            results["swap_results"].append({
-                                "operation_id": buy_op["operation_id"],
-                                "type": "buy",
-                                "wallet": wallet_address[:8] + "...",
-                                "amount_sol": amount,
-                                "status": "success",
-                                "timestamp": time.time()
-                            })
-                        else:
-                            logger.warning(f"❌ BUY failed: {buy_result.get('message', 'Unknown error')}")
-                            results["swaps_failed"] += 1
-                    else:
-                        logger.warning(f"❌ BUY quote failed: {buy_quote.get('message', 'Unknown error')}")
-                        results["swaps_failed"] += 1
-                    
-                    results["swaps_executed"] += 1
-                    
-                    # Random delay between buy operations (1-5 seconds)
-                    await asyncio.sleep(random.uniform(1, 5))
-                    
-                except Exception as e:
-                    error_msg = str(e)
-                    logger.error(f"Error in buy operation: {error_msg}")
-                    
-                    # Intelligent recovery for balance-related failures
-                    if '"message"' in error_msg or 'insufficient' in error_msg.lower():
-                        logger.info(f"🔄 Attempting balance recovery for {wallet_address[:8]}")
-                        
-                        # Try with 50% of current amount
-                        recovery_amount = amount * 0.5
-                        recovery_safe_amount = calculate_safe_swap_amount(wallet_address, recovery_amount)
-                        
-                        if recovery_safe_amount >= 0.0005:  # Worth retrying
-                            logger.info(f"🔄 Recovery attempt: {recovery_safe_amount:.6f} SOL (50% reduction)")
-                            try:
-                                # Retry with recovery amount
-                                recovery_quote = self.get_jupiter_quote(
-                                    input_mint=SOL_MINT,
-                                    output_mint=token_address,
-                                    amount=int(recovery_safe_amount * 1_000_000_000),
-                                    slippage_bps=100
+                            if recovery_quote.get("quoteResponse") is not None:
+                                recovery_result = await self.execute_jupiter_swap_async(
+                                    user_wallet_private_key=buy_op["wallet_private_key"],
+                                    quote_response=recovery_quote,
+                                    wallet_address=wallet_address,
+                                    verify_swap=verify_transfers
                                 )
                                 
-                                if recovery_quote.get("quoteResponse") is not None:
-                                    recovery_result = self.execute_jupiter_swap(
-                                        user_wallet_private_key=wallet_private_key,
-                                        quote_response=recovery_quote,
-                                        verify_swap=verify_transfers
-                                    )
+                                if recovery_result.get("success") or recovery_result.get("status") == "success":
+                                    logger.info(f"✅ Recovery successful: {recovery_safe_amount:.6f} SOL → {token_address[:8]}... (Wallet: {wallet_address[:8]}...)")
+                                    record_buy(buy_op, wallet_address, recovery_safe_amount)
+                                    return "success"
                                     
-                                    if recovery_result.get("success"):
-                                        logger.info(f"✅ Recovery successful: {recovery_safe_amount:.6f} SOL → {token_address[:8]}... (Wallet: {wallet_address[:8]}...)")
-                                        results["buys_succeeded"] += 1
-                                        results["total_volume_sol"] += recovery_safe_amount
-                                        continue
-                                        
-                            except Exception as recovery_error:
-                                logger.warning(f"🔴 Recovery failed: {str(recovery_error)}")
-                        else:
-                            logger.warning(f"❌ Recovery not viable: {recovery_safe_amount:.6f} SOL too small")
-                    
-                    results["swaps_failed"] += 1
-                    continue
+                        except Exception as recovery_error:
+                            logger.warning(f"🔴 Recovery failed: {str(recovery_error)}")
+                    else:
+                        logger.warning(f"❌ Recovery not viable: {recovery_safe_amount:.6f} SOL too small")
+                
+                return "failed"
+            
+            async def execute_buy(buy_op: Dict[str, Any]) -> str:
+                """
+                Run one BUY operation (quote, swap and balance recovery).
+                
+                Only a failed quote is retried by the scheduler; once a swap has been sent the
+                buy is settled here, since a swap that errored may still have landed.
+                
+                Returns:
+                    "success", "failed" or "skipped" (too little balance to trade)
+                """
+                wallet_address = buy_op["wallet_address"]
+                wallet_private_key = buy_op["wallet_private_key"]
+                trade_sol_amount = buy_op["amount_sol"]
+                
+                # Real-time balance verification before trade execution
+                pre_trade_check = await calculate_safe_swap_amount(wallet_address, trade_sol_amount)
+                amount = trade_sol_amount
+                
+                # Dynamic adjustment if wallet balance changed since planning
+                if pre_trade_check < trade_sol_amount:
+                    logger.info(f"🔄 Real-time adjustment: {wallet_address[:8]} {trade_sol_amount:.6f} → {pre_trade_check:.6f} SOL (balance declined)")
+                    amount = pre_trade_check
+                
+                # Enhanced minimum threshold check with structured logging
+                if amount <= 0.001:  # Increased from 0 to 0.001 SOL minimum
+                    current_bal = (await self.check_balance_async(wallet_address)).get("balance", 0.0)
+                    logger.warning(f"⚠️ Skipping {wallet_address[:8]}: insufficient balance {current_bal:.6f} SOL → safe amount {amount:.6f} SOL")
+                    return "skipped"
+                
+                # Volume conservation logging with emoji indicators
+                if amount < trade_sol_amount:
+                    reduction_pct = ((trade_sol_amount - amount) / trade_sol_amount) * 100
+                    logger.info(f"📉 Volume reduction: {wallet_address[:8]} {trade_sol_amount:.6f} → {amount:.6f} SOL (-{reduction_pct:.1f}%)")
+                
+                logger.info(f"BUY Operation: {amount:.6f} SOL → {token_address[:8]}... (Wallet: {wallet_address[:8]}...)")
+                
+                # BUY operation (SOL -> Token), usually prefetched while earlier swaps ran
+                try:
+                    buy_quote = await buy_quotes.get(buy_op["operation_id"], **buy_quote_params(amount))
+                except Exception as e:
+                    buy_quote = {"message": str(e)}
+                
+                if buy_quote.get("quoteResponse") is None:
+                    failure = f"BUY quote failed: {buy_quote.get('message', 'Unknown error')}"
+                    logger.warning(f"❌ {failure}")
+                    # Nothing was sent, so the scheduler retries later with a fresh balance and quote
+                    raise RescheduleOperation(failure)
+                
+                try:
+                    buy_result = await self.execute_jupiter_swap_async(
+                        user_wallet_private_key=wallet_private_key,
+                        quote_response=buy_quote,
+                        wallet_address=wallet_address,
+                        verify_swap=verify_transfers
+                    )
+                except Exception as e:
+                    logger.error(f"Error in buy operation: {str(e)}")
+                    return await recover_buy(buy_op, amount, str(e))
+                
+                # Check if buy was successful
+                if buy_result.get("status") == "success" or buy_result.get("success") == True:
+                    logger.info(f"✅ BUY successful: {amount:.6f} SOL → {token_address[:8]}... (Wallet: {wallet_address[:8]}...)")
+                    record_buy(buy_op, wallet_address, amount)
+                    return "success"
+                
+                logger.warning(f"❌ BUY failed: {buy_result.get('message', 'Unknown error')}")
+                unconfirmed_buy_wallets.add(wallet_address)
+                return "failed"
+            
+            async def execute_wallet_buy(buy_op: Dict[str, Any], attempt: int) -> str:
+                """Run a due BUY; the scheduler runs one at a time per wallet."""
+                prefetch_next_buys()
+                try:
+                    return await execute_buy(buy_op)
+                finally:
+                    # A buy skipped before its quote was used must not keep holding a lookahead slot
+                    buy_quotes.discard(buy_op["operation_id"])
+            
+            buy_run = trade_scheduler.submit(
+                buy_run_id, buy_operations, execute_wallet_buy,
+                user_id=user_id, max_concurrency=max_concurrent_swaps,
+                exclusive_key="wallet_address", key_gap=SPL_WALLET_TRADE_GAP
+            )
+            try:
+                await buy_run.wait()
+            finally:
+                # Drops whatever is still queued if this run is abandoned early
+                trade_scheduler.cancel(buy_run_id)
+                buy_quotes.cancel_all()
+            count_settled(buy_run)
+            logger.info(f"Buy phase: max dispatch lag {buy_run.max_lag:.2f}s, quote prefetching: {buy_quotes.stats()}, "
+                        f"quote latency: {self.get_quote_latency_stats()}")
 
-            # Phase 3: Wait period to create separation between buys and sells
+            # Phase 3: Sells start 10-30 seconds after the buys, creating a natural trading gap
             separation_delay = random.uniform(10, 30)  # 10-30 second delay
-            logger.info(f"⏳ SEPARATION PHASE: Waiting {separation_delay:.1f} seconds to create natural trading gap...")
-            await asyncio.sleep(separation_delay)
+            logger.info(f"⏳ SEPARATION PHASE: First sell scheduled {separation_delay:.1f} seconds from now to create natural trading gap...")
 
             # Phase 4: Generate SELL operations from wallets that have tokens
             logger.info("💰 PHASE 2: Generating SELL operations from token holders...")
             
             # Only create sell operations for wallets that actually bought tokens
             for wallet_address, estimated_token_amount in wallet_token_balances.items():
-                if estimated_token_amount > 0:  # Only wallets that successfully bought
+                # Wallets that bought, or whose failed swap may still have landed
+                if estimated_token_amount > 0 or wallet_address in unconfirmed_buy_wallets:
                     sell_operations.append({
                         "type": "sell",
                         "wallet_address": wallet_address,
@@ -5375,37 +6833,94 @@ class ApiClient:
             # Shuffle sell operations to randomize which wallet sells first
             random.shuffle(sell_operations)
             
-            # Phase 5: Execute SELL operations with delays
+            # Each wallet sells at its earliest scheduled sell time; without scheduled sells
+            # for every seller, sells are spaced 2-8 seconds apart
+            scheduled_sell_times = {}
+            for trade in sell_trades:
+                wallet_idx = trade.get("wallet_index")
+                if trade.get("timestamp") is not None and isinstance(wallet_idx, int) and 0 <= wallet_idx < len(child_wallets):
+                    wallet_address = child_wallets[wallet_idx]
+                    scheduled_sell_times[wallet_address] = min(
+                        trade["timestamp"], scheduled_sell_times.get(wallet_address, trade["timestamp"])
+                    )
+            use_scheduled_sells = all(sell_op["wallet_address"] in scheduled_sell_times for sell_op in sell_operations)
+            sell_timestamp = 0.0
+            for sell_op in sell_operations:
+                if use_scheduled_sells:
+                    sell_op["timestamp"] = scheduled_sell_times[sell_op["wallet_address"]]
+                else:
+                    sell_op["timestamp"] = sell_timestamp
+                    sell_timestamp += random.uniform(2, 8)
+            
+            # Every seller's token balance is read in one snapshot when the first sell comes due
+            token_snapshot_task = None
+            
+            def read_token_snapshot() -> asyncio.Future:
+                nonlocal token_snapshot_task
+                if token_snapshot_task is None or (
+                    token_snapshot_task.done() and not token_snapshot_task.cancelled() and token_snapshot_task.exception() is not None
+                ):
+                    token_snapshot_task = asyncio.ensure_future(self.get_spl_token_balances_async(
+                        [sell_op["wallet_address"] for sell_op in sell_operations], token_address, fresh=True
+                    ))
+                return token_snapshot_task
+            
+            # Phase 5: Execute SELL operations at their scheduled times
             logger.info(f"🔄 PHASE 2: Executing {len(sell_operations)} SELL operations...")
+            sell_run_id = f"{batch_id}_sell"
             
-            for sell_op in sell_operations:
+            # Quotes for sells about to come due are requested while earlier sells execute
+            sell_quotes = QuotePrefetcher(self.get_jupiter_quote_async)
+            
+            def sell_quote_params(sell_op: Dict[str, Any], token_snapshot: Dict[str, Dict[str, int]]) -> Dict[str, Any]:
+                return {
+                    "input_mint": token_address,
+                    "output_mint": SOL_MINT,
+                    "amount": token_snapshot[sell_op["wallet_address"]]["balance"],  # Raw balance (already in token units)
+                    "slippage_bps": 150  # Increased slippage for better success rate
+                }
+            
+            async def execute_sell(sell_op: Dict[str, Any], attempt: int) -> Optional[str]:
+                """
+                Run one due SELL of a wallet's whole token balance and record the outcome.
+                
+                Returns:
+                    "success", "failed" (no tokens to sell), or None if the wallet's buy
+                    failed and nothing of it landed
+                """
+                nonlocal successful_sells
+                wallet_address = sell_op["wallet_address"]
+                wallet_private_key = sell_op["wallet_private_key"]
                 try:
-                    wallet_address = sell_op["wallet_address"]
-                    wallet_private_key = sell_op["wallet_private_key"]
+                    token_snapshot = await read_token_snapshot()
+                    if attempt > 1:
+                        # A failed attempt may still have moved tokens, so re-read this wallet
+                        token_snapshot.update(await self.get_spl_token_balances_async([wallet_address], token_address, fresh=True))
+                    sell_quotes.prefetch_ahead(
+                        (next_op["operation_id"], sell_quote_params(next_op, token_snapshot))
+                        for next_op in trade_scheduler.upcoming(sell_run_id, within=sell_quotes.max_age / 2)
+                        if token_snapshot.get(next_op["wallet_address"], {}).get("balance", 0) > 0
+                    )
                     
                     logger.info(f"SELL Operation: {token_address[:8]}... → SOL (Wallet: {wallet_address[:8]}...)")
                     
-                    # Check actual SPL token balance
-                    token_balance_info = self.get_spl_token_balance(wallet_address, token_address)
+                    # Balance from the pre-sell snapshot
+                    token_balance_info = token_snapshot.get(wallet_address, {})
                     
-                    if token_balance_info.get("success") and token_balance_info.get("balance", 0) > 0:
-                        raw_token_balance = token_balance_info.get("balance", 0)
-                        token_decimals = token_balance_info.get("decimals", 6)
+                    if token_balance_info.get("balance", 0) > 0:
+                        raw_token_balance = token_balance_info["balance"]
+                        token_decimals = token_balance_info["decimals"]
                         
                         logger.info(f"💰 Found token balance: {raw_token_balance} (decimals: {token_decimals}) for wallet {wallet_address[:8]}...")
                         
-                        # Get sell quote (Token -> SOL)
-                        sell_quote = self.get_jupiter_quote(
-                            input_mint=token_address,
-                            output_mint=SOL_MINT,
-                            amount=raw_token_balance,  # Use raw balance (already in token units)
-                            slippage_bps=150  # Increased slippage for better success rate
-                        )
+                        # Get sell quote (Token -> SOL), usually prefetched during an earlier sell
+                        sell_quote = await sell_quotes.get(sell_op["operation_id"], **sell_quote_params(sell_op, token_snapshot))
                         
                         if sell_quote.get("quoteResponse") is not None:
-                            sell_result = self.execute_jupiter_swap(
+                            sell_result = await self.execute_jupiter_swap_async(
                                 user_wallet_private_key=wallet_private_key,
                                 quote_response=sell_quote,
+                                wallet_address=wallet_address,
                                 verify_swap=verify_transfers
                             )
                             
@@ -5424,25 +6939,42 @@ class ApiClient:
                                     "status": "success",
                                     "timestamp": time.time()
                                 })
+                                return "success"
                             else:
-                                logger.warning(f"❌ SELL failed: {sell_result.get('message', 'Unknown error')}")
-                                results["swaps_failed"] += 1
+                                failure = f"SELL failed: {sell_result.get('message', 'Unknown error')}"
                         else:
-                            logger.warning(f"❌ SELL quote failed: {sell_quote.get('message', 'Unknown error')}")
-                            results["swaps_failed"] += 1
+                            failure = f"SELL quote failed: {sell_quote.get('message', 'Unknown error')}"
+                        
+                        logger.warning(f"❌ {failure}")
+                        raise RescheduleOperation(failure)
+                    elif wallet_token_balances[wallet_address] <= 0:
+                        logger.info(f"No tokens landed from the failed buys of wallet {wallet_address[:8]}...")
+                        return None
                     else:
                         logger.warning(f"⚠️ No token balance found for wallet {wallet_address[:8]}...")
-                        results["swaps_failed"] += 1
-                    
-                    results["swaps_executed"] += 1
-                    
-                    # Random delay between sell operations (2-8 seconds)
-                    await asyncio.sleep(random.uniform(2, 8))
+                        return "failed"
                     
+                except RescheduleOperation:
+                    raise
                 except Exception as e:
                     logger.error(f"Error in sell operation: {str(e)}")
-                    results["swaps_failed"] += 1
-                    continue
+                    raise
+                finally:
+                    # A sell that ended before its quote was used must not keep holding a lookahead slot
+                    sell_quotes.discard(sell_op["operation_id"])
+            
+            sell_run = trade_scheduler.submit(
+                sell_run_id, sell_operations, execute_sell,
+                user_id=user_id, max_concurrency=max_concurrent_swaps, start_delay=separation_delay
+            )
+            try:
+                await sell_run.wait()
+            finally:
+                trade_scheduler.cancel(sell_run_id)
+                sell_quotes.cancel_all()
+            count_settled(sell_run)
+            logger.info(f"Sell phase: max dispatch lag {sell_run.max_lag:.2f}s, quote prefetching: {sell_quotes.stats()}, "
+                        f"quote latency: {self.get_quote_latency_stats()}")
             
             # Update final results
             results["buys_succeeded"] = successful_buys
@@ -5508,31 +7040,14 @@ class ApiClient:
             Token information including symbol, name, decimals, etc.
         """
         try:
-            # Try to get token info from Jupiter's token list API first
-            import requests
-            
-            # Jupiter's token list endpoint
-            token_list_response = requests.get(
-                "https://token.jup.ag/strict",
-                timeout=10
-            )
-            
-            if token_list_response.status_code == 200:
-                tokens = token_list_response.json()
-                for token in tokens:
-                    if token.get("address") == token_address:
-                        return {
-                            "status": "success",
-                            "token_info": {
-                                "address": token.get("address"),
-                                "symbol": token.get("symbol"),
-                                "name": token.get("name"),
-                                "decimals": token.get("decimals", 6),
-                                "logoURI": token.get("logoURI"),
-                                "tags": token.get("tags", []),
-                                "source": "jupiter"
-                            }
-                        }
+            # Only the first lookup without a saved snapshot waits for the download
+            token_registry.wait_until_loaded()
+            token = token_registry.get(token_address)
+            if token is not None:
+                return {
+                    "status": "success",
+                    "token_info": {**token.to_dict(), "source": "jupiter"}
+                }
             
             # Fallback to basic token info
             return {
@@ -5554,6 +7069,32 @@ class ApiClient:
                 "token_info": None
             }
     
+    @staticmethod
+    def _format_token_balance_response(response: Dict[str, Any], mint_address: str = None) -> Dict[str, Any]:
+        """
+        Transform a raw /api/wallets/token-balance response into the token balance format.
+        
+        Decimals missing from the response come from the token registry, and default to 6
+        (the pump.fun standard) for mints it does not know.
+        """
+        fallback_decimals = token_registry.decimals(mint_address, 6) if mint_address else 6
+        if response.get("message") == "Token balance retrieved successfully":
+            data = response.get("data", {})
+            decimals = data.get("decimals")
+            return {
+                "success": True,
+                "data": data,
+                "balance": data.get("balance", 0),
+                "decimals": decimals if decimals is not None else fallback_decimals
+            }
+        else:
+            return {
+                "success": False,
+                "error": response.get("message", "Failed to get token balance"),
+                "balance": 0,
+                "decimals": fallback_decimals
+            }
+
     def get_spl_token_balance(self, wallet_address: str, mint_address: str) -> Dict[str, Any]:
         """
         Get SPL token balance for a specific wallet and token mint.
@@ -5566,25 +7107,53 @@ class ApiClient:
             Dict containing balance information
         """
         try:
-            endpoint = f"/api/wallets/token-balance/{wallet_address}"
-            params = {"mintAddress": mint_address}
+            response = balance_cache.get(wallet_address, mint_address)
+            if response is None:
+                endpoint = f"/api/wallets/token-balance/{wallet_address}"
+                params = {"mintAddress": mint_address}
+                generation = balance_cache.generation(wallet_address)
+                
+                response = self._make_request("GET", endpoint, params=params)
+                if self._format_token_balance_response(response, mint_address)["success"]:
+                    balance_cache.put(wallet_address, response, mint_address, generation=generation)
             
-            response = self._make_request("GET", endpoint, params=params)
+            return self._format_token_balance_response(response, mint_address)
+                
+        except Exception as e:
+            logger.error(f"Error getting SPL token balance for {wallet_address}: {str(e)}")
+            return {
+                "success": False,
+                "error": str(e),
+                "balance": 0,
+                "decimals": token_registry.decimals(mint_address, 6)
+            }
+
+    async def get_spl_token_balance_async(self, wallet_address: str, mint_address: str) -> Dict[str, Any]:
+        """
+        Awaitable version of get_spl_token_balance() on the pooled async transport.
+        
+        Args:
+            wallet_address: The wallet's public key
+            mint_address: The SPL token mint address
+    
+        Returns:
+            Dict containing balance information
+        """
+        try:
+            response = balance_cache.get(wallet_address, mint_address)
+            if response is None:
+                endpoint = f"/api/wallets/token-balance/{wallet_address}"
+                params = {"mintAddress": mint_address}
+                generation = balance_cache.generation(wallet_address)
+                
+                response = await self._single_flight.do(
+                    ('token_balance', wallet_address, mint_address),
+                    lambda: self._make_request_async("GET", endpoint, params=params)
+                )
+                if self._format_token_balance_response(response, mint_address)["success"]:
+                    balance_cache.put(wallet_address, response, mint_address, generation=generation)
             
-            if response.get("message") == "Token balance retrieved successfully":
-                return {
-                    "success": True,
-                    "data": response.get("data", {}),
-                    "balance": response.get("data", {}).get("balance", 0),
-                    "decimals": response.get("data", {}).get("decimals", 6)
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": response.get("message", "Failed to get token balance"),
-                    "balance": 0,
-                    "decimals": 6
-                }
+            return self._format_token_balance_response(response, mint_address)
                 
         except Exception as e:
             logger.error(f"Error getting SPL token balance for {wallet_address}: {str(e)}")
@@ -5592,9 +7161,283 @@ class ApiClient:
                 "success": False,
                 "error": str(e),
                 "balance": 0,
-                "decimals": 6
+                "decimals": token_registry.decimals(mint_address, 6)
             }
 
+    @staticmethod
+    def _raw_token_amount(value: Any) -> Optional[int]:
+        """Read a raw integer token amount, or None if the value is not one (e.g. a UI amount)."""
+        if isinstance(value, bool):
+            return None
+        if isinstance(value, int):
+            return value
+        if isinstance(value, float):
+            return int(value) if value.is_integer() else None
+        if isinstance(value, str) and value.strip().isdigit():
+            return int(value)
+        return None
+    
+    @staticmethod
+    def _parse_token_balance_batch(payload: Any, mint_address: str) -> Dict[str, Dict[str, int]]:
+        """
+        Convert a batch token balance response into an address -> {"balance", "decimals"} mapping.
+        
+        Accepts {"balances": [{"publicKey": ..., "balance": ..., "decimals": ...}, ...]},
+        {"balances": {address: raw_amount}} or a bare list of balance objects, optionally
+        wrapped in "data". Malformed or truncated entries are left out, so those wallets
+        fall back to single-wallet reads.
+        
+        Args:
+            payload: Decoded response body
+            mint_address: Token mint the balances are for
+            
+        Returns:
+            Dictionary mapping wallet address to raw amount and decimals
+        """
+        fallback_decimals = token_registry.decimals(mint_address, 6)
+        entries = payload.get('balances', payload.get('data')) if isinstance(payload, dict) else payload
+        if isinstance(entries, dict) and isinstance(entries.get('balances'), (dict, list)):
+            entries = entries['balances']
+        
+        balances = {}
+        if isinstance(entries, dict):
+            # The last amount of a cut-off mapping may itself be cut short
+            if is_truncated(entries):
+                return balances
+            for address, amount in entries.items():
+                raw_amount = ApiClient._raw_token_amount(amount)
+                if raw_amount is not None:
+                    balances[address] = {"balance": raw_amount, "decimals": fallback_decimals}
+            return balances
+        
+        for entry in entries if isinstance(entries, list) else []:
+            if not isinstance(entry, dict) or is_truncated(entry):
+                continue
+            address = entry.get("publicKey") or entry.get("wallet") or entry.get("address")
+            raw_amount = ApiClient._raw_token_amount(entry.get("balance", entry.get("amount")))
+            if not address or raw_amount is None:
+                continue
+            decimals = entry.get("decimals")
+            raw_decimals = ApiClient._raw_token_amount(decimals) if decimals is not None else fallback_decimals
+            if raw_decimals is None:
+                continue
+            balances[address] = {"balance": raw_amount, "decimals": raw_decimals}
+        return balances
+    
+    @staticmethod
+    def _cache_token_balance_batch(balances: Dict[str, Dict[str, int]], mint_address: str,
+                                   generations: Dict[str, int]) -> Dict[str, Dict[str, int]]:
+        """Store batch-read token balances in the shared cache in the single-wallet response format."""
+        for address, balance in balances.items():
+            if address in generations:
+                balance_cache.put(
+                    address,
+                    {"message": "Token balance retrieved successfully", "data": dict(balance)},
+                    mint_address,
+                    generation=generations[address]
+                )
+        return balances
+    
+    def _cached_token_balances(self, addresses: List[str], mint_address: str) -> Dict[str, Dict[str, int]]:
+        """Get the token balances of the given wallets that the shared cache can still serve."""
+        balances = {}
+        for address in addresses:
+            response = balance_cache.get(address, mint_address)
+            if response is None:
+                continue
+            formatted = self._format_token_balance_response(response, mint_address)
+            if formatted["success"]:
+                balances[address] = {"balance": formatted["balance"], "decimals": formatted["decimals"]}
+        return balances
+    
+    def _fetch_token_balance_batch(self, addresses: List[str], mint_address: str) -> Optional[Dict[str, Dict[str, int]]]:
+        """
+        Read up to BALANCE_BATCH_SIZE token balances with one batch request.
+        
+        Like _fetch_balance_batch(), the first call probes whether the backend has the
+        endpoint and a 404 or 405 switches later calls to single-wallet reads.
+        
+        Args:
+            addresses: Wallet addresses (at most BALANCE_BATCH_SIZE)
+            mint_address: Token mint address
+            
+        Returns:
+            Address -> balance mapping, or None if the batch request could not be used
+        """
+        probing = self._batch_token_balances_supported is None
+        generations = {address: balance_cache.generation(address) for address in addresses}
+        try:
+            response = self._make_request_with_retry(
+                'post', TOKEN_BALANCE_BATCH_ENDPOINT, json={"publicKeys": addresses, "mintAddress": mint_address},
+                max_retries=1 if probing else 3, timeout=BALANCE_TIMEOUTS
+            )
+        except ApiBadResponseError as e:
+            if e.status_code in (404, 405):
+                logger.info("Backend has no batch token balance endpoint, using concurrent single-wallet reads")
+                self._batch_token_balances_supported = False
+            else:
+                logger.warning(f"Batch token balance request failed: {str(e)}")
+            return None
+        except ApiClientError as e:
+            logger.warning(f"Batch token balance request failed: {str(e)}")
+            return None
+        
+        self._batch_token_balances_supported = True
+        return self._cache_token_balance_batch(
+            self._parse_token_balance_batch(response, mint_address), mint_address, generations
+        )
+    
+    async def _fetch_token_balance_batch_async(self, addresses: List[str],
+                                               mint_address: str) -> Optional[Dict[str, Dict[str, int]]]:
+        """Async version of _fetch_token_balance_batch."""
+        probing = self._batch_token_balances_supported is None
+        generations = {address: balance_cache.generation(address) for address in addresses}
+        try:
+            response = await self._make_request_with_retry_async(
+                'post', TOKEN_BALANCE_BATCH_ENDPOINT, json={"publicKeys": addresses, "mintAddress": mint_address},
+                max_retries=1 if probing else 3, timeout=BALANCE_TIMEOUTS
+            )
+        except ApiBadResponseError as e:
+            if e.status_code in (404, 405):
+                logger.info("Backend has no batch token balance endpoint, using concurrent single-wallet reads")
+                self._batch_token_balances_supported = False
+            else:
+                logger.warning(f"Batch token balance request failed: {str(e)}")
+            return None
+        except ApiClientError as e:
+            logger.warning(f"Batch token balance request failed: {str(e)}")
+            return None
+        
+        self._batch_token_balances_supported = True
+        return self._cache_token_balance_batch(
+            self._parse_token_balance_batch(response, mint_address), mint_address, generations
+        )
+    
+    def _fetch_token_balance(self, wallet_address: str, mint_address: str) -> Optional[Dict[str, int]]:
+        """Read one wallet's token balance uncached, or None if it could not be read."""
+        generation = balance_cache.generation(wallet_address)
+        try:
+            response = self._make_request(
+                "GET", f"/api/wallets/token-balance/{wallet_address}", params={"mintAddress": mint_address}
+            )
+        except ApiClientError as e:
+            logger.warning(f"Could not read token balance for {wallet_address}: {str(e)}")
+            return None
+        formatted = self._format_token_balance_response(response, mint_address)
+        if not formatted["success"]:
+            return None
+        balance_cache.put(wallet_address, response, mint_address, generation=generation)
+        return {"balance": formatted["balance"], "decimals": formatted["decimals"]}
+    
+    async def _fetch_token_balance_async(self, wallet_address: str, mint_address: str) -> Optional[Dict[str, int]]:
+        """Async version of _fetch_token_balance; shares in-flight reads with get_spl_token_balance_async."""
+        generation = balance_cache.generation(wallet_address)
+        try:
+            response = await self._single_flight.do(
+                ('token_balance', wallet_address, mint_address),
+                lambda: self._make_request_async(
+                    "GET", f"/api/wallets/token-balance/{wallet_address}", params={"mintAddress": mint_address}
+                )
+            )
+        except ApiClientError as e:
+            logger.warning(f"Could not read token balance for {wallet_address}: {str(e)}")
+            return None
+        formatted = self._format_token_balance_response(response, mint_address)
+        if not formatted["success"]:
+            return None
+        balance_cache.put(wallet_address, response, mint_address, generation=generation)
+        return {"balance": formatted["balance"], "decimals": formatted["decimals"]}
+    
+    def get_spl_token_balances(self, wallet_addresses: List[str], mint_address: str,
+                               fresh: bool = False) -> Dict[str, Dict[str, int]]:
+        """
+        Read one token's balance in many wallets at once.
+        
+        Works like check_balances(): balances still in the shared cache are served
+        without a request, the rest come from the backend's batch endpoint in chunks of
+        BALANCE_BATCH_SIZE, and without that endpoint wallets are read concurrently,
+        at most BALANCE_FETCH_CONCURRENCY at a time.
+        
+        Args:
+            wallet_addresses: Wallet addresses (duplicates are read once)
+            mint_address: The SPL token mint address
+            fresh: Skip the balance cache, for callers about to trade on the balances
+            
+        Returns:
+            Dictionary mapping each readable address to {"balance": raw amount in base
+            units, "decimals": token decimals}; addresses that could not be read are omitted
+        """
+        addresses = list(dict.fromkeys(address for address in wallet_addresses if address))
+        if not addresses:
+            return {}
+        
+        balances = {} if fresh else self._cached_token_balances(addresses, mint_address)
+        pending = [address for address in addresses if address not in balances]
+        if pending and self._batch_token_balances_supported is not False:
+            for start in range(0, len(pending), BALANCE_BATCH_SIZE):
+                chunk = pending[start:start + BALANCE_BATCH_SIZE]
+                fetched = self._fetch_token_balance_batch(chunk, mint_address)
+                if fetched is None:
+                    break
+                balances.update({address: balance for address, balance in fetched.items() if address in chunk})
+        
+        remaining = [address for address in addresses if address not in balances]
+        if remaining:
+            with ThreadPoolExecutor(max_workers=min(BALANCE_FETCH_CONCURRENCY, len(remaining))) as pool:
+                fetched = pool.map(lambda address: self._fetch_token_balance(address, mint_address), remaining)
+                for address, balance in zip(remaining, fetched):
+                    if balance is not None:
+                        balances[address] = balance
+        
+        logger.info(f"Read {mint_address[:8]}... balances for {len(balances)}/{len(addresses)} wallets")
+        return balances
+    
+    async def get_spl_token_balances_async(self, wallet_addresses: List[str], mint_address: str,
+                                           fresh: bool = False) -> Dict[str, Dict[str, int]]:
+        """
+        Awaitable version of get_spl_token_balances() on the pooled async transport.
+        
+        Args:
+            wallet_addresses: Wallet addresses (duplicates are read once)
+            mint_address: The SPL token mint address
+            fresh: Skip the balance cache, for callers about to trade on the balances
+            
+        Returns:
+            Dictionary mapping each readable address to {"balance", "decimals"}
+        """
+        addresses = list(dict.fromkeys(address for address in wallet_addresses if address))
+        if not addresses:
+            return {}
+        
+        balances = {} if fresh else self._cached_token_balances(addresses, mint_address)
+        pending = [address for address in addresses if address not in balances]
+        if pending and self._batch_token_balances_supported is not False:
+            chunks = [pending[start:start + BALANCE_BATCH_SIZE] for start in range(0, len(pending), BALANCE_BATCH_SIZE)]
+            # Probe with the first chunk so an unsupported endpoint is only tried once
+            results = [await self._fetch_token_balance_batch_async(chunks[0], mint_address)]
+            if results[0] is not None and len(chunks) > 1:
+                results += await asyncio.gather(
+                    *(self._fetch_token_balance_batch_async(chunk, mint_address) for chunk in chunks[1:])
+                )
+            for chunk, fetched in zip(chunks, results):
+                if fetched is not None:
+                    balances.update({address: balance for address, balance in fetched.items() if address in chunk})
+        
+        remaining = [address for address in addresses if address not in balances]
+        if remaining:
+            semaphore = asyncio.Semaphore(BALANCE_FETCH_CONCURRENCY)
+            
+            async def fetch(address: str) -> Optional[Dict[str, int]]:
+                async with semaphore:
+                    return await self._fetch_token_balance_async(address, mint_address)
+            
+            for address, balance in zip(remaining, await asyncio.gather(*(fetch(address) for address in remaining))):
+                if balance is not None:
+                    balances[address] = balance
+        
+        logger.info(f"Read {mint_address[:8]}... balances for {len(balances)}/{len(addresses)} wallets")
+        return balances
+
     def check_spl_token_balance(self, wallet_address: str, mint_address: str) -> float:
         """
         Check SPL token balance and return as float (adjusted for decimals).
@@ -5626,6 +7469,37 @@ class ApiClient:
             logger.error(f"Error checking SPL token balance for {wallet_address}: {str(e)}")
             return 0.0
 
+    async def check_spl_token_balance_async(self, wallet_address: str, mint_address: str) -> float:
+        """
+        Awaitable version of check_spl_token_balance() on the pooled async transport.
+        
+        Args:
+            wallet_address: The wallet's public key
+            mint_address: The SPL token mint address
+    
+        Returns:
+            Token balance as float
+        """
+        try:
+            balance_info = await self.get_spl_token_balance_async(wallet_address, mint_address)
+            
+            if balance_info.get("success", False):
+                raw_balance = balance_info.get("balance", 0)
+                decimals = balance_info.get("decimals", 6)
+                
+                # Convert raw balance to decimal-adjusted balance
+                adjusted_balance = raw_balance / (10 ** decimals)
+                
+                logger.debug(f"SPL token balance for {wallet_address}: {adjusted_balance} (raw: {raw_balance}, decimals: {decimals})")
+                return adjusted_balance
+            else:
+                logger.warning(f"Failed to get SPL token balance for {wallet_address}: {balance_info.get('error', 'Unknown error')}")
+                return 0.0
+                
+        except Exception as e:
+            logger.error(f"Error checking SPL token balance for {wallet_address}: {str(e)}")
+            return 0.0
+
     async def sell_remaining_token_balance(self, child_wallets: List[str], child_private_keys: List[str], 
                                           token_address: str, min_balance_threshold: float = 0.0001) -> Dict[str, Any]:
         """
@@ -5662,6 +7536,9 @@ class ApiClient:
         }
         
         try:
+            # One balance snapshot for every wallet, so empty wallets are skipped without a quote
+            token_snapshot = await self.get_spl_token_balances_async(child_wallets, token_address, fresh=True)
+            
             for i, (wallet_address, private_key) in enumerate(zip(child_wallets, child_private_keys)):
                 wallet_result = {
                     "wallet_address": wallet_address,
@@ -5673,9 +7550,10 @@ class ApiClient:
                 }
                 
                 try:
-                    # Check token balance
-                    token_balance_info = self.get_spl_token_balance(wallet_address, token_address)
-                    token_balance = token_balance_info.get("balance", 0)
+                    # Raw amount and decimals from the snapshot; unreadable wallets count as empty
+                    token_balance_info = token_snapshot.get(wallet_address, {"balance": 0, "decimals": 6})
+                    token_amount_lamports = token_balance_info["balance"]
+                    token_balance = token_amount_lamports / (10 ** token_balance_info["decimals"])
                     wallet_result["token_balance_before"] = token_balance
                     
                     # Skip if balance is below threshold
@@ -5686,11 +7564,8 @@ class ApiClient:
                         logger.info(f"Skipping wallet {wallet_address}: balance {token_balance} below threshold")
                         continue
                     
-                    # Convert to lamports for Jupiter
-                    token_amount_lamports = int(token_balance * (10 ** token_balance_info.get("decimals", 6)))
-                    
                     # Get swap quote
-                    quote_response = self.get_jupiter_quote(
+                    quote_response = await self.get_jupiter_quote_async(
                         input_mint=token_address,
                         output_mint="SOL",
                         amount=token_amount_lamports,
@@ -5700,9 +7575,10 @@ class ApiClient:
                     results["sells_attempted"] += 1
                     
                     # Execute the sell swap
-                    swap_result = self.execute_jupiter_swap(
+                    swap_result = await self.execute_jupiter_swap_async(
                         user_wallet_private_key=private_key,
                         quote_response=quote_response["quoteResponse"],
+                        wallet_address=wallet_address,
                         wrap_and_unwrap_sol=True,
                         collect_fees=True,
                         verify_swap=False  # Skip verification for bulk operations
@@ -5784,11 +7660,14 @@ class ApiClient:
             unfunded_wallets = 0
             total_existing_balance = 0.0
             
-            # Check each wallet balance
+            # Read all SOL balances in one batched call
+            lamport_balances = self.check_balances(child_wallets)
+            
             for wallet_address in child_wallets:
                 try:
-                    balance_result = self.check_balance(wallet_address, token_address=None)  # SOL balance
-                    current_balance = balance_result.get('balance_sol', 0.0)
+                    if wallet_address not in lamport_balances:
+                        raise ApiClientError("balance unavailable")
+                    current_balance = lamport_balances[wallet_address] / 1_000_000_000
                     total_existing_balance += current_balance
                     
                     is_funded = current_balance >= min_balance_threshold
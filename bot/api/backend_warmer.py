@@ -0,0 +1,227 @@
+"""
+Background keep-warm for the Render-hosted backends.
+
+Render puts idle services to sleep, and the first request after that pays a cold
+start of tens of seconds. BackendWarmer pings each backend's health endpoint in
+the background, just before the backend is predicted to fall asleep. It learns each
+backend's idle-to-sleep window from the cold starts it observes, and the API clients
+report their successful responses so real traffic counts as contact. When a user enters
+the bundling or volume flow, the matching backend is pinged straight away, so it is
+warm by the time the user's first real request arrives.
+"""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+
+import httpx
+from loguru import logger
+
+from bot.config import API_BASE_URL
+from bot.api.pumpfun_client import PUMPFUN_API_BASE_URL, HEALTH_CHECK_ENDPOINT
+
+DEFAULT_SLEEP_AFTER = 15 * 60       # Render free tier sleeps after 15 minutes without traffic
+MIN_SLEEP_AFTER = 2 * 60            # Never assume a backend sleeps sooner than this
+PING_MARGIN = 0.8                   # Ping at this fraction of the predicted idle-to-sleep window
+COLD_START_THRESHOLD = 5.0          # Ping latency (seconds) that counts as a cold start
+COLD_STARTS_TO_SHRINK = 2           # Consecutive cold starts before the window is shortened
+WINDOW_GROWTH = 1.25                # Factor a warm ping at the end of the window lengthens it by
+PING_TIMEOUT = httpx.Timeout(120.0, connect=30.0)  # A cold start can take a minute or more
+SCHEDULER_TICK = 30.0               # Seconds between scheduler checks
+
+
+@dataclass
+class WarmTarget:
+    """A backend kept warm by pinging a cheap endpoint."""
+    name: str
+    base_url: str
+    health_path: str
+    sleep_after: float = DEFAULT_SLEEP_AFTER
+    last_contact: float = 0.0
+    last_latency: Optional[float] = None
+    pings: int = 0
+    cold_starts: int = 0
+    cold_streak: int = 0
+    cold_start_latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=20))
+
+    @property
+    def url(self) -> str:
+        """Full URL of the health endpoint."""
+        return f"{self.base_url.rstrip('/')}{self.health_path}"
+
+    def idle_for(self) -> float:
+        """Seconds since the backend last answered a keep-warm ping or a client request."""
+        return time.monotonic() - self.last_contact if self.last_contact else float('inf')
+
+    def predicted_cold(self) -> bool:
+        """Whether the backend has probably gone to sleep since it was last contacted."""
+        return self.idle_for() >= self.sleep_after
+
+    def next_ping_due(self) -> bool:
+        """Whether a keep-warm ping should be sent now."""
+        return self.idle_for() >= self.sleep_after * PING_MARGIN
+
+
+class BackendWarmer:
+    """
+    Keeps the bot's backends warm with background health pings.
+
+    The schedule adapts to each backend. Repeated cold starts shorten that backend's
+    predicted idle-to-sleep window to the idle gap; a single slow ping under load does
+    not. A warm response at the end of the window lengthens it, up to the platform
+    default or the longest gap seen warm. Pings are sent at PING_MARGIN of the
+    predicted window.
+    """
+
+    def __init__(self, targets: List[WarmTarget]):
+        """
+        Initialize the warmer.
+
+        Args:
+            targets: Backends to keep warm
+        """
+        self.targets: Dict[str, WarmTarget] = {target.name: target for target in targets}
+        self._task: Optional[asyncio.Task] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._in_flight: Dict[str, asyncio.Task] = {}
+
+    async def start(self):
+        """Start the background scheduler and warm every backend immediately."""
+        if self._task is not None and not self._task.done():
+            return
+        self._client = httpx.AsyncClient(timeout=PING_TIMEOUT, headers={'User-Agent': 'NinjaBot-Warmer/1.0'})
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Backend warmer started for {', '.join(self.targets)}")
+
+    async def stop(self):
+        """Stop the scheduler and close the HTTP client."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for task in list(self._in_flight.values()):
+            task.cancel()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        logger.info("Backend warmer stopped")
+
+    def warm(self, name: str) -> Optional[asyncio.Task]:
+        """
+        Ping a backend now, without waiting, if it may have gone to sleep.
+
+        Call this when a user enters a flow that will soon hit the backend.
+
+        Args:
+            name: Target name ('volume_api' or 'pumpfun')
+
+        Returns:
+            The ping task, or None if the backend is known to be warm or the warmer is stopped
+        """
+        target = self.targets.get(name)
+        if target is None or self._client is None:
+            return None
+        if not target.next_ping_due():
+            return None
+        if target.predicted_cold():
+            logger.info(f"Backend '{name}' predicted cold (idle {target.idle_for():.0f}s), warming ahead of user request")
+        return self._ping_in_background(target)
+
+    def record_contact(self, base_url: str):
+        """
+        Note a successful response from a backend, so real traffic postpones its pings.
+
+        Args:
+            base_url: Base URL of the client that received the response
+        """
+        base_url = base_url.rstrip('/')
+        for target in self.targets.values():
+            if target.base_url.rstrip('/') == base_url:
+                target.last_contact = time.monotonic()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-backend warmer statistics.
+
+        Returns:
+            Dictionary mapping target name to its schedule and cold-start measurements
+        """
+        result = {}
+        for name, target in self.targets.items():
+            latencies = list(target.cold_start_latencies)
+            result[name] = {
+                "predicted_cold": target.predicted_cold(),
+                "idle_for": None if target.last_contact == 0 else round(target.idle_for(), 1),
+                "sleep_after": round(target.sleep_after, 1),
+                "last_latency": target.last_latency,
+                "pings": target.pings,
+                "cold_starts": target.cold_starts,
+                "avg_cold_start_latency": round(sum(latencies) / len(latencies), 2) if latencies else None
+            }
+        return result
+
+    async def _run(self):
+        """Scheduler loop: ping every backend whose keep-warm ping is due."""
+        while True:
+            for target in self.targets.values():
+                if target.next_ping_due():
+                    self._ping_in_background(target)
+            await asyncio.sleep(SCHEDULER_TICK)
+
+    def _ping_in_background(self, target: WarmTarget) -> asyncio.Task:
+        """Start a ping for a target unless one is already running."""
+        task = self._in_flight.get(target.name)
+        if task is None or task.done():
+            task = asyncio.create_task(self._ping(target))
+            self._in_flight[target.name] = task
+        return task
+
+    async def _ping(self, target: WarmTarget):
+        """Ping one backend and update its cold-start prediction from the latency."""
+        idle_gap = target.idle_for()
+        started = time.monotonic()
+        try:
+            response = await self._client.get(target.url)
+            latency = time.monotonic() - started
+        except httpx.HTTPError as e:
+            logger.warning(f"Keep-warm ping to '{target.name}' failed after {time.monotonic() - started:.1f}s: {e}")
+            return
+        except Exception as e:
+            logger.error(f"Unexpected error in keep-warm ping to '{target.name}': {e}")
+            return
+
+        target.pings += 1
+        target.last_latency = round(latency, 2)
+        target.last_contact = time.monotonic()
+
+        if latency >= COLD_START_THRESHOLD:
+            target.cold_starts += 1
+            target.cold_streak += 1
+            target.cold_start_latencies.append(latency)
+            if idle_gap != float('inf') and target.cold_streak >= COLD_STARTS_TO_SHRINK:
+                # It keeps falling asleep within idle_gap, so ping sooner from now on
+                target.sleep_after = max(MIN_SLEEP_AFTER, min(target.sleep_after, idle_gap))
+            logger.warning(
+                f"Backend '{target.name}' cold start: {latency:.1f}s (status {response.status_code}); "
+                f"predicted sleep window now {target.sleep_after:.0f}s"
+            )
+        else:
+            target.cold_streak = 0
+            if idle_gap != float('inf') and idle_gap >= target.sleep_after * PING_MARGIN:
+                # Still warm at the end of the predicted window, so ping less often
+                target.sleep_after = max(
+                    target.sleep_after, idle_gap, min(DEFAULT_SLEEP_AFTER, target.sleep_after * WINDOW_GROWTH)
+                )
+            logger.debug(f"Backend '{target.name}' warm: {latency:.2f}s (status {response.status_code})")
+
+
+# Shared warmer for the volume API and the PumpFun bundler API
+backend_warmer = BackendWarmer([
+    WarmTarget("volume_api", API_BASE_URL, "/api/health"),
+    WarmTarget("pumpfun", PUMPFUN_API_BASE_URL, HEALTH_CHECK_ENDPOINT),
+])
@@ -0,0 +1,183 @@
+"""
+Process-wide short-lived cache for wallet balance reads.
+
+The same wallet is often read several times within seconds: during readiness checks,
+during swap planning, in pre-trade checks and when checking funding. BalanceCache keeps
+each (wallet, mint) read for a short TTL, and an LRU bound caps its size. Anything that
+submits a swap or transfer invalidates the wallets it touches, so a transaction's effect
+is never hidden behind a cached value.
+
+A read that started before an invalidation can finish after it, and must not put the
+old value back into the cache. Each wallet therefore carries a generation number.
+Callers take a generation before they read and pass it to put(); a put() made with an
+out-of-date generation is dropped.
+
+Invalidation listeners hear about every invalidation, so pollers watching those wallets
+can speed up while the transaction lands.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+SOL_MINT = "So11111111111111111111111111111111111111112"
+DEFAULT_TTL = 5.0               # Seconds a balance read stays fresh
+DEFAULT_MAX_ENTRIES = 4096      # LRU bound on cached (wallet, mint) entries
+
+
+class BalanceCache:
+    """Thread-safe TTL + LRU cache of balance reads keyed by (wallet, mint)."""
+
+    def __init__(self, ttl: float = DEFAULT_TTL, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays fresh
+            max_entries: Maximum number of cached entries before the least recently used is evicted
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._mints_by_wallet: Dict[str, Set[str]] = {}
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[List[str]], None]] = []
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def generation(self, wallet: str) -> int:
+        """
+        Get a wallet's current generation, to pass to put() after the read completes.
+
+        Args:
+            wallet: Wallet address
+
+        Returns:
+            Generation number, bumped by every invalidation of the wallet
+        """
+        with self._lock:
+            return self._generations.get(wallet, 0)
+
+    def get(self, wallet: str, mint: str = SOL_MINT) -> Optional[Any]:
+        """
+        Get a fresh cached balance read.
+
+        Args:
+            wallet: Wallet address
+            mint: Token mint (SOL by default)
+
+        Returns:
+            The cached value, or None if it is missing or older than the TTL
+        """
+        key = (wallet, mint)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > self.ttl:
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, wallet: str, value: Any, mint: str = SOL_MINT, generation: Optional[int] = None):
+        """
+        Cache a balance read.
+
+        Args:
+            wallet: Wallet address
+            value: Balance read to cache (treated as immutable)
+            mint: Token mint (SOL by default)
+            generation: Generation taken before the read; the value is dropped if the
+                wallet has been invalidated since
+        """
+        key = (wallet, mint)
+        with self._lock:
+            if generation is not None and generation != self._generations.get(wallet, 0):
+                return
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            self._mints_by_wallet.setdefault(wallet, set()).add(mint)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, wallets: Iterable[str]):
+        """
+        Drop every cached read for the given wallets and bump their generations.
+
+        Call this when submitting a swap or transfer that touches the wallets.
+
+        Args:
+            wallets: Wallet addresses
+        """
+        invalidated = [wallet for wallet in wallets if wallet]
+        with self._lock:
+            for wallet in invalidated:
+                self._generations[wallet] = self._generations.get(wallet, 0) + 1
+                for mint in list(self._mints_by_wallet.get(wallet, ())):
+                    self._remove((wallet, mint))
+                self.invalidations += 1
+            listeners = list(self._listeners)
+
+        for listener in listeners:
+            listener(invalidated)
+
+    def add_invalidation_listener(self, listener: Callable[[List[str]], None]):
+        """
+        Register a callback run after every invalidation.
+
+        The callback runs on the invalidating thread, outside the cache lock, and must not block.
+
+        Args:
+            listener: Callable taking the list of invalidated wallet addresses
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def clear(self):
+        """Drop every cached entry."""
+        with self._lock:
+            for wallet in self._mints_by_wallet:
+                self._generations[wallet] = self._generations.get(wallet, 0) + 1
+            self._entries.clear()
+            self._mints_by_wallet.clear()
+
+    def _remove(self, key: Tuple[str, str]):
+        """Remove one entry and its index record. Caller must hold the lock."""
+        self._entries.pop(key, None)
+        wallet, mint = key
+        mints = self._mints_by_wallet.get(wallet)
+        if mints is not None:
+            mints.discard(mint)
+            if not mints:
+                del self._mints_by_wallet[wallet]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit, miss, eviction and invalidation counts, hit ratio and size
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "size": len(self._entries),
+                "ttl": self.ttl
+            }
+
+
+# Shared by every client in the process
+balance_cache = BalanceCache()
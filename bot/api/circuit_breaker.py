@@ -0,0 +1,199 @@
+"""
+Per-endpoint-family circuit breakers for the backend API clients.
+
+When a backend goes down, every request would otherwise wait out a full timeout
+and then its retries. A breaker counts consecutive outage failures for a family of
+endpoints. Once the count reaches the threshold it opens, and calls fail fast
+instead. After a cool-off period one half-open probe is let through, and its
+result decides whether the breaker closes again or stays open.
+"""
+
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_THRESHOLD = 5      # Consecutive outage failures before opening
+DEFAULT_RESET_TIMEOUT = 30.0       # Seconds to stay open before allowing a probe
+
+# Gateway errors returned by the hosting platform while a backend is down or restarting
+OUTAGE_STATUS_CODES = frozenset({502, 503, 504})
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker for one endpoint family.
+
+    Thread-safe, so the sync and async transports of a client can share one breaker.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 reset_timeout: float = DEFAULT_RESET_TIMEOUT):
+        """
+        Initialize the breaker in the closed state.
+
+        Args:
+            name: Breaker name used in logs (client and endpoint family)
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds the breaker stays open before a half-open probe
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._probe_started_at = 0.0
+        self._fast_failures = 0
+
+    @property
+    def state(self) -> str:
+        """Current breaker state (closed, open or half_open)."""
+        with self._lock:
+            return self._state
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may be sent now.
+
+        An open breaker moves to half-open once the reset timeout has passed and lets
+        exactly one probe through. Other callers keep failing fast until that probe
+        reports its result, or until the probe has been silent for another reset timeout.
+
+        Returns:
+            True if the request may proceed, False if it should fail fast
+        """
+        with self._lock:
+            if self._state == CLOSED:
+                return True
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._transition(HALF_OPEN)
+            probe_stale = time.monotonic() - self._probe_started_at >= self.reset_timeout
+            if self._state == HALF_OPEN and (not self._probe_in_flight or probe_stale):
+                self._probe_in_flight = True
+                self._probe_started_at = time.monotonic()
+                logger.info(f"Circuit breaker '{self.name}' sending half-open probe")
+                return True
+            self._fast_failures += 1
+            return False
+
+    def record_success(self):
+        """Record a request that reached a responsive backend."""
+        with self._lock:
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+            if self._state != CLOSED:
+                self._transition(CLOSED)
+
+    def record_failure(self):
+        """Record a request that failed because the backend was unreachable or down."""
+        with self._lock:
+            self._consecutive_failures += 1
+            self._probe_in_flight = False
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED and self._consecutive_failures >= self.failure_threshold
+            ):
+                self._opened_at = time.monotonic()
+                self._transition(OPEN)
+
+    def retry_after(self) -> float:
+        """Seconds until the breaker will allow a half-open probe (0 if not open)."""
+        with self._lock:
+            if self._state != OPEN:
+                return 0.0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get the breaker state for logs and health checks.
+
+        Returns:
+            Dictionary with state, failure count, fast-fail count and retry delay
+        """
+        retry_after = self.retry_after()
+        with self._lock:
+            return {
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                "fast_failures": self._fast_failures,
+                "retry_after": round(retry_after, 1)
+            }
+
+    def _transition(self, new_state: str):
+        """Change state and log the transition. Caller must hold the lock."""
+        if new_state == self._state:
+            return
+        log = logger.warning if new_state == OPEN else logger.info
+        log(
+            f"Circuit breaker '{self.name}' {self._state} -> {new_state} "
+            f"(consecutive failures: {self._consecutive_failures})"
+        )
+        self._state = new_state
+
+
+class CircuitBreakerRegistry:
+    """Lazily created circuit breakers keyed by endpoint family."""
+
+    def __init__(self, client_name: str, failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 reset_timeout: float = DEFAULT_RESET_TIMEOUT):
+        """
+        Initialize the registry.
+
+        Args:
+            client_name: Client name used as the prefix of breaker names
+            failure_threshold: Consecutive failures that open a breaker
+            reset_timeout: Seconds a breaker stays open before a half-open probe
+        """
+        self.client_name = client_name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, family: str) -> CircuitBreaker:
+        """
+        Get the breaker for an endpoint family, creating it on first use.
+
+        Args:
+            family: Endpoint family name
+
+        Returns:
+            CircuitBreaker for the family
+        """
+        with self._lock:
+            breaker = self._breakers.get(family)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    f"{self.client_name}:{family}",
+                    failure_threshold=self.failure_threshold,
+                    reset_timeout=self.reset_timeout
+                )
+                self._breakers[family] = breaker
+            return breaker
+
+    def snapshot(self, family: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the state of every breaker, or of one family.
+
+        Args:
+            family: Optional endpoint family to restrict the snapshot to
+
+        Returns:
+            Dictionary mapping family name to breaker snapshot
+        """
+        with self._lock:
+            breakers = dict(self._breakers)
+        if family is not None:
+            breakers = {family: breakers[family]} if family in breakers else {}
+        return {name: breaker.snapshot() for name, breaker in breakers.items()}
+
+    def any_open(self) -> bool:
+        """Check whether any breaker is currently open."""
+        return any(snapshot["state"] == OPEN for snapshot in self.snapshot().values())
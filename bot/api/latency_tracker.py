@@ -0,0 +1,156 @@
+"""
+Online latency tracking and request hedging support.
+
+LatencyTracker keeps a sliding window of recent successful latencies for each
+endpoint. From that window it answers percentile queries. Hedged requests use the
+window's p95 as the point at which a slow request gets a duplicate sent alongside it.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+DEFAULT_WINDOW = 200           # Recent samples kept per endpoint
+MIN_SAMPLES_FOR_HEDGE = 10     # Do not hedge until the percentile estimate is meaningful
+MIN_HEDGE_DELAY = 0.25         # Never send the duplicate sooner than this (seconds)
+
+
+class EndpointLatency:
+    """Sliding latency window and hedging counters for one endpoint."""
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        """
+        Initialize the window.
+
+        Args:
+            window: Number of recent samples to keep
+        """
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.requests = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Get the q-th percentile of the recent samples.
+
+        Args:
+            q: Percentile between 0 and 100
+
+        Returns:
+            Latency in seconds, or None without samples
+        """
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        index = min(len(ordered) - 1, max(0, int(round(q / 100.0 * (len(ordered) - 1)))))
+        return ordered[index]
+
+
+class LatencyTracker:
+    """Thread-safe per-endpoint latency windows with hedge accounting."""
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        """
+        Initialize the tracker.
+
+        Args:
+            window: Number of recent samples to keep per endpoint
+        """
+        self.window = window
+        self._endpoints: Dict[str, EndpointLatency] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, endpoint: str) -> EndpointLatency:
+        """Get the window for an endpoint, creating it on first use. Caller must hold the lock."""
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = EndpointLatency(self.window)
+            self._endpoints[endpoint] = stats
+        return stats
+
+    def record(self, endpoint: str, seconds: float):
+        """
+        Record the latency of a successful request.
+
+        Args:
+            endpoint: Endpoint key
+            seconds: Time from the first send of the request to the answer used, including
+                any hedge
+        """
+        with self._lock:
+            self._get(endpoint).samples.append(seconds)
+
+    def record_request(self, endpoint: str, hedged: bool = False, hedge_won: bool = False):
+        """
+        Count a logical request and whether it was hedged.
+
+        Args:
+            endpoint: Endpoint key
+            hedged: Whether a duplicate request was sent
+            hedge_won: Whether the duplicate answered first
+        """
+        with self._lock:
+            stats = self._get(endpoint)
+            stats.requests += 1
+            stats.hedged += int(hedged)
+            stats.hedge_wins += int(hedge_won)
+
+    def percentile(self, endpoint: str, q: float) -> Optional[float]:
+        """
+        Get the q-th percentile latency of an endpoint.
+
+        Args:
+            endpoint: Endpoint key
+            q: Percentile between 0 and 100
+
+        Returns:
+            Latency in seconds, or None without samples
+        """
+        with self._lock:
+            return self._get(endpoint).percentile(q)
+
+    def hedge_delay(self, endpoint: str, q: float = 95.0) -> Optional[float]:
+        """
+        Get how long to wait before hedging a request to an endpoint.
+
+        Args:
+            endpoint: Endpoint key
+            q: Percentile of recent latency to hedge at
+
+        Returns:
+            Delay in seconds, or None while there are too few samples to hedge
+        """
+        with self._lock:
+            stats = self._get(endpoint)
+            if len(stats.samples) < MIN_SAMPLES_FOR_HEDGE:
+                return None
+            return max(MIN_HEDGE_DELAY, stats.percentile(q))
+
+    def stats(self, endpoint: str) -> Dict[str, Any]:
+        """
+        Get latency percentiles and hedge rate for an endpoint.
+
+        Args:
+            endpoint: Endpoint key
+
+        Returns:
+            Dictionary with p50/p95/p99 latency, request count, hedge rate and hedge wins
+        """
+        with self._lock:
+            stats = self._get(endpoint)
+
+            def rounded(q):
+                value = stats.percentile(q)
+                return round(value, 3) if value is not None else None
+
+            return {
+                "p50": rounded(50),
+                "p95": rounded(95),
+                "p99": rounded(99),
+                "samples": len(stats.samples),
+                "requests": stats.requests,
+                "hedged": stats.hedged,
+                "hedge_rate": round(stats.hedged / stats.requests, 4) if stats.requests else 0.0,
+                "hedge_wins": stats.hedge_wins
+            }
@@ -29,18 +29,35 @@ Example Usage:
         wallets=wallets,  # NEW: Required parameter
         slippage_bps=2500
     )
+    
+    # From async handlers, use AsyncPumpFunClient so cooldowns and backoff are awaited
+    async_client = AsyncPumpFunClient()
+    result = await async_client.create_token_and_buy_async(
+        token_params=token_params,
+        buy_amounts=buy_amounts,
+        wallets=wallets,
+        slippage_bps=2500
+    )
 """
 
+import asyncio
 import json
 import time
 import logging
+import threading
 import requests
+import httpx
+from urllib3.filepost import encode_multipart_formdata
 import os
 import re
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
 import random
 
+from bot.api.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, OUTAGE_STATUS_CODES
+from bot.api.adaptive_limiter import AdaptiveConcurrencyLimiter, is_throttling_signal
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -58,6 +75,10 @@ RATE_LIMIT_INITIAL_BACKOFF = 10.0  # Start with 10 seconds for rate limits
 RATE_LIMIT_MAX_BACKOFF = 300.0     # Max 5 minutes between retries
 RATE_LIMIT_MAX_RETRIES = 6         # Max attempts for rate-limited operations
 JITO_BUNDLE_COOLDOWN = 30.0        # Minimum time between bundle operations
+BALANCE_FETCH_CONCURRENCY = 10     # Concurrent balance reads in get_wallet_sol_balances
+
+# Lightweight endpoint used to check (and wake up) the API
+HEALTH_CHECK_ENDPOINT = "/api/wallets/11111111111111111111111111111111/balance"
 
 
 class PumpFunApiError(Exception):
@@ -85,6 +106,15 @@ class PumpFunNetworkError(PumpFunApiError):
     pass
 
 
+class PumpFunCircuitOpenError(PumpFunApiError):
+    """Raised without a request when the endpoint's circuit breaker is open"""
+
+    def __init__(self, message: str, family: str, retry_after: float = 0.0):
+        super().__init__(message)
+        self.family = family
+        self.retry_after = retry_after
+
+
 @dataclass
 class TokenCreationParams:
     """Token creation parameters"""
@@ -109,6 +139,63 @@ class BuyAmounts:
     first_bundled_wallet_4_buy_sol: float = 0.0  # Optional - only used if wallet exists
 
 
+class BundleCooldownTracker:
+    """
+    Process-wide cooldown tracker for Jito bundle operations.
+    
+    Cooldowns are kept per operation type on the monotonic clock and shared by every
+    client instance, sync or async. Each caller reserves the next free slot under a lock,
+    so concurrent callers queue up behind each other instead of all firing at once.
+    """
+
+    def __init__(self, cooldown: float = JITO_BUNDLE_COOLDOWN):
+        """
+        Initialize the tracker.
+        
+        Args:
+            cooldown: Minimum seconds between two operations of the same type
+        """
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+        self._next_allowed: Dict[str, float] = {}
+
+    def reserve(self, operation_type: str) -> float:
+        """
+        Reserve the next slot for an operation type.
+        
+        Args:
+            operation_type: Type of operation ('token_creation', 'batch_buy', etc.)
+            
+        Returns:
+            Seconds the caller must wait before starting the operation
+        """
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_allowed.get(operation_type, 0.0))
+            self._next_allowed[operation_type] = start_at + self.cooldown
+            return start_at - now
+
+    def remaining(self, operation_type: str) -> float:
+        """
+        Get the seconds left before an operation type may start again.
+        
+        Args:
+            operation_type: Type of operation
+            
+        Returns:
+            Remaining cooldown in seconds (0 if none)
+        """
+        with self._lock:
+            return max(0.0, self._next_allowed.get(operation_type, 0.0) - time.monotonic())
+
+
+# Shared by all PumpFun clients in the process
+bundle_cooldowns = BundleCooldownTracker()
+circuit_breakers = CircuitBreakerRegistry("PumpFun")
+# Concurrency of Jito bundle requests across all users, adapted to throttling signals
+bundle_limiter = AdaptiveConcurrencyLimiter("PumpFun bundle")
+
+
 class PumpFunClient:
     """
     PumpFun API client for managing Solana wallets and Pump.fun platform interactions.
@@ -139,6 +226,9 @@ class PumpFunClient:
             'batch_sell': 0,
             'balance_check': 0
         }
+        
+        # Per-attempt timings of the most recent multipart upload
+        self.last_upload_timings: List[Dict[str, Any]] = []
 
     def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """
@@ -157,6 +247,7 @@ class PumpFunClient:
             PumpFunNetworkError: On network errors
         """
         url = f"{self.base_url}{endpoint}"
+        breaker = self._acquire_circuit(endpoint)
         
         try:
             # Set timeout if not provided
@@ -169,82 +260,161 @@ class PumpFunClient:
             
             # Make request
             response = self.session.request(method, url, **kwargs)
+            self._record_status(breaker, response.status_code)
             
             # Log request details
             logger.info(f"PumpFun API {method} {endpoint} - Status: {response.status_code}")
             
-            # Handle response
-            if response.status_code == 200:
-                try:
-                    return response.json()
-                except json.JSONDecodeError:
-                    return {"status": "success", "data": response.text}
-            elif response.status_code == 400:
-                # Enhanced error handling for validation errors with field-level analysis
-                try:
-                    error_data = response.json() if response.content else {}
-                    detailed_error = error_data.get('error', error_data.get('message', 'Invalid request'))
-                    
-                    # Enhanced logging for field-level validation debugging
-                    logger.error(f"PumpFun API 400 validation error: {detailed_error}")
-                    logger.error(f"Full error response: {error_data}")
-                    
-                    # Detect common field name mismatches for better error reporting
-                    if 'showName' in str(detailed_error):
-                        logger.error("Field mismatch detected: API expects 'showName' (camelCase), check for 'show_name' (snake_case)")
-                    if 'initialSupplyAmount' in str(detailed_error):
-                        logger.error("Field mismatch detected: API expects 'initialSupplyAmount' (camelCase), check for 'initial_supply_amount' (snake_case)")
-                    if 'imageFileName' in str(detailed_error):
-                        logger.error("Field mismatch detected: API expects 'imageFileName' (camelCase), check for 'image_url' (snake_case)")
-                    
-                    # Include request body in error context if available
-                    if 'json' in kwargs:
-                        logger.error(f"Request body that caused validation error: {kwargs['json']}")
-                    
-                    raise PumpFunValidationError(f"Validation error: {detailed_error}")
-                except json.JSONDecodeError:
-                    # If response is not JSON, log the raw response
-                    logger.error(f"PumpFun API 400 non-JSON response: {response.text}")
-                    raise PumpFunValidationError(f"Validation error: {response.text}")
-            elif response.status_code == 500:
-                try:
-                    error_data = response.json() if response.content else {}
-                    error_message = error_data.get('error', error_data.get('message', 'Internal server error'))
-                    
-                    # CRITICAL FIX: Check if sell operations actually succeeded despite 500 error
-                    # Similar to token creation fix - some 500 responses contain success data
-                    if ('batch sell' in error_message.lower() or 'sell' in error_message.lower()) and error_data.get('data'):
-                        data = error_data.get('data', {})
-                        # Check for indicators of successful sell operations
-                        if (data.get('success') or 
-                            data.get('successfulBundles', 0) > 0 or 
-                            data.get('bundleResults') or
-                            'successful' in str(data).lower()):
-                            logger.warning(f"500 error but response contains sell success data - likely async success: {error_message}")
-                            logger.info("Found sell success indicators in 500 response - treating as success")
-                            # Ensure a consistent success flag for downstream handlers
-                            try:
-                                if isinstance(data, dict) and not data.get('success', False):
-                                    data['success'] = True
-                                    error_data['data'] = data
-                            except Exception:
-                                pass
-                            return error_data
-                    
-                    raise PumpFunApiError(f"Server error: {error_message}")
-                except json.JSONDecodeError:
-                    logger.error(f"PumpFun API 500 non-JSON response: {response.text}")
-                    raise PumpFunApiError(f"Server error: {response.text}")
-            else:
-                raise PumpFunApiError(f"HTTP {response.status_code}: {response.text}")
+            return self._handle_response(method, endpoint, response, kwargs)
                 
         except requests.exceptions.ConnectionError as e:
+            breaker.record_failure()
             raise PumpFunNetworkError(f"Connection error: {str(e)}")
         except requests.exceptions.Timeout as e:
+            breaker.record_failure()
             raise PumpFunNetworkError(f"Request timeout: {str(e)}")
         except requests.exceptions.RequestException as e:
+            breaker.record_failure()
             raise PumpFunNetworkError(f"Request error: {str(e)}")
 
+    @staticmethod
+    def _endpoint_family(endpoint: str) -> str:
+        """
+        Map an endpoint to the circuit breaker family it belongs to.
+        
+        Args:
+            endpoint: API endpoint path
+            
+        Returns:
+            Family name (pump_bundle, balance, fund_bundled or wallets)
+        """
+        if endpoint.startswith('/api/pump/'):
+            return 'pump_bundle'
+        if '/balance' in endpoint:
+            return 'balance'
+        if endpoint.startswith('/api/wallets/fund-bundled'):
+            return 'fund_bundled'
+        return 'wallets'
+
+    def _acquire_circuit(self, endpoint: str) -> CircuitBreaker:
+        """
+        Get the circuit breaker for an endpoint and check that a request may be sent.
+        
+        Args:
+            endpoint: API endpoint path
+            
+        Returns:
+            The endpoint family's circuit breaker
+            
+        Raises:
+            PumpFunCircuitOpenError: If the breaker is open and the request must fail fast
+        """
+        family = self._endpoint_family(endpoint)
+        breaker = circuit_breakers.get(family)
+        if not breaker.allow_request():
+            retry_after = breaker.retry_after()
+            logger.warning(f"PumpFun circuit '{family}' open, failing fast for {endpoint} (retry in {retry_after:.1f}s)")
+            raise PumpFunCircuitOpenError(
+                f"PumpFun API unavailable: circuit breaker open for {family} endpoints, retry in {retry_after:.1f}s",
+                family=family,
+                retry_after=retry_after
+            )
+        return breaker
+
+    def _record_status(self, breaker: CircuitBreaker, status_code: int):
+        """Record a received response with the breaker; only gateway errors count as outages."""
+        if status_code in OUTAGE_STATUS_CODES:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+            # Imported here because the warmer imports this module for the bundler's URL
+            from bot.api.backend_warmer import backend_warmer
+            # The backend is awake, so its keep-warm ping can wait
+            backend_warmer.record_contact(self.base_url)
+
+    def _handle_response(self, method: str, endpoint: str, response: Any,
+                         request_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Turn an HTTP response from either transport into a result dictionary.
+        
+        Args:
+            method: HTTP method of the request
+            endpoint: API endpoint path
+            response: requests.Response or httpx.Response
+            request_kwargs: Keyword arguments the request was made with
+            
+        Returns:
+            API response as dictionary
+            
+        Raises:
+            PumpFunValidationError: On 400 responses
+            PumpFunApiError: On other error responses
+        """
+        # Handle response
+        if response.status_code == 200:
+            try:
+                return response.json()
+            except json.JSONDecodeError:
+                return {"status": "success", "data": response.text}
+        elif response.status_code == 400:
+            # Enhanced error handling for validation errors with field-level analysis
+            try:
+                error_data = response.json() if response.content else {}
+                detailed_error = error_data.get('error', error_data.get('message', 'Invalid request'))
+                
+                # Enhanced logging for field-level validation debugging
+                logger.error(f"PumpFun API 400 validation error: {detailed_error}")
+                logger.error(f"Full error response: {error_data}")
+                
+                # Detect common field name mismatches for better error reporting
+                if 'showName' in str(detailed_error):
+                    logger.error("Field mismatch detected: API expects 'showName' (camelCase), check for 'show_name' (snake_case)")
+                if 'initialSupplyAmount' in str(detailed_error):
+                    logger.error("Field mismatch detected: API expects 'initialSupplyAmount' (camelCase), check for 'initial_supply_amount' (snake_case)")
+                if 'imageFileName' in str(detailed_error):
+                    logger.error("Field mismatch detected: API expects 'imageFileName' (camelCase), check for 'image_url' (snake_case)")
+                
+                # Include request body in error context if available
+                if 'json' in request_kwargs:
+                    logger.error(f"Request body that caused validation error: {request_kwargs['json']}")
+                
+                raise PumpFunValidationError(f"Validation error: {detailed_error}")
+            except json.JSONDecodeError:
+                # If response is not JSON, log the raw response
+                logger.error(f"PumpFun API 400 non-JSON response: {response.text}")
+                raise PumpFunValidationError(f"Validation error: {response.text}")
+        elif response.status_code == 500:
+            try:
+                error_data = response.json() if response.content else {}
+                error_message = error_data.get('error', error_data.get('message', 'Internal server error'))
+                
+                # CRITICAL FIX: Check if sell operations actually succeeded despite 500 error
+                # Similar to token creation fix - some 500 responses contain success data
+                if ('batch sell' in error_message.lower() or 'sell' in error_message.lower()) and error_data.get('data'):
+                    data = error_data.get('data', {})
+                    # Check for indicators of successful sell operations
+                    if (data.get('success') or 
+                        data.get('successfulBundles', 0) > 0 or 
+                        data.get('bundleResults') or
+                        'successful' in str(data).lower()):
+                        logger.warning(f"500 error but response contains sell success data - likely async success: {error_message}")
+                        logger.info("Found sell success indicators in 500 response - treating as success")
+                        # Ensure a consistent success flag for downstream handlers
+                        try:
+                            if isinstance(data, dict) and not data.get('success', False):
+                                data['success'] = True
+                                error_data['data'] = data
+                        except Exception:
+                            pass
+                        return error_data
+                
+                raise PumpFunApiError(f"Server error: {error_message}")
+            except json.JSONDecodeError:
+                logger.error(f"PumpFun API 500 non-JSON response: {response.text}")
+                raise PumpFunApiError(f"Server error: {response.text}")
+        else:
+            raise PumpFunApiError(f"HTTP {response.status_code}: {response.text}")
+
     def _make_request_with_retry(self, method: str, endpoint: str, max_retries: int = MAX_RETRIES, 
                                 initial_backoff: float = INITIAL_BACKOFF, **kwargs) -> Dict[str, Any]:
         """
@@ -262,31 +432,15 @@ class PumpFunClient:
             API response as dictionary
         """
         last_exception = None
-        is_cold_start = self._detect_cold_start_scenario()
-        
-        # Use enhanced retry parameters for cold start scenarios
-        if is_cold_start:
-            max_retries = max(max_retries, COLD_START_MAX_RETRIES)
-            initial_backoff = max(initial_backoff, COLD_START_INITIAL_BACKOFF)
-            logger.info(f"Cold start detected, using enhanced retry: max_retries={max_retries}, initial_backoff={initial_backoff}")
+        is_cold_start, max_retries, initial_backoff = self._retry_parameters(max_retries, initial_backoff)
         
         for attempt in range(max_retries + 1):
             try:
-                return self._make_request(method, endpoint, **kwargs)
+                return self._make_limited_request(method, endpoint, **kwargs)
             except PumpFunNetworkError as e:
                 last_exception = e
                 if attempt < max_retries:
-                    # Progressive backoff with jitter for cold starts
-                    base_backoff = initial_backoff * (2 ** attempt)
-                    # Add jitter to prevent thundering herd
-                    jitter = random.uniform(0.5, 1.5) if is_cold_start else 1.0
-                    backoff_time = base_backoff * jitter
-                    
-                    if is_cold_start and attempt == 0:
-                        logger.warning(f"Cold start timeout detected, initiating wake-up sequence. Retrying in {backoff_time:.1f}s")
-                    else:
-                        logger.warning(f"Network error on attempt {attempt + 1}/{max_retries + 1}, retrying in {backoff_time:.1f}s: {str(e)}")
-                    
+                    backoff_time = self._network_backoff(initial_backoff, attempt, max_retries, is_cold_start, e)
                     time.sleep(backoff_time)
                 else:
                     logger.error(f"All {max_retries + 1} retry attempts failed: {str(e)}")
@@ -296,6 +450,55 @@ class PumpFunClient:
                 
         raise last_exception
 
+    def _retry_parameters(self, max_retries: int, initial_backoff: float):
+        """
+        Adjust retry parameters for cold start scenarios.
+        
+        Args:
+            max_retries: Requested maximum number of retry attempts
+            initial_backoff: Requested initial backoff time in seconds
+            
+        Returns:
+            Tuple of (is_cold_start, max_retries, initial_backoff)
+        """
+        is_cold_start = self._detect_cold_start_scenario()
+        
+        # Use enhanced retry parameters for cold start scenarios
+        if is_cold_start:
+            max_retries = max(max_retries, COLD_START_MAX_RETRIES)
+            initial_backoff = max(initial_backoff, COLD_START_INITIAL_BACKOFF)
+            logger.info(f"Cold start detected, using enhanced retry: max_retries={max_retries}, initial_backoff={initial_backoff}")
+        
+        return is_cold_start, max_retries, initial_backoff
+
+    def _network_backoff(self, initial_backoff: float, attempt: int, max_retries: int,
+                         is_cold_start: bool, error: Exception) -> float:
+        """
+        Calculate and log the backoff before retrying a network error.
+        
+        Args:
+            initial_backoff: Initial backoff time in seconds
+            attempt: Current attempt number (0-based)
+            max_retries: Maximum number of retry attempts
+            is_cold_start: Whether a cold start scenario was detected
+            error: The network error being retried
+            
+        Returns:
+            Backoff time in seconds
+        """
+        # Progressive backoff with jitter for cold starts
+        base_backoff = initial_backoff * (2 ** attempt)
+        # Add jitter to prevent thundering herd
+        jitter = random.uniform(0.5, 1.5) if is_cold_start else 1.0
+        backoff_time = base_backoff * jitter
+        
+        if is_cold_start and attempt == 0:
+            logger.warning(f"Cold start timeout detected, initiating wake-up sequence. Retrying in {backoff_time:.1f}s")
+        else:
+            logger.warning(f"Network error on attempt {attempt + 1}/{max_retries + 1}, retrying in {backoff_time:.1f}s: {str(error)}")
+        
+        return backoff_time
+
     def _detect_cold_start_scenario(self) -> bool:
         """
         Detect if this might be a cold start scenario.
@@ -327,23 +530,39 @@ class PumpFunClient:
         Returns:
             True if this is a rate limiting error
         """
-        rate_limit_indicators = [
-            "Failed to send Jito bundle",
-            "rate limit",
-            "too many requests", 
-            "429",
-            "throttle",
-            "jito.wtf/api/v1/bundles",
-            "bundle submission failed"
-        ]
-        
-        error_lower = error_message.lower()
-        for indicator in rate_limit_indicators:
-            if indicator.lower() in error_lower:
-                logger.warning(f"Rate limit detected in error: {indicator} found in '{error_message}'")
-                return True
+        if is_throttling_signal(error_message):
+            logger.warning(f"Rate limit detected in error: '{error_message}'")
+            return True
         return False
 
+    def _make_limited_request(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """
+        Make a request, holding a bundle_limiter slot for Jito bundle endpoints.
+        
+        Successful bundle calls let the shared limiter raise concurrency, and rate limit
+        errors make it halve concurrency for every user.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            **kwargs: Additional request parameters
+            
+        Returns:
+            API response as dictionary
+        """
+        if self._endpoint_family(endpoint) != 'pump_bundle':
+            return self._make_request(method, endpoint, **kwargs)
+        
+        with bundle_limiter.slot():
+            try:
+                response = self._make_request(method, endpoint, **kwargs)
+            except PumpFunApiError as e:
+                if self._is_rate_limit_error(str(e)):
+                    bundle_limiter.record_throttle()
+                raise
+            bundle_limiter.record_success()
+            return response
+
     def _calculate_rate_limit_backoff(self, attempt: int) -> float:
         """
         Calculate exponential backoff with jitter for rate limiting.
@@ -371,18 +590,39 @@ class PumpFunClient:
         Args:
             operation_type: Type of operation ('token_creation', 'batch_buy', etc.)
         """
-        current_time = time.time()
-        time_since_last = current_time - self._last_bundle_operation_time
+        sleep_time = bundle_cooldowns.reserve(operation_type)
         
-        if time_since_last < JITO_BUNDLE_COOLDOWN:
-            sleep_time = JITO_BUNDLE_COOLDOWN - time_since_last
-            logger.info(f"Bundle operation cooldown: waiting {sleep_time:.1f}s since last bundle operation")
+        if sleep_time > 0:
+            logger.info(f"Bundle operation cooldown: waiting {sleep_time:.1f}s since last {operation_type} operation")
             time.sleep(sleep_time)
         
-        # Update operation timestamps
+        self._record_bundle_operation(operation_type)
+
+    def _record_bundle_operation(self, operation_type: str):
+        """Update the per-instance operation timestamps after a cooldown completes."""
+        current_time = time.time()
         self._operation_timestamps[operation_type] = current_time
         self._last_bundle_operation_time = current_time
 
+    @staticmethod
+    def _bundle_operation_type(endpoint: str) -> Optional[str]:
+        """
+        Get the cooldown operation type for a bundle endpoint.
+        
+        Args:
+            endpoint: API endpoint path
+            
+        Returns:
+            Operation type, or None if the endpoint is not a bundle operation
+        """
+        if 'create-and-buy' in endpoint:
+            return 'token_creation'
+        if 'batch-buy' in endpoint:
+            return 'batch_buy'
+        if 'batch-sell' in endpoint:
+            return 'batch_sell'
+        return None
+
     def _make_request_for_critical_operations(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
         """
         Make request with maximum retry effort for critical operations like wallet creation.
@@ -397,9 +637,8 @@ class PumpFunClient:
             API response as dictionary
         """
         # Check if this is a bundle operation that needs cooldown
-        bundle_endpoints = ['/api/pump/create-and-buy', '/api/pump/batch-buy', '/api/pump/batch-sell']
-        if any(bundle_endpoint in endpoint for bundle_endpoint in bundle_endpoints):
-            operation_type = 'token_creation' if 'create-and-buy' in endpoint else 'batch_buy' if 'batch-buy' in endpoint else 'batch_sell'
+        operation_type = self._bundle_operation_type(endpoint)
+        if operation_type:
             self._enforce_bundle_operation_cooldown(operation_type)
         
         # Use enhanced retry with rate limiting support
@@ -427,18 +666,12 @@ class PumpFunClient:
             API response as dictionary
         """
         last_exception = None
-        is_cold_start = self._detect_cold_start_scenario()
+        is_cold_start, max_retries, initial_backoff = self._retry_parameters(max_retries, initial_backoff)
         rate_limit_retries = 0
         
-        # Use enhanced retry parameters for cold start scenarios
-        if is_cold_start:
-            max_retries = max(max_retries, COLD_START_MAX_RETRIES)
-            initial_backoff = max(initial_backoff, COLD_START_INITIAL_BACKOFF)
-            logger.info(f"Cold start detected, using enhanced retry: max_retries={max_retries}, initial_backoff={initial_backoff}")
-        
         for attempt in range(max_retries + 1):
             try:
-                return self._make_request(method, endpoint, **kwargs)
+                return self._make_limited_request(method, endpoint, **kwargs)
             except PumpFunApiError as e:
                 error_message = str(e)
                 
@@ -461,17 +694,7 @@ class PumpFunClient:
             except PumpFunNetworkError as e:
                 last_exception = e
                 if attempt < max_retries:
-                    # Progressive backoff with jitter for cold starts
-                    base_backoff = initial_backoff * (2 ** attempt)
-                    # Add jitter to prevent thundering herd
-                    jitter = random.uniform(0.5, 1.5) if is_cold_start else 1.0
-                    backoff_time = base_backoff * jitter
-                    
-                    if is_cold_start and attempt == 0:
-                        logger.warning(f"Cold start timeout detected, initiating wake-up sequence. Retrying in {backoff_time:.1f}s")
-                    else:
-                        logger.warning(f"Network error on attempt {attempt + 1}/{max_retries + 1}, retrying in {backoff_time:.1f}s: {str(e)}")
-                    
+                    backoff_time = self._network_backoff(initial_backoff, attempt, max_retries, is_cold_start, e)
                     time.sleep(backoff_time)
                 else:
                     logger.error(f"All {max_retries + 1} retry attempts failed: {str(e)}")
@@ -1297,6 +1520,32 @@ class PumpFunClient:
         # Use legacy endpoint directly since enhanced endpoints are not available
         return self._get_wallet_balance_legacy(public_key)
 
+    def get_wallet_sol_balances(self, public_keys: List[str]) -> Dict[str, int]:
+        """
+        Get the SOL balances of many wallets, reading at most BALANCE_FETCH_CONCURRENCY at a time.
+        
+        Args:
+            public_keys: Wallet public keys (duplicates are read once)
+            
+        Returns:
+            Dictionary mapping each readable public key to its balance in lamports;
+            wallets whose balance could not be read are omitted
+        """
+        unique_keys = list(dict.fromkeys(key for key in public_keys if key))
+        if not unique_keys:
+            return {}
+        
+        balances = {}
+        with ThreadPoolExecutor(max_workers=min(BALANCE_FETCH_CONCURRENCY, len(unique_keys))) as pool:
+            for public_key, response in zip(unique_keys, pool.map(self._get_wallet_balance_legacy, unique_keys)):
+                if "error" in response:
+                    continue
+                data = response.get("data", {})
+                balances[public_key] = int(data.get("lamports") or round((data.get("balance") or 0) * 1_000_000_000))
+        
+        logger.info(f"Read SOL balances for {len(balances)}/{len(unique_keys)} wallets")
+        return balances
+
     def get_wallet_token_balance(self, public_key: str, mint_address: str) -> Dict[str, Any]:
         """
         Get specific SPL token balance for a wallet with fallback.
@@ -1621,6 +1870,36 @@ class PumpFunClient:
         Returns:
             Dictionary with token creation and buy results
         """
+        buy_amounts_dict = self._prepare_token_creation(token_params, buy_amounts, wallets)
+        
+        # Use image or non-image flow
+        if image_file_path:
+            logger.info(f"Creating token with image: {image_file_path}")
+            return self._create_token_with_image(
+                token_params, buy_amounts_dict, wallets, slippage_bps, image_file_path, create_amount_sol
+            )
+        else:
+            logger.info("Creating token without image")
+            return self._create_token_without_image(
+                token_params, buy_amounts_dict, wallets, slippage_bps, create_amount_sol
+            )
+
+    def _prepare_token_creation(self, token_params: TokenCreationParams, buy_amounts: BuyAmounts,
+                                wallets: List[Dict[str, str]]) -> Dict[str, float]:
+        """
+        Validate token creation inputs and build the dynamic buyAmountsSOL mapping.
+        
+        Args:
+            token_params: Token creation parameters
+            buy_amounts: Buy amounts
+            wallets: List of wallet dictionaries with 'name' and 'privateKey' fields
+            
+        Returns:
+            Dictionary mapping buyAmountsSOL keys to amounts
+            
+        Raises:
+            PumpFunValidationError: If the inputs are invalid
+        """
         if not token_params:
             raise PumpFunValidationError("Token parameters cannot be empty")
         if not wallets:
@@ -1650,17 +1929,7 @@ class PumpFunClient:
         
         logger.info(f"Built dynamic buyAmountsSOL for {len(buy_amounts_dict)} wallets: {list(buy_amounts_dict.keys())}")
         
-        # Use image or non-image flow
-        if image_file_path:
-            logger.info(f"Creating token with image: {image_file_path}")
-            return self._create_token_with_image(
-                token_params, buy_amounts_dict, wallets, slippage_bps, image_file_path, create_amount_sol
-            )
-        else:
-            logger.info("Creating token without image")
-            return self._create_token_without_image(
-                token_params, buy_amounts_dict, wallets, slippage_bps, create_amount_sol
-            )
+        return buy_amounts_dict
 
     def _build_dynamic_buy_amounts(self, wallets: List[Dict[str, str]], buy_amounts: BuyAmounts) -> Dict[str, float]:
         """
@@ -1752,7 +2021,71 @@ class PumpFunClient:
             Dictionary with token creation results
         """
         url = f"{self.base_url}/api/pump/create-and-buy"
+        form_data, file_extension = self._prepare_multipart_token_upload(
+            token_params, buy_amounts_dict, wallets, slippage_bps, image_file_path, create_amount_sol
+        )
+        
+        try:
+            # Build the request body once; every retry attempt replays the same bytes
+            multipart_body = self._encode_multipart_body(form_data, image_file_path, file_extension)
+            if multipart_body is None:
+                return self._create_token_without_image(
+                    token_params=token_params,
+                    buy_amounts_dict=buy_amounts_dict,
+                    wallets=wallets,
+                    slippage_bps=slippage_bps,
+                    create_amount_sol=create_amount_sol
+                )
+            body, content_type = multipart_body
+            
+            self._log_multipart_form_data(form_data, image_file_path)
+            
+            # Make multipart request with retry logic
+            try:
+                response = self._make_multipart_request_with_retry("POST", url, body=body, content_type=content_type)
+                logger.info("Token creation with image upload completed successfully")
+                return self._normalize_response_fields(response)
+            except (PumpFunValidationError, PumpFunApiError) as e:
+                # Graceful fallback: if the server reports empty file upload, continue without image
+                if self._is_empty_file_upload_error(e):
+                    logger.warning("EMPTY_FILE_UPLOAD detected during multipart upload. Falling back to token creation without image.")
+                    return self._create_token_without_image(
+                        token_params=token_params,
+                        buy_amounts_dict=buy_amounts_dict,
+                        wallets=wallets,
+                        slippage_bps=slippage_bps,
+                        create_amount_sol=create_amount_sol
+                    )
+                # Re-raise non-image related errors
+                raise
+                
+        except IOError as e:
+            raise PumpFunValidationError(f"Failed to read image file: {str(e)}")
+        except Exception as e:
+            logger.error(f"Image upload failed: {str(e)}")
+            raise PumpFunApiError(f"Image upload failed: {str(e)}")
+
+    def _prepare_multipart_token_upload(self, token_params: TokenCreationParams,
+                                        buy_amounts_dict: Dict[str, float], wallets: List[Dict[str, str]],
+                                        slippage_bps: int, image_file_path: str,
+                                        create_amount_sol: float = 0.001):
+        """
+        Validate the image file and build the multipart form fields for token creation.
         
+        Args:
+            token_params: Token creation parameters
+            buy_amounts_dict: Buy amounts dictionary
+            wallets: List of wallet dictionaries with 'name' and 'privateKey' fields
+            slippage_bps: Slippage in basis points
+            image_file_path: Path to image file
+            create_amount_sol: SOL amount for token creation
+            
+        Returns:
+            Tuple of (form data dictionary, lower-case image file extension)
+            
+        Raises:
+            PumpFunValidationError: If the form data or image file is invalid
+        """
         # Prepare form data according to API documentation
         # Use the dynamic buy_amounts_dict directly as it's already formatted correctly
         buy_amounts_json = json.dumps(buy_amounts_dict, separators=(',', ':'))
@@ -1827,47 +2160,77 @@ class PumpFunClient:
         if file_extension not in valid_extensions:
             raise PumpFunValidationError(f"Invalid image format: {file_extension}. Supported: {valid_extensions}")
         
-        try:
-            # Open and prepare file for upload
-            with open(image_file_path, 'rb') as image_file:
-                files = {'image': (os.path.basename(image_file_path), image_file, self._get_content_type(file_extension))}
-                
-                # Log complete request details for debugging
-                logger.info(f"Multipart upload - Form fields: {list(form_data.keys())}, File: {os.path.basename(image_file_path)}")
-                logger.info(f"Complete form data for debugging:")
-                for key, value in form_data.items():
-                    if key == 'buyAmountsSOL':
-                        logger.info(f"  {key}: {value} (type: {type(value).__name__}, length: {len(value)})")
-                    elif key == 'wallets':
-                        logger.info(f"  {key}: {value} (type: {type(value).__name__}, length: {len(value)})")
-                    else:
-                        logger.info(f"  {key}: {value} (type: {type(value).__name__})")
-                
-                # Make multipart request with retry logic
-                try:
-                    response = self._make_multipart_request_with_retry("POST", url, data=form_data, files=files)
-                    logger.info("Token creation with image upload completed successfully")
-                    return self._normalize_response_fields(response)
-                except (PumpFunValidationError, PumpFunApiError) as e:
-                    # Graceful fallback: if the server reports empty file upload, continue without image
-                    err_msg = str(e)
-                    if 'EMPTY_FILE_UPLOAD' in err_msg or 'empty file upload' in err_msg.lower():
-                        logger.warning("EMPTY_FILE_UPLOAD detected during multipart upload. Falling back to token creation without image.")
-                        return self._create_token_without_image(
-                            token_params=token_params,
-                            buy_amounts_dict=buy_amounts_dict,
-                            wallets=wallets,
-                            slippage_bps=slippage_bps,
-                            create_amount_sol=create_amount_sol
-                        )
-                    # Re-raise non-image related errors
-                    raise
-                
-        except IOError as e:
-            raise PumpFunValidationError(f"Failed to read image file: {str(e)}")
-        except Exception as e:
-            logger.error(f"Image upload failed: {str(e)}")
-            raise PumpFunApiError(f"Image upload failed: {str(e)}")
+        return form_data, file_extension
+
+    def _log_multipart_form_data(self, form_data: Dict[str, Any], image_file_path: str) -> None:
+        """Log complete multipart request details for debugging."""
+        logger.info(f"Multipart upload - Form fields: {list(form_data.keys())}, File: {os.path.basename(image_file_path)}")
+        logger.info(f"Complete form data for debugging:")
+        for key, value in form_data.items():
+            if key == 'buyAmountsSOL':
+                logger.info(f"  {key}: {value} (type: {type(value).__name__}, length: {len(value)})")
+            elif key == 'wallets':
+                logger.info(f"  {key}: {value} (type: {type(value).__name__}, length: {len(value)})")
+            else:
+                logger.info(f"  {key}: {value} (type: {type(value).__name__})")
+
+    def _encode_multipart_body(self, form_data: Dict[str, Any], image_file_path: str,
+                               file_extension: str) -> Optional[Tuple[bytes, str]]:
+        """
+        Read the image once and encode the complete multipart/form-data request body.
+        
+        The encoded bytes are replayed as-is on every retry attempt, so there are no file
+        handles to rewind and no chance of a retry sending an exhausted stream.
+        
+        Args:
+            form_data: Multipart form fields
+            image_file_path: Path to image file
+            file_extension: Lower-case image file extension (with dot)
+            
+        Returns:
+            Tuple of (body bytes, Content-Type header with boundary), or None if the image is empty
+            
+        Raises:
+            IOError: If the image file cannot be read
+        """
+        with open(image_file_path, 'rb') as image_file:
+            image_bytes = image_file.read()
+        
+        if not image_bytes:
+            logger.warning(f"Image file is empty: {image_file_path}. Falling back to token creation without image.")
+            return None
+        
+        fields = [(key, str(value)) for key, value in form_data.items()]
+        fields.append(('image', (os.path.basename(image_file_path), image_bytes, self._get_content_type(file_extension))))
+        body, content_type = encode_multipart_formdata(fields)
+        logger.debug(f"Encoded multipart body: {len(body)} bytes ({len(image_bytes)} bytes of image data)")
+        return body, content_type
+
+    def _record_upload_attempt(self, attempt: int, started_at: float, outcome: str) -> float:
+        """
+        Record the wall-clock duration of one multipart upload attempt.
+        
+        Args:
+            attempt: Zero-based attempt number
+            started_at: time.monotonic() value taken just before the request was sent
+            outcome: HTTP status code or exception class name
+            
+        Returns:
+            Elapsed seconds for the attempt
+        """
+        elapsed = time.monotonic() - started_at
+        self.last_upload_timings.append({
+            'attempt': attempt + 1,
+            'elapsed': round(elapsed, 3),
+            'outcome': outcome
+        })
+        return elapsed
+
+    @staticmethod
+    def _is_empty_file_upload_error(error: Exception) -> bool:
+        """Check whether the server rejected a multipart upload because the image arrived empty."""
+        err_msg = str(error)
+        return 'EMPTY_FILE_UPLOAD' in err_msg or 'empty file upload' in err_msg.lower()
 
     def _create_token_without_image(self, token_params: TokenCreationParams, 
                                    buy_amounts_dict: Dict[str, float], wallets: List[Dict[str, str]], slippage_bps: int,
@@ -1885,6 +2248,16 @@ class PumpFunClient:
         Returns:
             Dictionary with token creation results
         """
+        data = self._build_json_token_payload(token_params, buy_amounts_dict, wallets, slippage_bps, create_amount_sol)
+        
+        # Use enhanced retry for critical token creation operations
+        response = self._make_request_for_critical_operations("POST", "/api/pump/create-and-buy", json=data)
+        return self._normalize_response_fields(response)
+
+    def _build_json_token_payload(self, token_params: TokenCreationParams,
+                                  buy_amounts_dict: Dict[str, float], wallets: List[Dict[str, str]],
+                                  slippage_bps: int, create_amount_sol: float = 0.001) -> Dict[str, Any]:
+        """Build the JSON token creation request with the new API field names."""
         # Direct JSON request with new API field names
         data = {
             "name": token_params.name,
@@ -1903,9 +2276,7 @@ class PumpFunClient:
         # Log the final request payload for debugging
         logger.info(f"JSON token creation request - Fields: {list(data.keys())}")
         
-        # Use enhanced retry for critical token creation operations
-        response = self._make_request_for_critical_operations("POST", "/api/pump/create-and-buy", json=data)
-        return self._normalize_response_fields(response)
+        return data
 
     def _get_content_type(self, file_extension: str) -> str:
         """
@@ -1927,11 +2298,25 @@ class PumpFunClient:
         }
         return content_types.get(file_extension.lower(), 'application/octet-stream')
 
-    def _make_multipart_request_with_retry(self, method: str, url: str, data: Dict[str, Any], 
-                                         files: Dict[str, Any], max_retries: int = MAX_RETRIES) -> Dict[str, Any]:
+    def _make_multipart_request_with_retry(self, method: str, url: str, body: bytes, 
+                                         content_type: str, max_retries: int = MAX_RETRIES) -> Dict[str, Any]:
         """
         Make multipart request with retry logic for image uploads.
         Enhanced with basic rate limiting support.
+        
+        Uploads go through the client's pooled session so retries reuse the existing
+        connection, and the pre-encoded body is replayed on every attempt. Per-attempt
+        timings are kept in last_upload_timings.
+        
+        Args:
+            method: HTTP method
+            url: Full request URL
+            body: Encoded multipart/form-data body
+            content_type: Content-Type header including the multipart boundary
+            max_retries: Maximum number of retry attempts
+            
+        Returns:
+            API response as dictionary
         """
         # Enforce cooldown for bundle operations before starting
         if '/api/pump/' in url:
@@ -1944,62 +2329,33 @@ class PumpFunClient:
             max_retries = max(max_retries, COLD_START_MAX_RETRIES)
             logger.info(f"Cold start detected for multipart upload, using enhanced retry: max_retries={max_retries}")
         
+        self.last_upload_timings = []
+        headers = {'Content-Type': content_type}
+        
         for attempt in range(max_retries + 1):
+            breaker = self._acquire_circuit(url[len(self.base_url):])
+            started_at = time.monotonic()
             try:
-                with requests.Session() as session:
-                    session.headers.update({'User-Agent': 'NinjaBot-PumpFun-Client/1.0'})
-                    # Ensure file streams are reset for each retry attempt to avoid EMPTY_FILE_UPLOAD
-                    try:
-                        if files:
-                            for _k, _v in files.items():
-                                _f = _v[1]
-                                if hasattr(_f, 'seek'):
-                                    _f.seek(0)
-                    except Exception as _rewind_err:
-                        logger.warning(f"Failed to rewind multipart file stream before attempt {attempt + 1}: {_rewind_err}")
-                    response = session.request(method, url, data=data, files=files, timeout=self.timeout)
-                    logger.info(f"Multipart request {method} {url} - Status: {response.status_code}")
-                    
-                    if response.status_code == 200:
-                        try:
-                            return response.json()
-                        except json.JSONDecodeError:
-                            return {"status": "success", "data": response.text}
-                    elif response.status_code == 400:
-                        try:
-                            error_data = response.json() if response.content else {}
-                            detailed_error = error_data.get('error', error_data.get('message', 'Invalid request'))
-                            
-                            # CRITICAL FIX: Check if token was actually created despite 400 error
-                            # Some 400 responses are false negatives due to async processing
-                            if ('EMPTY_FILE_UPLOAD' in detailed_error or 'file' in detailed_error.lower()) and error_data.get('data'):
-                                logger.warning(f"400 error but response contains data - likely async success: {detailed_error}")
-                                # Return the data if it exists, indicating possible success
-                                if 'mintAddress' in str(error_data.get('data', {})) or 'mint' in str(error_data.get('data', {})).lower():
-                                    logger.info("Found mint data in 400 response - treating as delayed success")
-                                    return error_data
-                            
-                            logger.error(f"Multipart upload validation error: {detailed_error}")
-                            raise PumpFunValidationError(f"Validation error: {detailed_error}")
-                        except json.JSONDecodeError:
-                            logger.error(f"Multipart upload 400 non-JSON response: {response.text}")
-                            raise PumpFunValidationError(f"Validation error: {response.text}")
-                    elif response.status_code == 500:
-                        error_data = response.json() if response.content else {}
-                        error_message = error_data.get('error', 'Internal server error')
-                        
-                        # Check if this is a rate limiting error and apply backoff
-                        if self._is_rate_limit_error(error_message):
-                            backoff_time = self._calculate_rate_limit_backoff(attempt)
-                            logger.warning(f"Rate limit detected in multipart upload, waiting {backoff_time:.1f}s before retry")
-                            time.sleep(backoff_time)
-                            if attempt < max_retries:
-                                continue
-                        
-                        raise PumpFunApiError(f"Server error: {error_message}")
-                    else:
-                        raise PumpFunApiError(f"HTTP {response.status_code}: {response.text}")
+                try:
+                    response = self.session.request(method, url, data=body, headers=headers, timeout=self.timeout)
+                except requests.exceptions.RequestException as e:
+                    breaker.record_failure()
+                    self._record_upload_attempt(attempt, started_at, type(e).__name__)
+                    raise
+                self._record_status(breaker, response.status_code)
+                elapsed = self._record_upload_attempt(attempt, started_at, str(response.status_code))
+                logger.info(f"Multipart request {method} {url} - Status: {response.status_code} (attempt {attempt + 1}, {elapsed:.2f}s)")
+                
+                return self._handle_multipart_response(response)
                         
+            except PumpFunRateLimitError as e:
+                # Rate limiting reported by the server: apply backoff before retrying
+                backoff_time = self._calculate_rate_limit_backoff(attempt)
+                logger.warning(f"Rate limit detected in multipart upload, waiting {backoff_time:.1f}s before retry")
+                time.sleep(backoff_time)
+                if attempt < max_retries:
+                    continue
+                raise PumpFunApiError(str(e))
             except requests.exceptions.ConnectionError as e:
                 last_exception = PumpFunNetworkError(f"Connection error: {str(e)}")
             except requests.exceptions.Timeout as e:
@@ -2022,6 +2378,57 @@ class PumpFunClient:
         
         raise last_exception or PumpFunNetworkError("Unknown error in multipart upload")
 
+    def _handle_multipart_response(self, response: Any) -> Dict[str, Any]:
+        """
+        Turn a multipart upload response from either transport into a result dictionary.
+        
+        Args:
+            response: requests.Response or httpx.Response
+            
+        Returns:
+            API response as dictionary
+            
+        Raises:
+            PumpFunValidationError: On 400 responses without creation data
+            PumpFunRateLimitError: On 500 responses caused by rate limiting
+            PumpFunApiError: On other error responses
+        """
+        if response.status_code == 200:
+            try:
+                return response.json()
+            except json.JSONDecodeError:
+                return {"status": "success", "data": response.text}
+        elif response.status_code == 400:
+            try:
+                error_data = response.json() if response.content else {}
+                detailed_error = error_data.get('error', error_data.get('message', 'Invalid request'))
+                
+                # CRITICAL FIX: Check if token was actually created despite 400 error
+                # Some 400 responses are false negatives due to async processing
+                if ('EMPTY_FILE_UPLOAD' in detailed_error or 'file' in detailed_error.lower()) and error_data.get('data'):
+                    logger.warning(f"400 error but response contains data - likely async success: {detailed_error}")
+                    # Return the data if it exists, indicating possible success
+                    if 'mintAddress' in str(error_data.get('data', {})) or 'mint' in str(error_data.get('data', {})).lower():
+                        logger.info("Found mint data in 400 response - treating as delayed success")
+                        return error_data
+                
+                logger.error(f"Multipart upload validation error: {detailed_error}")
+                raise PumpFunValidationError(f"Validation error: {detailed_error}")
+            except json.JSONDecodeError:
+                logger.error(f"Multipart upload 400 non-JSON response: {response.text}")
+                raise PumpFunValidationError(f"Validation error: {response.text}")
+        elif response.status_code == 500:
+            error_data = response.json() if response.content else {}
+            error_message = error_data.get('error', 'Internal server error')
+            
+            # Check if this is a rate limiting error so the caller can apply backoff
+            if self._is_rate_limit_error(error_message):
+                raise PumpFunRateLimitError(f"Server error: {error_message}")
+            
+            raise PumpFunApiError(f"Server error: {error_message}")
+        else:
+            raise PumpFunApiError(f"HTTP {response.status_code}: {response.text}")
+
     def batch_buy_token(self, mint_address: str, sol_amount_per_wallet: float, 
                        wallets: List[Dict[str, str]], slippage_bps: int = 2500, 
                        target_wallet_names: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -2038,6 +2445,19 @@ class PumpFunClient:
         Returns:
             Dictionary with batch buy results
         """
+        endpoint = "/api/pump/batch-buy"
+        data = self._build_batch_buy_payload(mint_address, sol_amount_per_wallet, wallets, slippage_bps, target_wallet_names)
+        return self._make_request_with_retry("POST", endpoint, json=data)
+
+    def _build_batch_buy_payload(self, mint_address: str, sol_amount_per_wallet: float,
+                                 wallets: List[Dict[str, str]], slippage_bps: int = 2500,
+                                 target_wallet_names: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Validate batch buy inputs and build the /api/pump/batch-buy request body.
+        
+        Raises:
+            PumpFunValidationError: On client-side validation failures
+        """
         if not mint_address:
             raise PumpFunValidationError("Mint address cannot be empty")
         if sol_amount_per_wallet <= 0:
@@ -2054,7 +2474,6 @@ class PumpFunClient:
             if "privateKey" not in wallet or not wallet["privateKey"]:
                 raise PumpFunValidationError(f"Wallet {i} must have a 'privateKey' field")
                 
-        endpoint = "/api/pump/batch-buy"
         data = {
             "mintAddress": mint_address,
             "solAmountPerWallet": sol_amount_per_wallet,
@@ -2069,7 +2488,7 @@ class PumpFunClient:
         if target_wallet_names:
             logger.info(f"Target wallets: {target_wallet_names}")
             
-        return self._make_request_with_retry("POST", endpoint, json=data)
+        return data
 
     def sell_dev_wallet(self, mint_address: str, sell_percentage, slippage_bps: int = 2500, 
                        wallets: List[Dict[str, str]] = None) -> Dict[str, Any]:
@@ -2090,6 +2509,20 @@ class PumpFunClient:
         Returns:
             Dictionary with sell results from server
             
+        Raises:
+            PumpFunValidationError: On client-side validation failures
+        """
+        endpoint = "/api/pump/sell-dev"
+        data = self._build_sell_dev_payload(mint_address, sell_percentage, slippage_bps, wallets)
+        
+        # Use enhanced retry for critical operations
+        return self._make_request_for_critical_operations("POST", endpoint, json=data)
+
+    def _build_sell_dev_payload(self, mint_address: str, sell_percentage, slippage_bps: int = 2500,
+                                wallets: List[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Validate DevWallet sell inputs and build the /api/pump/sell-dev request body.
+        
         Raises:
             PumpFunValidationError: On client-side validation failures
         """
@@ -2125,16 +2558,12 @@ class PumpFunClient:
         # Show minimum SOL requirement reminder (UI responsibility but log for visibility)
         logger.info(" DevWallet requires minimum 0.005 SOL for sell transactions")
         
-        endpoint = "/api/pump/sell-dev"
-        data = {
+        return {
             "mintAddress": mint_address,
             "sellAmountPercentage": normalized_percentage,
             "slippageBps": slippage_bps,
             "wallets": wallets
         }
-        
-        # Use enhanced retry for critical operations
-        return self._make_request_for_critical_operations("POST", endpoint, json=data)
 
     def batch_sell_token(self, mint_address: str, sell_percentage, slippage_bps: int = 2500,
                         wallets: List[Dict[str, str]] = None, target_wallet_names: Optional[List[str]] = None) -> Dict[str, Any]:
@@ -2157,6 +2586,21 @@ class PumpFunClient:
         Returns:
             Dictionary with batch sell results from server
             
+        Raises:
+            PumpFunValidationError: On client-side validation failures
+        """
+        endpoint = "/api/pump/batch-sell"
+        data = self._build_batch_sell_payload(mint_address, sell_percentage, slippage_bps, wallets, target_wallet_names)
+            
+        # Use enhanced retry for critical operations
+        return self._make_request_for_critical_operations("POST", endpoint, json=data)
+
+    def _build_batch_sell_payload(self, mint_address: str, sell_percentage, slippage_bps: int = 2500,
+                                  wallets: List[Dict[str, str]] = None,
+                                  target_wallet_names: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Validate batch sell inputs and build the /api/pump/batch-sell request body.
+        
         Raises:
             PumpFunValidationError: On client-side validation failures
         """
@@ -2187,7 +2631,6 @@ class PumpFunClient:
         # Show minimum SOL requirement reminder (UI responsibility but log for visibility)
         logger.info(" Each wallet requires minimum 0.025 SOL for sell transactions")
         
-        endpoint = "/api/pump/batch-sell"
         data = {
             "mintAddress": mint_address,
             "sellAmountPercentage": normalized_percentage,
@@ -2198,8 +2641,7 @@ class PumpFunClient:
         if target_wallet_names:
             data["targetWalletNames"] = target_wallet_names
             
-        # Use enhanced retry for critical operations
-        return self._make_request_for_critical_operations("POST", endpoint, json=data)
+        return data
 
     def _normalize_percentage(self, sell_percentage) -> str:
         """
@@ -2282,39 +2724,43 @@ class PumpFunClient:
             # Try a simple endpoint first to potentially wake up the service
             response = self._make_request_with_retry(
                 "GET", 
-                "/api/wallets/11111111111111111111111111111111/balance",
+                HEALTH_CHECK_ENDPOINT,
                 max_retries=COLD_START_MAX_RETRIES,
                 initial_backoff=COLD_START_INITIAL_BACKOFF
             )
-            return {
-                "status": "healthy", 
-                "api_reachable": True,
-                "cold_start_detected": self._detect_cold_start_scenario(),
-                "response_time": "normal"
-            }
-        except PumpFunNetworkError as e:
-            if "timeout" in str(e).lower():
-                return {
-                    "status": "unhealthy", 
-                    "api_reachable": False, 
-                    "error": str(e),
-                    "cold_start_likely": True,
-                    "suggestion": "Service may be in cold start. Please retry in a few moments."
-                }
-            else:
-                return {
-                    "status": "unhealthy", 
-                    "api_reachable": False, 
-                    "error": str(e),
-                    "cold_start_likely": False
-                }
+            return self._healthy_status()
         except Exception as e:
+            return self._unhealthy_status(e)
+
+    def _healthy_status(self) -> Dict[str, Any]:
+        """Build the health check result for a reachable API."""
+        return {
+            "status": "healthy", 
+            "api_reachable": True,
+            "cold_start_detected": self._detect_cold_start_scenario(),
+            "response_time": "normal",
+            "circuit_breakers": circuit_breakers.snapshot()
+        }
+
+    @staticmethod
+    def _unhealthy_status(error: Exception) -> Dict[str, Any]:
+        """Build the health check result for an unreachable API."""
+        if isinstance(error, PumpFunNetworkError) and "timeout" in str(error).lower():
             return {
                 "status": "unhealthy", 
                 "api_reachable": False, 
-                "error": str(e),
-                "cold_start_likely": False
+                "error": str(error),
+                "cold_start_likely": True,
+                "suggestion": "Service may be in cold start. Please retry in a few moments.",
+                "circuit_breakers": circuit_breakers.snapshot()
             }
+        return {
+            "status": "unhealthy", 
+            "api_reachable": False, 
+            "error": str(error),
+            "cold_start_likely": False,
+            "circuit_breakers": circuit_breakers.snapshot()
+        }
 
     def test_server_configuration(self) -> Dict[str, Any]:
         """
@@ -2770,4 +3216,461 @@ except Exception as e:
         except Exception:
             pass
 
-        return normalized
\ No newline at end of file
+        return normalized
+
+
+class AsyncPumpFunClient(PumpFunClient):
+    """
+    PumpFun API client whose bundle operations can be awaited from async handlers.
+    
+    Requests go through a pooled httpx.AsyncClient. Cooldowns, rate limit backoff and
+    retry backoff are awaited instead of slept, so one user's Jito bundle cooldown does
+    not stall the bot for every other chat. Cooldowns are shared with PumpFunClient
+    through the process-wide bundle_cooldowns tracker. The synchronous methods inherited
+    from PumpFunClient remain available.
+    """
+
+    def __init__(self, base_url: str = PUMPFUN_API_BASE_URL, timeout: int = DEFAULT_TIMEOUT):
+        """
+        Initialize the async PumpFun API client.
+        
+        Args:
+            base_url: Base URL for the PumpFun API
+            timeout: Request timeout in seconds
+        """
+        super().__init__(base_url, timeout)
+        # Created lazily on first use so it binds to the running event loop
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop = None
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        Get the pooled async HTTP client, creating it for the running event loop if needed.
+        
+        Returns:
+            httpx.AsyncClient bound to the current event loop
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client.is_closed or self._async_client_loop is not loop:
+            self._async_client = httpx.AsyncClient(
+                timeout=self.timeout,
+                headers={'User-Agent': 'NinjaBot-PumpFun-Client/1.0'}
+            )
+            self._async_client_loop = loop
+        return self._async_client
+
+    async def aclose(self):
+        """Close the async HTTP client and release its pooled connections."""
+        if self._async_client is not None and not self._async_client.is_closed:
+            await self._async_client.aclose()
+        self._async_client = None
+        self._async_client_loop = None
+
+    @staticmethod
+    def _network_error(error: httpx.HTTPError) -> PumpFunNetworkError:
+        """Map an httpx transport error to a PumpFunNetworkError."""
+        if isinstance(error, httpx.ConnectError):
+            return PumpFunNetworkError(f"Connection error: {str(error)}")
+        if isinstance(error, httpx.TimeoutException):
+            return PumpFunNetworkError(f"Request timeout: {str(error)}")
+        return PumpFunNetworkError(f"Request error: {str(error)}")
+
+    async def _make_request_async(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """
+        Make HTTP request to PumpFun API on the async transport.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            **kwargs: Additional request parameters (params, json, timeout)
+            
+        Returns:
+            API response as dictionary
+            
+        Raises:
+            PumpFunApiError: On API errors
+            PumpFunNetworkError: On network errors
+        """
+        url = f"{self.base_url}{endpoint}"
+        breaker = self._acquire_circuit(endpoint)
+        
+        if 'timeout' not in kwargs:
+            kwargs['timeout'] = self.timeout
+        
+        if 'json' in kwargs:
+            logger.info(f"PumpFun API {method} {endpoint} - Request body: {kwargs['json']}")
+        
+        try:
+            response = await self._get_async_client().request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            breaker.record_failure()
+            raise self._network_error(e)
+        self._record_status(breaker, response.status_code)
+        
+        logger.info(f"PumpFun API {method} {endpoint} - Status: {response.status_code}")
+        return self._handle_response(method, endpoint, response, kwargs)
+
+    async def _make_limited_request_async(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """
+        Awaitable version of _make_limited_request(); waiting for a slot does not block the loop.
+        """
+        if self._endpoint_family(endpoint) != 'pump_bundle':
+            return await self._make_request_async(method, endpoint, **kwargs)
+        
+        async with bundle_limiter.async_slot():
+            try:
+                response = await self._make_request_async(method, endpoint, **kwargs)
+            except PumpFunApiError as e:
+                if self._is_rate_limit_error(str(e)):
+                    bundle_limiter.record_throttle()
+                raise
+            bundle_limiter.record_success()
+            return response
+
+    async def _make_request_with_retry_async(self, method: str, endpoint: str, max_retries: int = MAX_RETRIES,
+                                             initial_backoff: float = INITIAL_BACKOFF, **kwargs) -> Dict[str, Any]:
+        """
+        Awaitable version of _make_request_with_retry(); backoff is awaited.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            max_retries: Maximum number of retry attempts
+            initial_backoff: Initial backoff time in seconds
+            **kwargs: Additional request parameters
+            
+        Returns:
+            API response as dictionary
+        """
+        last_exception = None
+        is_cold_start, max_retries, initial_backoff = self._retry_parameters(max_retries, initial_backoff)
+        
+        for attempt in range(max_retries + 1):
+            try:
+                return await self._make_limited_request_async(method, endpoint, **kwargs)
+            except PumpFunNetworkError as e:
+                last_exception = e
+                if attempt < max_retries:
+                    backoff_time = self._network_backoff(initial_backoff, attempt, max_retries, is_cold_start, e)
+                    await asyncio.sleep(backoff_time)
+                else:
+                    logger.error(f"All {max_retries + 1} retry attempts failed: {str(e)}")
+            except (PumpFunValidationError, PumpFunApiError) as e:
+                # Don't retry validation or API errors
+                raise e
+                
+        raise last_exception
+
+    async def _enforce_bundle_operation_cooldown_async(self, operation_type: str):
+        """
+        Awaitable version of _enforce_bundle_operation_cooldown().
+        
+        Args:
+            operation_type: Type of operation ('token_creation', 'batch_buy', etc.)
+        """
+        sleep_time = bundle_cooldowns.reserve(operation_type)
+        
+        if sleep_time > 0:
+            logger.info(f"Bundle operation cooldown: waiting {sleep_time:.1f}s since last {operation_type} operation")
+            await asyncio.sleep(sleep_time)
+        
+        self._record_bundle_operation(operation_type)
+
+    async def _make_request_for_critical_operations_async(self, method: str, endpoint: str, **kwargs) -> Dict[str, Any]:
+        """
+        Awaitable version of _make_request_for_critical_operations().
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            **kwargs: Additional request parameters
+            
+        Returns:
+            API response as dictionary
+        """
+        operation_type = self._bundle_operation_type(endpoint)
+        if operation_type:
+            await self._enforce_bundle_operation_cooldown_async(operation_type)
+        
+        return await self._make_request_with_rate_limit_retry_async(
+            method,
+            endpoint,
+            max_retries=COLD_START_MAX_RETRIES,
+            initial_backoff=COLD_START_INITIAL_BACKOFF,
+            **kwargs
+        )
+
+    async def _make_request_with_rate_limit_retry_async(self, method: str, endpoint: str, max_retries: int = MAX_RETRIES,
+                                                        initial_backoff: float = INITIAL_BACKOFF, **kwargs) -> Dict[str, Any]:
+        """
+        Awaitable version of _make_request_with_rate_limit_retry(); backoff is awaited.
+        
+        Args:
+            method: HTTP method
+            endpoint: API endpoint
+            max_retries: Maximum number of retry attempts
+            initial_backoff: Initial backoff time in seconds
+            **kwargs: Additional request parameters
+            
+        Returns:
+            API response as dictionary
+        """
+        last_exception = None
+        is_cold_start, max_retries, initial_backoff = self._retry_parameters(max_retries, initial_backoff)
+        rate_limit_retries = 0
+        
+        for attempt in range(max_retries + 1):
+            try:
+                return await self._make_limited_request_async(method, endpoint, **kwargs)
+            except PumpFunApiError as e:
+                error_message = str(e)
+                
+                if self._is_rate_limit_error(error_message):
+                    if rate_limit_retries < RATE_LIMIT_MAX_RETRIES:
+                        rate_limit_retries += 1
+                        backoff_time = self._calculate_rate_limit_backoff(rate_limit_retries - 1)
+                        
+                        logger.warning(f"Rate limit detected on attempt {attempt + 1}, waiting {backoff_time:.1f}s before retry {rate_limit_retries}/{RATE_LIMIT_MAX_RETRIES}")
+                        await asyncio.sleep(backoff_time)
+                        continue
+                    else:
+                        logger.error(f"Rate limit retries exhausted ({RATE_LIMIT_MAX_RETRIES}), giving up")
+                        raise PumpFunRateLimitError(f"Rate limit exceeded after {RATE_LIMIT_MAX_RETRIES} attempts: {error_message}")
+                else:
+                    raise e
+                    
+            except PumpFunNetworkError as e:
+                last_exception = e
+                if attempt < max_retries:
+                    backoff_time = self._network_backoff(initial_backoff, attempt, max_retries, is_cold_start, e)
+                    await asyncio.sleep(backoff_time)
+                else:
+                    logger.error(f"All {max_retries + 1} retry attempts failed: {str(e)}")
+            except (PumpFunValidationError) as e:
+                raise e
+                
+        raise last_exception
+
+    async def _make_multipart_request_with_retry_async(self, method: str, url: str, body: bytes,
+                                                       content_type: str, max_retries: int = MAX_RETRIES) -> Dict[str, Any]:
+        """
+        Awaitable version of _make_multipart_request_with_retry(); cooldown and backoff are awaited.
+        """
+        if '/api/pump/' in url:
+            await self._enforce_bundle_operation_cooldown_async('token_creation')
+        
+        last_exception = None
+        is_cold_start = self._detect_cold_start_scenario()
+        
+        if is_cold_start:
+            max_retries = max(max_retries, COLD_START_MAX_RETRIES)
+            logger.info(f"Cold start detected for multipart upload, using enhanced retry: max_retries={max_retries}")
+        
+        client = self._get_async_client()
+        self.last_upload_timings = []
+        headers = {'Content-Type': content_type}
+        
+        for attempt in range(max_retries + 1):
+            breaker = self._acquire_circuit(url[len(self.base_url):])
+            started_at = time.monotonic()
+            try:
+                try:
+                    response = await client.request(method, url, content=body, headers=headers, timeout=self.timeout)
+                except httpx.HTTPError as e:
+                    breaker.record_failure()
+                    self._record_upload_attempt(attempt, started_at, type(e).__name__)
+                    raise
+                self._record_status(breaker, response.status_code)
+                elapsed = self._record_upload_attempt(attempt, started_at, str(response.status_code))
+                logger.info(f"Multipart request {method} {url} - Status: {response.status_code} (attempt {attempt + 1}, {elapsed:.2f}s)")
+                
+                return self._handle_multipart_response(response)
+                
+            except PumpFunRateLimitError as e:
+                backoff_time = self._calculate_rate_limit_backoff(attempt)
+                logger.warning(f"Rate limit detected in multipart upload, waiting {backoff_time:.1f}s before retry")
+                await asyncio.sleep(backoff_time)
+                if attempt < max_retries:
+                    continue
+                raise PumpFunApiError(str(e))
+            except httpx.HTTPError as e:
+                last_exception = self._network_error(e)
+            except (PumpFunValidationError, PumpFunApiError) as e:
+                raise e
+            
+            if last_exception and attempt < max_retries:
+                backoff_time = INITIAL_BACKOFF * (2 ** attempt)
+                if is_cold_start:
+                    backoff_time *= random.uniform(0.5, 1.5)
+                logger.warning(f"Multipart upload error on attempt {attempt + 1}/{max_retries + 1}, retrying in {backoff_time:.1f}s: {str(last_exception)}")
+                await asyncio.sleep(backoff_time)
+            elif last_exception:
+                logger.error(f"All {max_retries + 1} multipart upload attempts failed: {str(last_exception)}")
+                raise last_exception
+        
+        raise last_exception or PumpFunNetworkError("Unknown error in multipart upload")
+
+    # Async Bundle Operations
+
+    async def create_token_and_buy_async(self, token_params: TokenCreationParams,
+                                         buy_amounts: BuyAmounts, wallets: List[Dict[str, str]], slippage_bps: int = 2500,
+                                         image_file_path: Optional[str] = None, create_amount_sol: float = 0.001) -> Dict[str, Any]:
+        """
+        Awaitable version of create_token_and_buy().
+        
+        Args:
+            token_params: Token creation parameters
+            buy_amounts: Buy amounts (used to build dynamic buyAmountsSOL)
+            wallets: List of wallet dictionaries with 'name' and 'privateKey' fields
+            slippage_bps: Slippage in basis points
+            image_file_path: Optional path to image file
+            create_amount_sol: SOL amount for token creation
+            
+        Returns:
+            Dictionary with token creation and buy results
+        """
+        buy_amounts_dict = self._prepare_token_creation(token_params, buy_amounts, wallets)
+        
+        if image_file_path:
+            logger.info(f"Creating token with image: {image_file_path}")
+            return await self._create_token_with_image_async(
+                token_params, buy_amounts_dict, wallets, slippage_bps, image_file_path, create_amount_sol
+            )
+        else:
+            logger.info("Creating token without image")
+            return await self._create_token_without_image_async(
+                token_params, buy_amounts_dict, wallets, slippage_bps, create_amount_sol
+            )
+
+    async def _create_token_with_image_async(self, token_params: TokenCreationParams,
+                                             buy_amounts_dict: Dict[str, float], wallets: List[Dict[str, str]],
+                                             slippage_bps: int, image_file_path: str,
+                                             create_amount_sol: float = 0.001) -> Dict[str, Any]:
+        """Awaitable version of _create_token_with_image()."""
+        url = f"{self.base_url}/api/pump/create-and-buy"
+        form_data, file_extension = self._prepare_multipart_token_upload(
+            token_params, buy_amounts_dict, wallets, slippage_bps, image_file_path, create_amount_sol
+        )
+        
+        try:
+            multipart_body = self._encode_multipart_body(form_data, image_file_path, file_extension)
+            if multipart_body is None:
+                return await self._create_token_without_image_async(
+                    token_params=token_params,
+                    buy_amounts_dict=buy_amounts_dict,
+                    wallets=wallets,
+                    slippage_bps=slippage_bps,
+                    create_amount_sol=create_amount_sol
+                )
+            body, content_type = multipart_body
+            
+            self._log_multipart_form_data(form_data, image_file_path)
+            
+            try:
+                response = await self._make_multipart_request_with_retry_async("POST", url, body=body, content_type=content_type)
+                logger.info("Token creation with image upload completed successfully")
+                return self._normalize_response_fields(response)
+            except (PumpFunValidationError, PumpFunApiError) as e:
+                # Graceful fallback: if the server reports empty file upload, continue without image
+                if self._is_empty_file_upload_error(e):
+                    logger.warning("EMPTY_FILE_UPLOAD detected during multipart upload. Falling back to token creation without image.")
+                    return await self._create_token_without_image_async(
+                        token_params=token_params,
+                        buy_amounts_dict=buy_amounts_dict,
+                        wallets=wallets,
+                        slippage_bps=slippage_bps,
+                        create_amount_sol=create_amount_sol
+                    )
+                raise
+                
+        except IOError as e:
+            raise PumpFunValidationError(f"Failed to read image file: {str(e)}")
+        except Exception as e:
+            logger.error(f"Image upload failed: {str(e)}")
+            raise PumpFunApiError(f"Image upload failed: {str(e)}")
+
+    async def _create_token_without_image_async(self, token_params: TokenCreationParams,
+                                                buy_amounts_dict: Dict[str, float], wallets: List[Dict[str, str]],
+                                                slippage_bps: int, create_amount_sol: float = 0.001) -> Dict[str, Any]:
+        """Awaitable version of _create_token_without_image()."""
+        data = self._build_json_token_payload(token_params, buy_amounts_dict, wallets, slippage_bps, create_amount_sol)
+        response = await self._make_request_for_critical_operations_async("POST", "/api/pump/create-and-buy", json=data)
+        return self._normalize_response_fields(response)
+
+    async def batch_buy_token_async(self, mint_address: str, sol_amount_per_wallet: float,
+                                    wallets: List[Dict[str, str]], slippage_bps: int = 2500,
+                                    target_wallet_names: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Awaitable version of batch_buy_token().
+        
+        Args:
+            mint_address: Token mint address
+            sol_amount_per_wallet: SOL amount per wallet
+            wallets: List of wallet objects with name and privateKey
+            slippage_bps: Slippage in basis points
+            target_wallet_names: Optional list of target wallet names
+            
+        Returns:
+            Dictionary with batch buy results
+        """
+        data = self._build_batch_buy_payload(mint_address, sol_amount_per_wallet, wallets, slippage_bps, target_wallet_names)
+        return await self._make_request_with_retry_async("POST", "/api/pump/batch-buy", json=data)
+
+    async def sell_dev_wallet_async(self, mint_address: str, sell_percentage, slippage_bps: int = 2500,
+                                    wallets: List[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Awaitable version of sell_dev_wallet().
+        
+        Args:
+            mint_address: Token mint address (non-empty string)
+            sell_percentage: Percentage to sell - accepts "X%" or X (1-100)
+            slippage_bps: Slippage in basis points (default 2500 = 25%)
+            wallets: List of wallet objects with name and privateKey (must include DevWallet)
+            
+        Returns:
+            Dictionary with sell results from server
+        """
+        data = self._build_sell_dev_payload(mint_address, sell_percentage, slippage_bps, wallets)
+        return await self._make_request_for_critical_operations_async("POST", "/api/pump/sell-dev", json=data)
+
+    async def batch_sell_token_async(self, mint_address: str, sell_percentage, slippage_bps: int = 2500,
+                                     wallets: List[Dict[str, str]] = None,
+                                     target_wallet_names: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Awaitable version of batch_sell_token().
+        
+        Args:
+            mint_address: Token mint address (non-empty string)
+            sell_percentage: Percentage to sell - accepts "X%" or X (1-100)
+            slippage_bps: Slippage in basis points (default 2500 = 25%)
+            wallets: List of wallet objects with name and privateKey
+            target_wallet_names: Optional filter to only use specific wallets
+            
+        Returns:
+            Dictionary with batch sell results from server
+        """
+        data = self._build_batch_sell_payload(mint_address, sell_percentage, slippage_bps, wallets, target_wallet_names)
+        return await self._make_request_for_critical_operations_async("POST", "/api/pump/batch-sell", json=data)
+
+    async def health_check_async(self) -> Dict[str, Any]:
+        """
+        Awaitable version of health_check(); cold start retries are awaited.
+        
+        Returns:
+            Dictionary with health status
+        """
+        try:
+            logger.info("Performing API health check with cold start handling")
+            await self._make_request_with_retry_async(
+                "GET",
+                HEALTH_CHECK_ENDPOINT,
+                max_retries=COLD_START_MAX_RETRIES,
+                initial_backoff=COLD_START_INITIAL_BACKOFF
+            )
+            return self._healthy_status()
+        except Exception as e:
+            return self._unhealthy_status(e)
+
+
+# Shared async client for handlers; its pooled connections are closed on bot shutdown
+async_pumpfun_client = AsyncPumpFunClient()
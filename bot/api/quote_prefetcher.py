@@ -0,0 +1,160 @@
+"""
+Quote prefetching for pipelined swap execution.
+
+A swap cannot start until its quote arrives, so a run of swaps executed one after another
+pays the quote round trip on every swap. QuotePrefetcher requests the quotes of the next
+few planned swaps while the current swap is still in flight. When a swap's turn comes,
+its quote is usually already there.
+
+A quote is only as good as the pool state it was priced against. Every prefetched quote
+therefore carries a freshness deadline, counted from when it was requested. A quote past
+its deadline, one that failed, or one requested with different parameters is discarded
+and fetched again, so a swap never executes against a stale price. A swap that ends
+without asking for its quote must discard() it, or it keeps holding a lookahead slot.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+from loguru import logger
+
+DEFAULT_LOOKAHEAD = 3           # Quotes prefetched ahead of the current swap
+DEFAULT_MAX_QUOTE_AGE = 15.0    # Seconds a prefetched quote stays usable
+
+QuoteFetcher = Callable[..., Awaitable[Dict[str, Any]]]
+
+
+@dataclass
+class _PrefetchedQuote:
+    """One prefetched quote request."""
+    params: Dict[str, Any]
+    task: asyncio.Task
+    deadline: float
+
+
+class QuotePrefetcher:
+    """Fetches quotes for upcoming swaps ahead of time and hands them out while still fresh."""
+
+    def __init__(self, fetch_quote: QuoteFetcher, lookahead: int = DEFAULT_LOOKAHEAD,
+                 max_age: float = DEFAULT_MAX_QUOTE_AGE):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            fetch_quote: Coroutine function returning a quote for the given keyword parameters
+            lookahead: Maximum number of prefetched quotes held at once
+            max_age: Seconds after its request that a quote may still be used
+        """
+        self.fetch_quote = fetch_quote
+        self.lookahead = max(0, lookahead)
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self._entries: Dict[Hashable, _PrefetchedQuote] = {}
+
+    def prefetch(self, key: Hashable, **params: Any) -> bool:
+        """
+        Start fetching a quote for a planned swap, unless it is already prefetched.
+
+        Args:
+            key: Identifier of the planned swap
+            **params: Parameters passed to fetch_quote
+
+        Returns:
+            True if a prefetch is in progress or done for the key
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry.params == params:
+            return True
+        if entry is not None:
+            self.discard(key)
+        if len(self._entries) >= self.lookahead:
+            return False
+        task = asyncio.create_task(self.fetch_quote(**params))
+        # The outcome is read in get(); this keeps an unused failure from being logged as unretrieved
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        self._entries[key] = _PrefetchedQuote(params, task, time.monotonic() + self.max_age)
+        return True
+
+    def prefetch_ahead(self, upcoming: Iterable[Tuple[Hashable, Dict[str, Any]]]):
+        """
+        Prefetch quotes for the next planned swaps, up to the lookahead.
+
+        Args:
+            upcoming: (key, params) pairs of planned swaps in execution order
+        """
+        for key, params in upcoming:
+            if not self.prefetch(key, **params):
+                break
+
+    async def get(self, key: Hashable, **params: Any) -> Dict[str, Any]:
+        """
+        Get the quote for a swap about to execute.
+
+        A prefetched quote still in flight is awaited. A quote that is past its deadline,
+        failed, or was requested with different parameters is fetched again.
+
+        Args:
+            key: Identifier of the swap
+            **params: Parameters passed to fetch_quote
+
+        Returns:
+            Quote response
+
+        Raises:
+            Whatever fetch_quote raises when the fresh request fails
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None and entry.params == params:
+            try:
+                quote = await entry.task
+            except Exception as e:
+                logger.debug(f"Prefetched quote for {key} failed, requesting again: {str(e)}")
+                quote = None
+            if quote is not None and time.monotonic() <= entry.deadline:
+                self.hits += 1
+                return quote
+            if quote is not None:
+                self.expired += 1
+                logger.debug(f"Prefetched quote for {key} expired, requesting again")
+        elif entry is not None:
+            entry.task.cancel()
+
+        self.misses += 1
+        return await self.fetch_quote(**params)
+
+    def cancel_all(self):
+        """Cancel every outstanding prefetch, e.g. when a run ends early."""
+        for key in list(self._entries):
+            self.discard(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get prefetch statistics.
+
+        Returns:
+            Dictionary with hits, misses, expired quotes and the number currently held
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "expired": self.expired,
+            "pending": len(self._entries)
+        }
+
+    def discard(self, key: Hashable):
+        """
+        Drop a prefetched quote, cancelling its request if still in flight.
+
+        Call this for a swap that ends without calling get(), e.g. one skipped for low
+        balance, so its quote does not hold a lookahead slot for the rest of the run.
+
+        Args:
+            key: Identifier of the swap
+        """
+        entry: Optional[_PrefetchedQuote] = self._entries.pop(key, None)
+        if entry is not None and not entry.task.done():
+            entry.task.cancel()
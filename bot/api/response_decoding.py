@@ -0,0 +1,323 @@
+"""
+Single-pass JSON decoding for backend responses.
+
+Bodies are decoded once: with orjson when it is installed, otherwise with the
+standard library. A body that is not valid JSON is handed to a tolerant
+recursive-descent parser instead of being re-scanned with regular expressions. The
+parser makes one pass, skips any text before the first JSON value, ignores trailing
+garbage and trailing commas, and keeps everything it parsed before a truncation.
+Every object or array that broke off is returned as a PartialDict or PartialList,
+so callers can tell it apart with is_truncated(), down to a single batch entry.
+
+The typed response objects turn the decoded balance, child-wallet and quote payloads
+into checked fields, so callers never parse a body a second time. The balance and
+quote objects reject truncated payloads, whose numbers may have been cut short.
+"""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # Optional speed-up; the standard library decoder is used without it
+    orjson = None
+
+LAMPORTS_PER_SOL = 1_000_000_000
+
+
+class JSONRecoveryError(ValueError):
+    """Raised when no JSON value can be recovered from a response body"""
+    pass
+
+
+class PartialDict(dict):
+    """JSON object recovered from a body that broke off; fields may be missing or cut short."""
+    truncated = True
+
+
+class PartialList(list):
+    """JSON array recovered from a body that broke off; elements may be missing."""
+    truncated = True
+
+
+def is_truncated(payload: Any) -> bool:
+    """
+    Check whether a decoded payload was recovered from a truncated body.
+
+    Args:
+        payload: Decoded response body
+
+    Returns:
+        True if part of the body was lost
+    """
+    return getattr(payload, "truncated", False)
+
+
+class _Incomplete(Exception):
+    """Internal signal: the input ended or broke off in the middle of a value."""
+    pass
+
+
+class _TolerantParser:
+    """Recursive-descent JSON parser that returns whatever it parsed before an error, marked partial."""
+
+    _LITERALS = {"true": True, "false": False, "null": None, "NaN": float("nan")}
+
+    def __init__(self, text: str):
+        self.text = text
+        self.pos = 0
+        self.truncated = False
+
+    def _skip_whitespace(self):
+        text, pos = self.text, self.pos
+        while pos < len(text) and text[pos] in " \t\r\n":
+            pos += 1
+        self.pos = pos
+
+    def _peek(self) -> str:
+        self._skip_whitespace()
+        if self.pos >= len(self.text):
+            raise _Incomplete()
+        return self.text[self.pos]
+
+    def parse_value(self) -> Any:
+        char = self._peek()
+        if char == "{":
+            return self._parse_object()
+        if char == "[":
+            return self._parse_array()
+        if char == '"':
+            return self._parse_string()
+        if char == "-" or char.isdigit():
+            return self._parse_number()
+        for literal, value in self._LITERALS.items():
+            if self.text.startswith(literal, self.pos):
+                self.pos += len(literal)
+                return value
+        raise _Incomplete()
+
+    def _parse_object(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = {}
+        self.pos += 1
+        try:
+            while True:
+                char = self._peek()
+                if char == "}":
+                    self.pos += 1
+                    return result
+                if char == ",":
+                    self.pos += 1
+                    continue
+                key = self._parse_string()
+                if self._peek() != ":":
+                    raise _Incomplete()
+                self.pos += 1
+                result[key] = self.parse_value()
+        except _Incomplete:
+            self.truncated = True
+            return PartialDict(result)
+
+    def _parse_array(self) -> List[Any]:
+        result: List[Any] = []
+        self.pos += 1
+        try:
+            while True:
+                char = self._peek()
+                if char == "]":
+                    self.pos += 1
+                    return result
+                if char == ",":
+                    self.pos += 1
+                    continue
+                result.append(self.parse_value())
+        except _Incomplete:
+            self.truncated = True
+            return PartialList(result)
+
+    def _parse_string(self) -> str:
+        if self._peek() != '"':
+            raise _Incomplete()
+        start = self.pos
+        pos = start + 1
+        text = self.text
+        while pos < len(text):
+            char = text[pos]
+            if char == "\\":
+                pos += 2
+                continue
+            if char == '"':
+                self.pos = pos + 1
+                try:
+                    return json.loads(text[start:pos + 1])
+                except ValueError:
+                    return text[start + 1:pos]
+            pos += 1
+        raise _Incomplete()
+
+    def _parse_number(self) -> Union[int, float]:
+        start = self.pos
+        pos = start
+        text = self.text
+        while pos < len(text) and text[pos] in "+-0123456789.eE":
+            pos += 1
+        token = text[start:pos]
+        self.pos = pos
+        try:
+            if any(char in token for char in ".eE"):
+                return float(token)
+            return int(token)
+        except ValueError:
+            raise _Incomplete()
+
+
+def recover_json(text: str) -> Any:
+    """
+    Recover a JSON value from a malformed or truncated body in one pass.
+
+    Args:
+        text: Raw response text
+
+    Returns:
+        The recovered object or array; a PartialDict or PartialList if the body was cut off
+
+    Raises:
+        JSONRecoveryError: If the body contains no recoverable object or array
+    """
+    starts = [index for index in (text.find("{"), text.find("[")) if index != -1]
+    if not starts:
+        raise JSONRecoveryError("Response body contains no JSON object or array")
+
+    parser = _TolerantParser(text)
+    parser.pos = min(starts)
+    value = parser.parse_value()
+    if not value:
+        raise JSONRecoveryError("No data could be recovered from the response body")
+    return value
+
+
+def decode_json(body: Union[bytes, str]) -> Any:
+    """
+    Decode a response body, recovering what it can if the body is not valid JSON.
+
+    Args:
+        body: Raw response content
+
+    Returns:
+        The decoded JSON value
+
+    Raises:
+        JSONRecoveryError: If the body is invalid and nothing could be recovered
+    """
+    try:
+        if orjson is not None:
+            return orjson.loads(body)
+        return json.loads(body)
+    except ValueError:
+        text = body.decode("utf-8", errors="replace") if isinstance(body, bytes) else body
+        return recover_json(text)
+
+
+@dataclass
+class BalanceResponse:
+    """SOL balance returned by /api/wallets/mother/{address}."""
+    public_key: str
+    balance_sol: float
+    source_field: Optional[str] = None
+
+    @property
+    def lamports(self) -> int:
+        """Balance in lamports."""
+        return int(round(self.balance_sol * LAMPORTS_PER_SOL))
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> Optional['BalanceResponse']:
+        """
+        Build from a decoded payload.
+
+        The balance is read from balanceSol, then balanceLamports, then balance.
+
+        Args:
+            payload: Decoded response body
+
+        Returns:
+            BalanceResponse, or None if the payload has no publicKey or was truncated
+        """
+        if not isinstance(payload, dict) or not payload.get("publicKey") or is_truncated(payload):
+            return None
+
+        for key, scale in (("balanceSol", 1), ("balanceLamports", LAMPORTS_PER_SOL), ("balance", 1)):
+            value = payload.get(key)
+            if value is None:
+                continue
+            try:
+                return cls(str(payload["publicKey"]), float(value) / scale, key)
+            except (TypeError, ValueError):
+                continue
+        return cls(str(payload["publicKey"]), 0.0)
+
+
+@dataclass
+class ChildWallet:
+    """One derived child wallet."""
+    address: str
+    private_key: str
+    index: int
+
+
+@dataclass
+class ChildWalletsResponse:
+    """Child wallets returned by /api/wallets/children."""
+    wallets: List[ChildWallet] = field(default_factory=list)
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> Optional['ChildWalletsResponse']:
+        """
+        Build from a decoded payload.
+
+        Args:
+            payload: Decoded response body
+
+        Returns:
+            ChildWalletsResponse, or None if the payload has no childWallets list
+        """
+        if not isinstance(payload, dict) or not isinstance(payload.get("childWallets"), list):
+            return None
+
+        wallets = [
+            ChildWallet(child["publicKey"], child.get("privateKeyBase58", "") or "", index)
+            for index, child in enumerate(payload["childWallets"])
+            if isinstance(child, dict) and child.get("publicKey")
+        ]
+        return cls(wallets)
+
+
+@dataclass
+class QuoteResponse:
+    """Jupiter quote returned by /api/jupiter/quote."""
+    in_amount: Any
+    out_amount: Any
+    price_impact_pct: Any
+    quote: Dict[str, Any]
+
+    @classmethod
+    def from_payload(cls, payload: Any) -> Optional['QuoteResponse']:
+        """
+        Build from a decoded payload.
+
+        Args:
+            payload: Decoded response body
+
+        Returns:
+            QuoteResponse, or None if the payload has no quoteResponse object or was truncated
+        """
+        if not isinstance(payload, dict) or not isinstance(payload.get("quoteResponse"), dict) or is_truncated(payload):
+            return None
+
+        quote = payload["quoteResponse"]
+        return cls(
+            in_amount=quote.get("inAmount", "unknown"),
+            out_amount=quote.get("outAmount", "unknown"),
+            price_impact_pct=quote.get("priceImpactPct", "unknown"),
+            quote=quote
+        )
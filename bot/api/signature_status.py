@@ -0,0 +1,315 @@
+"""
+Transaction confirmation by signature.
+
+Instead of inferring success from balances moving, transfers are confirmed by asking
+the Solana node for the status of the signatures the backend returned. A single
+getSignatureStatuses call covers up to 256 signatures, so a 100-transfer batch is
+confirmed in one or two round trips per probe. Probes start at short intervals and
+back off exponentially. Only signatures still pending are re-queried, and the wait
+ends as soon as every signature is confirmed or has failed.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+import base58
+import httpx
+from loguru import logger
+
+from bot.config import SOLANA_RPC_URL
+from bot.api.timeouts import RPC_TIMEOUTS
+from bot.api.trade_scheduler import trade_scheduler
+from bot.utils.adaptive_interval import AdaptiveInterval
+
+MAX_SIGNATURES_PER_CALL = 256      # getSignatureStatuses limit
+DEFAULT_CONFIRM_TIMEOUT = 60.0     # Seconds to wait for signatures to confirm
+PROBE_MIN_INTERVAL = 0.5           # First re-probe delay (seconds)
+PROBE_MAX_INTERVAL = 4.0           # Re-probe delay cap (seconds)
+
+_COMMITMENT_RANK = {"processed": 0, "confirmed": 1, "finalized": 2}
+
+
+def is_signature(value: Any) -> bool:
+    """
+    Check whether a value looks like a base58 transaction signature.
+
+    One malformed signature makes the node reject a whole getSignatureStatuses call,
+    so values are checked before they are sent.
+
+    Args:
+        value: Candidate signature
+
+    Returns:
+        True if value is a base58 string decoding to 64 bytes
+    """
+    if not isinstance(value, str) or not 64 <= len(value) <= 90:
+        return False
+    try:
+        return len(base58.b58decode(value)) == 64
+    except ValueError:
+        return False
+
+
+class SignatureStatusError(Exception):
+    """Raised when the RPC node rejects a signature status request"""
+    pass
+
+
+@dataclass
+class SignatureStatus:
+    """Status of one transaction signature as reported by getSignatureStatuses."""
+    signature: str
+    slot: Optional[int] = None
+    confirmations: Optional[int] = None
+    confirmation_status: Optional[str] = None
+    err: Any = None
+
+    @property
+    def found(self) -> bool:
+        """Whether the node knows the signature."""
+        return self.confirmation_status is not None
+
+    @property
+    def failed(self) -> bool:
+        """Whether the transaction landed but failed."""
+        return self.err is not None
+
+    def reached(self, commitment: str = "confirmed") -> bool:
+        """
+        Check whether the transaction succeeded at the given commitment or higher.
+
+        Args:
+            commitment: processed, confirmed or finalized
+
+        Returns:
+            True if it landed without error at that commitment
+        """
+        if not self.found or self.failed:
+            return False
+        return _COMMITMENT_RANK.get(self.confirmation_status, -1) >= _COMMITMENT_RANK.get(commitment, 1)
+
+    @classmethod
+    def from_rpc(cls, signature: str, value: Any) -> 'SignatureStatus':
+        """
+        Build from one entry of a getSignatureStatuses result.
+
+        Args:
+            signature: Transaction signature
+            value: Status object, or None if the node does not know the signature
+
+        Returns:
+            SignatureStatus
+        """
+        if not isinstance(value, dict):
+            return cls(signature)
+        confirmations = value.get("confirmations")
+        confirmation_status = value.get("confirmationStatus")
+        if confirmation_status is None:
+            # Older nodes omit confirmationStatus; null confirmations means rooted
+            confirmation_status = "finalized" if confirmations is None else ("confirmed" if confirmations > 0 else "processed")
+        return cls(
+            signature=signature,
+            slot=value.get("slot"),
+            confirmations=confirmations,
+            confirmation_status=confirmation_status,
+            err=value.get("err")
+        )
+
+
+class SignatureStatusClient:
+    """Batched getSignatureStatuses client with sync and async confirmation waits."""
+
+    def __init__(self, rpc_url: str, commitment: str = "confirmed"):
+        """
+        Initialize the client.
+
+        Args:
+            rpc_url: Solana JSON-RPC URL
+            commitment: Commitment a signature must reach to count as confirmed
+        """
+        self.rpc_url = rpc_url
+        self.commitment = commitment
+        self._client: Optional[httpx.Client] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._async_client_loop = None
+
+    def _get_client(self) -> httpx.Client:
+        """Get the sync HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.Client(timeout=RPC_TIMEOUTS.as_httpx_timeout())
+        return self._client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Get the async HTTP client for the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client.is_closed or self._async_client_loop is not loop:
+            self._async_client = httpx.AsyncClient(timeout=RPC_TIMEOUTS.as_httpx_timeout())
+            self._async_client_loop = loop
+        return self._async_client
+
+    @staticmethod
+    def _chunks(signatures: List[str]) -> List[List[str]]:
+        """Split signatures into getSignatureStatuses-sized chunks."""
+        return [signatures[start:start + MAX_SIGNATURES_PER_CALL]
+                for start in range(0, len(signatures), MAX_SIGNATURES_PER_CALL)]
+
+    @staticmethod
+    def _payload(chunk: List[str], search_history: bool) -> Dict[str, Any]:
+        """Build the JSON-RPC request for one chunk."""
+        return {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "getSignatureStatuses",
+            "params": [chunk, {"searchTransactionHistory": search_history}]
+        }
+
+    @staticmethod
+    def _parse(chunk: List[str], body: Any) -> Dict[str, SignatureStatus]:
+        """
+        Parse one getSignatureStatuses response.
+
+        Raises:
+            SignatureStatusError: If the node returned an error or an unexpected body
+        """
+        if not isinstance(body, dict):
+            raise SignatureStatusError("Unexpected getSignatureStatuses response")
+        if "error" in body:
+            raise SignatureStatusError(f"getSignatureStatuses failed: {body['error']}")
+        values = (body.get("result") or {}).get("value")
+        if not isinstance(values, list) or len(values) != len(chunk):
+            raise SignatureStatusError("getSignatureStatuses returned a malformed result")
+        return {signature: SignatureStatus.from_rpc(signature, value) for signature, value in zip(chunk, values)}
+
+    def get_statuses(self, signatures: Iterable[str], search_history: bool = False) -> Dict[str, SignatureStatus]:
+        """
+        Look up the status of signatures, up to 256 per RPC call.
+
+        Args:
+            signatures: Transaction signatures
+            search_history: Also search beyond the node's recent status cache (slower)
+
+        Returns:
+            Dictionary mapping each signature to its status
+
+        Raises:
+            SignatureStatusError: If a lookup fails
+        """
+        statuses: Dict[str, SignatureStatus] = {}
+        for chunk in self._chunks(list(dict.fromkeys(signatures))):
+            try:
+                response = self._get_client().post(self.rpc_url, json=self._payload(chunk, search_history))
+                response.raise_for_status()
+                statuses.update(self._parse(chunk, response.json()))
+            except (httpx.HTTPError, ValueError) as e:
+                raise SignatureStatusError(f"getSignatureStatuses request failed: {str(e)}") from e
+        return statuses
+
+    async def get_statuses_async(self, signatures: Iterable[str], search_history: bool = False) -> Dict[str, SignatureStatus]:
+        """
+        Awaitable version of get_statuses(); chunks are looked up concurrently.
+
+        Args:
+            signatures: Transaction signatures
+            search_history: Also search beyond the node's recent status cache (slower)
+
+        Returns:
+            Dictionary mapping each signature to its status
+
+        Raises:
+            SignatureStatusError: If a lookup fails
+        """
+        client = self._get_async_client()
+
+        async def lookup(chunk: List[str]) -> Dict[str, SignatureStatus]:
+            try:
+                response = await client.post(self.rpc_url, json=self._payload(chunk, search_history))
+                response.raise_for_status()
+                return self._parse(chunk, response.json())
+            except (httpx.HTTPError, ValueError) as e:
+                raise SignatureStatusError(f"getSignatureStatuses request failed: {str(e)}") from e
+
+        statuses: Dict[str, SignatureStatus] = {}
+        for result in await asyncio.gather(*(lookup(chunk) for chunk in self._chunks(list(dict.fromkeys(signatures))))):
+            statuses.update(result)
+        return statuses
+
+    def _settled(self, status: SignatureStatus) -> bool:
+        """Whether a signature needs no further probing."""
+        return status.failed or status.reached(self.commitment)
+
+    def wait_for_confirmation(self, signatures: Iterable[str],
+                              timeout: float = DEFAULT_CONFIRM_TIMEOUT) -> Dict[str, SignatureStatus]:
+        """
+        Probe signatures until each is confirmed or failed, or the timeout passes.
+
+        Args:
+            signatures: Transaction signatures
+            timeout: Seconds to wait
+
+        Returns:
+            Dictionary mapping each signature to its last known status; signatures that
+            never settled are returned with whatever status was last seen
+        """
+        pending = list(dict.fromkeys(signatures))
+        statuses = {signature: SignatureStatus(signature) for signature in pending}
+        interval = AdaptiveInterval(PROBE_MIN_INTERVAL, PROBE_MAX_INTERVAL)
+        deadline = time.monotonic() + timeout
+
+        while pending:
+            try:
+                statuses.update(self.get_statuses(pending))
+            except SignatureStatusError as e:
+                logger.warning(f"Signature status probe failed: {str(e)}")
+            pending = [signature for signature in pending if not self._settled(statuses[signature])]
+            if not pending or time.monotonic() >= deadline:
+                break
+            interval.on_unchanged()
+            time.sleep(min(interval.next_delay(), max(0.0, deadline - time.monotonic())))
+
+        self._log_outcome(statuses, pending)
+        return statuses
+
+    async def wait_for_confirmation_async(self, signatures: Iterable[str],
+                                          timeout: float = DEFAULT_CONFIRM_TIMEOUT) -> Dict[str, SignatureStatus]:
+        """
+        Awaitable version of wait_for_confirmation().
+
+        Args:
+            signatures: Transaction signatures
+            timeout: Seconds to wait
+
+        Returns:
+            Dictionary mapping each signature to its last known status
+        """
+        pending = list(dict.fromkeys(signatures))
+        statuses = {signature: SignatureStatus(signature) for signature in pending}
+        interval = AdaptiveInterval(PROBE_MIN_INTERVAL, PROBE_MAX_INTERVAL)
+        deadline = time.monotonic() + timeout
+
+        while pending:
+            try:
+                statuses.update(await self.get_statuses_async(pending))
+            except SignatureStatusError as e:
+                logger.warning(f"Signature status probe failed: {str(e)}")
+            pending = [signature for signature in pending if not self._settled(statuses[signature])]
+            if not pending or time.monotonic() >= deadline:
+                break
+            interval.on_unchanged()
+            await trade_scheduler.sleep(min(interval.next_delay(), max(0.0, deadline - time.monotonic())))
+
+        self._log_outcome(statuses, pending)
+        return statuses
+
+    def _log_outcome(self, statuses: Dict[str, SignatureStatus], pending: List[str]):
+        """Log how many signatures confirmed, failed or are still pending."""
+        failed = sum(1 for status in statuses.values() if status.failed)
+        logger.info(
+            f"Signature confirmation: {len(statuses) - failed - len(pending)} confirmed, "
+            f"{failed} failed, {len(pending)} pending of {len(statuses)}"
+        )
+
+
+# Shared client for the configured RPC node
+signature_status_client = SignatureStatusClient(SOLANA_RPC_URL)
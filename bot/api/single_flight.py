@@ -0,0 +1,110 @@
+"""
+Single-flight coalescing for concurrent identical API reads.
+
+When several coroutines ask for the same idempotent resource at once (the same
+wallet balance, token balance or Jupiter quote), only the first one issues the
+HTTP call. The others await that call, and every caller receives its own copy of
+the result.
+"""
+
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+from loguru import logger
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into one in-flight call.
+
+    The shared call runs as its own task, so a caller being cancelled does not cancel
+    the request for everyone else. Errors are raised to every waiting caller.
+    """
+
+    def __init__(self, name: str = "single-flight"):
+        """
+        Initialize the coalescing layer.
+
+        Args:
+            name: Label used in log messages
+        """
+        self.name = name
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.requests = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run call() for key, or join the call already in flight for the same key.
+
+        Args:
+            key: Hashable identity of the request
+            call: Zero-argument coroutine function that performs the request
+
+        Returns:
+            A private deep copy of the call's result
+        """
+        self.requests += 1
+        if self.requests % 100 == 0:
+            logger.info(f"{self.name} coalescing stats: {self.stats()}")
+        loop = asyncio.get_running_loop()
+        task = self._in_flight.get(key)
+
+        if task is not None and not task.done() and task.get_loop() is loop:
+            self.coalesced += 1
+            logger.debug(f"{self.name}: joined in-flight call for {key}")
+            return copy.deepcopy(await asyncio.shield(task))
+
+        task = loop.create_task(call())
+        self._in_flight[key] = task
+        task.add_done_callback(lambda finished: self._forget(key, finished))
+        # Every caller gets its own copy so no caller sees another one's mutations
+        return copy.deepcopy(await asyncio.shield(task))
+
+    def invalidate(self, matches: Callable[[Hashable], bool]):
+        """
+        Stop new callers from joining in-flight calls whose key matches.
+
+        Use this when a resource has just changed: an in-flight call may return the old
+        value, so later callers should start a fresh call. Callers already waiting still
+        receive the result of the call they joined.
+
+        Args:
+            matches: Predicate selecting the keys to detach
+        """
+        for key in [key for key in self._in_flight if matches(key)]:
+            del self._in_flight[key]
+
+    def _forget(self, key: Hashable, task: asyncio.Task):
+        """Drop a finished call so the next request for its key hits the backend again."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception as retrieved in case every waiting caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def backend_calls(self) -> int:
+        """Number of calls that actually reached the backend."""
+        return self.requests - self.coalesced
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of requests served by joining an in-flight call."""
+        return self.coalesced / self.requests if self.requests else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get coalescing statistics.
+
+        Returns:
+            Dictionary with request, backend call and coalesced counts and the hit ratio
+        """
+        return {
+            "requests": self.requests,
+            "backend_calls": self.backend_calls,
+            "coalesced": self.coalesced,
+            "hit_ratio": round(self.hit_ratio, 4),
+            "in_flight": len(self._in_flight)
+        }
@@ -0,0 +1,84 @@
+"""
+Per-request timeout profiles and retry deadlines for the API clients.
+
+A TimeoutProfile is passed with each request instead of temporarily changing the
+client's shared timeout, so concurrent calls can never see each other's values.
+Connect and read timeouts are separate, so an unreachable host fails in seconds
+even when a slow blockchain operation is allowed a long read. The profile's total
+budget becomes a Deadline that bounds the whole retry loop, backoff included.
+"""
+
+import time
+from dataclasses import dataclass, replace
+from typing import Tuple, Union
+
+import httpx
+
+
+@dataclass(frozen=True)
+class TimeoutProfile:
+    """Connect/read timeouts for one request attempt and the total budget across retries."""
+    name: str
+    connect: float
+    read: float
+    total: float
+
+    def capped(self, remaining: float) -> 'TimeoutProfile':
+        """
+        Shrink the per-attempt timeouts so an attempt cannot outlive the remaining budget.
+
+        Args:
+            remaining: Seconds left before the deadline
+
+        Returns:
+            Profile whose connect and read timeouts do not exceed remaining
+        """
+        remaining = max(remaining, 0.001)
+        return replace(self, connect=min(self.connect, remaining), read=min(self.read, remaining))
+
+    def as_requests_timeout(self) -> Tuple[float, float]:
+        """Timeout in the (connect, read) form used by requests."""
+        return (self.connect, self.read)
+
+    def as_httpx_timeout(self) -> httpx.Timeout:
+        """Timeout in the form used by httpx."""
+        return httpx.Timeout(self.read, connect=self.connect)
+
+    def __str__(self) -> str:
+        return f"{self.name} (connect {self.connect:.1f}s, read {self.read:.1f}s)"
+
+
+class Deadline:
+    """A point in monotonic time by which an operation, retries included, must finish."""
+
+    def __init__(self, seconds: float):
+        """
+        Start a deadline that expires after the given number of seconds.
+
+        Args:
+            seconds: Time budget in seconds
+        """
+        self.budget = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (0 once expired)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return self.remaining() <= 0
+
+
+RequestTimeout = Union[float, TimeoutProfile]
+
+# Named profiles: connect, read (per attempt) and total (across retries) in seconds
+DEFAULT_TIMEOUTS = TimeoutProfile("default", connect=5.0, read=10.0, total=60.0)
+HEALTH_TIMEOUTS = TimeoutProfile("health", connect=3.0, read=5.0, total=10.0)
+BALANCE_TIMEOUTS = TimeoutProfile("balance", connect=5.0, read=15.0, total=45.0)        # Solana RPC balance queries
+QUOTE_TIMEOUTS = TimeoutProfile("quote", connect=5.0, read=20.0, total=60.0)            # DEX quotes can take longer
+SWAP_TIMEOUTS = TimeoutProfile("swap", connect=5.0, read=30.0, total=120.0)             # DEX swaps need more time
+FUNDING_TIMEOUTS = TimeoutProfile("funding", connect=10.0, read=45.0, total=180.0)      # Blockchain transfers
+TRANSFER_TIMEOUTS = TimeoutProfile("transfer", connect=10.0, read=60.0, total=180.0)    # Return-funds confirmation
+RPC_TIMEOUTS = TimeoutProfile("rpc", connect=5.0, read=10.0, total=10.0)               # Solana JSON-RPC status lookups
@@ -0,0 +1,190 @@
+"""
+Hierarchical timing wheel.
+
+A timing wheel stores timers in slots indexed by their expiry tick instead of in a
+sorted structure. Inserting or cancelling a timer is O(1) regardless of how many
+timers are pending, which keeps tens of thousands of scheduled operations cheap.
+
+Each level has SLOTS slots. Level 0 slots are one tick wide; every slot of level L
+covers SLOTS ticks of level L-1. A timer is placed on the lowest level whose range
+reaches its expiry. When the lower levels wrap around, the matching slot of the level
+above is cascaded: its timers are re-inserted and move down toward level 0, where
+they expire.
+"""
+
+import itertools
+import math
+from typing import Any, Dict, List, Optional
+
+DEFAULT_TICK = 0.01      # Seconds per level-0 slot
+DEFAULT_SLOTS = 256      # Slots per level
+DEFAULT_LEVELS = 4       # 256^4 ticks of 10ms cover about 16 months
+
+
+class TimerHandle:
+    """A pending timer. Pass it to TimingWheel.cancel() to remove the timer."""
+
+    __slots__ = ("deadline", "item", "_tick", "_key", "_bucket")
+
+    def __init__(self, deadline: float, item: Any, tick: int, key: int):
+        self.deadline = deadline
+        self.item = item
+        self._tick = tick
+        self._key = key
+        self._bucket: Optional[Dict[int, 'TimerHandle']] = None
+
+    @property
+    def pending(self) -> bool:
+        """Whether the timer is still waiting to expire."""
+        return self._bucket is not None
+
+
+class TimingWheel:
+    """Hierarchical timing wheel with O(1) insert and cancel."""
+
+    def __init__(self, now: float, tick: float = DEFAULT_TICK, slots: int = DEFAULT_SLOTS,
+                 levels: int = DEFAULT_LEVELS):
+        """
+        Initialize an empty wheel.
+
+        Args:
+            now: Current time on the clock deadlines are given in
+            tick: Seconds per level-0 slot, i.e. the expiry resolution
+            slots: Slots per level
+            levels: Number of levels
+        """
+        self.tick = tick
+        self.slots = slots
+        self.levels = levels
+        self._wheels: List[List[Dict[int, TimerHandle]]] = [
+            [{} for _ in range(slots)] for _ in range(levels)
+        ]
+        self._expired: Dict[int, TimerHandle] = {}
+        self._current = math.floor(now / tick)
+        self._max_ticks = slots ** levels - 1
+        self._keys = itertools.count()
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Number of pending timers."""
+        return self._size
+
+    def insert(self, deadline: float, item: Any) -> TimerHandle:
+        """
+        Add a timer.
+
+        Args:
+            deadline: Time the timer expires
+            item: Value returned by advance() once the deadline has passed
+
+        Returns:
+            Handle for cancelling the timer
+        """
+        handle = TimerHandle(deadline, item, math.ceil(deadline / self.tick), next(self._keys))
+        self._place(handle)
+        self._size += 1
+        return handle
+
+    def cancel(self, handle: TimerHandle) -> bool:
+        """
+        Remove a pending timer.
+
+        Args:
+            handle: Handle returned by insert()
+
+        Returns:
+            True if the timer was still pending
+        """
+        if handle._bucket is None:
+            return False
+        del handle._bucket[handle._key]
+        handle._bucket = None
+        self._size -= 1
+        return True
+
+    def advance(self, now: float) -> List[TimerHandle]:
+        """
+        Move the wheel forward to now and collect the timers that expired.
+
+        Args:
+            now: Current time
+
+        Returns:
+            Expired timers, in expiry order
+        """
+        target = math.floor(now / self.tick)
+        expired = list(self._expired.values())
+        self._expired.clear()
+        if not self._size - len(expired):
+            # Nothing else is pending, so there is nothing to cascade on the way
+            self._current = max(self._current, target)
+        while self._current < target:
+            self._current += 1
+            self._cascade()
+            bucket = self._wheels[0][self._current % self.slots]
+            if bucket:
+                expired.extend(bucket.values())
+                bucket.clear()
+        # Timers cascaded straight to their expiry tick
+        expired.extend(self._expired.values())
+        self._expired.clear()
+
+        due = []
+        for handle in expired:
+            handle._bucket = None
+            if handle._tick > self._current:
+                # Clamped beyond the wheel's range; not due yet
+                self._place(handle)
+            else:
+                due.append(handle)
+                self._size -= 1
+        due.sort(key=lambda handle: handle.deadline)
+        return due
+
+    def next_expiry(self) -> Optional[float]:
+        """
+        Earliest time advance() may return timers, for sleeping until then.
+
+        Only the current level-0 rotation is scanned, so the result can be the end of
+        the rotation (when the level above cascades) rather than an actual deadline.
+
+        Returns:
+            Time to advance at, or None if the wheel is empty
+        """
+        if not self._size:
+            return None
+        if self._expired:
+            return self._current * self.tick
+        boundary = (self._current // self.slots + 1) * self.slots
+        for tick in range(self._current + 1, boundary):
+            if self._wheels[0][tick % self.slots]:
+                return tick * self.tick
+        return boundary * self.tick
+
+    def _place(self, handle: TimerHandle):
+        """Put a timer into the slot matching its expiry tick."""
+        delta = handle._tick - self._current
+        if delta <= 0:
+            bucket = self._expired
+        else:
+            ticks = min(handle._tick, self._current + self._max_ticks)
+            delta = ticks - self._current
+            level = 0
+            while delta >= self.slots ** (level + 1):
+                level += 1
+            bucket = self._wheels[level][(ticks // self.slots ** level) % self.slots]
+        bucket[handle._key] = handle
+        handle._bucket = bucket
+
+    def _cascade(self):
+        """Re-insert the upper-level slots whose time has come, moving their timers down."""
+        for level in range(1, self.levels):
+            span = self.slots ** level
+            if self._current % span:
+                break
+            bucket = self._wheels[level][(self._current // span) % self.slots]
+            if bucket:
+                handles = list(bucket.values())
+                bucket.clear()
+                for handle in handles:
+                    self._place(handle)
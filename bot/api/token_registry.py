@@ -0,0 +1,301 @@
+"""
+Local registry of SPL token metadata.
+
+Looking up one mint used to mean downloading the whole token list and scanning it.
+TokenRegistry downloads the list once and keeps it in memory as a dictionary keyed by
+mint, so a symbol or decimals lookup is a single dictionary access. The list is also
+saved to disk in a compact form: one [symbol, name, decimals, logoURI, tags] row per
+mint, together with the response's ETag and Last-Modified headers.
+
+After a restart the registry loads straight from that snapshot. When the snapshot is
+older than REFRESH_INTERVAL, a background thread re-fetches the list conditionally
+(If-None-Match / If-Modified-Since). The server usually answers 304 Not Modified, and
+lookups keep being served from memory while that happens.
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import httpx
+from loguru import logger
+
+from bot.config import TOKEN_LIST_URL
+
+DEFAULT_CACHE_PATH = "data/token_registry/tokens.json"
+REFRESH_INTERVAL = 6 * 60 * 60     # Seconds before the snapshot is re-validated
+RETRY_INTERVAL = 60.0              # Seconds before retrying after a failed refresh
+FETCH_TIMEOUT = 30.0               # The full list is several megabytes
+SNAPSHOT_VERSION = 1
+
+# Always resolvable, even before the list has been downloaded
+BUILTIN_TOKENS = {
+    "So11111111111111111111111111111111111111112": ["SOL", "Wrapped SOL", 9, None, []],
+}
+
+
+@dataclass
+class TokenInfo:
+    """Metadata for one SPL token mint."""
+    address: str
+    symbol: Optional[str]
+    name: Optional[str]
+    decimals: int
+    logo_uri: Optional[str] = None
+    tags: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the token_info format returned by the API client."""
+        return {
+            "address": self.address,
+            "symbol": self.symbol,
+            "name": self.name,
+            "decimals": self.decimals,
+            "logoURI": self.logo_uri,
+            "tags": list(self.tags)
+        }
+
+
+class TokenRegistry:
+    """Mint-indexed token metadata backed by an on-disk snapshot with conditional refresh."""
+
+    def __init__(self, url: str = TOKEN_LIST_URL, cache_path: str = DEFAULT_CACHE_PATH,
+                 refresh_interval: float = REFRESH_INTERVAL):
+        """
+        Initialize the registry. Nothing is read or downloaded until the first lookup.
+
+        Args:
+            url: Token list URL returning a JSON array of token objects
+            cache_path: File the compact snapshot is kept in
+            refresh_interval: Seconds before the snapshot is re-validated with the server
+        """
+        self.url = url
+        self.cache_path = cache_path
+        self.refresh_interval = refresh_interval
+        self._rows: Dict[str, List[Any]] = dict(BUILTIN_TOKENS)
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._fetched_at = 0.0
+        self._retry_at = 0.0
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    def get(self, mint_address: str) -> Optional[TokenInfo]:
+        """
+        Look up a mint without waiting on the network.
+
+        A missing or stale list is refreshed in the background. Until that finishes,
+        mints that are not in the snapshot return None.
+
+        Args:
+            mint_address: SPL token mint address
+
+        Returns:
+            TokenInfo, or None if the mint is not known (yet)
+        """
+        row = self._lookup_row(mint_address)
+        if row is None:
+            return None
+        symbol, name, decimals, logo_uri, tags = row
+        return TokenInfo(mint_address, symbol, name, decimals, logo_uri, list(tags or []))
+
+    def symbol(self, mint_address: str) -> Optional[str]:
+        """
+        Get a mint's symbol.
+
+        Args:
+            mint_address: SPL token mint address
+
+        Returns:
+            Symbol, or None if the mint is not known
+        """
+        row = self._lookup_row(mint_address)
+        return row[0] if row is not None else None
+
+    def decimals(self, mint_address: str, default: Optional[int] = None) -> Optional[int]:
+        """
+        Get a mint's decimals.
+
+        Args:
+            mint_address: SPL token mint address
+            default: Value returned for unknown mints
+
+        Returns:
+            Decimals, or default if the mint is not known
+        """
+        row = self._lookup_row(mint_address)
+        return row[2] if row is not None else default
+
+    def wait_until_loaded(self, timeout: float = FETCH_TIMEOUT) -> bool:
+        """
+        Block until the list is available, downloading it if there is no snapshot.
+
+        Args:
+            timeout: Seconds to wait for a download already in progress
+
+        Returns:
+            True if the full list is loaded
+        """
+        self._ensure_loaded()
+        if self._fetched_at:
+            return True
+        if self._refresh_lock.acquire(timeout=timeout):
+            try:
+                if not self._fetched_at:
+                    self._refresh()
+            finally:
+                self._refresh_lock.release()
+        return bool(self._fetched_at)
+
+    def refresh_in_background(self, force: bool = False):
+        """
+        Start a conditional refresh on a daemon thread if the list is missing or stale.
+
+        Args:
+            force: Refresh even if the snapshot is still fresh
+        """
+        now = time.time()
+        if not force and (now - self._fetched_at < self.refresh_interval or now < self._retry_at):
+            return
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_once, name="token-registry-refresh", daemon=True
+            )
+            self._refresh_thread.start()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get registry statistics.
+
+        Returns:
+            Dictionary with the token count, snapshot age in seconds and ETag
+        """
+        return {
+            "tokens": len(self._rows),
+            "age": time.time() - self._fetched_at if self._fetched_at else None,
+            "etag": self._etag
+        }
+
+    def _lookup_row(self, mint_address: str) -> Optional[List[Any]]:
+        """Row for a mint, loading the snapshot and scheduling a refresh as needed."""
+        self._ensure_loaded()
+        self.refresh_in_background()
+        return self._rows.get(mint_address)
+
+    def _ensure_loaded(self):
+        """Load the on-disk snapshot on first use."""
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self._load_snapshot()
+            self._loaded = True
+
+    def _load_snapshot(self):
+        """Read the compact snapshot from disk, ignoring a missing or unreadable file."""
+        try:
+            with open(self.cache_path, "r") as f:
+                snapshot = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable token registry snapshot {self.cache_path}: {str(e)}")
+            return
+        if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+            return
+        rows = snapshot.get("tokens")
+        if not isinstance(rows, dict):
+            return
+        self._rows = {**rows, **BUILTIN_TOKENS}
+        self._etag = snapshot.get("etag")
+        self._last_modified = snapshot.get("last_modified")
+        self._fetched_at = float(snapshot.get("fetched_at") or 0)
+        logger.info(f"Loaded {len(rows)} tokens from {self.cache_path}")
+
+    def _save_snapshot(self):
+        """Write the compact snapshot atomically so a crash never leaves a torn file."""
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "etag": self._etag,
+            "last_modified": self._last_modified,
+            "fetched_at": self._fetched_at,
+            "tokens": self._rows
+        }
+        temp_path = f"{self.cache_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            with open(temp_path, "w") as f:
+                json.dump(snapshot, f, separators=(",", ":"))
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Could not save token registry snapshot: {str(e)}")
+
+    def _refresh_once(self):
+        """Run one refresh unless another is already in progress."""
+        if not self._refresh_lock.acquire(blocking=False):
+            return
+        try:
+            self._refresh()
+        except Exception as e:
+            # Keep a broken list or server from spawning a refresh on every lookup
+            self._retry_at = time.time() + RETRY_INTERVAL
+            logger.error(f"Token registry refresh failed: {str(e)}")
+        finally:
+            self._refresh_lock.release()
+
+    def _refresh(self):
+        """Re-validate the list with the server and swap in a new index if it changed."""
+        headers = {}
+        if self._fetched_at and self._etag:
+            headers["If-None-Match"] = self._etag
+        if self._fetched_at and self._last_modified:
+            headers["If-Modified-Since"] = self._last_modified
+
+        try:
+            response = httpx.get(self.url, headers=headers, timeout=FETCH_TIMEOUT, follow_redirects=True)
+            if response.status_code == 304:
+                self._fetched_at = time.time()
+                self._save_snapshot()
+                logger.debug("Token list unchanged")
+                return
+            response.raise_for_status()
+            tokens = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            self._retry_at = time.time() + RETRY_INTERVAL
+            logger.warning(f"Could not refresh token list from {self.url}: {str(e)}")
+            return
+        if not isinstance(tokens, list):
+            self._retry_at = time.time() + RETRY_INTERVAL
+            logger.warning(f"Unexpected token list format from {self.url}")
+            return
+
+        rows = {}
+        for token in tokens:
+            if not isinstance(token, dict) or not token.get("address"):
+                continue
+            rows[token["address"]] = [
+                token.get("symbol"),
+                token.get("name"),
+                int(token.get("decimals", 6)),
+                token.get("logoURI"),
+                token.get("tags") or []
+            ]
+        # Replace the whole dictionary so concurrent lookups see either the old or the new index
+        self._rows = {**rows, **BUILTIN_TOKENS}
+        self._etag = response.headers.get("etag")
+        self._last_modified = response.headers.get("last-modified")
+        self._fetched_at = time.time()
+        self._save_snapshot()
+        logger.info(f"Token registry refreshed: {len(rows)} tokens")
+
+
+# Shared registry; the snapshot lives next to the bot's other data files
+token_registry = TokenRegistry()
@@ -0,0 +1,602 @@
+"""
+Process-wide dispatch of scheduled trading operations.
+
+Generated schedules give every operation a timestamp. TradeScheduler turns those
+timestamps into dispatch times. Each run's timestamps are anchored to the moment the
+run is submitted, so the spacing between operations is kept even when the schedule was
+generated minutes earlier.
+
+Every pending operation of every user's runs lives in one hierarchical timing wheel,
+where inserting or cancelling is O(1). The wait between verification probes is held in
+the same wheel (see sleep()), so the bot has a single set of timers and one view of its
+load. A single dispatcher task moves due operations into per-user ready queues and
+serves the users round-robin, one operation per turn. A busy user therefore cannot
+starve the others. Dispatching is bounded by a worker pool, each run's concurrency
+limit and a global operations-per-second cap. A run can also name an operation key,
+such as the wallet, whose operations never execute at once; an operation whose key is
+busy waits without taking one of the run's concurrency slots, and can be held back for
+a random gap after the key's previous operation finishes.
+
+Runs can be paused, resumed or cancelled. Failed operations are rescheduled with
+exponential backoff until their attempts run out.
+"""
+
+import asyncio
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Hashable, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from bot.api.timing_wheel import TimingWheel, TimerHandle
+
+DEFAULT_MAX_WORKERS = 32            # Operations executing at once across all runs
+DEFAULT_MAX_DISPATCH_RATE = 20.0    # Operations started per second across all runs
+DEFAULT_MAX_ATTEMPTS = 2            # Attempts per operation, including the first
+DEFAULT_RETRY_DELAY = 5.0           # Seconds before the first retry; doubles on each further retry
+LAG_SAMPLES = 1000                  # Recent dispatch lags kept for percentiles
+
+OperationHandler = Callable[[Dict[str, Any], int], Awaitable[Any]]
+
+
+class RescheduleOperation(Exception):
+    """Raised by a handler whose operation should be retried, optionally after a specific delay."""
+
+    def __init__(self, message: str = "", delay: Optional[float] = None):
+        super().__init__(message)
+        self.delay = delay
+
+
+@dataclass
+class _ScheduledOperation:
+    """One pending operation of a run."""
+    run: 'ScheduledRun'
+    operation: Dict[str, Any]
+    operation_id: str
+    due: float
+    attempts: int = 0
+    timer: Optional[TimerHandle] = None
+
+
+@dataclass
+class ScheduledRun:
+    """A submitted schedule with its progress and outcome."""
+    run_id: str
+    user_id: Hashable
+    handler: OperationHandler
+    max_concurrency: int
+    max_attempts: int
+    retry_delay: float
+    exclusive_key: Optional[str] = None
+    key_gap: Optional[Tuple[float, float]] = None
+    total: int = 0
+    active: int = 0
+    paused_at: Optional[float] = None
+    cancelled: bool = False
+    results: Dict[str, Any] = field(default_factory=dict)
+    failures: Dict[str, str] = field(default_factory=dict)
+    max_lag: float = 0.0
+    busy_keys: Set[Hashable] = field(default_factory=set)
+    _remaining: int = 0
+    _pending: Dict[str, _ScheduledOperation] = field(default_factory=dict)
+    _parked: List[_ScheduledOperation] = field(default_factory=list)
+    _waiting: List[_ScheduledOperation] = field(default_factory=list)
+    _blocked: Dict[Hashable, Deque[_ScheduledOperation]] = field(default_factory=dict)
+    _key_free_at: Dict[Hashable, float] = field(default_factory=dict)
+    _done: Optional[asyncio.Event] = None
+
+    @property
+    def paused(self) -> bool:
+        """Whether dispatching is paused."""
+        return self.paused_at is not None
+
+    @property
+    def finished(self) -> bool:
+        """Whether every operation has completed, failed or been cancelled."""
+        return self._remaining == 0
+
+    def key_of(self, operation: Dict[str, Any]) -> Optional[Hashable]:
+        """Exclusive key of an operation, if the run has one."""
+        return operation.get(self.exclusive_key) if self.exclusive_key else None
+
+    async def wait(self) -> 'ScheduledRun':
+        """
+        Wait until every operation of the run has completed, failed or been cancelled.
+
+        Returns:
+            The run itself
+        """
+        if self._remaining:
+            await self._done.wait()
+        return self
+
+    def _settle(self):
+        """Count one operation as finished for good."""
+        self._remaining -= 1
+        if self._remaining == 0:
+            self._done.set()
+
+
+class _DispatchRate:
+    """Token bucket capping how many operations start per second."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self, now: float) -> bool:
+        """Take a token if one is available."""
+        self._refill(now)
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
+
+    def next_available(self, now: float) -> float:
+        """Time the next token becomes available."""
+        self._refill(now)
+        return now + max(0.0, 1.0 - self.tokens) / self.rate
+
+
+class TradeScheduler:
+    """Timing-wheel scheduler dispatching the timed operations of all runs fairly to a worker pool."""
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS,
+                 max_dispatch_rate: float = DEFAULT_MAX_DISPATCH_RATE):
+        """
+        Initialize the scheduler. Its tasks start on first use.
+
+        Args:
+            max_workers: Operations executing at once across all runs
+            max_dispatch_rate: Operations started per second across all runs
+        """
+        self.max_workers = max(1, max_workers)
+        self.max_dispatch_rate = max_dispatch_rate
+        self._runs: Dict[str, ScheduledRun] = {}
+        self._wheel = TimingWheel(time.monotonic())
+        self._ready: Dict[Hashable, Deque[_ScheduledOperation]] = {}
+        self._ready_users: Deque[Hashable] = deque()
+        self._rate = _DispatchRate(max_dispatch_rate)
+        self._lags: Deque[float] = deque(maxlen=LAG_SAMPLES)
+        self._loop = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._wake_at: Optional[float] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._busy = 0
+        self._sleepers = 0
+        self.dispatched = 0
+        self.retried = 0
+
+    def submit(self, run_id: str, operations: List[Dict[str, Any]], handler: OperationHandler,
+               user_id: Optional[Hashable] = None, max_concurrency: Optional[int] = None,
+               max_attempts: int = DEFAULT_MAX_ATTEMPTS, retry_delay: float = DEFAULT_RETRY_DELAY,
+               time_key: str = "timestamp", start_delay: float = 0.0,
+               exclusive_key: Optional[str] = None,
+               key_gap: Optional[Tuple[float, float]] = None) -> ScheduledRun:
+        """
+        Schedule a run's operations by their timestamps.
+
+        The earliest timestamp is due start_delay seconds from now and every other
+        operation keeps its offset from it. Operations without a timestamp are due with
+        the earliest one.
+
+        Args:
+            run_id: Unique name of the run
+            operations: Operation dictionaries, passed unchanged to the handler
+            handler: Coroutine function called with (operation, attempt number); raising
+                reschedules the operation until max_attempts is reached
+            user_id: Owner of the run; due operations are shared out fairly between owners
+                (default: the run is its own owner)
+            max_concurrency: Operations of this run executing at once (default: no limit
+                beyond the worker pool)
+            max_attempts: Attempts per operation, including the first
+            retry_delay: Seconds before the first retry; doubles on each further retry
+            time_key: Operation key holding its timestamp in seconds
+            start_delay: Seconds from now until the earliest operation is due
+            exclusive_key: Operation key (e.g. the wallet) whose operations run one at a
+                time; a due operation whose key is busy waits for it outside the run's
+                concurrency slots
+            key_gap: (min, max) seconds; after an operation finishes, the next one with the
+                same key waits a random gap in this range (requires exclusive_key)
+
+        Returns:
+            ScheduledRun tracking the run
+
+        Raises:
+            ValueError: If a run with the same id is still in progress
+        """
+        self._ensure_started()
+        if run_id in self._runs:
+            raise ValueError(f"Run {run_id} is already scheduled")
+
+        run = ScheduledRun(
+            run_id=run_id,
+            user_id=run_id if user_id is None else user_id,
+            handler=handler,
+            max_concurrency=max(1, max_concurrency or self.max_workers),
+            max_attempts=max(1, max_attempts),
+            retry_delay=retry_delay,
+            exclusive_key=exclusive_key,
+            key_gap=key_gap,
+            total=len(operations),
+            _remaining=len(operations),
+            _done=asyncio.Event()
+        )
+        if not operations:
+            run._done.set()
+            return run
+
+        timestamps = [op[time_key] for op in operations if op.get(time_key) is not None]
+        first_timestamp = min(timestamps) if timestamps else 0.0
+        start = time.monotonic() + max(0.0, start_delay)
+        for index, operation in enumerate(operations):
+            timestamp = operation.get(time_key)
+            offset = timestamp - first_timestamp if timestamp is not None else 0.0
+            operation_id = str(operation.get("operation_id", operation.get("id", index)))
+            if operation_id in run._pending:
+                operation_id = f"{operation_id}#{index}"
+            entry = _ScheduledOperation(run, operation, operation_id, start + offset)
+            run._pending[operation_id] = entry
+            self._schedule(entry)
+
+        self._runs[run_id] = run
+        logger.info(
+            f"Scheduled run {run_id} for user {run.user_id}: {len(operations)} operations over "
+            f"{(max(timestamps) - first_timestamp) if timestamps else 0.0:.1f}s"
+        )
+        return run
+
+    async def sleep(self, delay: float):
+        """
+        Sleep on the shared timing wheel, e.g. between verification probes.
+
+        Args:
+            delay: Seconds to sleep
+        """
+        self._ensure_started()
+        waiter = self._loop.create_future()
+        timer = self._insert_timer(time.monotonic() + max(0.0, delay), waiter)
+        self._sleepers += 1
+        try:
+            await waiter
+        finally:
+            self._sleepers -= 1
+            self._wheel.cancel(timer)
+
+    def pause(self, run_id: str) -> bool:
+        """
+        Stop dispatching a run's operations. Operations already executing finish.
+
+        Args:
+            run_id: Run to pause
+
+        Returns:
+            True if the run was found and not already paused
+        """
+        run = self._runs.get(run_id)
+        if run is None or run.paused:
+            return False
+        run.paused_at = time.monotonic()
+        logger.info(f"Paused run {run_id}")
+        return True
+
+    def resume(self, run_id: str) -> bool:
+        """
+        Resume a paused run. Its remaining operations are shifted by the time spent
+        paused, so their spacing is kept.
+
+        Args:
+            run_id: Run to resume
+
+        Returns:
+            True if the run was found and paused
+        """
+        run = self._runs.get(run_id)
+        if run is None or not run.paused:
+            return False
+        paused_for = time.monotonic() - run.paused_at
+        run.paused_at = None
+
+        for entry in list(run._pending.values()):
+            if entry.timer is not None and self._wheel.cancel(entry.timer):
+                entry.due += paused_for
+                self._schedule(entry)
+        for entry in run._parked:
+            entry.due += paused_for
+            self._schedule(entry)
+        run._parked = []
+        waiting, run._waiting = run._waiting, []
+        for entry in waiting:
+            self._make_ready(entry)
+        self._wakeup.set()
+        logger.info(f"Resumed run {run_id} after {paused_for:.1f}s")
+        return True
+
+    def cancel(self, run_id: str) -> bool:
+        """
+        Drop a run's pending operations. Operations already executing finish.
+
+        Args:
+            run_id: Run to cancel
+
+        Returns:
+            True if the run was found
+        """
+        run = self._runs.pop(run_id, None)
+        if run is None:
+            return False
+        run.cancelled = True
+        # Entries already in a ready queue are skipped when the dispatcher reaches them
+        for entry in run._pending.values():
+            if entry.timer is not None:
+                self._wheel.cancel(entry.timer)
+            run.failures[entry.operation_id] = "cancelled"
+            run._settle()
+        dropped = len(run._pending)
+        run._pending = {}
+        run._parked = []
+        run._waiting = []
+        run._blocked = {}
+        logger.info(f"Cancelled run {run_id}: {dropped} pending operations dropped")
+        return True
+
+    def reschedule(self, run_id: str, operation_id: str, delay: float) -> bool:
+        """
+        Move an operation that is not yet due to delay seconds from now.
+
+        Args:
+            run_id: Run the operation belongs to
+            operation_id: Operation to move
+            delay: Seconds from now
+
+        Returns:
+            True if the operation was waiting for its due time and has been moved
+        """
+        run = self._runs.get(run_id)
+        entry = run._pending.get(operation_id) if run is not None else None
+        if entry is None or entry.timer is None or not self._wheel.cancel(entry.timer):
+            return False
+        entry.due = time.monotonic() + max(0.0, delay)
+        self._schedule(entry)
+        return True
+
+    def upcoming(self, run_id: str, within: float) -> List[Dict[str, Any]]:
+        """
+        Get a run's pending operations that come due in the next few seconds.
+
+        Args:
+            run_id: Run to inspect
+            within: Horizon in seconds
+
+        Returns:
+            Operations in due order
+        """
+        run = self._runs.get(run_id)
+        if run is None or run.paused:
+            return []
+        horizon = time.monotonic() + within
+        entries = [entry for entry in run._pending.values() if entry.due <= horizon]
+        return [entry.operation for entry in sorted(entries, key=lambda entry: entry.due)]
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get scheduler load and pacing statistics.
+
+        Returns:
+            Dictionary with queue depths (overall and per user), executing operations,
+            dispatch counters and recent dispatch lag percentiles in seconds
+        """
+        lags = sorted(self._lags)
+        depth_by_user: Dict[Hashable, int] = {}
+        for run in self._runs.values():
+            depth_by_user[run.user_id] = depth_by_user.get(run.user_id, 0) + len(run._pending)
+        return {
+            "runs": len(self._runs),
+            "users": len(depth_by_user),
+            "queued": sum(depth_by_user.values()),
+            "queued_by_user": depth_by_user,
+            "ready": sum(len(entries) for entries in self._ready.values()),
+            "executing": self._busy,
+            "probe_timers": self._sleepers,
+            "dispatched": self.dispatched,
+            "retried": self.retried,
+            "lag_p50": lags[len(lags) // 2] if lags else None,
+            "lag_p95": lags[int(len(lags) * 0.95)] if lags else None,
+            "lag_max": lags[-1] if lags else None,
+            "max_workers": self.max_workers,
+            "max_dispatch_rate": self.max_dispatch_rate
+        }
+
+    def _ensure_started(self):
+        """Start the dispatcher and workers on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and all(not task.done() for task in self._tasks):
+            return
+        # A new loop cannot reuse the old loop's tasks, futures, queue or event
+        for task in self._tasks:
+            task.cancel()
+        self._loop = loop
+        self._runs = {}
+        self._wheel = TimingWheel(time.monotonic())
+        self._ready = {}
+        self._ready_users = deque()
+        self._wakeup = asyncio.Event()
+        self._wake_at = None
+        self._queue = asyncio.Queue()
+        self._busy = 0
+        self._sleepers = 0
+        self._tasks = [loop.create_task(self._dispatch())]
+        self._tasks += [loop.create_task(self._work()) for _ in range(self.max_workers)]
+
+    def _insert_timer(self, deadline: float, item: Any) -> TimerHandle:
+        """Add a timer, waking the dispatcher if it is sleeping past the deadline."""
+        timer = self._wheel.insert(deadline, item)
+        if self._wake_at is None or deadline < self._wake_at:
+            self._wakeup.set()
+        return timer
+
+    def _schedule(self, entry: _ScheduledOperation):
+        """Put an operation on the wheel at its due time."""
+        entry.timer = self._insert_timer(entry.due, entry)
+
+    def _make_ready(self, entry: _ScheduledOperation):
+        """Queue a due operation for its owner's next dispatch turn."""
+        user_id = entry.run.user_id
+        entries = self._ready.get(user_id)
+        if entries is None:
+            entries = self._ready[user_id] = deque()
+            self._ready_users.append(user_id)
+        entries.append(entry)
+
+    def _expire(self, item: Any):
+        """Handle a timer that has come due."""
+        if isinstance(item, asyncio.Future):
+            if not item.done():
+                item.set_result(None)
+            return
+        item.timer = None
+        if not item.run.cancelled:
+            self._make_ready(item)
+
+    def _dispatch_ready(self, now: float) -> Optional[float]:
+        """
+        Start ready operations, one per user in turn, while workers and rate allow.
+
+        Returns:
+            Time the rate cap allows the next start, if it is what stopped dispatching
+        """
+        while self._ready_users and self._busy < self.max_workers:
+            user_id = self._ready_users.popleft()
+            entries = self._ready[user_id]
+            entry = entries.popleft()
+            run = entry.run
+            key = run.key_of(entry.operation)
+            if run.cancelled:
+                pass
+            elif run.paused:
+                run._parked.append(entry)
+            elif key in run.busy_keys:
+                # Released when the operation holding the key finishes
+                run._blocked.setdefault(key, deque()).append(entry)
+            elif run._key_free_at.get(key, 0.0) > now:
+                # Still inside the gap after the key's previous operation
+                entry.due = run._key_free_at[key]
+                self._schedule(entry)
+            elif run.active >= run.max_concurrency:
+                run._waiting.append(entry)
+            elif not self._rate.try_acquire(now):
+                entries.appendleft(entry)
+                self._ready_users.appendleft(user_id)
+                return self._rate.next_available(now)
+            else:
+                self._start(entry, now)
+            # The user takes its next turn after every other ready user
+            if entries:
+                self._ready_users.append(user_id)
+            else:
+                del self._ready[user_id]
+        return None
+
+    async def _dispatch(self):
+        """Expire due timers and hand ready operations to the workers."""
+        while True:
+            now = time.monotonic()
+            for timer in self._wheel.advance(now):
+                self._expire(timer.item)
+            rate_wait = self._dispatch_ready(now)
+
+            wake_times = [at for at in (rate_wait, self._wheel.next_expiry()) if at is not None]
+            self._wake_at = min(wake_times) if wake_times else None
+            timeout = None if self._wake_at is None else max(0.0, self._wake_at - time.monotonic())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def _start(self, entry: _ScheduledOperation, now: float):
+        """Hand one due operation to the worker pool."""
+        run = entry.run
+        run._pending.pop(entry.operation_id, None)
+        run.active += 1
+        self._busy += 1
+        key = run.key_of(entry.operation)
+        if key is not None:
+            run.busy_keys.add(key)
+        lag = max(0.0, now - entry.due)
+        run.max_lag = max(run.max_lag, lag)
+        self._lags.append(lag)
+        self.dispatched += 1
+        self._queue.put_nowait(entry)
+
+    async def _work(self):
+        """Execute dispatched operations, rescheduling failures while attempts remain."""
+        while True:
+            entry = await self._queue.get()
+            run = entry.run
+            entry.attempts += 1
+            try:
+                result = await run.handler(entry.operation, entry.attempts)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if entry.attempts < run.max_attempts and not run.cancelled:
+                    delay = run.retry_delay * 2 ** (entry.attempts - 1)
+                    if isinstance(e, RescheduleOperation) and e.delay is not None:
+                        delay = e.delay
+                    logger.warning(
+                        f"Run {run.run_id} operation {entry.operation_id} failed (attempt {entry.attempts}/"
+                        f"{run.max_attempts}), retrying in {delay:.1f}s: {str(e)}"
+                    )
+                    self.retried += 1
+                    entry.due = time.monotonic() + delay
+                    run._pending[entry.operation_id] = entry
+                    self._schedule(entry)
+                else:
+                    logger.warning(f"Run {run.run_id} operation {entry.operation_id} failed: {str(e)}")
+                    run.failures[entry.operation_id] = str(e)
+                    run._settle()
+            else:
+                run.results[entry.operation_id] = result
+                run._settle()
+            finally:
+                run.active -= 1
+                self._busy -= 1
+                self._queue.task_done()
+                key = run.key_of(entry.operation)
+                if key is not None:
+                    run.busy_keys.discard(key)
+                    if run.key_gap:
+                        run._key_free_at[key] = time.monotonic() + random.uniform(*run.key_gap)
+
+            # The key is free again for the next operation that was waiting on it; the
+            # dispatcher holds it back until the key's gap has passed
+            blocked = run._blocked.get(key) if key is not None else None
+            if blocked:
+                self._make_ready(blocked.popleft())
+                if not blocked:
+                    del run._blocked[key]
+
+            # A finished operation frees a slot for one the concurrency limit held back
+            if run._waiting and not run.paused:
+                self._make_ready(run._waiting.pop(0))
+            self._wakeup.set()
+            if run.finished and self._runs.get(run.run_id) is run:
+                del self._runs[run.run_id]
+                logger.info(
+                    f"Run {run.run_id} finished: {len(run.results)} succeeded, {len(run.failures)} failed, "
+                    f"max dispatch lag {run.max_lag:.2f}s"
+                )
+
+
+# Shared scheduler; every run and verification probe in the bot's event loop is timed through it
+trade_scheduler = TradeScheduler()
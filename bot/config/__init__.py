@@ -17,6 +17,15 @@ if not BOT_TOKEN:
 # API configuration
 API_BASE_URL = os.getenv("API_BASE_URL", "https://solanaapivolume-render.onrender.com/")
 
+# Solana JSON-RPC endpoint for transaction signature status lookups
+SOLANA_RPC_URL = os.getenv("SOLANA_RPC_URL", "https://api.mainnet-beta.solana.com")
+
+# Solana RPC WebSocket for push-based balance updates (unset = poll only)
+SOLANA_WS_URL = os.getenv("SOLANA_WS_URL") or None
+
+# Token list used to resolve mint symbols and decimals
+TOKEN_LIST_URL = os.getenv("TOKEN_LIST_URL", "https://token.jup.ag/strict")
+
 # Logging configuration
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 
@@ -161,6 +170,9 @@ __all__ = [
     'CallbackPrefix', 
     'VolumeStrategy',
     'API_BASE_URL',
+    'SOLANA_RPC_URL',
+    'SOLANA_WS_URL',
+    'TOKEN_LIST_URL',
     'BOT_TOKEN',
     'SERVICE_FEE_RATE',
     'MIN_CHILD_WALLETS',
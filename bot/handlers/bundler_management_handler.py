@@ -600,9 +600,9 @@ async def execute_bundler_sell_operation(update: Update, context: CallbackContex
             )
             return ConversationState.TOKEN_TRADING_OPERATION
         
-        # Import and initialize client
-        from bot.api.pumpfun_client import PumpFunClient
-        pumpfun_client = PumpFunClient()
+        # Shared client, so every sell reuses one connection pool
+        from bot.api.pumpfun_client import async_pumpfun_client
+        pumpfun_client = async_pumpfun_client
         slippage_bps = 2500
         
         # Execute sell operation according to type
@@ -611,7 +611,7 @@ async def execute_bundler_sell_operation(update: Update, context: CallbackContex
             dev_wallets = [w for w in wallets_data if w.get('name') == 'DevWallet']
             if not dev_wallets:
                 raise Exception("DevWallet not found in wallet data")
-            results = pumpfun_client.sell_dev_wallet(
+            results = await pumpfun_client.sell_dev_wallet_async(
                 mint_address=mint_address,
                 sell_percentage=sell_percentage,
                 slippage_bps=slippage_bps,
@@ -621,7 +621,7 @@ async def execute_bundler_sell_operation(update: Update, context: CallbackContex
             bundled_only = [w for w in wallets_data if w.get('name') != 'DevWallet']
             if not bundled_only:
                 raise Exception("No bundled wallets found in wallet data")
-            results = pumpfun_client.batch_sell_token(
+            results = await pumpfun_client.batch_sell_token_async(
                 mint_address=mint_address,
                 sell_percentage=sell_percentage,
                 slippage_bps=slippage_bps,
@@ -632,7 +632,7 @@ async def execute_bundler_sell_operation(update: Update, context: CallbackContex
             # 1) Dev sell
             dev_wallets = [w for w in wallets_data if w.get('name') == 'DevWallet']
             if dev_wallets:
-                dev_res = pumpfun_client.sell_dev_wallet(
+                dev_res = await pumpfun_client.sell_dev_wallet_async(
                     mint_address=mint_address,
                     sell_percentage=sell_percentage,
                     slippage_bps=slippage_bps,
@@ -642,7 +642,7 @@ async def execute_bundler_sell_operation(update: Update, context: CallbackContex
             # 2) Batch sell bundled
             bundled_only = [w for w in wallets_data if w.get('name') != 'DevWallet']
             if bundled_only:
-                batch_res = pumpfun_client.batch_sell_token(
+                batch_res = await pumpfun_client.batch_sell_token_async(
                     mint_address=mint_address,
                     sell_percentage=sell_percentage,
                     slippage_bps=slippage_bps,
@@ -48,6 +48,7 @@ from bot.utils.message_utils import (
     format_bundler_management_selection_message
 )
 from bot.api.api_client import api_client, ApiClientError
+from bot.api.backend_warmer import backend_warmer
 from bot.events.event_system import event_system, TransactionConfirmedEvent, TransactionFailedEvent
 from bot.utils.balance_poller import balance_poller
 from bot.state.session_manager import session_manager
@@ -81,7 +82,8 @@ async def volume_generation_job(context: CallbackContext):
             child_private_keys=job_data['child_private_keys'],
             trades=job_data['trades'],
             token_address=job_data['token_address'],
-            verify_transfers=True
+            verify_transfers=True,
+            user_id=user_id
         )
         # Enhanced logging for debugging
         logger.info(
@@ -359,6 +361,9 @@ async def start_volume_generation_workflow(update: Update, context: CallbackCont
     user = update.callback_query.from_user
     query = update.callback_query
     
+    # Wake the volume API in the background if it may have gone to sleep
+    backend_warmer.warm("volume_api")
+    
     # Check if there are any saved mother wallets
     saved_wallets = api_client.list_saved_wallets('mother')
 
@@ -862,7 +867,7 @@ async def start_balance_polling(user_id: int, context: CallbackContext) -> None:
         return
 
     async def on_target_reached():
-        balance_info = api_client.check_balance(mother_wallet, token_addr)
+        balance_info = await api_client.check_balance_async(mother_wallet, token_addr)
         current_balance = 0
         token_symbol = "tokens"
         if isinstance(balance_info, dict) and 'balances' in balance_info:
@@ -927,16 +932,16 @@ async def check_balance(update: Update, context: CallbackContext) -> int:
             pass
 
         # Check if balance poller is already running to avoid double requests
-        poller_task_id = f"{mother_wallet}_{token_addr or 'So11111111111111111111111111111111111111112'}"
-        if poller_task_id in balance_poller._polling_tasks and poller_task_id in balance_poller._last_balances:
+        cached_balance = balance_poller.get_cached_balance(mother_wallet, token_addr)
+        if balance_poller.is_polling(mother_wallet, token_addr) and cached_balance is not None:
             # Use cached balance from poller to avoid duplicate API call
             logger.info(f"Using cached balance from poller for {mother_wallet[:8]}...")
-            current_balance = balance_poller._last_balances[poller_task_id]
+            current_balance = cached_balance
             token_symbol = "SOL"
         else:
             # Only make API call if poller is not active
             logger.info(f"Making direct balance check for {mother_wallet[:8]}...")
-            balance_info = api_client.check_balance(mother_wallet, token_addr)
+            balance_info = await api_client.check_balance_async(mother_wallet, token_addr)
             current_balance = 0
             token_symbol = "tokens"
             if isinstance(balance_info, dict) and 'balances' in balance_info:
@@ -1466,14 +1471,14 @@ async def fund_child_wallets_handler(update: Update, context: CallbackContext) -
     )
 
     try:
-        logger.info(f"Calling api_client.fund_child_wallets with:")
+        logger.info(f"Calling api_client.fund_child_wallets_async with:")
         logger.info(f"  - mother_wallet: {mother_wallet}")
         logger.info(f"  - child_wallets (count): {len(child_wallets)}")
         logger.info(f"  - token_address: So11111111111111111111111111111111111111112")
         logger.info(f"  - amount_per_wallet: {min_required_per_wallet}")
         logger.info(f"  - verify_transfers: True")
         
-        funding_result = api_client.fund_child_wallets(
+        funding_result = await api_client.fund_child_wallets_async(
             mother_wallet=mother_wallet,
             child_wallets=child_wallets,
             token_address="So11111111111111111111111111111111111111112",  # SOL mint
@@ -1574,16 +1579,19 @@ async def start_bundling_workflow(update: Update, context: CallbackContext) -> i
     query = update.callback_query
     await query.answer()
 
+    # Wake the bundler API in the background if it may have gone to sleep
+    backend_warmer.warm("pumpfun")
+
     # Initialize PumpFun client (was previously unreachable due to misplaced code)
     try:
-        from bot.api.pumpfun_client import PumpFunClient
-        pumpfun_client = PumpFunClient()
+        from bot.api.pumpfun_client import async_pumpfun_client
+        pumpfun_client = async_pumpfun_client
 
         # Store client in session for later use
         session_manager.update_session_value(user.id, "pumpfun_client", pumpfun_client)
 
         # Check PumpFun API health
-        health_status = pumpfun_client.health_check()
+        health_status = await pumpfun_client.health_check_async()
         if not health_status.get("api_reachable", False):
             logger.error(
                 f"PumpFun API not reachable for user {user.id}",
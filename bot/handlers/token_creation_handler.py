@@ -513,7 +513,7 @@ async def create_token_final(update: Update, context: CallbackContext) -> int:
         
         # Create token and execute buys with ALL wallets using new dynamic API
         try:
-            token_result = pumpfun_client.create_token_and_buy(
+            token_result = await pumpfun_client.create_token_and_buy_async(
                 token_params=token_creation_params,
                 buy_amounts=buy_amounts_obj,
                 wallets=wallets,  # Use ALL wallets - API will process them dynamically
@@ -31,7 +31,7 @@ from bot.utils.message_utils import (
 from bot.state.session_manager import session_manager
 from bot.utils.token_storage import token_storage
 from bot.api.api_client import api_client
-from bot.api.pumpfun_client import PumpFunClient  # Added for token trading operations
+from bot.api.pumpfun_client import async_pumpfun_client  # Added for token trading operations
 from bot.utils.wallet_storage import airdrop_wallet_storage, bundled_wallet_storage
 
 
@@ -639,8 +639,8 @@ async def execute_sell_operation(update: Update, context: CallbackContext) -> in
         # Execute the sell operations based on operation type
         results = {}
         
-        # Initialize PumpFun client for trading operations
-        pumpfun_client = PumpFunClient()
+        # Shared PumpFun client for trading operations
+        pumpfun_client = async_pumpfun_client
         
         if operation == "sell_dev":
             # Sell with DevWallet only - SIMPLIFIED PROCESS
@@ -658,7 +658,7 @@ async def execute_sell_operation(update: Update, context: CallbackContext) -> in
             logger.info(f"Starting simplified DevWallet sell for mint {mint_address} with {sell_percentage}% of tokens")
             
             # ✅ SIMPLIFIED API CALL - API handles balance validation internally
-            results = pumpfun_client.sell_dev_wallet(
+            results = await pumpfun_client.sell_dev_wallet_async(
                 mint_address=mint_address,
                 sell_percentage=sell_percentage,
                 slippage_bps=slippage_bps,
@@ -683,7 +683,7 @@ async def execute_sell_operation(update: Update, context: CallbackContext) -> in
             logger.info(f"Starting simplified batch sell for mint {mint_address} with {sell_percentage}% of tokens")
             
             # ✅ SIMPLIFIED API CALL - API handles balance validation internally
-            results = pumpfun_client.batch_sell_token(
+            results = await pumpfun_client.batch_sell_token_async(
                 mint_address=mint_address,
                 sell_percentage=sell_percentage,
                 slippage_bps=slippage_bps,
@@ -705,7 +705,7 @@ async def execute_sell_operation(update: Update, context: CallbackContext) -> in
             dev_wallets = [w for w in wallets_data if w['name'] == 'DevWallet']
             if dev_wallets:
                 # ✅ SIMPLIFIED API CALL for DevWallet - API validates internally
-                dev_result = pumpfun_client.sell_dev_wallet(
+                dev_result = await pumpfun_client.sell_dev_wallet_async(
                     mint_address=mint_address,
                     sell_percentage=sell_percentage,
                     slippage_bps=slippage_bps,
@@ -724,7 +724,7 @@ async def execute_sell_operation(update: Update, context: CallbackContext) -> in
             bundled_wallets_only = [w for w in wallets_data if w['name'] != 'DevWallet']
             if bundled_wallets_only:
                 # ✅ SIMPLIFIED API CALL for batch sell - API validates internally
-                batch_result = pumpfun_client.batch_sell_token(
+                batch_result = await pumpfun_client.batch_sell_token_async(
                     mint_address=mint_address,
                     sell_percentage=sell_percentage,
                     slippage_bps=slippage_bps,
@@ -739,8 +739,15 @@ async def check_wallet_balance(update: Update, context: CallbackContext) -> int:
             wallet_name = wallet.get("name", f"wallet_{idx}")
             logger.info(f"BALANCE CHECK DEBUG: Will check {wallet_name} address: {wallet_address}")
         
+        # Refresh session before the balance reads so a long check cannot time it out
+        session_manager.refresh_session(user.id)
+        
+        # Read all bundled wallet balances concurrently in one call, off the event loop
+        lamport_balances = await asyncio.to_thread(pumpfun_client.get_wallet_sol_balances, [
+            wallet.get("address") or wallet.get("publicKey") for wallet in bundled_wallets_data
+        ])
+        
         # Check each wallet's SOL balance with proper requirements
-        wallet_check_count = 0
         for wallet in bundled_wallets_data:
             # Use normalized address field (bundled_wallet_storage returns normalized structure)
             wallet_address = wallet.get("address") or wallet.get("publicKey")
@@ -750,22 +757,9 @@ async def check_wallet_balance(update: Update, context: CallbackContext) -> int:
                 continue
                 
             try:
-                # Refresh session every 10 wallet checks to prevent timeout during long balance checking
-                wallet_check_count += 1
-                if wallet_check_count % 10 == 0:
-                    session_manager.refresh_session(user.id)
-                    logger.info(f"Session refreshed after checking {wallet_check_count} wallets")
-                
-                # Use enhanced SOL balance endpoint
-                balance_response = pumpfun_client.get_wallet_sol_balance(wallet_address)
-                
-                # Extract SOL balance from enhanced response format
-                sol_balance = 0
-                if "data" in balance_response and "sol" in balance_response["data"]:
-                    sol_balance = balance_response["data"]["sol"].get("balance", 0)
-                elif "data" in balance_response:
-                    # Fallback for legacy format
-                    sol_balance = balance_response["data"].get("balance", 0)
+                if wallet_address not in lamport_balances:
+                    raise Exception("Balance unavailable")
+                sol_balance = lamport_balances[wallet_address] / 1_000_000_000
                 
                 # Determine required balance based on wallet role
                 if wallet_name == "DevWallet":
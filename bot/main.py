@@ -9,6 +9,10 @@ from telegram.ext import ApplicationBuilder, CommandHandler
 from bot.handlers.start_handler import register_start_handler
 from bot.config import BOT_TOKEN, LOG_LEVEL
 from bot.events.event_system import event_system
+from bot.api.backend_warmer import backend_warmer
+from bot.api.account_subscriber import account_subscriber
+from bot.api.token_registry import token_registry
+from bot.api.pumpfun_client import async_pumpfun_client
 
 def setup_logging():
     """Configure structured logging with loguru."""
@@ -57,7 +61,13 @@ def setup_bot():
     logger.info("Starting Solana Volume Telegram Bot")
     
     # Create the Application and pass it your bot's token
-    application = ApplicationBuilder().token(BOT_TOKEN).build()
+    application = (
+        ApplicationBuilder()
+        .token(BOT_TOKEN)
+        .post_init(on_startup)
+        .post_shutdown(on_shutdown)
+        .build()
+    )
     
     # Register command handlers
     register_start_handler(application)
@@ -68,6 +78,22 @@ def setup_bot():
     # Return the application without running it
     return application
 
+async def on_startup(application):
+    """Start background services once the application is initialized."""
+    # Wake the Render-hosted backends before the first user needs them
+    await backend_warmer.start()
+    # Push balance changes over the RPC WebSocket when SOLANA_WS_URL is configured
+    await account_subscriber.start()
+    # Load the token list snapshot and re-validate it off the event loop
+    token_registry.refresh_in_background()
+
+async def on_shutdown(application):
+    """Stop background services when the application shuts down."""
+    await account_subscriber.stop()
+    await backend_warmer.stop()
+    # Release the shared PumpFun client's pooled connections
+    await async_pumpfun_client.aclose()
+
 async def start_event_system():
     """Start the event system."""
     await event_system.start()
@@ -122,16 +122,18 @@ class AmountCalculator:
         
         logger.debug(f"Calculating {percentage*100}% of balance for each wallet")
         
+        is_sol = token_mint == "So11111111111111111111111111111111111111112"
+        # Read all balances in one batched call instead of one request per wallet
+        lamport_balances = self.api_client.check_balances(wallet_addresses) if is_sol else {}
+        token_balances = {} if is_sol else self.api_client.get_spl_token_balances(wallet_addresses, token_mint)
+        
         for i, address in enumerate(wallet_addresses):
             try:
-                if token_mint == "So11111111111111111111111111111111111111112":
+                if is_sol:
                     # SOL balance check
-                    balance_info = self.api_client.check_balance(address, token_mint)
-                    sol_balance = 0.0
-                    for balance in balance_info.get('balances', []):
-                        if balance.get('symbol') == 'SOL':
-                            sol_balance = balance.get('amount', 0.0)
-                            break
+                    if address not in lamport_balances:
+                        raise ValueError("balance unavailable")
+                    sol_balance = lamport_balances[address] / 1_000_000_000
                     
                     if sol_balance <= min_balance_threshold:
                         results.append(WalletAmountResult(
@@ -161,7 +163,10 @@ class AmountCalculator:
                     
                 else:
                     # SPL token balance check
-                    token_balance = self.api_client.check_spl_token_balance(address, token_mint)
+                    if address not in token_balances:
+                        raise ValueError("balance unavailable")
+                    token_info = token_balances[address]
+                    token_balance = token_info["balance"] / (10 ** token_info["decimals"])
                     
                     if token_balance <= 0:
                         results.append(WalletAmountResult(
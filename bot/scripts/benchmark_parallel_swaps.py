@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Benchmark for parallel execution mode of the SPL Token Buy/Sell Script.
+
+Runs WalletSwapManager in parallel mode against a simulated API client whose calls
+take a fixed latency, once per max_concurrent value, and prints the wall time of
+each run. With the API calls awaited on the async transport the wall time drops
+roughly in proportion to max_concurrent. Passing --blocking makes the simulated
+client block the event loop instead, the way synchronous client calls inside the
+swap coroutines did, so every setting runs as slowly as max_concurrent = 1.
+
+Usage (from the repository root):
+    python bot/scripts/benchmark_parallel_swaps.py --wallets 40 --latency 0.1 --concurrency 1,2,4,8,16
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add the repository root to Python path for imports
+sys.path.append(str(Path(__file__).parent.parent.parent))
+
+from loguru import logger
+from bot.scripts.buy_sell_config import (
+    SwapConfiguration, OperationType, TokenConfig, AmountConfig, AmountStrategy,
+    ExecutionConfig, ExecutionMode
+)
+from bot.scripts.wallet_swap_manager import WalletSwapManager
+
+SOL_MINT = "So11111111111111111111111111111111111111112"
+BENCHMARK_TOKEN = "BenchmarkTokenMint1111111111111111111111111"
+
+
+class SimulatedApiClient:
+    """API client stand-in whose calls take a fixed latency and always succeed."""
+
+    def __init__(self, latency: float, blocking: bool = False):
+        """
+        Initialize the simulated client.
+
+        Args:
+            latency: Seconds each API call takes
+            blocking: Block the event loop during calls instead of awaiting them
+        """
+        self.latency = latency
+        self.blocking = blocking
+        self.calls = 0
+
+    async def _call(self):
+        """Simulate one API round trip."""
+        self.calls += 1
+        if self.blocking:
+            time.sleep(self.latency)
+        else:
+            await asyncio.sleep(self.latency)
+
+    async def check_balance_async(self, wallet_address: str, token_address: str = None,
+                                  fresh: bool = False) -> Dict[str, Any]:
+        await self._call()
+        return {"wallet_address": wallet_address, "balances": [{"symbol": "SOL", "amount": 1.0}]}
+
+    async def check_spl_token_balance_async(self, wallet_address: str, mint_address: str) -> float:
+        await self._call()
+        return 1_000_000.0
+
+    async def get_jupiter_quote_async(self, input_mint: str, output_mint: str, amount: int,
+                                      **kwargs) -> Dict[str, Any]:
+        await self._call()
+        return {
+            "message": "Jupiter quote retrieved successfully",
+            "quoteResponse": {
+                "inputMint": input_mint,
+                "outputMint": output_mint,
+                "inAmount": str(amount),
+                "outAmount": str(amount),
+                "priceImpactPct": "0.1"
+            }
+        }
+
+    async def execute_jupiter_swap_async(self, user_wallet_private_key: str, quote_response: Dict[str, Any],
+                                         **kwargs) -> Dict[str, Any]:
+        await self._call()
+        return {"status": "success", "transactionId": f"benchmark_tx_{self.calls}"}
+
+
+def build_configuration(max_concurrent: int) -> SwapConfiguration:
+    """Build a parallel-mode buy configuration with a fixed amount per wallet."""
+    return SwapConfiguration(
+        operation=OperationType.BUY,
+        token_config=TokenConfig(input_token=SOL_MINT, output_token=BENCHMARK_TOKEN),
+        amount_config=AmountConfig(strategy=AmountStrategy.FIXED, base_amount=0.01),
+        execution_config=ExecutionConfig(
+            mode=ExecutionMode.PARALLEL,
+            max_concurrent=max_concurrent,
+            verify_swaps=False,
+            collect_fees=False,
+            retry_failed=False
+        )
+    )
+
+
+async def run_once(wallets: List[Dict[str, Any]], max_concurrent: int, latency: float,
+                   blocking: bool) -> Dict[str, Any]:
+    """Run one parallel execution and measure its wall time."""
+    api_client = SimulatedApiClient(latency, blocking=blocking)
+    manager = WalletSwapManager(api_client)
+
+    start = time.perf_counter()
+    summary = await manager.execute_swaps(build_configuration(max_concurrent), wallets)
+    wall_time = time.perf_counter() - start
+
+    return {
+        "max_concurrent": max_concurrent,
+        "wall_time": wall_time,
+        "successful": summary.total_success_count,
+        "swaps": len(summary.all_swap_results),
+        "api_calls": api_client.calls
+    }
+
+
+async def run_benchmark(wallet_count: int, latency: float, concurrency_levels: List[int],
+                        blocking: bool) -> List[Dict[str, Any]]:
+    """Run the benchmark for every concurrency level."""
+    wallets = [
+        {"address": f"BenchmarkWallet{index:04d}", "private_key": f"benchmark_key_{index}"}
+        for index in range(wallet_count)
+    ]
+    return [await run_once(wallets, level, latency, blocking) for level in concurrency_levels]
+
+
+def print_results(results: List[Dict[str, Any]], wallet_count: int, latency: float, blocking: bool):
+    """Print a table of wall times and speedups relative to the first run."""
+    baseline: Optional[float] = results[0]["wall_time"] if results else None
+    mode = "blocking client" if blocking else "async client"
+    print(f"\nParallel swap benchmark: {wallet_count} wallets, {latency * 1000:.0f}ms per API call, {mode}")
+    print(f"{'max_concurrent':>14} {'wall time (s)':>14} {'speedup':>8} {'successful':>11} {'api calls':>10}")
+    for result in results:
+        speedup = baseline / result["wall_time"] if baseline else 0.0
+        print(
+            f"{result['max_concurrent']:>14} {result['wall_time']:>14.2f} {speedup:>7.1f}x "
+            f"{result['successful']:>5}/{result['swaps']:<5} {result['api_calls']:>10}"
+        )
+
+
+def create_cli_parser() -> argparse.ArgumentParser:
+    """Create command line argument parser."""
+    parser = argparse.ArgumentParser(description="Benchmark parallel execution mode against a simulated API")
+    parser.add_argument("--wallets", type=int, default=40, help="Number of wallets to swap with")
+    parser.add_argument("--latency", type=float, default=0.1, help="Seconds per simulated API call")
+    parser.add_argument("--concurrency", default="1,2,4,8,16",
+                        help="Comma-separated max_concurrent values to benchmark")
+    parser.add_argument("--blocking", action="store_true",
+                        help="Simulate synchronous API calls that block the event loop")
+    return parser
+
+
+def main() -> int:
+    """Benchmark entry point."""
+    args = create_cli_parser().parse_args()
+    concurrency_levels = [int(level) for level in args.concurrency.split(",") if level.strip()]
+
+    # Keep per-swap logging out of the timings
+    logger.remove()
+    logger.add(sys.stderr, level="ERROR")
+
+    results = asyncio.run(run_benchmark(args.wallets, args.latency, concurrency_levels, args.blocking))
+    print_results(results, args.wallets, args.latency, args.blocking)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,6 +10,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 
 from loguru import logger
+from bot.api.quote_prefetcher import QuotePrefetcher
 from .buy_sell_config import ExecutionConfig, TokenConfig
 
 
@@ -100,8 +101,8 @@ class SwapExecutor:
         """Initialize swap executor."""
         self.api_client = api_client
         self.config = execution_config
-        self.quote_cache = {}  # Simple quote caching
-        self.quote_cache_ttl = 30  # 30 seconds TTL
+        # Quotes for upcoming swaps are requested while the current one executes
+        self.quote_prefetcher = QuotePrefetcher(self._request_quote)
     
     async def execute_swap(
         self,
@@ -142,6 +143,8 @@ class SwapExecutor:
         # Pre-execution validation
         validation_error = await self._validate_swap_preconditions(result)
         if validation_error:
+            # The swap will not ask for its prefetched quote, so free its lookahead slot
+            self.quote_prefetcher.discard(wallet_index)
             result.status = SwapStatus.SKIPPED
             result.final_error = validation_error
             result.end_time = time.time()
@@ -203,7 +206,7 @@ class SwapExecutor:
             if result.output_token == "SOL" or result.output_token == "So11111111111111111111111111111111111111112":
                 # This is a sell operation (token -> SOL)
                 # Check if wallet has the input token
-                token_balance = self.api_client.check_spl_token_balance(
+                token_balance = await self.api_client.check_spl_token_balance_async(
                     result.wallet_address, 
                     result.input_token
                 )
@@ -218,7 +221,7 @@ class SwapExecutor:
             else:
                 # This is a buy operation (SOL -> token)
                 # Check SOL balance
-                balance_info = self.api_client.check_balance(result.wallet_address)
+                balance_info = await self.api_client.check_balance_async(result.wallet_address)
                 sol_balance = 0.0
                 
                 for balance in balance_info.get('balances', []):
@@ -243,7 +246,8 @@ class SwapExecutor:
             quote_data = await self._get_fresh_quote(
                 result.input_token,
                 result.output_token,
-                result.input_amount
+                result.input_amount,
+                wallet_index=result.wallet_index
             )
             
             if not quote_data:
@@ -256,7 +260,8 @@ class SwapExecutor:
             attempt.status = SwapStatus.EXECUTING
             swap_response = await self._execute_jupiter_swap(
                 result.wallet_private_key,
-                quote_data
+                quote_data,
+                result.wallet_address
             )
             
             # Step 3: Process results
@@ -282,61 +287,77 @@ class SwapExecutor:
             attempt.end_time = time.time()
             raise
     
+    def prefetch_quote(self, wallet_index: int, input_token: str, output_token: str, amount: float) -> None:
+        """
+        Start fetching the quote of an upcoming swap so it is ready when the swap starts.
+        
+        Quotes are keyed by wallet alone. If the swap's amount changes before it starts,
+        e.g. a sell capped to the token balance, get() sees different parameters and
+        fetches a new quote instead of leaving the old one behind.
+        
+        Args:
+            wallet_index: Index of the wallet that will swap
+            input_token: Input token symbol or mint
+            output_token: Output token symbol or mint
+            amount: Amount to swap
+        """
+        self.quote_prefetcher.prefetch(
+            wallet_index,
+            input_token=input_token, output_token=output_token, amount=amount
+        )
+    
     async def _get_fresh_quote(
         self,
         input_token: str,
         output_token: str,
-        amount: float
+        amount: float,
+        wallet_index: Optional[int] = None
     ) -> Optional[Dict[str, Any]]:
-        """Get a fresh quote from Jupiter, with caching."""
-        cache_key = f"{input_token}_{output_token}_{amount}"
-        current_time = time.time()
-        
-        # Check cache
-        if cache_key in self.quote_cache:
-            cached_quote, cache_time = self.quote_cache[cache_key]
-            if current_time - cache_time < self.quote_cache_ttl:
-                logger.debug(f"Using cached quote for {input_token} → {output_token}")
-                return cached_quote
-        
+        """Get a quote from Jupiter, using the prefetched one if it is still fresh."""
         try:
-            # Convert amount to lamports/base units (assuming SOL input for now)
-            amount_lamports = int(amount * 1_000_000_000) if input_token in ["SOL", "WSOL"] else int(amount)
-            
-            quote_response = self.api_client.get_jupiter_quote(
-                input_mint=input_token,
-                output_mint=output_token,
-                amount=amount_lamports,
-                slippage_bps=self.config.slippage_bps,
-                only_direct_routes=False,
-                as_legacy_transaction=False,
-                platform_fee_bps=0
+            return await self.quote_prefetcher.get(
+                wallet_index,
+                input_token=input_token, output_token=output_token, amount=amount
             )
-            
-            # Cache the quote
-            self.quote_cache[cache_key] = (quote_response, current_time)
-            
-            logger.debug(f"Got fresh quote: {amount} {input_token} → {output_token}")
-            return quote_response
-            
         except Exception as e:
             logger.error(f"Failed to get quote: {str(e)}")
             return None
     
+    async def _request_quote(self, input_token: str, output_token: str, amount: float) -> Dict[str, Any]:
+        """Request a quote from Jupiter."""
+        # Convert amount to lamports/base units (assuming SOL input for now)
+        amount_lamports = int(amount * 1_000_000_000) if input_token in ["SOL", "WSOL"] else int(amount)
+        
+        quote_response = await self.api_client.get_jupiter_quote_async(
+            input_mint=input_token,
+            output_mint=output_token,
+            amount=amount_lamports,
+            slippage_bps=self.config.slippage_bps,
+            only_direct_routes=False,
+            as_legacy_transaction=False,
+            platform_fee_bps=0
+        )
+        
+        logger.debug(f"Got fresh quote: {amount} {input_token} → {output_token}")
+        return quote_response
+    
     async def _execute_jupiter_swap(
         self,
         private_key: str,
-        quote_data: Dict[str, Any]
+        quote_data: Dict[str, Any],
+        wallet_address: Optional[str] = None
     ) -> Dict[str, Any]:
         """Execute the actual Jupiter swap."""
         try:
-            swap_response = self.api_client.execute_jupiter_swap(
+            # Awaited on the async transport so parallel swaps overlap instead of blocking the loop
+            swap_response = await self.api_client.execute_jupiter_swap_async(
                 user_wallet_private_key=private_key,
                 quote_response=quote_data,
                 wrap_and_unwrap_sol=True,
                 as_legacy_transaction=False,
                 collect_fees=self.config.collect_fees,
-                verify_swap=self.config.verify_swaps
+                verify_swap=self.config.verify_swaps,
+                wallet_address=wallet_address
             )
             
             return swap_response
@@ -425,11 +446,10 @@ class MockSwapExecutor(SwapExecutor):
     def __init__(self, execution_config: ExecutionConfig):
         """Initialize mock executor without API client."""
         self.config = execution_config
-        self.quote_cache = {}
-        self.quote_cache_ttl = 30
+        self.quote_prefetcher = QuotePrefetcher(self._request_quote)
         self.api_client = None  # No real API client needed
     
-    async def _get_fresh_quote(self, input_token: str, output_token: str, amount: float) -> Optional[Dict[str, Any]]:
+    async def _request_quote(self, input_token: str, output_token: str, amount: float) -> Dict[str, Any]:
         """Generate mock quote data."""
         import random
         
@@ -452,7 +472,8 @@ class MockSwapExecutor(SwapExecutor):
             }
         }
     
-    async def _execute_jupiter_swap(self, private_key: str, quote_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def _execute_jupiter_swap(self, private_key: str, quote_data: Dict[str, Any],
+                                    wallet_address: Optional[str] = None) -> Dict[str, Any]:
         """Simulate swap execution."""
         import random
         
@@ -281,6 +281,10 @@ class WalletSwapManager:
             start_time=time.time()
         )
         
+        # One executor for the whole run so quotes prefetched for the next wallets are reused
+        executor = self._create_executor(config.execution_config)
+        lookahead = executor.quote_prefetcher.lookahead
+        
         for i, (wallet_data, amount_result) in enumerate(zip(selected_wallets, amount_results)):
             if self.is_cancelled:
                 logger.info("Execution cancelled by user")
@@ -293,9 +297,19 @@ class WalletSwapManager:
             # Report progress
             self._report_progress("executing", i + 1, len(selected_wallets))
             
+            # Quote the next wallets' swaps while this one executes
+            for next_index in range(i + 1, min(i + 1 + lookahead, len(amount_results))):
+                if amount_results[next_index].is_valid:
+                    executor.prefetch_quote(
+                        next_index,
+                        config.token_config.input_token,
+                        config.token_config.output_token,
+                        amount_results[next_index].calculated_amount
+                    )
+            
             try:
                 # Execute the swap
-                swap_result = await self._create_executor(config.execution_config).execute_swap(
+                swap_result = await executor.execute_swap(
                     wallet_address=wallet_data["address"],
                     wallet_private_key=wallet_data["private_key"],
                     wallet_index=i,
@@ -338,10 +352,12 @@ class WalletSwapManager:
                 batch_result.swap_results.append(failed_result)
                 summary.all_swap_results.append(failed_result)
         
+        executor.quote_prefetcher.cancel_all()
         batch_result.end_time = time.time()
         summary.batch_results.append(batch_result)
         
         logger.info(f"Sequential execution completed: {batch_result.success_count}/{len(batch_result.swap_results)} successful")
+        logger.debug(f"Quote prefetching: {executor.quote_prefetcher.stats()}")
     
     async def _execute_parallel(
         self,
@@ -356,6 +372,9 @@ class WalletSwapManager:
         # Create executor
         executor = self._create_executor(config.execution_config)
         
+        # Index wallets by address once instead of scanning the list for every swap
+        wallets_by_address = {wallet['address']: wallet for wallet in selected_wallets}
+        
         # Create semaphore for concurrency control
         semaphore = asyncio.Semaphore(config.execution_config.max_concurrent)
         
@@ -382,10 +401,7 @@ class WalletSwapManager:
                     )
                 
                 # Find wallet data
-                wallet_data = next(
-                    (w for w in selected_wallets if w['address'] == amount_result.wallet_address),
-                    None
-                )
+                wallet_data = wallets_by_address.get(amount_result.wallet_address)
                 
                 if not wallet_data:
                     return SwapResult(
@@ -437,6 +453,7 @@ class WalletSwapManager:
         
         # Create executor
         executor = self._create_executor(config.execution_config)
+        wallets_by_address = {wallet['address']: wallet for wallet in selected_wallets}
         
         # Split into batches
         batches = [amount_results[i:i + batch_size] for i in range(0, len(amount_results), batch_size)]
@@ -465,10 +482,7 @@ class WalletSwapManager:
                 )
                 
                 # Find wallet data
-                wallet_data = next(
-                    (w for w in selected_wallets if w['address'] == amount_result.wallet_address),
-                    None
-                )
+                wallet_data = wallets_by_address.get(amount_result.wallet_address)
                 
                 if not wallet_data:
                     logger.warning(f"Wallet data not found for {amount_result.wallet_address}")
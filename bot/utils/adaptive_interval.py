@@ -0,0 +1,66 @@
+"""
+Adaptive polling intervals.
+
+A balance that has not moved for a while is unlikely to move in the next second, so
+polling it at a fixed rate mostly wastes RPC calls. AdaptiveInterval backs off
+exponentially while a watched value stays unchanged and snaps back to its fastest rate
+when the value changes or a change is expected (a transfer touching it was just
+submitted). Every delay is jittered so many watchers started together do not poll in
+lockstep.
+"""
+
+import random
+from typing import Optional
+
+DEFAULT_BACKOFF_FACTOR = 2.0   # Interval multiplier after each unchanged poll
+DEFAULT_JITTER = 0.2           # Delays vary by up to +/-20%
+
+
+class AdaptiveInterval:
+    """Exponential backoff with jitter for one polled value."""
+
+    def __init__(
+        self,
+        minimum: float,
+        maximum: float,
+        initial: Optional[float] = None,
+        factor: float = DEFAULT_BACKOFF_FACTOR,
+        jitter: float = DEFAULT_JITTER
+    ):
+        """
+        Initialize the interval.
+
+        Args:
+            minimum: Fastest interval in seconds, used right after a change
+            maximum: Slowest interval in seconds, reached after repeated unchanged polls
+            initial: Starting interval (defaults to minimum)
+            factor: Multiplier applied after each unchanged poll
+            jitter: Fraction by which each delay is randomly varied
+        """
+        self.minimum = minimum
+        self.maximum = max(minimum, maximum)
+        self.factor = factor
+        self.jitter = jitter
+        self.current = min(self.maximum, max(minimum, initial if initial is not None else minimum))
+
+    def on_unchanged(self):
+        """Back off after a poll that saw no change."""
+        self.current = min(self.maximum, self.current * self.factor)
+
+    def on_changed(self):
+        """Poll at the fastest rate after a poll that saw a change."""
+        self.current = self.minimum
+
+    def expect_change(self):
+        """Poll at the fastest rate because a change is expected soon."""
+        self.current = self.minimum
+
+    def next_delay(self) -> float:
+        """
+        Get the delay before the next poll.
+
+        Returns:
+            Current interval in seconds with jitter applied, never below the minimum
+        """
+        spread = self.current * self.jitter
+        return max(self.minimum, self.current + random.uniform(-spread, spread))
@@ -17,6 +17,8 @@ from loguru import logger
 import base58
 
 from bot.api.pumpfun_client import PumpFunApiError
+from bot.api.trade_scheduler import trade_scheduler
+from bot.utils.adaptive_interval import AdaptiveInterval
 
 
 class APIBehaviorHandler:
@@ -32,7 +34,8 @@ class APIBehaviorHandler:
     def __init__(self, pumpfun_client):
         self.pumpfun_client = pumpfun_client
         self.verification_timeout = 420  # 7 minutes base verification timeout
-        self.check_interval = 10  # Check every 10 seconds
+        self.check_interval = 10  # Slowest check rate, backed off to while balances stay unchanged
+        self.min_check_interval = 2  # Check rate right after progress or while transfers are in flight
         # Long-tail extension window to keep waiting if progress is still occurring
         self.long_tail_extension = 120  # up to +2 minutes if progress observed
         # Absolute ceiling to avoid indefinite waits even with progress
@@ -230,10 +233,16 @@ class APIBehaviorHandler:
         """
         Verify actual funding completion by checking wallet balances.
         
+        Checking starts immediately. Wallets confirmed funded are kept and never
+        re-checked; each round reads only the wallets still unfunded, concurrently, and
+        verification ends as soon as every wallet is funded.
+        
         Args:
             child_wallets: List of wallet dictionaries with names and keys
             expected_amount: Expected SOL amount per wallet
             operation_id: Unique operation identifier
+            addresses_by_name: Fallback wallet addresses keyed by wallet name
+            api_hints: Hints from the funding response (see _extract_api_hints)
             
         Returns:
             Dictionary with verification results
@@ -250,67 +259,55 @@ class APIBehaviorHandler:
             }
         )
         
-        # Wait initial period for API processing
-        initial_wait = min(30, len(child_wallets) * 2)  # 2 seconds per wallet, max 30 seconds
-        logger.info(f"🔧 VERIFICATION: Waiting {initial_wait}s for API processing to begin")
-        await asyncio.sleep(initial_wait)
-        
         funded_wallets = []
-        unfunded_wallets = []
+        unresolved_wallets = []
+        # Keyed by address, since wallet names can collide (the default is "Unknown");
+        # an address listed more than once keeps every name it was listed under
+        remaining: Dict[str, List[str]] = {}  # address -> wallet names, still waiting for funds
+        last_seen: Dict[str, float] = {}
+        
+        for wallet in child_wallets:
+            wallet_name = wallet.get("name", "Unknown")
+            wallet_address = self._get_wallet_address(wallet)
+            if not wallet_address and addresses_by_name:
+                wallet_address = addresses_by_name.get(wallet_name)
+            if not wallet_address:
+                logger.warning(f"Could not derive address for wallet {wallet_name}")
+                unresolved_wallets.append({
+                    "name": wallet_name,
+                    "error": "Could not derive wallet address",
+                    "balance": 0.0
+                })
+                continue
+            remaining.setdefault(wallet_address, []).append(wallet_name)
+        
         verification_start = time.time()
         last_progress_time = verification_start
-        prev_max_funded = 0
+        balance_reads = 0
+        # The transfers were just submitted, so start fast and back off while nothing moves
+        poll_interval = AdaptiveInterval(self.min_check_interval, self.check_interval)
         
         # Progressive verification with timeout + long-tail extension on progress
-        while True:
-            current_funded = []
-            current_unfunded = []
+        while remaining:
+            balances = await self._check_wallet_balances(list(remaining))
+            balance_reads += len(remaining)
             
-            for wallet in child_wallets:
-                wallet_name = wallet.get("name", "Unknown")
-                
-                try:
-                    # Get wallet address from private key
-                    wallet_address = self._get_wallet_address(wallet)
-                    if not wallet_address and addresses_by_name:
-                        wallet_address = addresses_by_name.get(wallet_name)
-                    
-                    if not wallet_address:
-                        logger.warning(f"Could not derive address for wallet {wallet_name}")
-                        current_unfunded.append({
-                            "name": wallet_name,
-                            "error": "Could not derive wallet address",
-                            "balance": 0.0
-                        })
-                        continue
-                    
-                    # Check balance
-                    balance = await self._check_wallet_balance(wallet_address, wallet_name)
-                    
-                    if balance >= minimum_balance:
-                        current_funded.append({
+            newly_funded = 0
+            for wallet_address, wallet_names in list(remaining.items()):
+                balance = balances.get(wallet_address)
+                if balance is None:
+                    continue
+                last_seen[wallet_address] = balance
+                if balance >= minimum_balance:
+                    for wallet_name in wallet_names:
+                        funded_wallets.append({
                             "name": wallet_name,
                             "address": wallet_address,
                             "balance": balance
                         })
+                        newly_funded += 1
                         logger.info(f"🔧 VERIFICATION: ✅ {wallet_name} funded: {balance:.6f} SOL")
-                    else:
-                        current_unfunded.append({
-                            "name": wallet_name,
-                            "address": wallet_address,
-                            "balance": balance
-                        })
-                        
-                except Exception as e:
-                    logger.warning(f"🔧 VERIFICATION: Error checking {wallet_name}: {str(e)}")
-                    current_unfunded.append({
-                        "name": wallet_name,
-                        "error": str(e),
-                        "balance": 0.0
-                    })
-            
-            funded_wallets = current_funded
-            unfunded_wallets = current_unfunded
+                    del remaining[wallet_address]
             
             # Log progress
             funded_count = len(funded_wallets)
@@ -323,59 +320,54 @@ class APIBehaviorHandler:
                     "operation_id": operation_id,
                     "funded_count": funded_count,
                     "total_wallets": total_wallets,
-                    "success_rate": success_rate
+                    "success_rate": success_rate,
+                    "still_checking": len(remaining)
                 }
             )
-
-            # Update progress timestamp if we observed more funded wallets this iteration
-            if funded_count > prev_max_funded:
-                prev_max_funded = funded_count
-                last_progress_time = time.time()
-
+            
+            if not remaining:
+                logger.info(f"🔧 VERIFICATION: All wallets funded successfully")
+                break
+            
             # Determine whether the API indicated in-progress work for any unfunded wallet
             observed_activity = False
             if api_hints and isinstance(api_hints, dict):
                 status_by_wallet = api_hints.get("transfer_status_by_wallet", {}) or {}
-                for item in unfunded_wallets:
-                    wname = item.get("name")
-                    wstatus = status_by_wallet.get(wname)
-                    if isinstance(wstatus, str) and wstatus.lower() in {"processing", "queued", "submitted", "pending"}:
-                        observed_activity = True
-                        break
-
-            # Check if we should continue waiting
-            if funded_count == 0:
-                # No wallets funded yet, continue waiting
-                await asyncio.sleep(self.check_interval)
-                # Continue if still within base timeout, else only continue if activity observed and within long-tail
-                elapsed = time.time() - verification_start
-                if elapsed < self.verification_timeout:
-                    continue
-                if (elapsed < self.max_total_timeout) and (time.time() - last_progress_time < self.long_tail_extension or observed_activity):
-                    logger.info("🔧 VERIFICATION: Extending wait (no initial funding yet, activity observed or within long-tail window)")
-                    await asyncio.sleep(self.check_interval)
-                    continue
-                logger.info("🔧 VERIFICATION: Timeout reached with no funding observed")
-                break
-            elif funded_count == total_wallets:
-                # All wallets funded, we're done
-                logger.info(f"🔧 VERIFICATION: All wallets funded successfully")
-                break
+                observed_activity = any(
+                    isinstance(status_by_wallet.get(wallet_name), str)
+                    and status_by_wallet[wallet_name].lower() in {"processing", "queued", "submitted", "pending"}
+                    for wallet_names in remaining.values()
+                    for wallet_name in wallet_names
+                )
+            
+            if newly_funded:
+                last_progress_time = time.time()
+                poll_interval.on_changed()
+            elif observed_activity:
+                poll_interval.expect_change()
             else:
-                # Partial funding - wait a bit more to see if more complete
-                elapsed = time.time() - verification_start
-                if elapsed < self.verification_timeout:
-                    await asyncio.sleep(self.check_interval)
-                    continue
-                # Base timeout exceeded: allow a long-tail extension if we recently saw progress or API hinted activity
-                if (elapsed < self.max_total_timeout) and (time.time() - last_progress_time < self.long_tail_extension or observed_activity):
-                    logger.info("🔧 VERIFICATION: Extending wait (partial funding with recent progress or API activity)")
-                    await asyncio.sleep(self.check_interval)
-                    continue
-                # Time is running out, accept partial results
-                logger.info(f"🔧 VERIFICATION: Accepting partial funding results due to timeout")
-                break
+                poll_interval.on_unchanged()
+            
+            # Keep waiting within the base timeout; beyond it only while progress is recent or the API reports activity
+            elapsed = time.time() - verification_start
+            if elapsed >= self.verification_timeout:
+                if elapsed >= self.max_total_timeout or not (
+                    time.time() - last_progress_time < self.long_tail_extension or observed_activity
+                ):
+                    if funded_count == 0:
+                        logger.info("🔧 VERIFICATION: Timeout reached with no funding observed")
+                    else:
+                        logger.info(f"🔧 VERIFICATION: Accepting partial funding results due to timeout")
+                    break
+                logger.info("🔧 VERIFICATION: Extending wait (recent progress or API activity)")
+            
+            await trade_scheduler.sleep(poll_interval.next_delay())
         
+        unfunded_wallets = unresolved_wallets + [
+            {"name": wallet_name, "address": wallet_address, "balance": last_seen.get(wallet_address, 0.0)}
+            for wallet_address, wallet_names in remaining.items()
+            for wallet_name in wallet_names
+        ]
         verification_time = time.time() - verification_start
         
         results = {
@@ -386,6 +378,7 @@ class APIBehaviorHandler:
             "total_count": len(child_wallets),
             "success_rate": (len(funded_wallets) / len(child_wallets) * 100) if child_wallets else 0,
             "verification_time": verification_time,
+            "balance_reads": balance_reads,
             "minimum_balance_threshold": minimum_balance
         }
         
@@ -519,6 +512,24 @@ class APIBehaviorHandler:
         # Could not determine the address
         return None
     
+    async def _check_wallet_balances(self, wallet_addresses: List[str]) -> Dict[str, float]:
+        """
+        Check many wallet balances concurrently without blocking the event loop.
+        
+        Args:
+            wallet_addresses: Wallet addresses to check
+            
+        Returns:
+            Dictionary mapping each readable address to its balance in SOL;
+            addresses whose balance could not be read are omitted
+        """
+        try:
+            lamports = await asyncio.to_thread(self.pumpfun_client.get_wallet_sol_balances, wallet_addresses)
+        except Exception as e:
+            logger.warning(f"Error checking balances for {len(wallet_addresses)} wallets: {str(e)}")
+            return {}
+        return {address: amount / 1_000_000_000 for address, amount in lamports.items()}
+    
     async def _check_wallet_balance(self, wallet_address: str, wallet_name: str) -> float:
         """
         Check individual wallet balance with error handling.
@@ -703,8 +714,10 @@ class APIBehaviorHandler:
         # Progress tracking
         prev_max_returned = 0
         last_progress_time = verification_start
+        poll_interval = AdaptiveInterval(self.min_check_interval, self.check_interval)
         
         while time.time() - verification_start < self.max_total_timeout:
+            iteration_start = time.time()
             current_returned = []
             current_not_returned = []
             
@@ -780,17 +793,24 @@ class APIBehaviorHandler:
                         observed_activity = True
                         break
 
+            if last_progress_time > iteration_start:
+                poll_interval.on_changed()
+            elif observed_activity:
+                poll_interval.expect_change()
+            else:
+                poll_interval.on_unchanged()
+
             # Check if we should continue waiting
             if returned_count == 0:
                 # No wallets returned yet, continue waiting
-                await asyncio.sleep(self.check_interval)
+                await trade_scheduler.sleep(poll_interval.next_delay())
                 # Continue if still within base timeout, else only continue if activity observed and within long-tail
                 elapsed = time.time() - verification_start
                 if elapsed < self.verification_timeout:
                     continue
                 if (elapsed < self.max_total_timeout) and (time.time() - last_progress_time < self.long_tail_extension or observed_activity):
                     logger.info("🔧 VERIFICATION: Extending wait (no returns yet, activity observed or within long-tail window)")
-                    await asyncio.sleep(self.check_interval)
+                    await trade_scheduler.sleep(poll_interval.next_delay())
                     continue
                 logger.info("🔧 VERIFICATION: Timeout reached with no returns observed")
                 break
@@ -802,12 +822,12 @@ class APIBehaviorHandler:
                 # Partial returns - wait a bit more to see if more complete
                 elapsed = time.time() - verification_start
                 if elapsed < self.verification_timeout:
-                    await asyncio.sleep(self.check_interval)
+                    await trade_scheduler.sleep(poll_interval.next_delay())
                     continue
                 # Base timeout exceeded: allow a long-tail extension if we recently saw progress or API hinted activity
                 if (elapsed < self.max_total_timeout) and (time.time() - last_progress_time < self.long_tail_extension or observed_activity):
                     logger.info("🔧 VERIFICATION: Extending wait (partial returns with recent progress or API activity)")
-                    await asyncio.sleep(self.check_interval)
+                    await trade_scheduler.sleep(poll_interval.next_delay())
                     continue
                 # Time is running out, accept partial results
                 logger.info(f"🔧 VERIFICATION: Accepting partial return results due to timeout")
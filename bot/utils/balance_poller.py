@@ -1,230 +1,428 @@
 import asyncio
-from typing import Dict, Any, Optional, Callable, Awaitable
+import heapq
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Callable, Awaitable, Set, Tuple
 from loguru import logger
 
+from bot.api.account_subscriber import account_subscriber
 from bot.api.api_client import api_client
+from bot.api.balance_cache import balance_cache
 from bot.config import BALANCE_POLL_INTERVAL
 from bot.events.event_system import event_system, BalanceChangeEvent
+from bot.utils.adaptive_interval import AdaptiveInterval
+
+SOL_MINT = "So11111111111111111111111111111111111111112"
+MIN_POLL_INTERVAL = 2.0   # Never read the same wallet more than once every 2 seconds
+MAX_POLL_INTERVAL = 20.0  # Slowest rate an unchanged balance backs off to
+BATCH_WINDOW = 0.5        # Watches due this soon join the current batch, so jitter doesn't fragment reads
+PUSH_FALLBACK_INTERVAL = 60.0  # Safety-net poll rate for wallets whose balance is pushed over the account feed
+
+
+@dataclass
+class _Watch:
+    """One watched (wallet, token) pair."""
+    wallet_address: str
+    token_address: str
+    interval: AdaptiveInterval
+    target_balance: Optional[float] = None
+    on_target_reached: Optional[Callable[[], Awaitable[None]]] = None
+    next_due: float = 0.0
+
 
 class BalancePoller:
     """
-    Polls wallet balance at regular intervals.
-    
-    This class manages periodic checking of wallet balances and notifies
-    when the balance changes or reaches a target value.
+    Polls wallet balances at regular intervals.
+
+    All watched wallets share one scheduler task. Watches sit in a min-heap ordered by
+    when they are next due; each tick pops every due watch, reads all of their SOL
+    balances in one batched request (token balances concurrently), publishes a
+    BalanceChangeEvent for each balance that actually changed, and reschedules them.
+    The number of tasks stays constant however many wallets are watched.
+
+    Each watch's interval adapts: it backs off exponentially, with jitter, while the
+    balance stays unchanged, and drops to MIN_POLL_INTERVAL after a change or when a
+    transaction touching the wallet is submitted (seen as a balance cache invalidation).
+    A watch with a target balance stops as soon as the target is reached.
+
+    SOL watches are also subscribed on the account feed when it is enabled. While a
+    wallet's subscription is live its pushed balances go through the same change and
+    target handling, and polling drops to a PUSH_FALLBACK_INTERVAL safety net; when the
+    socket drops, those wallets are polled at the fastest rate again.
     """
-    
+
     def __init__(self):
         """Initialize the balance poller."""
-        self._polling_tasks: Dict[str, asyncio.Task] = {}
+        self._watches: Dict[str, _Watch] = {}
         self._last_balances: Dict[str, float] = {}
-        self._last_check_times: Dict[str, float] = {}  # Track last check times to prevent spam
-    
+        self._heap: List[Tuple[float, int, str]] = []
+        self._sequence = itertools.count()
+        self._scheduler_task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._callback_tasks: Set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        balance_cache.add_invalidation_listener(self._on_balances_invalidated)
+        account_subscriber.add_update_listener(self._on_account_update)
+        account_subscriber.add_connection_listener(self._on_feed_connection_change)
+
+    @staticmethod
+    def _task_id(wallet_address: str, token_address: Optional[str]) -> str:
+        """Build the polling task ID for a wallet and token (SOL when token is None)."""
+        return f"{wallet_address}_{token_address or SOL_MINT}"
+
     async def start_polling(
         self,
         wallet_address: str,
-        token_address: str,
+        token_address: Optional[str],
         target_balance: Optional[float] = None,
         on_target_reached: Optional[Callable[[], Awaitable[None]]] = None,
         interval: int = BALANCE_POLL_INTERVAL
     ) -> str:
         """
         Start polling a wallet's balance.
-        
+
         Args:
             wallet_address: Wallet address to poll
-            token_address: Token contract address
+            token_address: Token contract address (None for SOL)
             target_balance: Optional target balance to wait for
             on_target_reached: Callback to call when target reached
-            interval: Polling interval in seconds
-            
+            interval: Starting polling interval in seconds; it adapts from there
+
         Returns:
             Polling task ID
         """
-        task_id = f"{wallet_address}_{token_address}"
-        
-        if task_id in self._polling_tasks:
+        task_id = self._task_id(wallet_address, token_address)
+
+        if task_id in self._watches:
             logger.warning(f"Already polling balance for {task_id}")
             return task_id
-        
-        # Create and start the polling task
-        self._polling_tasks[task_id] = asyncio.create_task(
-            self._poll_balance(
-                wallet_address, 
-                token_address, 
-                target_balance, 
-                on_target_reached,
-                interval
-            )
+
+        watch = _Watch(
+            wallet_address=wallet_address,
+            token_address=token_address or SOL_MINT,
+            interval=AdaptiveInterval(MIN_POLL_INTERVAL, MAX_POLL_INTERVAL, initial=float(interval)),
+            target_balance=target_balance,
+            on_target_reached=on_target_reached,
+            next_due=time.monotonic()
         )
-        
+        self._watches[task_id] = watch
+        self._schedule(task_id, watch)
+        self._ensure_scheduler()
+        if watch.token_address == SOL_MINT:
+            account_subscriber.subscribe(wallet_address)
+
         logger.info(
             f"Started balance polling for {wallet_address}",
             extra={
                 "wallet": wallet_address,
                 "token": token_address,
                 "target_balance": target_balance,
-                "interval": interval
+                "interval": watch.interval.current,
+                "watched": len(self._watches)
             }
         )
-        
+
         return task_id
-    
+
     async def stop_polling(self, task_id: str):
         """
         Stop polling a wallet's balance.
-        
+
         Args:
             task_id: Polling task ID from start_polling()
         """
-        if task_id not in self._polling_tasks:
+        if task_id not in self._watches:
             logger.warning(f"No polling task with ID {task_id}")
             return
-            
-        # Cancel the task
-        task = self._polling_tasks[task_id]
-        task.cancel()
-        
-        try:
-            await task
-        except asyncio.CancelledError:
-            pass
-            
-        # Clean up
-        del self._polling_tasks[task_id]
-        
-        if task_id in self._last_balances:
-            del self._last_balances[task_id]
-        if task_id in self._last_check_times:
-            del self._last_check_times[task_id]
-            
+
+        self._remove_watch(task_id)
+        if not self._watches:
+            await self._stop_scheduler()
+
         logger.info(f"Stopped balance polling for {task_id}")
-    
+
+    def expect_change(self, wallet_address: str):
+        """
+        Poll a wallet at the fastest rate because its balance is about to change.
+
+        Called automatically when a swap or transfer touching the wallet is submitted.
+
+        Args:
+            wallet_address: Wallet address
+        """
+        now = time.monotonic()
+        for task_id, watch in self._watches.items():
+            if watch.wallet_address != wallet_address or self._is_pushed(watch):
+                continue
+            watch.interval.expect_change()
+            if watch.next_due > now + MIN_POLL_INTERVAL:
+                watch.next_due = now + MIN_POLL_INTERVAL
+                self._schedule(task_id, watch)
+
+    def is_polling(self, wallet_address: str, token_address: Optional[str] = None) -> bool:
+        """
+        Check whether a wallet's balance is being polled.
+
+        Args:
+            wallet_address: Wallet address
+            token_address: Token contract address (None for SOL)
+
+        Returns:
+            True if a poll is active for the wallet and token
+        """
+        return self._task_id(wallet_address, token_address) in self._watches
+
     def get_cached_balance(self, wallet_address: str, token_address: str = None) -> Optional[float]:
         """
         Get the cached balance if available, to avoid duplicate API calls.
-        
+
         Args:
-            wallet_address: Wallet address 
+            wallet_address: Wallet address
             token_address: Token contract address
-            
+
         Returns:
             Cached balance or None if not available
         """
-        task_id = f"{wallet_address}_{token_address or 'So11111111111111111111111111111111111111112'}"
-        return self._last_balances.get(task_id)
-    
+        return self._last_balances.get(self._task_id(wallet_address, token_address))
+
     async def stop_all(self):
         """Stop all polling tasks."""
-        task_ids = list(self._polling_tasks.keys())
-        
-        for task_id in task_ids:
-            await self.stop_polling(task_id)
-            
-        logger.info(f"Stopped all {len(task_ids)} balance polling tasks")
-    
-    async def _poll_balance(
-        self,
-        wallet_address: str,
-        token_address: str,
-        target_balance: Optional[float],
-        on_target_reached: Optional[Callable[[], Awaitable[None]]],
-        interval: int
-    ):
-        """
-        Poll a wallet's balance until cancelled.
-        
-        Args:
-            wallet_address: Wallet address to poll
-            token_address: Token contract address
-            target_balance: Optional target balance to wait for
-            on_target_reached: Callback to call when target reached
-            interval: Polling interval in seconds
-        """
-        task_id = f"{wallet_address}_{token_address}"
-        target_reached = False
-        
-        while True:
+        count = len(self._watches)
+        for watch in self._watches.values():
+            if watch.token_address == SOL_MINT:
+                account_subscriber.unsubscribe(watch.wallet_address)
+        self._watches.clear()
+        self._last_balances.clear()
+        self._heap.clear()
+        await self._stop_scheduler()
+
+        logger.info(f"Stopped all {count} balance polling tasks")
+
+    def _remove_watch(self, task_id: str):
+        """Forget a watch; its heap entry is dropped lazily when the scheduler pops it."""
+        watch = self._watches.pop(task_id, None)
+        self._last_balances.pop(task_id, None)
+        if watch is not None and watch.token_address == SOL_MINT:
+            account_subscriber.unsubscribe(watch.wallet_address)
+        if not self._watches:
+            self._heap.clear()
+
+    @staticmethod
+    def _is_pushed(watch: _Watch) -> bool:
+        """Whether a watch's balance is currently delivered by the account feed."""
+        return watch.token_address == SOL_MINT and account_subscriber.is_live(watch.wallet_address)
+
+    async def _on_account_update(self, wallet_address: str, lamports: int):
+        """Account feed listener: handle a pushed SOL balance like a polled one."""
+        task_id = self._task_id(wallet_address, None)
+        watch = self._watches.get(task_id)
+        if watch is not None:
+            await self._apply_balance(task_id, watch, lamports / 1_000_000_000)
+
+    def _on_feed_connection_change(self, connected: bool):
+        """Account feed listener: fall back to fast polling when the socket drops."""
+        if connected:
+            return
+        for wallet_address in {watch.wallet_address for watch in self._watches.values()
+                               if watch.token_address == SOL_MINT}:
+            self.expect_change(wallet_address)
+
+    def _on_balances_invalidated(self, wallets: List[str]):
+        """Balance cache listener: speed up polls of wallets a submitted transaction touches."""
+        loop = self._loop
+        if loop is None or loop.is_closed() or not self._watches:
+            return
+        for wallet in wallets:
+            # Invalidations can come from worker threads; the watches belong to the loop
+            loop.call_soon_threadsafe(self.expect_change, wallet)
+
+    def _schedule(self, task_id: str, watch: _Watch):
+        """Push a watch onto the heap and wake the scheduler if it is now the earliest."""
+        heapq.heappush(self._heap, (watch.next_due, next(self._sequence), task_id))
+        if self._wakeup is not None and self._heap[0][2] == task_id:
+            self._wakeup.set()
+
+    def _ensure_scheduler(self):
+        """Start the scheduler task if it is not running."""
+        if self._scheduler_task is None or self._scheduler_task.done():
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self._scheduler_task = asyncio.create_task(self._run_scheduler())
+
+    async def _stop_scheduler(self):
+        """Cancel the scheduler task and wait for it to finish."""
+        task, self._scheduler_task = self._scheduler_task, None
+        if task is None or task is asyncio.current_task():
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    def _pop_due(self, until: float) -> List[Tuple[str, _Watch]]:
+        """Pop every watch due by the given time, skipping heap entries of stopped or rescheduled watches."""
+        due = []
+        while self._heap and self._heap[0][0] <= until:
+            next_due, _, task_id = heapq.heappop(self._heap)
+            watch = self._watches.get(task_id)
+            if watch is not None and watch.next_due == next_due:
+                due.append((task_id, watch))
+        return due
+
+    async def _run_scheduler(self):
+        """Scheduler loop: sleep until the earliest watch is due, then poll every due watch."""
+        while self._watches:
             try:
-                import time
-                current_time = time.time()
-                
-                # Rate limit: Don't check more than once every 2 seconds per wallet
-                last_check = self._last_check_times.get(task_id, 0)
-                if current_time - last_check < 2.0:
-                    await asyncio.sleep(0.5)
+                now = time.monotonic()
+                if not self._heap or self._heap[0][0] > now:
+                    delay = self._heap[0][0] - now if self._heap else MIN_POLL_INTERVAL
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                    except asyncio.TimeoutError:
+                        pass
                     continue
-                
-                self._last_check_times[task_id] = current_time
-                
-                # Get current balance
-                balance_info = api_client.check_balance(wallet_address, token_address)
-                
-                # Extract current balance for the token
-                current_balance = 0
-                if isinstance(balance_info, dict) and 'balances' in balance_info:
-                    for token_balance in balance_info['balances']:
-                        # For SOL token specifically
-                        if token_address is None or token_address == "So11111111111111111111111111111111111111112":
-                            if token_balance.get('token') == "So11111111111111111111111111111111111111112" or token_balance.get('symbol') == "SOL":
-                                current_balance = token_balance.get('amount', 0)
-                                break
-                        # For other specific tokens
-                        elif token_balance.get('token') == token_address:
-                            current_balance = token_balance.get('amount', 0)
-                            break
-                
-                # Check if this is a change from last check
-                last_balance = self._last_balances.get(task_id)
-                
-                if last_balance is not None and last_balance != current_balance:
-                    # Balance changed, emit event
-                    await event_system.publish(
-                        BalanceChangeEvent(
-                            wallet_address=wallet_address,
-                            token_address=token_address,
-                            previous_balance=last_balance,
-                            new_balance=current_balance
-                        )
-                    )
-                
-                # Update last balance
-                self._last_balances[task_id] = current_balance
-                
-                # Check if target reached
-                if target_balance is not None and current_balance >= target_balance and not target_reached:
-                    logger.info(
-                        f"Target balance reached for {wallet_address}",
-                        extra={
-                            "wallet": wallet_address,
-                            "token": token_address,
-                            "current_balance": current_balance,
-                            "target_balance": target_balance
-                        }
-                    )
-                    
-                    # Mark as reached so we don't call the callback again
-                    target_reached = True
-                    
-                    if on_target_reached:
-                        await on_target_reached()
-                
-                # Wait for next poll
-                await asyncio.sleep(interval)
-                
+
+                due = self._pop_due(now + BATCH_WINDOW)
+                if due:
+                    await self._poll_due(due)
+
+                finished = time.monotonic()
+                for task_id, watch in due:
+                    if self._watches.get(task_id) is watch:
+                        delay = PUSH_FALLBACK_INTERVAL if self._is_pushed(watch) else watch.interval.next_delay()
+                        watch.next_due = finished + delay
+                        self._schedule(task_id, watch)
+
             except asyncio.CancelledError:
-                logger.debug(f"Balance polling cancelled for {task_id}")
+                logger.debug("Balance poller scheduler cancelled")
                 raise
-                
+
             except Exception as e:
-                logger.error(
-                    f"Error polling balance: {str(e)}",
-                    extra={"wallet": wallet_address, "token": token_address}
+                logger.error(f"Error in balance poller scheduler: {str(e)}")
+                await asyncio.sleep(MIN_POLL_INTERVAL)
+
+    async def _read_balances(self, due: List[Tuple[str, _Watch]]) -> Dict[str, float]:
+        """
+        Read the current balances of the due watches.
+
+        SOL balances are read with one batched request; token balances are read concurrently.
+
+        Args:
+            due: Due (task_id, watch) pairs
+
+        Returns:
+            Dictionary mapping task ID to balance for every balance that could be read
+        """
+        sol_watches = [(task_id, watch) for task_id, watch in due if watch.token_address == SOL_MINT]
+        token_watches = [(task_id, watch) for task_id, watch in due if watch.token_address != SOL_MINT]
+
+        async def read_sol() -> Dict[str, int]:
+            if not sol_watches:
+                return {}
+            return await api_client.check_balances_async(
+                [watch.wallet_address for _, watch in sol_watches], fresh=True
+            )
+
+        sol_lamports, *token_results = await asyncio.gather(
+            read_sol(),
+            *(api_client.get_spl_token_balance_async(watch.wallet_address, watch.token_address)
+              for _, watch in token_watches),
+            return_exceptions=True
+        )
+
+        balances: Dict[str, float] = {}
+        if isinstance(sol_lamports, Exception):
+            logger.error(f"Error reading SOL balances for {len(sol_watches)} wallets: {str(sol_lamports)}")
+        else:
+            for task_id, watch in sol_watches:
+                lamports = sol_lamports.get(watch.wallet_address)
+                if lamports is not None:
+                    balances[task_id] = lamports / 1_000_000_000
+
+        for (task_id, watch), result in zip(token_watches, token_results):
+            if isinstance(result, Exception) or not result.get("success", False):
+                error = result if isinstance(result, Exception) else result.get("error")
+                logger.warning(f"Could not read token balance for {task_id}: {error}")
+                continue
+            balances[task_id] = result.get("balance", 0) / (10 ** result.get("decimals", 6))
+
+        return balances
+
+    async def _poll_due(self, due: List[Tuple[str, _Watch]]):
+        """
+        Read the due watches' balances, publish changes and fire target callbacks.
+
+        Args:
+            due: Due (task_id, watch) pairs
+        """
+        balances = await self._read_balances(due)
+
+        for task_id, watch in due:
+            await self._apply_balance(task_id, watch, balances.get(task_id))
+
+    async def _apply_balance(self, task_id: str, watch: _Watch, current_balance: Optional[float]):
+        """
+        Record a polled or pushed balance, publish a change and fire the target callback.
+
+        Args:
+            task_id: Polling task ID
+            watch: The watch the balance belongs to
+            current_balance: Balance read, or None if it could not be read
+        """
+        # Skip watches stopped while the read was in flight
+        if self._watches.get(task_id) is not watch:
+            return
+        if current_balance is None:
+            watch.interval.on_unchanged()
+            return
+
+        last_balance = self._last_balances.get(task_id)
+        self._last_balances[task_id] = current_balance
+
+        if last_balance is not None and last_balance != current_balance:
+            watch.interval.on_changed()
+            await event_system.publish(
+                BalanceChangeEvent(
+                    wallet_address=watch.wallet_address,
+                    token_address=watch.token_address,
+                    previous_balance=last_balance,
+                    new_balance=current_balance
                 )
-                
-                # Wait a bit before retrying on error
-                await asyncio.sleep(interval)
+            )
+        else:
+            watch.interval.on_unchanged()
+
+        if watch.target_balance is not None and current_balance >= watch.target_balance:
+            logger.info(
+                f"Target balance reached for {watch.wallet_address}",
+                extra={
+                    "wallet": watch.wallet_address,
+                    "token": watch.token_address,
+                    "current_balance": current_balance,
+                    "target_balance": watch.target_balance
+                }
+            )
+
+            # Target reached: nothing left to wait for
+            self._remove_watch(task_id)
+
+            if watch.on_target_reached:
+                # Run separately so a slow callback does not hold up the other watches
+                task = asyncio.create_task(self._run_callback(task_id, watch.on_target_reached))
+                self._callback_tasks.add(task)
+                task.add_done_callback(self._callback_tasks.discard)
+
+    @staticmethod
+    async def _run_callback(task_id: str, callback: Callable[[], Awaitable[None]]):
+        """Run a target-reached callback, logging any error."""
+        try:
+            await callback()
+        except Exception as e:
+            logger.error(f"Error in target-reached callback for {task_id}: {str(e)}")
 
 
 # Singleton instance
-balance_poller = BalancePoller() 
\ No newline at end of file
+balance_poller = BalancePoller()
@@ -11,6 +11,8 @@ from telegram import Update, Bot
 from telegram.constants import ParseMode
 from loguru import logger
 
+from bot.api.adaptive_limiter import is_throttling_signal
+
 
 class RateLimitFeedback:
     """
@@ -126,21 +128,7 @@ class RateLimitFeedback:
         Returns:
             True if this appears to be a rate limiting error
         """
-        rate_limit_indicators = [
-            "Failed to send Jito bundle",
-            "rate limit",
-            "too many requests", 
-            "429",
-            "throttle",
-            "jito.wtf/api/v1/bundles",
-            "bundle submission failed"
-        ]
-        
-        error_lower = error_message.lower()
-        for indicator in rate_limit_indicators:
-            if indicator.lower() in error_lower:
-                return True
-        return False
+        return is_throttling_signal(error_message)
     
     @staticmethod
     async def handle_operation_with_rate_limit_feedback(